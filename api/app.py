@@ -24,6 +24,8 @@ APP-001: Proxy/forwarded IP handling with TRUSTED_PROXIES env var.
 APP-002: Rate limit memory cleanup with max_tracked_ips and periodic eviction.
 APP-003: Structured JSON logging when APP_LOG_FORMAT=json.
 APP-004: CORS middleware with configurable origins via APP_CORS_ORIGINS.
+OPT-CACHE-001: Shared cross-worker result cache when APP_CACHE_BACKEND=sqlite.
+OPT-GEN-001: Result caches and ETags keyed on the database data generation.
 OPT-FMT-001: fmt_amount Jinja filter uses shared format_amount() from utils.
 """
 
@@ -43,10 +45,17 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from starlette.responses import Response
 
-from api.database import get_db_path, _make_conn
+from api.database import close_pool, get_db_generation, get_db_path, get_pool, get_pool_stats
 from utils.database import get_slow_queries, get_query_stats
 from api.routes import aggregations, bli, budget_lines, dashboard, download, explorer, facets, feedback, files, metadata, pe, reference, search
 from api.routes import frontend as frontend_routes
+from utils.cache import (
+    SQLiteCacheBackend,
+    all_cache_stats,
+    get_shared_backend,
+    set_generation_provider,
+    set_shared_backend,
+)
 from utils.config import AppConfig
 
 # ── Configuration ─────────────────────────────────────────────────────────────
@@ -179,6 +188,8 @@ async def lifespan(app: FastAPI):
             name="agg-cache-warmup",
         ).start()
     yield
+    # OPT-DB-003: Release pooled read-only connections on shutdown
+    close_pool()
 
 
 def create_app(db_path: Path | None = None) -> FastAPI:
@@ -194,6 +205,28 @@ def create_app(db_path: Path | None = None) -> FastAPI:
         import api.database as _db_mod
         _db_mod._DB_PATH = db_path
 
+    # OPT-GEN-001: Every result cache invalidates when the data generation moves
+    set_generation_provider(get_db_generation)
+
+    # OPT-CACHE-001: Shared result cache so all workers warm a single store
+    if _cfg.cache_backend == "sqlite":
+        # Entries are pickled, so the file lives in an app-owned directory
+        # (next to the database) rather than the shared system temp dir.
+        cache_path = _cfg.cache_path or get_db_path().with_name(
+            f"{get_db_path().stem}_api_cache.sqlite")
+        try:
+            set_shared_backend(SQLiteCacheBackend(
+                cache_path,
+                generation=get_db_generation,
+                max_bytes=_cfg.cache_max_mb * 1024 * 1024,
+            ))
+        except Exception:
+            _logger.exception(
+                "Shared cache unavailable at %s; using per-process caches",
+                cache_path,
+            )
+            set_shared_backend(None)
+
     app = FastAPI(
         title="DoD Budget API",
         summary="REST API for searching and analyzing DoD budget justification data.",
@@ -289,29 +322,25 @@ def create_app(db_path: Path | None = None) -> FastAPI:
 
     # ── TIGER-009: ETag + Cache-Control middleware ────────────────────────────
 
-    _etag_value: str | None = None
-    _etag_size: int = 0
+    # Endpoints whose responses are not derived only from pipeline data.
+    # The keyword explorer reads its own cache tables, which the background
+    # explorer builder rewrites without bumping the data generation, and
+    # /files serves documents straight from disk.  A generation ETag would
+    # hand out stale 304s for both.
+    _NO_ETAG_PREFIXES = ("/api/v1/explorer", "/api/v1/files")
 
     def _compute_etag() -> str | None:
-        """Compute ETag based on database file size.
+        """Compute ETag from the database data generation (OPT-GEN-001).
 
-        Uses file size as the basis since SQLite WAL mode may update
-        mtime on reads.  Recomputes when size changes (indicating a
-        data modification).
+        The generation only changes when a pipeline step (build, load,
+        repair or enrich) modifies the data, so clients never get a stale
+        304 after a same-size rebuild.  Paths in ``_NO_ETAG_PREFIXES`` are
+        never given a generation ETag.
         """
-        nonlocal _etag_value, _etag_size
-        db_path = get_db_path()
-        if not db_path.exists():
-            return None
-        try:
-            size = db_path.stat().st_size
-        except OSError:
+        generation = get_db_generation()
+        if generation == "missing":
             return None
-        if _etag_value and size == _etag_size:
-            return _etag_value
-        _etag_size = size
-        _etag_value = f'W/"{size:x}"'
-        return _etag_value
+        return f'W/"{generation}"'
 
     @app.middleware("http")
     async def cache_control_middleware(request: Request, call_next) -> Response:
@@ -320,7 +349,11 @@ def create_app(db_path: Path | None = None) -> FastAPI:
 
         # Compute ETag for GET requests to API endpoints
         etag = None
-        if request.method == "GET" and path.startswith("/api/v1"):
+        if (
+            request.method == "GET"
+            and path.startswith("/api/v1")
+            and not path.startswith(_NO_ETAG_PREFIXES)
+        ):
             etag = _compute_etag()
 
             # Handle If-None-Match → 304 Not Modified
@@ -348,6 +381,9 @@ def create_app(db_path: Path | None = None) -> FastAPI:
             response.headers.setdefault(
                 "Cache-Control", "private, no-cache"
             )
+        elif path.startswith("/api/v1/explorer"):
+            # Explorer status/results change as the background build runs
+            response.headers.setdefault("Cache-Control", "no-store")
 
         return response
 
@@ -477,9 +513,8 @@ def create_app(db_path: Path | None = None) -> FastAPI:
         db_ok = db_path.exists()
         if db_ok:
             try:
-                conn = _make_conn(db_path, read_only=True)
-                count = conn.execute("SELECT COUNT(*) FROM budget_lines").fetchone()[0]
-                conn.close()
+                with get_pool().connection() as conn:
+                    count = conn.execute("SELECT COUNT(*) FROM budget_lines").fetchone()[0]
                 return {"status": "ok", "database": str(db_path), "budget_lines": count}
             except Exception:
                 logging.exception("Health check degraded: database error while querying budget_lines")
@@ -508,7 +543,9 @@ def create_app(db_path: Path | None = None) -> FastAPI:
         """Return detailed operational metrics for monitoring dashboards.
 
         Includes uptime, request/error counters, database statistics,
-        average response time, and rate-limiter stats.  Counters reset
+        average response time, rate-limiter stats, connection-pool usage
+        (OPT-DB-003), shared-cache size (OPT-CACHE-001) and per-cache
+        hit/miss/eviction counters (OPT-CACHE-002).  Counters reset
         on process restart (stateless — no persistence).
         """
         db_path = get_db_path()
@@ -522,14 +559,13 @@ def create_app(db_path: Path | None = None) -> FastAPI:
             )
 
         try:
-            conn = _make_conn(db_path, read_only=True)
-            budget_count = conn.execute(
-                "SELECT COUNT(*) FROM budget_lines"
-            ).fetchone()[0]
-            pdf_count = conn.execute(
-                "SELECT COUNT(*) FROM pdf_pages"
-            ).fetchone()[0]
-            conn.close()
+            with get_pool().connection() as conn:
+                budget_count = conn.execute(
+                    "SELECT COUNT(*) FROM budget_lines"
+                ).fetchone()[0]
+                pdf_count = conn.execute(
+                    "SELECT COUNT(*) FROM pdf_pages"
+                ).fetchone()[0]
         except Exception:
             # Log full exception details server-side without exposing them to the client.
             logging.exception("health_detailed: database check failed")
@@ -561,6 +597,9 @@ def create_app(db_path: Path | None = None) -> FastAPI:
             },
             "slow_query_count": qstats["slow_query_count"],
             "avg_query_time_ms": qstats["avg_query_time_ms"],
+            "db_pool": get_pool_stats(),
+            "shared_cache": backend.stats() if (backend := get_shared_backend()) else None,
+            "caches": all_cache_stats(),
         }
 
     # TIGER-011: Slow query monitoring endpoint
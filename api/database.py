@@ -1,20 +1,37 @@
 """
 Database connection management for the API (Step 2.C7-a).
 
-Provides a get_db() dependency that opens a per-request SQLite connection and
-closes it after the response is sent.  The database path is resolved once at
-startup from the APP_DB_PATH environment variable (default: dod_budget.sqlite).
+Provides a get_db() dependency that checks out a pooled read-only SQLite
+connection for the duration of a request and returns it to the pool after the
+response is sent.  The database path is resolved once at startup from the
+APP_DB_PATH environment variable (default: dod_budget.sqlite).
 
 OPT-DB-002: Read-only connection mode via SQLite URI.
+OPT-DB-003: Bounded read-only connection pool.  Connections are opened with
+    ``mode=ro`` and configured once (mmap, page cache, temp store), then reused
+    across requests so their page cache stays warm and no per-request PRAGMA
+    round trips are paid.  Pool size comes from APP_DB_POOL_SIZE (default 10).
+    Routes that must write (explorer cache metadata) use get_db_rw() instead.
 """
 
 import os
 import sqlite3
-from collections.abc import Generator
+import threading
+import time
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
+from utils.database import get_data_generation
+
 _DB_PATH: Path = Path(os.getenv("APP_DB_PATH", "dod_budget.sqlite"))
 
+# OPT-DB-003: Pool sizing and per-connection read tuning
+_POOL_SIZE: int = int(os.getenv("APP_DB_POOL_SIZE", "10"))
+_POOL_TIMEOUT_S = 30.0               # Max wait for a free connection
+_MMAP_SIZE = 256 * 1024 * 1024       # 256 MB memory-mapped I/O per connection
+_CACHE_SIZE_KB = 32_000              # ~32 MB page cache per connection
+
 
 def get_db_path() -> Path:
     """Return the configured database path."""
@@ -46,8 +63,289 @@ def _make_conn(db_path: Path, read_only: bool = False) -> sqlite3.Connection:
     return conn
 
 
+# OPT-GEN-001: Last (file signature, generation) seen, so the data_generation
+# row is only re-read after the database or its WAL has been written to.  The
+# row is read on a dedicated connection, never a pooled one: callers already
+# hold a pool slot, and a full pool must not stall or change the stamp.
+_generation_lock = threading.Lock()
+_generation_memo: tuple[tuple, str] | None = None
+_generation_conn: tuple[tuple, sqlite3.Connection] | None = None
+
+
+def _file_signature(db_path: Path) -> tuple:
+    """Return stat-based change indicators for the database and its WAL."""
+    sig: list[tuple[int, int, int] | None] = []
+    for path in (db_path, db_path.with_name(db_path.name + "-wal")):
+        try:
+            st = path.stat()
+            sig.append((st.st_ino, st.st_size, st.st_mtime_ns))
+        except OSError:
+            sig.append(None)
+    return (str(db_path), tuple(sig))
+
+
+def _read_generation(db_path: Path) -> int | None:
+    """Read data_generation on the dedicated connection (caller holds the lock)."""
+    global _generation_conn
+    key = (str(db_path), _file_identity(db_path))
+    if _generation_conn is not None and _generation_conn[0] != key:
+        _generation_conn[1].close()
+        _generation_conn = None
+    if _generation_conn is None:
+        _generation_conn = (key, _make_conn(db_path, read_only=True))
+    return get_data_generation(_generation_conn[1])
+
+
+def _close_generation_conn() -> None:
+    global _generation_conn
+    with _generation_lock:
+        if _generation_conn is not None:
+            _generation_conn[1].close()
+            _generation_conn = None
+
+
+def get_db_generation() -> str:
+    """Return the database's data generation stamp (OPT-GEN-001).
+
+    The pipeline bumps ``data_generation`` whenever the builder, staging
+    loader or enricher changes the data.  All API result caches and the ETag
+    key on this value, so they stay valid until the data actually changes.
+
+    The row is re-read only when the database or WAL file changes on disk,
+    so the common case is two ``stat`` calls.  Databases built before the
+    generation table existed fall back to the file identity and size.  A
+    read that fails also returns that fallback, but it is not memoized, so
+    the next call reads the row again.
+    """
+    global _generation_memo, _generation_conn
+    sig = _file_signature(_DB_PATH)
+    db_stat = sig[1][0]
+    if db_stat is None:
+        return "missing"
+    fallback = f"f{db_stat[0]:x}-{db_stat[1]:x}"
+    with _generation_lock:
+        if _generation_memo is not None and _generation_memo[0] == sig:
+            return _generation_memo[1]
+        try:
+            generation = _read_generation(_DB_PATH)
+        except sqlite3.Error:
+            if _generation_conn is not None:
+                _generation_conn[1].close()
+                _generation_conn = None
+            return fallback
+        value = f"g{generation:x}" if generation is not None else fallback
+        _generation_memo = (sig, value)
+    return value
+
+
+def _file_identity(db_path: Path) -> tuple[int, int] | None:
+    """Return (device, inode) for *db_path*, or None if it does not exist."""
+    try:
+        st = db_path.stat()
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+class ConnectionPool:
+    """Bounded checkout/return pool of read-only SQLite connections.
+
+    Idle connections are reused LIFO so the most recently used (warmest) page
+    cache is handed out first.  When all ``max_size`` connections are checked
+    out, acquire() blocks until one is released or ``timeout`` expires.
+
+    If the database file is replaced (e.g. a rebuild renamed a new file into
+    place), idle connections still point at the old inode; they are discarded
+    on the next checkout so requests never read a stale file.
+
+    Args:
+        db_path: Path to the SQLite database file.
+        max_size: Maximum number of open connections.
+        timeout: Seconds acquire() waits for a free connection.
+    """
+
+    def __init__(self, db_path: Path, max_size: int = _POOL_SIZE,
+                 timeout: float = _POOL_TIMEOUT_S) -> None:
+        self.db_path = db_path
+        self.max_size = max(1, max_size)
+        self.timeout = timeout
+        self._idle: list[sqlite3.Connection] = []
+        self._open = 0
+        self._cond = threading.Condition()
+        self._identity = _file_identity(db_path)
+        self._closed = False
+        self._stats = {
+            "checkouts": 0,
+            "created": 0,
+            "discarded": 0,
+            "waits": 0,
+            "wait_time_ms": 0.0,
+            "timeouts": 0,
+        }
+
+    def _new_conn(self) -> sqlite3.Connection:
+        """Open and tune a read-only connection (called without the lock held)."""
+        conn = _make_conn(self.db_path, read_only=True)
+        conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+        conn.execute(f"PRAGMA cache_size=-{_CACHE_SIZE_KB}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    def _discard_stale_locked(self) -> None:
+        """Drop idle connections if the database file was replaced."""
+        identity = _file_identity(self.db_path)
+        if identity == self._identity:
+            return
+        self._identity = identity
+        for conn in self._idle:
+            conn.close()
+        self._open -= len(self._idle)
+        self._stats["discarded"] += len(self._idle)
+        self._idle.clear()
+
+    def acquire(self) -> sqlite3.Connection:
+        """Check out a connection, opening a new one if under ``max_size``.
+
+        Raises:
+            TimeoutError: If no connection becomes free within ``timeout``.
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Connection pool is closed")
+            self._discard_stale_locked()
+            if not self._idle and self._open >= self.max_size:
+                self._stats["waits"] += 1
+                start = time.monotonic()
+                ok = self._cond.wait_for(
+                    lambda: self._idle or self._open < self.max_size,
+                    timeout=self.timeout,
+                )
+                self._stats["wait_time_ms"] += (time.monotonic() - start) * 1000
+                if not ok:
+                    self._stats["timeouts"] += 1
+                    raise TimeoutError(
+                        f"No database connection available within {self.timeout}s "
+                        f"(pool size {self.max_size})"
+                    )
+            self._stats["checkouts"] += 1
+            if self._idle:
+                return self._idle.pop()
+            # Reserve a slot, then connect outside the lock
+            self._open += 1
+            self._stats["created"] += 1
+        try:
+            return self._new_conn()
+        except Exception:
+            with self._cond:
+                self._open -= 1
+                self._cond.notify()
+            raise
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Return a checked-out connection to the pool."""
+        # Never hand a connection with an open read transaction to the next request
+        if conn.in_transaction:
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                pass
+        with self._cond:
+            if self._closed or _file_identity(self.db_path) != self._identity:
+                conn.close()
+                self._open -= 1
+                self._stats["discarded"] += 1
+            else:
+                self._idle.append(conn)
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Context manager: acquire a connection and release it on exit."""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self) -> None:
+        """Close all idle connections; in-use ones are closed on release."""
+        with self._cond:
+            self._closed = True
+            for conn in self._idle:
+                conn.close()
+            self._open -= len(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        """Return pool sizing and usage counters for monitoring."""
+        with self._cond:
+            idle = len(self._idle)
+            return {
+                "max_size": self.max_size,
+                "open": self._open,
+                "idle": idle,
+                "in_use": self._open - idle,
+                "checkouts": self._stats["checkouts"],
+                "created": self._stats["created"],
+                "discarded": self._stats["discarded"],
+                "waits": self._stats["waits"],
+                "wait_time_ms": round(self._stats["wait_time_ms"], 2),
+                "timeouts": self._stats["timeouts"],
+            }
+
+
+_pool: ConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """Return the shared pool for the configured database path.
+
+    The pool is created lazily and recreated if ``_DB_PATH`` changes (as
+    create_app(db_path=...) and tests do).
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool.db_path != _DB_PATH:
+            if _pool is not None:
+                _pool.close()
+            _pool = ConnectionPool(_DB_PATH)
+        return _pool
+
+
+def close_pool() -> None:
+    """Close the shared pool (called on application shutdown)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+    _close_generation_conn()
+
+
+def get_pool_stats() -> dict | None:
+    """Return stats for the shared pool, or None if it has not been created."""
+    with _pool_lock:
+        pool = _pool
+    return pool.stats() if pool is not None else None
+
+
 def get_db() -> Generator[sqlite3.Connection, None, None]:
-    """FastAPI dependency: yield a SQLite connection, close on exit."""
+    """FastAPI dependency: yield a pooled read-only connection, return it on exit."""
+    pool = get_pool()
+    conn = pool.acquire()
+    try:
+        yield conn
+    finally:
+        pool.release(conn)
+
+
+def get_db_rw() -> Generator[sqlite3.Connection, None, None]:
+    """FastAPI dependency: yield a writable SQLite connection, close on exit.
+
+    Only for routes that persist state (explorer cache metadata).
+    """
     conn = _make_conn(_DB_PATH)
     try:
         yield conn
@@ -483,6 +483,11 @@ class PaginatedResponse(BaseModel):
     page: int = Field(..., description="Current page number (0-indexed)", examples=[0])
     page_count: int = Field(..., description="Total number of pages", examples=[154])
     has_next: bool = Field(..., description="Whether there is a next page")
+    next_cursor: str | None = Field(
+        None,
+        description="Opaque cursor for the next page (pass as ?cursor=); "
+        "null on the last page",
+    )
     items: list[BudgetLineOut] = Field(
         ..., description="Budget line items for this page"
     )
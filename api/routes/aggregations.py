@@ -6,8 +6,10 @@ Supports optional pre-filter by fiscal_year, service, or exhibit_type.
 
 AGG-001: Dynamic FY columns discovered from schema at runtime.
 AGG-002: pct_of_total and yoy_change_pct added to each row.
-OPT-AGG-001: Server-side TTL cache (600 seconds) for aggregation queries.
+OPT-AGG-001: Server-side cache for aggregation queries (generation-keyed,
+    see OPT-GEN-001).
 OPT-AGG-002: Background cache warmup at startup for common no-filter queries.
+OPT-CACHE-001: Caches are namespaced so they can be shared across workers.
 """
 
 import logging
@@ -40,8 +42,11 @@ _ALLOWED_GROUPS = {
     "budget_type": "budget_type",
 }
 
-# OPT-AGG-001: 600-second TTL cache keyed on filter params (data changes only on DB rebuild)
-_agg_cache: TTLCache = TTLCache(maxsize=128, ttl_seconds=600)
+# OPT-AGG-001: Cache keyed on filter params (data changes only on DB rebuild)
+# OPT-CACHE-002: Bounded by estimated payload size as well as entry count.
+# OPT-GEN-001: No TTL — entries are dropped when the data generation changes.
+_agg_cache: TTLCache = TTLCache(maxsize=512, ttl_seconds=None, namespace="agg",
+                                max_bytes=32 * 1024 * 1024)
 
 
 def _cache_key(
@@ -104,7 +109,8 @@ def aggregate(
     AGG-001: Amount columns are discovered dynamically from the schema so new
     fiscal year columns (FY2027+) are included automatically.
     AGG-002: Each row includes pct_of_total and yoy_change_pct.
-    OPT-AGG-001: Results are cached for 600 seconds per unique filter combination.
+    OPT-AGG-001: Results are cached per unique filter combination until the
+    data generation changes.
     """
     if group_by not in _ALLOWED_GROUPS:
         raise HTTPException(
@@ -206,7 +212,8 @@ def aggregate(
     return result
 
 
-_hierarchy_cache: TTLCache = TTLCache(maxsize=16, ttl_seconds=600)
+_hierarchy_cache: TTLCache = TTLCache(maxsize=64, ttl_seconds=None, namespace="hierarchy",
+                                      max_bytes=64 * 1024 * 1024)
 
 
 @router.get("/hierarchy", summary="Hierarchical budget breakdown for treemap")
@@ -221,7 +228,7 @@ def hierarchy(
     """Return Service > Appropriation > Program hierarchy for treemap visualization.
 
     Returns items with service, appropriation, program title, PE number, and amount.
-    Results are cached for 300 seconds per unique filter combination.
+    Results are cached per unique filter combination until the data changes.
     """
     cache_key = ("hierarchy", fiscal_year, service, exhibit_type)
     cached = _hierarchy_cache.get(cache_key)
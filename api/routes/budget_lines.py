@@ -4,6 +4,11 @@ GET /api/v1/budget-lines endpoint (Step 2.C3-b).
 Supports filtering by fiscal_year, service, exhibit_type, pe_number,
 appropriation_code; plus sorting and pagination.  Also handles the
 GET /api/v1/budget-lines/{id} single-item endpoint.
+
+OPT-PAGE-001: Keyset pagination.  Every page returns ``next_cursor``; passing
+    it back as ``cursor`` seeks straight to the next page via the sort
+    column's index instead of scanning ``offset`` rows, and the total count
+    is cached per filter set.
 """
 
 import sqlite3
@@ -20,9 +25,15 @@ from api.models import (
 )
 from utils.query import (
     ALLOWED_SORT_COLUMNS,
+    build_keyset_condition,
     build_where_clause,
+    cached_count,
     compute_pagination,
+    decode_cursor,
+    encode_cursor,
     fetch_bli_related_pes,
+    fetch_with_has_more,
+    probe_fts_match,
 )
 from utils.strings import sanitize_fts5_query
 
@@ -57,50 +68,85 @@ def list_budget_lines(
     sort_dir: str = Query("asc", pattern="^(asc|desc)$", description="Sort direction"),
     limit: int = Query(25, ge=1, le=500, description="Max items per page"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
+    cursor: str | None = Query(
+        None,
+        description="Opaque cursor from a previous page's next_cursor "
+        "(keyset pagination; cannot be combined with offset)",
+    ),
     conn: sqlite3.Connection = Depends(get_db),
 ) -> PaginatedResponse:
-    """Return a paginated, filtered list of budget line items."""
+    """Return a paginated, filtered list of budget line items.
+
+    OPT-PAGE-001: With ``cursor`` the page is located by a keyset seek on
+    ``(sort_by, id)``, so deep pages cost the same as the first one.
+    """
     if sort_by not in ALLOWED_SORT_COLUMNS:
         raise HTTPException(
             status_code=400,
             detail=f"sort_by must be one of: {sorted(ALLOWED_SORT_COLUMNS)}",
         )
-
-    # FTS5 free-text search: resolve matching row IDs first
+    keyset: tuple[str, list] | None = None
+    if cursor:
+        if offset:
+            raise HTTPException(
+                status_code=400, detail="cursor and offset cannot be combined"
+            )
+        try:
+            value, last_id = decode_cursor(cursor, sort_by, sort_dir)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        keyset = build_keyset_condition(sort_by, sort_dir, value, last_id)
+
+    # FTS5 free-text search, applied as a subquery (OPT-FTS-001)
+    fts_match: str | None = None
     fts_ids: list[int] | None = None
     if filters.q:
         safe_q = sanitize_fts5_query(filters.q)
         if safe_q:
-            try:
-                fts_rows = conn.execute(
-                    "SELECT rowid FROM budget_lines_fts WHERE budget_lines_fts MATCH ?",
-                    (safe_q,),
-                ).fetchall()
-                fts_ids = [r[0] for r in fts_rows]
-            except (sqlite3.OperationalError, sqlite3.DatabaseError):
-                fts_ids = []  # FTS table missing → no matches
+            if probe_fts_match(conn, safe_q):
+                fts_match = safe_q
+            else:
+                fts_ids = []  # No hits, bad syntax or FTS table missing
 
-    where, params = build_where_clause(**filters.where_kwargs(fts_ids=fts_ids))
+    where, params = build_where_clause(
+        **filters.where_kwargs(fts_ids=fts_ids, fts_match=fts_match)
+    )
 
     direction = "DESC" if sort_dir == "desc" else "ASC"
 
-    count_sql = f"SELECT COUNT(*) FROM budget_lines {where}"
-    total = conn.execute(count_sql, params).fetchone()[0]
+    total = cached_count(conn, "budget_lines", where, params)
+
+    page_where, page_params = where, list(params)
+    if keyset is not None:
+        connector = "AND" if page_where else "WHERE"
+        page_where = f"{page_where} {connector} {keyset[0]}"
+        page_params += keyset[1]
 
+    # Tie-break on id so the order is total and cursors are unambiguous
+    order = f"{sort_by} {direction}" + (f", id {direction}" if sort_by != "id" else "")
     data_sql = (
-        f"SELECT {_SELECT_COLUMNS} FROM budget_lines {where} "
-        f"ORDER BY {sort_by} {direction} LIMIT ? OFFSET ?"
+        f"SELECT {_SELECT_COLUMNS} FROM budget_lines {page_where} "
+        f"ORDER BY {order} LIMIT ? OFFSET ?"
+    )
+    rows, has_more = fetch_with_has_more(
+        conn.execute(data_sql, page_params + [limit + 1, offset]), limit
     )
-    rows = conn.execute(data_sql, params + [limit, offset]).fetchall()
     items = [BudgetLineOut(**dict(row)) for row in rows]
 
     pag = compute_pagination(offset, limit, total)
+    next_cursor = None
+    if has_more:
+        last = rows[-1]
+        next_cursor = encode_cursor(sort_by, sort_dir, last[sort_by], last["id"])
+    if keyset is not None:
+        pag["has_next"] = has_more
 
     return PaginatedResponse(
         total=total,
         limit=limit,
         offset=offset,
         items=items,
+        next_cursor=next_cursor,
         **pag,
     )
 
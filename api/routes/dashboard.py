@@ -12,7 +12,8 @@ from utils.query import build_where_clause, detect_fy_columns
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
-_summary_cache: TTLCache = TTLCache(maxsize=32, ttl_seconds=900)
+# OPT-GEN-001: No TTL — entries are dropped when the data generation changes.
+_summary_cache: TTLCache = TTLCache(maxsize=32, ttl_seconds=None, namespace="dashboard_summary")
 
 
 @router.post("/cache-clear", summary="Clear dashboard cache (dev)")
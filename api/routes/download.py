@@ -4,18 +4,25 @@ GET /api/v1/download endpoint (Step 2.C4-a).
 Streams large result sets as CSV, JSON, or Excel without loading everything
 into memory. Accepts the same filter parameters as /budget-lines.
 
-DL-001: Excel (.xlsx) export via openpyxl write_only mode.
+DL-001: Excel (.xlsx) export via xlsxwriter constant_memory mode.
 DL-002: Keyword search filter (q) for FTS-filtered downloads.
 DL-003: X-Total-Count header for client progress tracking.
 OPT-DL-001: Uses shared WHERE builder from utils/query.py.
+OPT-XLSX-002: Excel exports are produced on a worker thread and streamed
+while the file is written; the COUNT(*) behind X-Total-Count is optional.
 """
 
 import csv
 import io
 import json
+import logging
+import queue
+import shutil
 import sqlite3
+import tempfile
+import threading
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable, Iterator
 
 from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import StreamingResponse
@@ -23,7 +30,9 @@ from fastapi.responses import StreamingResponse
 from api.database import get_db
 from api.models import FilterParams
 from utils import sanitize_fts5_query
-from utils.query import ALLOWED_SORT_COLUMNS, build_where_clause
+from utils.query import ALLOWED_SORT_COLUMNS, build_where_clause, probe_fts_match
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/download", tags=["download"])
 
@@ -103,6 +112,100 @@ def _iter_rows(conn: sqlite3.Connection, sql: str, params: list[Any]):
         yield from batch
 
 
+class _ExportCancelled(Exception):
+    """Raised on the export worker once the client has gone away."""
+
+
+class _ChunkPipe:
+    """Write-only, non-seekable file object feeding a bounded chunk queue.
+
+    OPT-XLSX-002: the export worker writes the XLSX zip stream into the pipe
+    while the response iterates :meth:`chunks`.  At most ``max_chunks`` full
+    chunks are buffered; a producer that gets ahead blocks until the client
+    catches up, and raises :class:`_ExportCancelled` once the consumer stops.
+    zipfile writes data descriptors when ``tell()``/``seek()`` are missing.
+    """
+
+    _EOF = object()
+
+    def __init__(self, chunk_size: int = 64 * 1024, max_chunks: int = 16) -> None:
+        self.chunk_size = chunk_size
+        self.cancelled = threading.Event()
+        self._queue: queue.Queue = queue.Queue(maxsize=max_chunks)
+        self._buf = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self._buf += data
+        if len(self._buf) >= self.chunk_size:
+            self._put(bytes(self._buf))
+            self._buf.clear()
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def check(self) -> None:
+        """Raise _ExportCancelled if the consumer has stopped reading."""
+        if self.cancelled.is_set():
+            raise _ExportCancelled()
+
+    def _put(self, item: Any) -> None:
+        while True:
+            self.check()
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def finish(self, error: BaseException | None = None) -> None:
+        """Flush buffered bytes and signal end of stream (or ``error``)."""
+        if error is None and self._buf:
+            self._put(bytes(self._buf))
+            self._buf.clear()
+        self._put(error if error is not None else self._EOF)
+
+    def chunks(self) -> Iterator[bytes]:
+        while True:
+            item = self._queue.get()
+            if item is self._EOF:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+
+def _stream_from_worker(produce: Callable[[_ChunkPipe], None]) -> Iterator[bytes]:
+    """Run ``produce(pipe)`` on a worker thread and yield what it writes.
+
+    The worker starts when the response begins iterating.  If the client
+    disconnects, the pipe is cancelled and the worker is joined before the
+    request's DB connection goes back to the pool.
+    """
+    pipe = _ChunkPipe()
+
+    def run() -> None:
+        try:
+            produce(pipe)
+            pipe.finish()
+        except _ExportCancelled:
+            pass
+        except Exception as exc:
+            logger.exception("Streamed export failed")
+            try:
+                pipe.finish(exc)
+            except _ExportCancelled:
+                pass
+
+    worker = threading.Thread(target=run, name="download-export", daemon=True)
+    worker.start()
+    try:
+        yield from pipe.chunks()
+    finally:
+        pipe.cancelled.set()
+        worker.join()
+
+
 def _build_download_sql(
     filters: FilterParams,
     conn: sqlite3.Connection,
@@ -110,31 +213,35 @@ def _build_download_sql(
     export_cols: list[str],
     sort_by: str = "id",
     sort_dir: str = "asc",
-) -> tuple[str, list[Any], int]:
+    count: bool = True,
+) -> tuple[str, list[Any], int | None]:
     """Build the download SQL with all filters applied.
 
+    ``count=False`` skips the COUNT(*) query (OPT-XLSX-002).
+
     Returns:
-        (sql, params, total_count)
+        (sql, params, total_count) — total_count is None when not counted
     """
-    # DL-002: Handle FTS keyword filter
+    # DL-002: Handle FTS keyword filter (OPT-FTS-001: as a subquery)
+    fts_match: str | None = None
     fts_ids: list[int] | None = None
     if filters.q and filters.q.strip():
-        try:
-            safe_q = sanitize_fts5_query(filters.q.strip())
-            fts_rows = conn.execute(
-                "SELECT rowid FROM budget_lines_fts WHERE budget_lines_fts MATCH ?",
-                (safe_q,),
-            ).fetchall()
-            fts_ids = [r[0] for r in fts_rows]
-        except (sqlite3.OperationalError, sqlite3.DatabaseError):
+        safe_q = sanitize_fts5_query(filters.q.strip())
+        if safe_q and probe_fts_match(conn, safe_q):
+            fts_match = safe_q
+        else:
             fts_ids = []
 
     # OPT-DL-001: Use shared WHERE builder
-    where, params = build_where_clause(**filters.where_kwargs(fts_ids=fts_ids))
+    where, params = build_where_clause(
+        **filters.where_kwargs(fts_ids=fts_ids, fts_match=fts_match)
+    )
 
     # DL-003: Count first for X-Total-Count header
-    count_sql = f"SELECT COUNT(*) FROM budget_lines {where}"
-    total = conn.execute(count_sql, params).fetchone()[0]
+    total: int | None = None
+    if count:
+        count_sql = f"SELECT COUNT(*) FROM budget_lines {where}"
+        total = conn.execute(count_sql, params).fetchone()[0]
 
     col_list = ", ".join(_render_col(c, conn) for c in export_cols)
     sort_col = sort_by if sort_by in ALLOWED_SORT_COLUMNS else "id"
@@ -168,6 +275,11 @@ def download(
     columns: list[str] | None = Query(
         None, description="FE-011: Subset of columns to export"
     ),
+    count: bool = Query(
+        True,
+        description="Count matching rows for X-Total-Count (false skips the "
+        "COUNT(*) query and omits the header)",
+    ),
     conn: sqlite3.Connection = Depends(get_db),
 ) -> StreamingResponse:
     """Stream budget line items as CSV, JSON (newline-delimited), or Excel."""
@@ -177,6 +289,7 @@ def download(
     ) or _DOWNLOAD_COLUMNS
 
     # FIX-017: If item_id is specified, download just that single row
+    total_count: int | None
     if item_id is not None:
         col_list = ", ".join(_render_col(c, conn) for c in export_cols)
         sql = f"SELECT {col_list} FROM budget_lines WHERE id = ?"
@@ -190,10 +303,13 @@ def download(
             export_cols=export_cols,
             sort_by=sort_by,
             sort_dir=sort_dir,
+            count=count,
         )
 
     # DL-003: X-Total-Count header
-    extra_headers: dict[str, str] = {"X-Total-Count": str(total_count)}
+    extra_headers: dict[str, str] = {}
+    if total_count is not None:
+        extra_headers["X-Total-Count"] = str(total_count)
 
     # EAGLE-6: Source attribution metadata
     export_date = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -232,7 +348,9 @@ def download(
             writer_raw.writerow([f"# Export Date: {export_date}"])
             writer_raw.writerow([f"# Filters: {filter_summary}"])
             writer_raw.writerow([f"# URL: {export_url}"])
-            writer_raw.writerow([f"# Total Records: {total_count}"])
+            writer_raw.writerow(
+                [f"# Total Records: {total_count if total_count is not None else 'not counted'}"]
+            )
             yield buf.getvalue()
             buf.seek(0)
             buf.truncate()
@@ -255,34 +373,51 @@ def download(
         )
 
     if fmt == "xlsx":
-        # DL-001/JS-001: Excel export using openpyxl write_only mode
-        import openpyxl
-
-        def xlsx_bytes() -> bytes:
-            wb = openpyxl.Workbook(write_only=True)
-            # EAGLE-6: Metadata sheet with source attribution
-            meta_ws = wb.create_sheet("Metadata")
-            meta_ws.append(["Source", "DoD Budget Explorer"])
-            meta_ws.append(["Export Date", export_date])
-            meta_ws.append(["Filters", filter_summary])
-            meta_ws.append(["URL", export_url])
-            meta_ws.append(["Total Records", total_count])
-            # Data sheet
-            ws = wb.create_sheet("Budget Lines")
-            ws.append(export_cols)  # header row (FE-011: respects column subset)
-            for row in _iter_rows(conn, sql, params):
-                ws.append(list(row))
-            buf = io.BytesIO()
-            wb.save(buf)
-            return buf.getvalue()
+        # DL-001/JS-001: Excel export.  OPT-XLSX-002: xlsxwriter constant_memory
+        # flushes each row to a temp file (inline strings, no shared-string
+        # table) and the zip is streamed out of a worker thread as it is
+        # assembled, so memory stays bounded whatever the limit.
+        import xlsxwriter
+
+        def write_xlsx(pipe: _ChunkPipe) -> None:
+            tmpdir = tempfile.mkdtemp(prefix="dl_xlsx_")
+            try:
+                wb = xlsxwriter.Workbook(
+                    pipe,
+                    {
+                        "constant_memory": True,
+                        "tmpdir": tmpdir,
+                        "strings_to_formulas": False,
+                        "strings_to_urls": False,
+                    },
+                )
+                # EAGLE-6: Metadata sheet with source attribution
+                meta_ws = wb.add_worksheet("Metadata")
+                for r, meta_row in enumerate([
+                    ["Source", "DoD Budget Explorer"],
+                    ["Export Date", export_date],
+                    ["Filters", filter_summary],
+                    ["URL", export_url],
+                    ["Total Records",
+                     total_count if total_count is not None else "not counted"],
+                ]):
+                    meta_ws.write_row(r, 0, meta_row)
+                # Data sheet
+                ws = wb.add_worksheet("Budget Lines")
+                ws.write_row(0, 0, export_cols)  # FE-011: respects column subset
+                for r, row in enumerate(_iter_rows(conn, sql, params), start=1):
+                    if r % 500 == 0:
+                        pipe.check()
+                    ws.write_row(r, 0, row)
+                wb.close()
+            finally:
+                shutil.rmtree(tmpdir, ignore_errors=True)
 
-        content = xlsx_bytes()
         return StreamingResponse(
-            iter([content]),
+            _stream_from_worker(write_xlsx),
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={
                 "Content-Disposition": "attachment; filename=budget_lines.xlsx",
-                "Content-Length": str(len(content)),
                 **extra_headers,
             },
         )
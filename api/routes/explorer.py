@@ -16,18 +16,21 @@ Endpoints:
 from __future__ import annotations
 
 import hashlib
+import itertools
 import json
 import logging
+import os
 import re
 import sqlite3
+import tempfile
 import threading
 import time
-from typing import Any
+from typing import Any, Iterator
 
 from fastapi import APIRouter, BackgroundTasks, Body, Depends, Query
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 
-from api.database import get_db
+from api.database import get_db, get_db_rw
 from api.routes.keyword_helpers import FY_END, FY_START, find_matched_keywords
 from utils.config import R2_TYPES
 from api.routes.keyword_search import (
@@ -36,7 +39,7 @@ from api.routes.keyword_search import (
     load_per_fy_descriptions,
     lookup_cache_description,
 )
-from api.routes.keyword_xlsx import build_keyword_xlsx
+from api.routes.keyword_xlsx import iter_file_chunks, write_keyword_xlsx
 from utils.config import EXHIBIT_R1
 from utils.fuzzy_match import expand_keywords
 
@@ -96,6 +99,25 @@ _build_lock = threading.Lock()
 _build_progress: dict[str, dict[str, Any]] = {}
 _PROGRESS_TTL_SECONDS = 24 * 3600  # evict finished entries after 24 hours
 
+# ── XLSX export limits ───────────────────────────────────────────────────────
+
+# OPT-XLSX-001: exports are written to a spooled temp file (RAM up to
+# _XLSX_SPOOL_MAX_BYTES, then disk) and streamed back in chunks.  Building
+# still holds the cache rows and description maps, and the spool lives until
+# the download finishes, so concurrent exports per worker process (build and
+# stream) are capped and excess requests get 503 + Retry-After.
+_XLSX_EXPORT_CONCURRENCY = int(os.getenv("APP_XLSX_EXPORT_CONCURRENCY", "2"))
+_XLSX_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+_xlsx_export_slots = threading.BoundedSemaphore(_XLSX_EXPORT_CONCURRENCY)
+
+
+def _stream_export(spool: Any) -> Iterator[bytes]:
+    """Stream a finished export, keeping its slot until the stream closes."""
+    try:
+        yield from iter_file_chunks(spool)
+    finally:
+        _xlsx_export_slots.release()
+
 # ── Fixed columns for XLSX export ─────────────────────────────────────────────
 
 _FIXED_COLUMNS: list[tuple[str, str]] = [
@@ -324,7 +346,7 @@ def start_build(
     keywords: str = Query(..., description="Comma-separated keywords"),
     extra_pes: str = Query("", description="Comma-separated PE numbers to force-include"),
     background_tasks: BackgroundTasks = BackgroundTasks(),
-    conn: sqlite3.Connection = Depends(get_db),
+    conn: sqlite3.Connection = Depends(get_db_rw),
 ) -> dict:
     """Kick off a background cache build and return immediately."""
     try:
@@ -405,7 +427,7 @@ def start_build(
 def build_status(
     keywords: str = Query(..., description="Comma-separated keywords"),
     extra_pes: str = Query("", description="Comma-separated PE numbers (must match build call)"),
-    conn: sqlite3.Connection = Depends(get_db),
+    conn: sqlite3.Connection = Depends(get_db_rw),
 ) -> dict:
     """Return current build state for a keyword set.
 
@@ -560,6 +582,7 @@ def download_explorer_xlsx(
     """Generate XLSX with fixed columns, optional sub-columns, and user-selected fiscal years.
 
     Uses a fixed column layout. Y/N/P is computed per line per FY.
+    The workbook is streamed from a spooled temp file (OPT-XLSX-001).
     """
     try:
         keyword_list, pe_list, kw_id = _resolve_keyword_set(keywords, extra_pes)
@@ -570,97 +593,126 @@ def download_explorer_xlsx(
             status_code=400,
         )
 
-    cache_table = _cache_table_name(kw_id)
-
+    if not _xlsx_export_slots.acquire(blocking=False):
+        return Response(
+            content=b"Too many XLSX exports in progress; retry shortly",
+            media_type="text/plain",
+            status_code=503,
+            headers={"Retry-After": "5"},
+        )
+    # Once the workbook is built the slot passes to the response stream
+    handed_off = False
     try:
-        sql = f"SELECT * FROM {cache_table} ORDER BY pe_number, exhibit_type, line_item_title"
-        raw_rows = conn.execute(sql).fetchall()
-    except sqlite3.OperationalError:
-        return Response(content=b"Cache not built", media_type="text/plain", status_code=400)
+        cache_table = _cache_table_name(kw_id)
 
-    items = cache_rows_to_dicts(raw_rows)
+        try:
+            sql = f"SELECT * FROM {cache_table} ORDER BY pe_number, exhibit_type, line_item_title"
+            cursor = conn.execute(sql)
+        except sqlite3.OperationalError:
+            return Response(content=b"Cache not built", media_type="text/plain", status_code=400)
 
-    if matching_only:
-        items = [
-            r for r in items
-            if r.get("matched_keywords_row")
-        ]
+        items = cache_rows_to_dicts(cursor)
 
-    if not items:
-        return Response(content=b"No rows to export", media_type="text/plain", status_code=400)
+        if matching_only:
+            items = [
+                r for r in items
+                if r.get("matched_keywords_row")
+            ]
 
-    year_range = list(range(FY_START, FY_END + 1))
-    active_years = [
-        yr for yr in year_range
-        if any(r.get(f"fy{yr}") is not None for r in items)
-    ]
+        if not items:
+            return Response(content=b"No rows to export", media_type="text/plain", status_code=400)
 
-    # Filter to user-selected fiscal years (if specified)
-    if fiscal_years and fiscal_years.strip():
-        requested_fys = set()
-        for fy in fiscal_years.split(","):
-            fy = fy.strip()
-            try:
-                requested_fys.add(int(fy))
-            except ValueError:
-                pass
-        if requested_fys:
-            active_years = [yr for yr in active_years if yr in requested_fys]
-
-    desc_by_pe_fy = load_per_fy_descriptions(
-        conn, {r.get("pe_number", "") for r in items}
-    )
-
-    # Per-FY description keyword matching
-    fy_desc_kws: dict[tuple[str, str], list[str]] = {}
-    for (pe, fy), desc_text in desc_by_pe_fy.items():
-        kws = find_matched_keywords([desc_text], keyword_list)
-        if kws:
-            fy_desc_kws[(pe, fy)] = kws
-
-    # Precompute PEs that have at least one per-FY description keyword match (O(1) lookup)
-    pes_with_desc_match = {pe for pe, _fy in fy_desc_kws}
-
-    # Determine which PEs have ANY keyword match.
-    # matched_keywords_desc is PE-level (too broad for inclusion filtering);
-    # only row-level title hits and per-FY description hits count.
-    # Extra PEs are always included (user explicitly requested them).
-    pes_with_match: set[str] = set(pe_list) if pe_list else set()
-    pe_has_r2_match: set[str] = set()
-    for r in items:
-        pe = r.get("pe_number", "")
-        has_row_match = bool(r.get("matched_keywords_row"))
-        if has_row_match or pe in pes_with_desc_match:
-            pes_with_match.add(pe)
-            if r.get("exhibit_type") in R2_TYPES:
-                pe_has_r2_match.add(pe)
-
-    # Filter out PEs with zero matches in all rows and all FY descriptions
-    items = [r for r in items if r.get("pe_number", "") in pes_with_match]
-
-    if not items:
-        return Response(content=b"No matching rows to export", media_type="text/plain", status_code=400)
-
-    xlsx_bytes = build_keyword_xlsx(
-        items=items,
-        active_years=active_years,
-        desc_by_pe_fy=desc_by_pe_fy,
-        fy_desc_kws=fy_desc_kws,
-        pe_has_r2_match=pe_has_r2_match,
-        fixed_columns=list(_FIXED_COLUMNS),
-        include_source=include_source,
-        include_description=include_description,
-        include_intotal=include_intotal,
-        include_desc_keywords=include_desc_keywords,
-        sheet_title="Explorer",
-        keywords=keyword_list,
-    )
-
-    return Response(
-        content=xlsx_bytes,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": f'attachment; filename="explorer_{time.strftime("%Y%m%d_%H%M%S")}.xlsx"'},
-    )
+        year_range = list(range(FY_START, FY_END + 1))
+        active_years = [
+            yr for yr in year_range
+            if any(r.get(f"fy{yr}") is not None for r in items)
+        ]
+
+        # Filter to user-selected fiscal years (if specified)
+        if fiscal_years and fiscal_years.strip():
+            requested_fys = set()
+            for fy in fiscal_years.split(","):
+                fy = fy.strip()
+                try:
+                    requested_fys.add(int(fy))
+                except ValueError:
+                    pass
+            if requested_fys:
+                active_years = [yr for yr in active_years if yr in requested_fys]
+
+        desc_by_pe_fy = load_per_fy_descriptions(
+            conn, {r.get("pe_number", "") for r in items}
+        )
+
+        # Per-FY description keyword matching
+        fy_desc_kws: dict[tuple[str, str], list[str]] = {}
+        for (pe, fy), desc_text in desc_by_pe_fy.items():
+            kws = find_matched_keywords([desc_text], keyword_list)
+            if kws:
+                fy_desc_kws[(pe, fy)] = kws
+
+        # Precompute PEs that have at least one per-FY description keyword match (O(1) lookup)
+        pes_with_desc_match = {pe for pe, _fy in fy_desc_kws}
+
+        # Determine which PEs have ANY keyword match.
+        # matched_keywords_desc is PE-level (too broad for inclusion filtering);
+        # only row-level title hits and per-FY description hits count.
+        # Extra PEs are always included (user explicitly requested them).
+        pes_with_match: set[str] = set(pe_list) if pe_list else set()
+        pe_has_r2_match: set[str] = set()
+        for r in items:
+            pe = r.get("pe_number", "")
+            has_row_match = bool(r.get("matched_keywords_row"))
+            if has_row_match or pe in pes_with_desc_match:
+                pes_with_match.add(pe)
+                if r.get("exhibit_type") in R2_TYPES:
+                    pe_has_r2_match.add(pe)
+
+        # Filter out PEs with zero matches in all rows and all FY descriptions
+        items = [r for r in items if r.get("pe_number", "") in pes_with_match]
+
+        if not items:
+            return Response(content=b"No matching rows to export", media_type="text/plain", status_code=400)
+
+        spool = tempfile.SpooledTemporaryFile(max_size=_XLSX_SPOOL_MAX_BYTES)
+        try:
+            write_keyword_xlsx(
+                spool,
+                items=items,
+                active_years=active_years,
+                desc_by_pe_fy=desc_by_pe_fy,
+                fy_desc_kws=fy_desc_kws,
+                pe_has_r2_match=pe_has_r2_match,
+                fixed_columns=list(_FIXED_COLUMNS),
+                include_source=include_source,
+                include_description=include_description,
+                include_intotal=include_intotal,
+                include_desc_keywords=include_desc_keywords,
+                sheet_title="Explorer",
+                keywords=keyword_list,
+                constant_memory=True,
+            )
+            size = spool.seek(0, os.SEEK_END)
+        except Exception:
+            spool.close()
+            raise
+
+        body = _stream_export(spool)
+        # Start the generator so that, from here on, closing or discarding
+        # it (e.g. on client disconnect) runs its finally and frees the slot.
+        first = next(body, b"")
+        handed_off = True
+        return StreamingResponse(
+            itertools.chain([first], body),
+            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            headers={
+                "Content-Disposition": f'attachment; filename="explorer_{time.strftime("%Y%m%d_%H%M%S")}.xlsx"',
+                "Content-Length": str(size),
+            },
+        )
+    finally:
+        if not handed_off:
+            _xlsx_export_slots.release()
 
 
 # ── GET /api/v1/explorer/presets ──────────────────────────────────────────────
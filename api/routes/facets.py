@@ -18,7 +18,10 @@ from utils.query import add_in_condition
 
 router = APIRouter(prefix="/facets", tags=["facets"])
 
-_facets_cache: TTLCache = TTLCache(maxsize=64, ttl_seconds=300)
+# OPT-CACHE-002: O(1) LRU eviction makes a large facet-combination cache cheap.
+# OPT-GEN-001: No TTL — entries are dropped when the data generation changes.
+_facets_cache: TTLCache = TTLCache(maxsize=4096, ttl_seconds=None, namespace="facets",
+                                   max_bytes=32 * 1024 * 1024)
 
 
 def _build_conditions(
@@ -28,10 +28,17 @@ from pipeline.builder import EXHIBIT_TYPES as _EXHIBIT_TYPE_NAMES
 from utils.cache import TTLCache
 from utils.query import (
     ALLOWED_SORT_COLUMNS,
+    FTS_MATCH_CONDITION,
     _AMOUNT_COL_RE,
+    build_keyset_condition,
     build_where_clause,
+    cached_count,
+    decode_cursor,
+    encode_cursor,
+    fetch_with_has_more,
     make_placeholders,
     parse_json,
+    probe_fts_match,
     validate_amount_column,
     FISCAL_YEAR_COLUMN_LABELS,
     DEFAULT_AMOUNT_COLUMN,
@@ -74,10 +81,12 @@ def register_error_handlers(app: Any) -> None:
 # Templates instance is set by create_app() after mounting.
 _templates: Jinja2Templates | None = None
 
-# OPT-FE-002: TTL caches for reference data (5-minute TTL)
-_services_cache: TTLCache = TTLCache(maxsize=4, ttl_seconds=300)
-_exhibit_types_cache: TTLCache = TTLCache(maxsize=4, ttl_seconds=300)
-_fiscal_years_cache: TTLCache = TTLCache(maxsize=4, ttl_seconds=300)
+# OPT-FE-002: Caches for reference data
+# OPT-CACHE-001: Namespaced so they can be shared across workers.
+# OPT-GEN-001: No TTL — entries are dropped when the data generation changes.
+_services_cache: TTLCache = TTLCache(maxsize=4, ttl_seconds=None, namespace="fe_services")
+_exhibit_types_cache: TTLCache = TTLCache(maxsize=4, ttl_seconds=None, namespace="fe_exhibit_types")
+_fiscal_years_cache: TTLCache = TTLCache(maxsize=4, ttl_seconds=None, namespace="fe_fiscal_years")
 
 
 def _format_fy(value: str | None) -> str:
@@ -129,7 +138,7 @@ def _get_services(conn: sqlite3.Connection) -> list[dict]:
     creating duplicates. Now uses only actual values from budget_lines, with a
     LEFT JOIN to services_agencies for display names where available.
     """
-    cache_key = ("services", id(conn))
+    cache_key = ("services",)
     cached = _services_cache.get(cache_key)
     if cached is not None:
         return cached
@@ -160,7 +169,7 @@ def _get_services(conn: sqlite3.Connection) -> list[dict]:
 
 
 def _get_exhibit_types(conn: sqlite3.Connection) -> list[dict]:
-    cache_key = ("exhibit_types", id(conn))
+    cache_key = ("exhibit_types",)
     cached = _exhibit_types_cache.get(cache_key)
     if cached is not None:
         return cached
@@ -201,7 +210,7 @@ def _get_fiscal_years(conn: sqlite3.Connection) -> list[dict]:
     'Emergency Disaster Relief Act' from parsing errors. Only return values
     that look like valid fiscal years (4-digit numbers or 'FYxxxx' patterns).
     """
-    cache_key = ("fiscal_years", id(conn))
+    cache_key = ("fiscal_years",)
     cached = _fiscal_years_cache.get(cache_key)
     if cached is not None:
         return cached
@@ -276,6 +285,8 @@ def _parse_filters(request: Request) -> dict[str, Any]:
         "sort_by":           params.get("sort_by", "id"),
         "sort_dir":          params.get("sort_dir", "asc"),
         "page":              max(1, _safe_int(params.get("page", "1"), 1)),
+        # OPT-PAGE-001: keyset cursor carried by the "Next" button
+        "cursor":            params.get("cursor", ""),
         # EAGLE-4: Expanded page size cap from 100 to 200
         "page_size":         min(200, max(10, _safe_int(params.get("page_size", "25"), 25))),
     }
@@ -299,7 +310,6 @@ def _query_results(
     sort_dir  = "DESC" if filters["sort_dir"] == "desc" else "ASC"
     page      = filters["page"]
     page_size = page_size or filters.get("page_size", 25)
-    offset    = (page - 1) * page_size
 
     # EAGLE-1: Parse amount filter values with dynamic column support
     min_amt_val = None
@@ -392,42 +402,46 @@ def _query_results(
             where = f"{where} {connector} {cond}"
         params = list(params) + extra_field_params
 
-    # Apply keyword filter against FTS if provided
-    fts_ids: list[int] | None = None
+    # Apply keyword filter against FTS if provided.
+    # OPT-FTS-001: Probe for a hit, then filter with a MATCH subquery rather
+    # than binding every matching rowid.
     if fts_terms:
         try:
             safe_q = sanitize_fts5_query(fts_terms)
         except Exception:
             safe_q = fts_terms.replace('"', '""')
-        try:
-            fts_rows = conn.execute(
-                "SELECT rowid FROM budget_lines_fts WHERE budget_lines_fts MATCH ?",
-                (safe_q,),
-            ).fetchall()
-            fts_ids = [r[0] for r in fts_rows]
-        except Exception:
-            fts_ids = []
-
-    if fts_ids is not None:
-        if not fts_ids:
+        if not probe_fts_match(conn, safe_q):
             return {
                 "items": [], "total": 0, "page": page,
                 "total_pages": 0, "sort_by": sort_by.lower(),
                 "sort_dir": filters["sort_dir"],
                 "parsed_query": parsed_query,
             }
-        id_placeholders = make_placeholders(fts_ids)
-        id_condition = f"id IN ({id_placeholders})"
-        if where:
-            where = where + f" AND {id_condition}"
-            params = params + fts_ids
-        else:
-            where = f"WHERE {id_condition}"
-            params = fts_ids
+        connector = "AND" if where else "WHERE"
+        where = f"{where} {connector} {FTS_MATCH_CONDITION}"
+        params = list(params) + [safe_q]
 
-    total = conn.execute(f"SELECT COUNT(*) FROM budget_lines {where}", params).fetchone()[0]
+    # OPT-PAGE-001: Count is cached per filter set, so paging doesn't re-count.
+    total = cached_count(conn, "budget_lines", where, params)
     total_pages = max(1, (total + page_size - 1) // page_size)
     page = min(page, total_pages)
+    offset = (page - 1) * page_size
+
+    # OPT-PAGE-001: "Next" links carry a keyset cursor for the previous page's
+    # last row; seek past it instead of scanning OFFSET rows.  Stale or
+    # mismatched cursors fall back to offset paging.
+    page_where, page_params = where, list(params)
+    if filters.get("cursor") and page > 1:
+        try:
+            value, last_id = decode_cursor(filters["cursor"], sort_by, sort_dir)
+        except ValueError:
+            pass
+        else:
+            cond, cond_params = build_keyset_condition(sort_by, sort_dir, value, last_id)
+            connector = "AND" if page_where else "WHERE"
+            page_where = f"{page_where} {connector} {cond}"
+            page_params += cond_params
+            offset = 0
 
     # FIX-005: Added FY25 total and FY26 total columns.
     # FIX-007: Added source_file for source material links.
@@ -437,16 +451,25 @@ def _query_results(
         amount_cols = ["amount_fy2024_actual", "amount_fy2025_enacted", "amount_fy2025_total",
                        "amount_fy2026_request", "amount_fy2026_total"]
     amt_select = ", ".join(amount_cols)
-    rows = conn.execute(
+    select_cols = {"id", "exhibit_type", "fiscal_year", "account", "account_title",
+                   "organization_name", "pe_number", "source_file", *amount_cols}
+    if sort_by not in select_cols:
+        amt_select += f", {sort_by}"
+    order = f"{sort_by} {sort_dir}" + (f", id {sort_dir}" if sort_by != "id" else "")
+    cursor = conn.execute(
         f"SELECT id, exhibit_type, fiscal_year, account, account_title, "
         f"organization_name, budget_activity_title, line_item_title, pe_number, "
         f"{amt_select}, source_file "
-        f"FROM budget_lines {where} "
-        f"ORDER BY {sort_by} {sort_dir} LIMIT ? OFFSET ?",
-        params + [page_size, offset],
-    ).fetchall()
+        f"FROM budget_lines {page_where} "
+        f"ORDER BY {order} LIMIT ? OFFSET ?",
+        page_params + [page_size + 1, offset],
+    )
+    rows, has_more = fetch_with_has_more(cursor, page_size)
 
     items = [dict(r) for r in rows]
+    next_cursor = ""
+    if has_more and items:
+        next_cursor = encode_cursor(sort_by, sort_dir, items[-1].get(sort_by), items[-1]["id"])
 
     # ── Total program value from golden record (line_item_amounts) ─────────
     # Batch-query total value + FY range for PE numbers in current results.
@@ -489,6 +512,7 @@ def _query_results(
         "sort_by":     sort_by,
         "sort_dir":    filters["sort_dir"],
         "page_size":   page_size,
+        "next_cursor": next_cursor,
         # Issue #29: Pass dynamic amount columns to templates
         "amount_columns": amount_cols,
         # EAGLE-5: Parsed query structure for template display
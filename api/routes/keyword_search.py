@@ -10,7 +10,7 @@ import json
 import logging
 import sqlite3
 from itertools import groupby
-from typing import Any
+from typing import Any, Iterable
 
 from utils.config import EXHIBIT_R1, EXHIBIT_R2, R2_TYPES
 from utils.database import get_amount_columns
@@ -196,7 +196,7 @@ def lookup_cache_description(
 
 
 def cache_rows_to_dicts(
-    rows: list[sqlite3.Row],
+    rows: Iterable[sqlite3.Row],
     fy_start: int = FY_START,
     fy_end: int = FY_END,
 ) -> list[dict]:
@@ -257,7 +257,7 @@ def load_per_fy_descriptions(
         f"    WHEN section_header LIKE '%Acquisition Strategy%' THEN 3 "
         f"    ELSE 4 END",
         pe_params,
-    ).fetchall()
+    )
 
     result: dict[tuple[str, str], str] = {}
     for pe_num, fiscal_year, _section_header, description_text in rows:
@@ -1,13 +1,14 @@
 """XLSX workbook generation for keyword-search exports.
 
-Pure presentation layer — takes pre-built data structures and returns bytes.
+Pure presentation layer — takes pre-built data structures and returns bytes
+(or writes to a file for streamed exports).
 No database queries or cache-building logic.
 """
 
 from __future__ import annotations
 
 import time
-from typing import Any
+from typing import Any, Iterator
 
 from utils.query import parse_json_array
 
@@ -79,10 +80,21 @@ def _write_merged_fy_headers(
     sub_col_names: list[str],
     fmt_merge: Any,
     fmt_sub: Any,
+    split_fmts: tuple[Any, Any] | None = None,
 ) -> list[str]:
-    """Write two-row merged FY headers and return the flat header list."""
-    for ci, (h, _) in enumerate(fixed_columns):
-        ws.merge_range(0, ci, 1, ci, h, fmt_merge)
+    """Write two-row merged FY headers and return the flat header list.
+
+    OPT-XLSX-001: ``split_fmts`` (top, bottom) writes the headers strictly
+    row by row for constant_memory worksheets, which drop cells written
+    above an already-flushed row.  Fixed-column labels are then stacked
+    over a borderless blank instead of merged vertically.
+    """
+    if split_fmts is None:
+        for ci, (h, _) in enumerate(fixed_columns):
+            ws.merge_range(0, ci, 1, ci, h, fmt_merge)
+    else:
+        for ci, (h, _) in enumerate(fixed_columns):
+            ws.write(0, ci, h, split_fmts[0])
     col = fixed_count
     for yr in active_years:
         if len(sub_col_names) > 1:
@@ -91,6 +103,12 @@ def _write_merged_fy_headers(
             )
         else:
             ws.write(0, col, f"FY{yr} ($K)", fmt_merge)
+        col += len(sub_col_names)
+    if split_fmts is not None:
+        for ci in range(fixed_count):
+            ws.write_blank(1, ci, None, split_fmts[1])
+    col = fixed_count
+    for _yr in active_years:
         for si, sub in enumerate(sub_col_names):
             ws.write(1, col + si, sub, fmt_sub)
         col += len(sub_col_names)
@@ -202,6 +220,45 @@ def _apply_fy_conditional_formatting(
 
 
 def build_keyword_xlsx(
+    items: list[dict],
+    active_years: list[int],
+    desc_by_pe_fy: dict[tuple[str, str], str],
+    fixed_columns: list[tuple[str, str]],
+    **options: Any,
+) -> bytes:
+    """Build a keyword-search XLSX workbook and return it as bytes.
+
+    Thin in-memory wrapper around :func:`write_keyword_xlsx`; ``options``
+    are its keyword arguments.
+    """
+    import io
+
+    buf = io.BytesIO()
+    write_keyword_xlsx(
+        buf, items, active_years, desc_by_pe_fy, fixed_columns, **options
+    )
+    return buf.getvalue()
+
+
+def iter_file_chunks(fh: Any, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Yield a finished export file from the start in chunks, then close it.
+
+    OPT-XLSX-001: lets a route stream a spooled workbook instead of
+    materialising it as one bytes object.
+    """
+    try:
+        fh.seek(0)
+        while True:
+            chunk = fh.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        fh.close()
+
+
+def write_keyword_xlsx(
+    output: Any,
     items: list[dict],
     active_years: list[int],
     desc_by_pe_fy: dict[tuple[str, str], str],
@@ -215,14 +272,20 @@ def build_keyword_xlsx(
     keywords: list[str] | None = None,
     fy_desc_kws: dict[tuple[str, str], list[str]] | None = None,
     pe_has_r2_match: set[str] | None = None,
-) -> bytes:
-    """Build a keyword-search XLSX workbook and return it as bytes.
+    constant_memory: bool = False,
+    tmpdir: str | None = None,
+) -> None:
+    """Write a keyword-search XLSX workbook to ``output`` (path or file object).
 
     Uses xlsxwriter for proper Excel 365 dynamic array formula support.
     Y/N/P is computed per-FY based on description keyword matches.
-    """
-    import io
 
+    OPT-XLSX-001: with ``constant_memory`` the workbook is assembled through
+    temp files in ``tmpdir`` instead of RAM, and the data sheet — the only
+    one that grows with the result set — flushes each row as it is written.
+    The Selected, Summary and matrix sheets are small and write cells out of
+    row order, so they keep the regular in-memory cell table.
+    """
     import xlsxwriter
 
     sty = xlsx_base_styles()
@@ -282,9 +345,14 @@ def build_keyword_xlsx(
     intotal_letters = [fc.intotal_l for fc in fy_cols if fc.intotal_l]
 
     # ── Build workbook ──
-    buf = io.BytesIO()
-    wb = xlsxwriter.Workbook(buf, {"in_memory": True})
+    wb = xlsxwriter.Workbook(
+        output, {"in_memory": not constant_memory, "tmpdir": tmpdir}
+    )
+    # constant_memory is read per worksheet when it is added, so enabling it
+    # around the data sheet alone leaves the out-of-order sheets unaffected.
+    wb.constant_memory = constant_memory
     ws = wb.add_worksheet(sheet_title)
+    wb.constant_memory = False
 
     # Create all Format objects once (xlsxwriter formats are workbook-bound)
     fmt = {
@@ -303,17 +371,15 @@ def build_keyword_xlsx(
     }
 
     # ── Headers: two-row layout with merged FY cells ──
-    fmt_merge = wb.add_format(
-        {
-            "bold": True,
-            "font_size": 11,
-            "font_color": "#FFFFFF",
-            "bg_color": "#2C3E50",
-            "align": "center",
-            "valign": "vcenter",
-            "border": 1,
-        }
-    )
+    merge_props = {
+        "bold": True,
+        "font_size": 11,
+        "font_color": "#FFFFFF",
+        "bg_color": "#2C3E50",
+        "align": "center",
+        "border": 1,
+    }
+    fmt_merge = wb.add_format({**merge_props, "valign": "vcenter"})
     fmt_sub = wb.add_format(
         {
             "bold": True,
@@ -335,6 +401,13 @@ def build_keyword_xlsx(
     if include_desc_keywords:
         sub_col_names.append("Keywords")
 
+    split_fmts = None
+    if constant_memory:
+        split_fmts = (
+            wb.add_format({**merge_props, "valign": "bottom", "bottom": 0}),
+            wb.add_format({**merge_props, "top": 0}),
+        )
+
     headers = _write_merged_fy_headers(
         ws,
         fixed_columns,
@@ -343,6 +416,7 @@ def build_keyword_xlsx(
         sub_col_names,
         fmt_merge,
         fmt_sub,
+        split_fmts=split_fmts,
     )
 
     # ── Data rows (row_num is 1-based for formula references, data starts row 3) ──
@@ -449,14 +523,16 @@ def build_keyword_xlsx(
 
     # ── Totals rows ──
     if include_intotal and last_data_row >= first_data_row and active_years:
+        # Written row by row so constant_memory sheets keep every cell.
         y_row, p_row, grand_row = row_num, row_num + 1, row_num + 2
-        ws.write(y_row - 1, 0, "Y TOTALS", fmt["total"])
-        ws.write(p_row - 1, 0, "P TOTALS", fmt["total"])
-        ws.write(grand_row - 1, 0, "GRAND TOTAL", fmt["total"])
-        for fc in fy_cols:
-            val_rng = f"${fc.val_l}${first_data_row}:${fc.val_l}${last_data_row}"
-            it_rng = f"${fc.intotal_l}${first_data_row}:${fc.intotal_l}${last_data_row}"
-            for tr, label, criteria in [(y_row, "Y Sum", "Y"), (p_row, "P Sum", "P")]:
+        for tr, title, label, criteria in [
+            (y_row, "Y TOTALS", "Y Sum", "Y"),
+            (p_row, "P TOTALS", "P Sum", "P"),
+        ]:
+            ws.write(tr - 1, 0, title, fmt["total"])
+            for fc in fy_cols:
+                val_rng = f"${fc.val_l}${first_data_row}:${fc.val_l}${last_data_row}"
+                it_rng = f"${fc.intotal_l}${first_data_row}:${fc.intotal_l}${last_data_row}"
                 ws.write(tr - 1, fc.intotal - 1, label, fmt["total"])
                 ws.write_formula(
                     tr - 1,
@@ -464,6 +540,8 @@ def build_keyword_xlsx(
                     f'=SUMIF({it_rng},"{criteria}",{val_rng})',
                     fmt["total_money"],
                 )
+        ws.write(grand_row - 1, 0, "GRAND TOTAL", fmt["total"])
+        for fc in fy_cols:
             ws.write(grand_row - 1, fc.intotal - 1, "Grand Sum", fmt["total"])
             ws.write_formula(
                 grand_row - 1,
@@ -556,7 +634,6 @@ def build_keyword_xlsx(
         _build_keyword_matrix(wb, items, keywords, fmt)
 
     wb.close()
-    return buf.getvalue()
 
 
 def _build_xlsx_summary(
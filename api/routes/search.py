@@ -21,6 +21,7 @@ from api.models import FilterParams, SearchResponse, SearchResultItem
 from utils import sanitize_fts5_query
 from utils.formatting import extract_snippet_highlighted
 from utils.query import build_where_clause
+from utils.suggestions import query_suggestions
 
 logger = logging.getLogger(__name__)
 
@@ -562,11 +563,18 @@ def suggest(
     pe_index display_title for values matching the given prefix.
     Uses prefix match first; falls back to contains match if needed.
     PE entries include display_title for richer autocomplete display.
+
+    OPT-SUGGEST-001: Served from the enrichment-time suggestion index when
+    present; databases without it fall back to scanning the source tables.
     """
     prefix = q.strip()
     if not prefix:
         return []
 
+    indexed = query_suggestions(conn, prefix, limit)
+    if indexed is not None:
+        return indexed
+
     prefix_param = f"{prefix}%"
     contains_param = f"%{prefix}%"
     suggestions: list[dict] = []
@@ -65,7 +65,9 @@ from downloader.metadata import (
 # ---- Manifest ----
 from downloader.manifest import (
     _compute_sha256,
+    flush_manifest,
     load_manifest_ok_urls,
+    read_manifest,
     update_manifest_entry,
     write_manifest,
 )
@@ -145,7 +147,9 @@ __all__ = [
     "DETAIL_EXHIBIT_KEYS",
     # Manifest
     "_compute_sha256",
+    "flush_manifest",
     "load_manifest_ok_urls",
+    "read_manifest",
     "update_manifest_entry",
     "write_manifest",
     # Core / download
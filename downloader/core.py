@@ -30,6 +30,7 @@ from utils import format_bytes, elapsed
 from downloader.manifest import (
     _compute_sha256,
     _manifest,
+    flush_manifest,
     load_manifest_ok_urls,
     update_manifest_entry,
     write_manifest,
@@ -1061,6 +1062,7 @@ def download_all(
         browser_pool.shutdown(wait=True)
 
     # -- Phase 3: Summary and cleanup --
+    flush_manifest()
     summary = {
         "downloaded": _tracker.completed,
         "skipped": _tracker.skipped,
@@ -3,10 +3,18 @@ Manifest management for the DoD Budget Downloader.
 
 Tracks download status, file hashes, and enables incremental updates
 via the manifest.json file written alongside downloaded documents.
+
+OPT-DL-001: The manifest is journaled.  write_manifest() writes the full
+``manifest.json`` snapshot once; each update_manifest_entry() then appends a
+single JSON line to ``manifest.json.journal`` instead of rewriting the whole
+file.  The journal is folded back into the snapshot periodically (and by
+flush_manifest() at the end of a run).  read_manifest() replays any journal
+left behind by a crash, ignoring a torn final line.
 """
 
 import hashlib
 import json
+import os
 import threading
 from datetime import datetime, timezone
 from pathlib import Path
@@ -17,6 +25,136 @@ _manifest: dict = {}
 _manifest_path: Path | None = None
 _manifest_lock = threading.Lock()
 
+# OPT-DL-001: Journal state (guarded by _manifest_lock)
+_generated_at: str = ""
+_journal_fh = None
+_journal_lines = 0
+_compacting = False
+# Compact once the journal holds this many lines, or as many lines as the
+# manifest has entries, whichever is larger (keeps updates amortised O(1)).
+_JOURNAL_COMPACT_MIN = 1000
+
+
+def _journal_path(manifest_path: Path) -> Path:
+    """Return the append-only journal that accompanies *manifest_path*."""
+    return manifest_path.with_name(manifest_path.name + ".journal")
+
+
+def _rotated_journal_path(manifest_path: Path) -> Path:
+    """Return the journal segment being folded in by a running compaction."""
+    return manifest_path.with_name(manifest_path.name + ".journal.1")
+
+
+def _replay_journal(files: dict, journal: Path) -> int:
+    """Apply the updates recorded in *journal* to *files* in place.
+
+    A torn (partially written) last line from a crash is skipped.
+
+    Returns:
+        Number of updates applied.
+    """
+    if not journal.exists():
+        return 0
+    applied = 0
+    try:
+        with open(journal, encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    delta = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                entry = files.get(delta.pop("url", None))
+                if entry is not None:
+                    entry.update(delta)
+                    applied += 1
+    except OSError:
+        pass
+    return applied
+
+
+def read_manifest(manifest_path: Path) -> dict:
+    """Load a manifest snapshot and replay any journal written after it.
+
+    Returns:
+        The manifest dict (``{"generated_at": ..., "files": {...}}``), or an
+        empty dict if there is no readable snapshot.
+    """
+    if not manifest_path.exists():
+        return {}
+    try:
+        with open(manifest_path, encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (json.JSONDecodeError, OSError):
+        return {}
+    files = data.setdefault("files", {})
+    # Older segment first: later lines override earlier ones
+    _replay_journal(files, _rotated_journal_path(manifest_path))
+    _replay_journal(files, _journal_path(manifest_path))
+    return data
+
+
+def _write_snapshot(manifest_path: Path, generated_at: str, files: dict) -> None:
+    """Atomically replace the manifest.json snapshot."""
+    tmp = manifest_path.with_name(manifest_path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump({"generated_at": generated_at, "files": files}, fh, indent=2)
+    os.replace(tmp, manifest_path)
+
+
+def _close_journal() -> None:
+    """Close the open journal handle (caller holds _manifest_lock)."""
+    global _journal_fh
+    if _journal_fh is not None:
+        try:
+            _journal_fh.close()
+        except OSError:
+            pass
+        _journal_fh = None
+
+
+def _compact_journal() -> None:
+    """Fold the journal into the snapshot without blocking other updaters.
+
+    The journal is rotated and the entries copied under the lock; the
+    snapshot is serialised and written outside it, so download threads keep
+    appending to the fresh journal meanwhile.
+    """
+    global _journal_lines, _compacting
+    with _manifest_lock:
+        if _compacting or not _manifest_path:
+            return
+        _compacting = True
+        path = _manifest_path
+        _close_journal()
+        journal, rotated = _journal_path(path), _rotated_journal_path(path)
+        try:
+            if journal.exists():
+                os.replace(journal, rotated)
+        except OSError:
+            pass
+        _journal_lines = 0
+        files = {url: dict(entry) for url, entry in _manifest.items()}
+        generated_at = _generated_at
+    try:
+        _write_snapshot(path, generated_at, files)
+        rotated.unlink(missing_ok=True)
+    except OSError:
+        pass  # The rotated segment is replayed by read_manifest()
+    finally:
+        with _manifest_lock:
+            _compacting = False
+
+
+def flush_manifest() -> None:
+    """Fold the journal into manifest.json and close it.
+
+    Call once a download run is finished so the snapshot alone is complete
+    for readers that do not replay the journal.
+    """
+    _compact_journal()
+    with _manifest_lock:
+        _close_journal()
+
 
 def _compute_sha256(file_path: Path) -> str:
     """Compute the SHA-256 hex digest of a file.
@@ -44,13 +182,8 @@ def load_manifest_ok_urls(manifest_path: Path, since_date: str | None = None) ->
     Returns:
         Set of URL strings that should be skipped (already current).
     """
-    if not manifest_path.exists():
-        return set()
-    try:
-        with open(manifest_path, encoding="utf-8") as fh:
-            data = json.load(fh)
-        files = data.get("files", {})
-    except (json.JSONDecodeError, OSError):
+    files = read_manifest(manifest_path).get("files", {})
+    if not files:
         return set()
 
     cutoff = None
@@ -87,8 +220,7 @@ def write_manifest(output_dir: Path, all_files: dict, manifest_path: Path) -> No
     Each entry records: url, expected_filename, source, fiscal_year, extension.
     After downloading, call update_manifest_entry() to add status/size/hash.
     """
-    global _manifest, _manifest_path
-    _manifest_path = manifest_path
+    global _manifest_path, _generated_at, _journal_lines
 
     # Import metadata enrichment (lightweight, no heavy deps)
     from downloader.metadata import enrich_file_metadata, extract_fy_from_filename
@@ -124,37 +256,50 @@ def write_manifest(output_dir: Path, all_files: dict, manifest_path: Path) -> No
                     "detected_fy": extract_fy_from_filename(f["filename"]),
                 }
 
-    _manifest = entries
     manifest_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(manifest_path, "w", encoding="utf-8") as fh:
-        json.dump(
-            {"generated_at": datetime.now(timezone.utc).isoformat(), "files": entries},
-            fh, indent=2)
+    with _manifest_lock:
+        _close_journal()
+        # Mutate in place: downloader.core holds a reference to _manifest
+        _manifest.clear()
+        _manifest.update(entries)
+        _manifest_path = manifest_path
+        _generated_at = datetime.now(timezone.utc).isoformat()
+        _journal_lines = 0
+        _write_snapshot(manifest_path, _generated_at, entries)
+        for stale in (_journal_path(manifest_path),
+                      _rotated_journal_path(manifest_path)):
+            stale.unlink(missing_ok=True)
 
 
 def update_manifest_entry(url: str, status: str, file_size: int,
                           file_hash: str | None) -> None:
     """Update a manifest entry after a download attempt.
 
-    Writes the updated manifest to disk immediately so it survives crashes.
-    Thread-safe: serialised via ``_manifest_lock``.
+    OPT-DL-001: Appends one line to the manifest journal (flushed, so it
+    survives crashes) rather than rewriting manifest.json.  Thread-safe:
+    serialised via ``_manifest_lock``; the periodic compaction runs outside it.
     """
-    global _manifest, _manifest_path
+    global _journal_fh, _journal_lines
+    delta = {
+        "status": status,
+        "file_size": file_size,
+        "sha256": file_hash,
+        "downloaded_at": datetime.now(timezone.utc).isoformat(),
+    }
     with _manifest_lock:
         if not _manifest_path or url not in _manifest:
             return
-        _manifest[url].update({
-            "status": status,
-            "file_size": file_size,
-            "sha256": file_hash,
-            "downloaded_at": datetime.now(timezone.utc).isoformat(),
-        })
+        _manifest[url].update(delta)
         try:
-            with open(_manifest_path, "w", encoding="utf-8") as fh:
-                json.dump(
-                    {"generated_at": _manifest.get("_meta_generated_at", ""),
-                     "files": _manifest},
-                    fh, indent=2,
-                )
+            if _journal_fh is None:
+                _journal_fh = open(_journal_path(_manifest_path), "a",
+                                   encoding="utf-8")
+            _journal_fh.write(json.dumps({"url": url, **delta}) + "\n")
+            _journal_fh.flush()
+            _journal_lines += 1
         except OSError:
             pass  # Non-fatal: manifest update failures don't block downloads
+        compact = (not _compacting
+                   and _journal_lines >= max(_JOURNAL_COMPACT_MIN, len(_manifest)))
+    if compact:
+        _compact_journal()
@@ -16,24 +16,35 @@ import argparse
 import dataclasses
 import json
 from typing import Any
+import pickle
 import re
 import signal
 import sqlite3
 import sys
+import tempfile
 import time
 import uuid
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from concurrent.futures import (
-    ThreadPoolExecutor, ProcessPoolExecutor, TimeoutError as FuturesTimeoutError,
+    Executor, ThreadPoolExecutor, ProcessPoolExecutor, TimeoutError as FuturesTimeoutError,
     as_completed, wait, FIRST_COMPLETED,
 )
 import logging
 import os
 
-from utils import safe_float
+from utils import compute_file_hash, safe_float
 from utils.config import SUMMARY_EXHIBIT_KEYS, _SHORT_SUMMARY_KEYS
-from utils.database import init_pragmas, APPROP_TO_BUDGET_TYPE
+from utils.database import (
+    APPROP_TO_BUDGET_TYPE,
+    BUDGET_LINE_DEDUP_KEY,
+    bump_data_generation,
+    budget_line_fingerprint,
+    init_pragmas,
+    track_source_file_changes,
+)
+from utils.suggestions import refresh_suggestion_index
 from utils.query import make_placeholders
 from utils.normalization import (
     ORG_NORMALIZE as ORG_MAP,
@@ -85,19 +96,40 @@ from pipeline.schema import migrate as _schema_migrate  # noqa: E402
 # ~8x faster Excel reading.  The wrapper exposes the same iteration interface
 # that the rest of the builder expects: sheetnames, iter_rows(values_only=True).
 
+
+def _calamine_row(row: list) -> tuple:
+    """Convert one calamine row to an openpyxl-style tuple.
+
+    Calamine returns '' for empty cells; openpyxl returns None.  The
+    membership test runs in C, so fully populated rows skip the per-cell
+    comprehension entirely.
+    """
+    if "" in row:
+        return tuple([None if v == "" else v for v in row])
+    return tuple(row)
+
+
 class _CalamineSheet:
-    """Thin wrapper around a calamine sheet to match openpyxl iteration API."""
+    """Lazy wrapper around a calamine sheet to match openpyxl iteration API.
+
+    OPT-BUILD-003: Rows are streamed from calamine's row iterator instead of
+    materialising the whole sheet with ``to_python()``.  Callers read the
+    first few rows to sniff the header and abandon the generator for
+    irrelevant sheets, so those are never converted to Python objects.
+    """
 
-    __slots__ = ("_rows",)
+    __slots__ = ("_wb", "_name")
 
-    def __init__(self, rows: list[list]):
-        # Calamine returns '' for empty cells; openpyxl returns None.
-        # Normalize to None for compatibility with downstream code.
-        self._rows = rows
+    def __init__(self, wb, name: str):
+        self._wb = wb
+        self._name = name
 
     def iter_rows(self, values_only: bool = False):
-        for r in self._rows:
-            yield tuple(None if v == '' else v for v in r)
+        sheet = self._wb.get_sheet_by_name(self._name)
+        # iter_rows() arrived in python-calamine 0.2; older releases only
+        # offer the materialising to_python().
+        rows = sheet.iter_rows() if hasattr(sheet, "iter_rows") else sheet.to_python()
+        return map(_calamine_row, rows)
 
 
 class _CalamineWorkbook:
@@ -110,10 +142,12 @@ class _CalamineWorkbook:
         self.sheetnames = self._wb.sheet_names
 
     def __getitem__(self, name: str) -> _CalamineSheet:
-        return _CalamineSheet(self._wb.get_sheet_by_name(name).to_python())
+        return _CalamineSheet(self._wb, name)
 
     def close(self):
-        pass
+        close = getattr(self._wb, "close", None)
+        if close is not None:
+            close()
 
 
 def _open_xlsx(path: str):
@@ -318,6 +352,8 @@ def _migrate_add_columns(conn: sqlite3.Connection) -> None:
             ("cost_type", "TEXT"),
             ("cost_type_title", "TEXT"),
             ("add_non_add", "TEXT"),
+            # OPT-BUILD-004: ingest-time dedup fingerprint
+            ("row_fingerprint", "TEXT"),
         ],
         # Manifest metadata enrichment: capture download-time metadata
         "ingested_files": [
@@ -325,6 +361,8 @@ def _migrate_add_columns(conn: sqlite3.Connection) -> None:
             ("budget_cycle", "TEXT"),
             ("download_timestamp", "TEXT"),
             ("service_org", "TEXT"),
+            # OPT-BUILD-002: sha256 of the ingested bytes
+            ("content_hash", "TEXT"),
         ],
     }
 
@@ -458,8 +496,13 @@ def create_database(db_path: Path) -> sqlite3.Connection:
             -- Type of budget amounts in this row (Step 1.B3-c):
             -- "budget_authority" (default), "authorization" (C-1 MilCon),
             -- "appropriation", or "outlay"
-            amount_type TEXT DEFAULT 'budget_authority'
+            amount_type TEXT DEFAULT 'budget_authority',
+            -- OPT-BUILD-004: hash of the dedup key columns; unique, so a
+            -- duplicate line is rejected when it is inserted
+            row_fingerprint TEXT
         );
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_bl_fingerprint
+            ON budget_lines(row_fingerprint);
 
         -- Full-text search index for budget lines (Step 1.B4-a: pe_number added)
         CREATE VIRTUAL TABLE IF NOT EXISTS budget_lines_fts USING fts5(
@@ -562,7 +605,8 @@ def create_database(db_path: Path) -> sqlite3.Connection:
             exhibit_type TEXT,
             budget_cycle TEXT,
             download_timestamp TEXT,
-            service_org TEXT
+            service_org TEXT,
+            content_hash TEXT
         );
 
         -- Data source registry
@@ -725,6 +769,8 @@ def create_database(db_path: Path) -> sqlite3.Connection:
             applied_at   TEXT DEFAULT (datetime('now'))
         );
     """)
+    _create_fingerprint_trigger(conn)
+    track_source_file_changes(conn)
 
     # Seed reference tables with canonical data
     _seed_reference_tables(conn)
@@ -1166,37 +1212,61 @@ def _map_columns(headers: list, exhibit_type: str) -> dict:
     return mapping
 
 
+_HEADER_ANCHOR_WORDS = frozenset({"account", "pe", "program element"})
+
+
+def _sniff_header(rows_iter) -> tuple[int | None, list]:
+    """Find the header row within the first 5 rows of a sheet.
+
+    Anchor columns: "Account" for most exhibits, "PE"/"Program Element" for
+    R-2/R-3/R-4.  When found, one extra row is read for two-row header merge
+    detection.  Only the rows examined are pulled from *rows_iter*, so a
+    sheet without a header costs at most five rows (OPT-BUILD-003).
+
+    Returns:
+        (header_idx or None, rows read so far).
+    """
+    header_idx = None
+    first_rows = []
+    for i, row in enumerate(rows_iter):
+        first_rows.append(row)
+        if header_idx is not None:
+            # We already found the header; this extra row is for merge detection
+            break
+        if i >= 4:
+            break
+        for val in row:
+            if val and str(val).strip().lower() in _HEADER_ANCHOR_WORDS:
+                header_idx = i
+                break
+    return header_idx, first_rows
+
+
 def ingest_excel_file(conn: sqlite3.Connection, file_path: Path,
                       docs_dir: Path | None = None,
-                      ensure_columns: bool = True) -> int:
-    """Ingest a single Excel file into the database."""
+                      ensure_columns: bool = True,
+                      replace: bool = False) -> int:
+    """Ingest a single Excel file into the database.
+
+    With ``replace`` the file's existing budget_lines are diffed against the
+    new rows via _replace_budget_rows() instead of simply appended
+    (OPT-BUILD-002).
+
+    Returns the number of rows stored for the file, i.e. excluding rows
+    rejected as duplicates of a higher-priority line (OPT-BUILD-004).
+    """
     _docs_dir = (docs_dir or DOCS_DIR).resolve()
+    rel_path = str(file_path.relative_to(_docs_dir))
     wb = _open_xlsx(str(file_path))
     exhibit_type = _detect_exhibit_type(file_path.name)
     total_rows = 0
+    replace_groups: list[tuple[str, list]] = []
 
     for sheet_name in wb.sheetnames:
         ws = wb[sheet_name]
         rows_iter = ws.iter_rows(values_only=True)
 
-        # Find the header row in the first 5 rows (buffer to avoid full materialization).
-        # When found, read one extra row for two-row header merge detection.
-        # Anchor columns: "Account" for most exhibits, "PE"/"Program Element" for R-2/R-3/R-4.
-        _anchor_words = {"account", "pe", "program element"}
-        header_idx = None
-        first_rows = []
-        for i, row in enumerate(rows_iter):
-            first_rows.append(row)
-            if header_idx is not None:
-                # We already found the header; this extra row is for merge detection
-                break
-            if i >= 4:
-                break
-            for val in row:
-                if val and str(val).strip().lower() in _anchor_words:
-                    header_idx = i
-                    break
-
+        header_idx, first_rows = _sniff_header(rows_iter)
         if header_idx is None:
             continue
 
@@ -1346,7 +1416,7 @@ def ingest_excel_file(conn: sqlite3.Connection, file_path: Path,
             # Normalize dir_fy to bare 4-digit year for source_fiscal_year
             _source_fy = _normalize_fy_value(dir_fy) if dir_fy else None
             batch.append((
-                str(file_path.relative_to(_docs_dir)),
+                rel_path,
                 _source_fy,
                 exhibit_type,
                 sheet_name,
@@ -1375,6 +1445,10 @@ def ingest_excel_file(conn: sqlite3.Connection, file_path: Path,
                 amount_unit,   # Step 1.B3-b: normalised to "thousands"
                 row_budget_type,  # Step 1.B3-d: from exhibit type or appropriation code
                 amount_type,   # Step 1.B3-c: type of amounts (BA, authorization, etc.)
+                # OPT-BUILD-004: dedup fingerprint
+                budget_line_fingerprint(
+                    fiscal_year, pe_number, get_str(row, "line_item_title"),
+                    org_name, exhibit_type, amount_type, approp_code),
             ))
 
         if batch:
@@ -1391,18 +1465,18 @@ def ingest_excel_file(conn: sqlite3.Connection, file_path: Path,
             _tail_cols = (
                 "extra_fields, pe_number, currency_year, "
                 "appropriation_code, appropriation_title, "
-                "amount_unit, budget_type, amount_type"
+                "amount_unit, budget_type, amount_type, row_fingerprint"
             )
             all_cols = ", ".join(filter(None, [_fixed_cols, _fy_col_str, _tail_cols]))
-            n_params = len(all_cols.split(","))
-            placeholders = make_placeholders(n_params)
-            conn.executemany(
-                f"INSERT OR IGNORE INTO budget_lines ({all_cols}) VALUES ({placeholders})",
-                batch,
-            )
-            total_rows += len(batch)
+            if replace:
+                replace_groups.append((all_cols, batch))
+            else:
+                total_rows += _insert_budget_rows(conn, [(all_cols, batch)])[rel_path]
 
     wb.close()
+    if replace:
+        kept, inserted, _ = _replace_budget_rows(conn, rel_path, replace_groups)
+        total_rows = kept + inserted
     conn.commit()
     return total_rows
 
@@ -1420,7 +1494,7 @@ def _extract_excel_rows(args: tuple) -> dict:
 
     Returns:
         Dict with keys: relative_path, rows (list of tuples), columns (list of str),
-        error (str|None), exhibit_type (str).
+        error (str|None), exhibit_type (str), content_hash (str|None).
     """
     file_path_str, docs_dir_str = args
     file_path = Path(file_path_str)
@@ -1433,6 +1507,8 @@ def _extract_excel_rows(args: tuple) -> dict:
         "columns": [],
         "exhibit_type": exhibit_type,
         "error": None,
+        # OPT-BUILD-002: hashed here so the writer thread doesn't re-read it
+        "content_hash": _file_hash_or_none(file_path),
     }
 
     try:
@@ -1451,20 +1527,7 @@ def _extract_excel_rows(args: tuple) -> dict:
         ws = wb[sheet_name]
         rows_iter = ws.iter_rows(values_only=True)
 
-        _anchor_words = {"account", "pe", "program element"}
-        header_idx = None
-        first_rows = []
-        for i, row in enumerate(rows_iter):
-            first_rows.append(row)
-            if header_idx is not None:
-                break
-            if i >= 4:
-                break
-            for val in row:
-                if val and str(val).strip().lower() in _anchor_words:
-                    header_idx = i
-                    break
-
+        header_idx, first_rows = _sniff_header(rows_iter)
         if header_idx is None:
             continue
 
@@ -1588,6 +1651,11 @@ def _extract_excel_rows(args: tuple) -> dict:
                 json.dumps({"additional_pe_numbers": additional_pes}) if additional_pes else None,
                 pe_number, currency_year, approp_code, approp_title,
                 amount_unit, row_budget_type, amount_type,
+                # OPT-BUILD-004: hashed here so the worker, not the writer,
+                # pays for it
+                budget_line_fingerprint(
+                    fiscal_year, pe_number, line_item_title_val, org_name,
+                    exhibit_type, amount_type, approp_code),
             )
             _raw_rows.append((fixed, fy_dict, tail))
 
@@ -1968,21 +2036,189 @@ def ingest_pdf_file(conn: sqlite3.Connection, file_path: Path,
     return total_pages, len(issues_batch)
 
 
+# OPT-PDF-001: Page-range sharding of large PDFs.  Files of at least
+# _PDF_SHARD_MIN_BYTES are page-counted up front (from the page tree's
+# /Count, in the worker pool when one is given); those with more than
+# _PDF_SHARD_PAGES pages are split into page-range tasks so one giant
+# justification book is spread over the whole worker pool.
+_PDF_SHARD_PAGES = 150
+_PDF_SHARD_MIN_BYTES = 5 * 1024 * 1024
+
+# OPT-PDF-002: With a spill directory, PDF workers pickle extracted pages to
+# a per-task spill file in batches of this many pages instead of returning
+# them in the result dict, so worker and writer memory stay flat.
+_PDF_PAGE_BATCH = 64
+
+
+def _pdf_page_count(file_path: Path) -> int:
+    """Return the number of pages in *file_path*, or 0 if it cannot be read.
+
+    Reads /Count from the root of the page tree, so only the xref table and
+    catalog are parsed rather than every page object.
+    """
+    try:
+        from pdfminer.pdfdocument import PDFDocument
+        from pdfminer.pdfparser import PDFParser
+        from pdfminer.pdftypes import resolve1
+        with open(file_path, "rb") as fh:
+            doc = PDFDocument(PDFParser(fh))
+            return int(resolve1(resolve1(doc.catalog["Pages"])["Count"]))
+    except Exception:
+        return 0
+
+
+def _plan_pdf_tasks(
+    pdfs: list[Path],
+    shard_pages: int | None = None,
+    min_bytes: int | None = None,
+    executor: Executor | None = None,
+) -> list[tuple[Path, tuple[int, int] | None]]:
+    """Split *pdfs* into (pdf, page_range) extraction tasks.
+
+    OPT-PDF-001: page_range is a 0-based half-open (start, stop) tuple for
+    shards of a large PDF and None for a whole-file task.  Sharded files are
+    scheduled first (largest first) so they do not end up as the serial tail
+    of the build.  The thresholds default to the module constants.  With an
+    *executor*, the large files are page-counted in it.
+    """
+    if shard_pages is None:
+        shard_pages = _PDF_SHARD_PAGES
+    if min_bytes is None:
+        min_bytes = _PDF_SHARD_MIN_BYTES
+
+    def _is_big(pdf: Path) -> bool:
+        try:
+            return pdf.stat().st_size >= min_bytes
+        except OSError:
+            return False
+
+    big = [pdf for pdf in pdfs if _is_big(pdf)]
+    counts = executor.map(_pdf_page_count, big) if executor else map(_pdf_page_count, big)
+    page_counts = dict(zip(big, counts))
+    sharded: list[tuple[int, Path]] = []
+    whole: list[Path] = []
+    for pdf in pdfs:
+        n_pages = page_counts.get(pdf, 0)
+        if n_pages > shard_pages:
+            sharded.append((n_pages, pdf))
+        else:
+            whole.append(pdf)
+    tasks: list[tuple[Path, tuple[int, int] | None]] = []
+    for n_pages, pdf in sorted(sharded, key=lambda t: -t[0]):
+        for start in range(0, n_pages, shard_pages):
+            tasks.append((pdf, (start, min(start + shard_pages, n_pages))))
+    tasks.extend((pdf, None) for pdf in whole)
+    return tasks
+
+
+def _merge_pdf_shards(results: list[dict]) -> dict:
+    """Reassemble page-range results of one PDF into a whole-file result.
+
+    *results* may arrive in any order; pages, PE mentions and issues are
+    concatenated in page order.  If any shard failed the file is reported as
+    failed, matching the all-or-nothing behaviour of a whole-file task.
+    """
+    ordered = sorted(results, key=lambda r: (r.get("page_range") or (0, 0))[0])
+    first = ordered[0]
+    merged = {
+        "relative_path": first["relative_path"],
+        "category": first.get("category"),
+        "fiscal_year": first.get("fiscal_year"),
+        "pages_data": [],
+        "pe_mentions": [],
+        "issues": [],
+        "error": None,
+        "num_pages": max(r.get("num_pages", 0) for r in ordered),
+        "content_hash": first.get("content_hash"),
+    }
+    merged["pages_spill"] = []
+    merged["page_count"] = 0
+    for r in ordered:
+        merged["issues"].extend(r.get("issues", []))
+        if r.get("error") and merged["error"] is None:
+            merged["error"] = r["error"]
+        merged["pages_data"].extend(r.get("pages_data", []))
+        merged["pages_spill"].extend(r.get("pages_spill", []))
+        merged["page_count"] += _pdf_result_page_count(r)
+        merged["pe_mentions"].extend(r.get("pe_mentions", []))
+    if merged["error"]:
+        _discard_pdf_spill(merged)
+        merged["pages_data"] = []
+        merged["pe_mentions"] = []
+        merged["page_count"] = 0
+    return merged
+
+
+def _pdf_result_page_count(result: dict) -> int:
+    """Number of extracted pages in a result, whether in memory or spilled."""
+    return result.get("page_count", len(result.get("pages_data", [])))
+
+
+def iter_pdf_page_batches(result: dict):
+    """Yield lists of page tuples from an _extract_pdf_data() result.
+
+    OPT-PDF-002: In-memory ``pages_data`` comes first, then each spill file
+    in order, one pickled batch at a time.  Spill files are deleted once
+    read.
+    """
+    if result.get("pages_data"):
+        yield result["pages_data"]
+    for spill in result.get("pages_spill", []):
+        try:
+            with open(spill, "rb") as fh:
+                while True:
+                    try:
+                        yield pickle.load(fh)
+                    except EOFError:
+                        break
+        finally:
+            Path(spill).unlink(missing_ok=True)
+
+
+def _open_pdf_spill(spill_dir: str):
+    """Create a uniquely named spill file in *spill_dir*; return (path, fh)."""
+    path = os.path.join(spill_dir, f"{uuid.uuid4().hex}.pages")
+    return path, open(path, "wb")
+
+
+def _discard_pdf_spill(result: dict) -> None:
+    """Delete any spill files of a result that will not be consumed."""
+    for spill in result.get("pages_spill", []):
+        Path(spill).unlink(missing_ok=True)
+    result["pages_spill"] = []
+
+
 def _extract_pdf_data(args):
     """Worker function for parallel PDF extraction (runs in a separate process).
 
-    Extracts text and table data from all pages of a single PDF file.
+    Extracts text and table data from all pages of a single PDF file, or
+    from one page range of it (OPT-PDF-001).
     No database access — returns raw data for the main process to insert.
 
+    OPT-PDF-002: If a spill directory is given, pages are written to a spill
+    file in batches of _PDF_PAGE_BATCH as they are extracted and the result
+    carries only the file name (``pages_spill``); read them back with
+    iter_pdf_page_batches().  Each page's parsed layout is released as soon
+    as it is processed.
+
     Args:
-        args: Tuple of (file_path_str, docs_dir_str, pdf_timeout) for picklability.
+        args: Tuple of (file_path_str, docs_dir_str, pdf_timeout) for
+            picklability, optionally followed by a (start, stop) 0-based
+            page range (or None) and a spill directory.
 
     Returns:
-        Dict with keys: relative_path, category, pages_data, issues, error,
-        num_pages.
+        Dict with keys: relative_path, category, pages_data, pages_spill,
+        page_count, pe_mentions, issues, error, num_pages, page_range,
+        content_hash (whole-file sha256, computed by the first shard only).
     """
-    if len(args) == 3:
-        file_path_str, docs_dir_str, pdf_timeout = args
+    page_range = None
+    spill_dir = None
+    if len(args) >= 3:
+        file_path_str, docs_dir_str, pdf_timeout, *rest = args
+        if rest:
+            page_range = rest[0]
+        if len(rest) > 1:
+            spill_dir = rest[1]
     else:
         file_path_str, docs_dir_str = args
         pdf_timeout = 30
@@ -1998,14 +2234,30 @@ def _extract_pdf_data(args):
     pe_mentions = []  # LION-103: (pe_number, page_number) tuples
     issues = []
     num_pages = 0
+    page_count = 0
+    spill_path = None
+    spill_fh = None
+    # OPT-BUILD-002: one shard hashes the file for the writer thread
+    content_hash = (_file_hash_or_none(file_path)
+                    if not page_range or page_range[0] == 0 else None)
 
     try:
         import pdfplumber  # lazy import — kept out of module level to avoid startup crash
         with pdfplumber.open(file_path_str) as pdf:
             num_pages = len(pdf.pages)
+            start, stop = page_range if page_range else (0, num_pages)
             executor = ThreadPoolExecutor(max_workers=1)
             try:
-                for i, page in enumerate(pdf.pages):
+                for i in range(start, min(stop, num_pages)):
+                    # OPT-PDF-002: Hand the batch to the spill file
+                    if spill_dir and len(pages_data) >= _PDF_PAGE_BATCH:
+                        if spill_fh is None:
+                            spill_path, spill_fh = _open_pdf_spill(spill_dir)
+                        pickle.dump(pages_data, spill_fh,
+                                    protocol=pickle.HIGHEST_PROTOCOL)
+                        pages_data = []
+
+                    page = pdf.pages[i]
                     try:
                         text = page.extract_text(layout=False) or ""
                     except Exception as e:
@@ -2026,11 +2278,14 @@ def _extract_pdf_data(args):
                             tables = None
 
                     table_text = _extract_table_text(tables or [])
+                    # pdfplumber caches every parsed object on the page
+                    page.close()
 
                     if not text.strip() and not table_text.strip():
                         continue
 
                     page_num = i + 1
+                    page_count += 1
                     pages_data.append((
                         relative_path, category,
                         pdf_fiscal_year,     # LION-100
@@ -2046,27 +2301,49 @@ def _extract_pdf_data(args):
                         pe_mentions.append((pe, page_num))
             finally:
                 executor.shutdown(wait=False)
+        # In spill mode every page goes through the spill file, so merged
+        # shards can be replayed strictly in order
+        if spill_dir and pages_data:
+            if spill_fh is None:
+                spill_path, spill_fh = _open_pdf_spill(spill_dir)
+            pickle.dump(pages_data, spill_fh, protocol=pickle.HIGHEST_PROTOCOL)
+            pages_data = []
     except Exception as e:
+        if spill_fh is not None:
+            spill_fh.close()
+            spill_fh = None
+            Path(spill_path).unlink(missing_ok=True)
         return {
             "relative_path": relative_path,
             "category": category,
             "fiscal_year": pdf_fiscal_year,
             "pages_data": [],
+            "pages_spill": [],
+            "page_count": 0,
             "pe_mentions": [],
             "issues": issues,
             "error": str(e),
             "num_pages": num_pages,
+            "page_range": page_range,
+            "content_hash": content_hash,
         }
+    finally:
+        if spill_fh is not None:
+            spill_fh.close()
 
     return {
         "relative_path": relative_path,
         "category": category,
         "fiscal_year": pdf_fiscal_year,
         "pages_data": pages_data,
+        "pages_spill": [spill_path] if spill_path else [],
+        "page_count": page_count,
         "pe_mentions": pe_mentions,
         "issues": issues,
         "error": None,
         "num_pages": num_pages,
+        "page_range": page_range,
+        "content_hash": content_hash,
     }
 
 
@@ -2074,31 +2351,76 @@ def _extract_pdf_data(args):
 
 def _file_needs_update(conn: sqlite3.Connection, rel_path: str,
                        file_path: Path,
-                       cache: dict | None = None) -> bool:
-    """Check if a file needs to be (re)ingested based on size and mtime.
+                       cache: dict | None = None,
+                       hashes: dict | None = None) -> bool:
+    """Check if a file needs to be (re)ingested based on size, mtime and hash.
 
-    If cache is provided (dict mapping rel_path -> (size, mtime)), uses it
-    for an O(1) in-memory lookup instead of a DB round-trip.  The cache is
-    pre-populated once before the main loops to avoid ~5000 individual
+    If cache is provided (dict mapping rel_path -> (size, mtime, content_hash)),
+    uses it for an O(1) in-memory lookup instead of a DB round-trip.  The cache
+    is pre-populated once before the main loops to avoid ~5000 individual
     indexed SELECTs across the xlsx + pdf file lists.
+
+    OPT-BUILD-002: A size match with a different mtime is usually a
+    re-download that rewrote identical bytes.  When a content hash was
+    recorded, the file is hashed and skipped if it matches (file_modified is
+    refreshed so the next build takes the cheap path).  Digests computed here
+    are stored in *hashes* so the caller can record them without re-reading.
     """
     stat = file_path.stat()
     if cache is not None:
         row = cache.get(rel_path)
     else:
         row = conn.execute(
-            "SELECT file_size, file_modified FROM ingested_files"
+            "SELECT file_size, file_modified, content_hash FROM ingested_files"
             " WHERE file_path = ?",
             (rel_path,)
         ).fetchone()
 
     if row is None:
         return True  # New file
-    if row[0] != stat.st_size or abs((row[1] or 0) - stat.st_mtime) > 1:
+    if row[0] != stat.st_size:
         return True  # Modified file
+    if abs((row[1] or 0) - stat.st_mtime) <= 1:
+        return False
+    stored_hash = row[2] if len(row) > 2 else None
+    if not stored_hash:
+        return True  # Touched, and no hash to prove it unchanged
+    digest = hashes.get(rel_path) if hashes is not None else None
+    if digest is None:
+        digest = compute_file_hash(file_path)
+    if hashes is not None:
+        hashes[rel_path] = digest
+    if digest != stored_hash:
+        return True
+    conn.execute(
+        "UPDATE ingested_files SET file_modified = ? WHERE file_path = ?",
+        (stat.st_mtime, rel_path))
     return False
 
 
+def _file_hash_or_none(file_path: Path) -> str | None:
+    """sha256 of *file_path*, or None if it cannot be read."""
+    try:
+        return compute_file_hash(file_path)
+    except OSError:
+        return None
+
+
+def _record_content_hash(conn: sqlite3.Connection, rel_path: str,
+                         file_path: Path, hashes: dict,
+                         digest: str | None = None) -> None:
+    """Store the sha256 of a successfully ingested file (OPT-BUILD-002).
+
+    *digest* is the hash an extraction worker computed; the file is only
+    read here when neither it nor a change-check digest is available.
+    """
+    digest = hashes.pop(rel_path, None) or digest or _file_hash_or_none(file_path)
+    if digest is None:
+        return
+    conn.execute("UPDATE ingested_files SET content_hash = ? WHERE file_path = ?",
+                 (digest, rel_path))
+
+
 def _derive_ingest_metadata(rel_path: str, file_type: str) -> tuple[str, str | None, str | None]:
     """Derive exhibit_type, budget_cycle, and service_org from a relative path.
 
@@ -2160,23 +2482,445 @@ def _remove_file_data(conn: sqlite3.Connection, rel_path: str, file_type: str):
         conn.execute("DELETE FROM pdf_pe_numbers WHERE source_file = ?", (rel_path,))
 
 
+# ── OPT-BUILD-004: Ingest-time dedup by row fingerprint ──────────────────────
+#
+# Every budget_lines row carries row_fingerprint, a hash of the
+# BUDGET_LINE_DEDUP_KEY columns under the unique idx_bl_fingerprint index.
+# Rows are inserted through temp._bl_incoming so a collision is settled
+# against the stored row right away, with the precedence the post-build
+# window DELETE used to apply: a row whose source_file names its fiscal
+# year beats one that does not, then the greater source_file wins, then
+# the row stored first.  Losing incoming rows are never inserted; stored
+# rows that lose are deleted and their file's ingested_files.row_count is
+# decremented, so the build needs no dedup or row_count reconciliation pass.
+
+def _create_fingerprint_trigger(conn: sqlite3.Connection) -> None:
+    """Clear row_fingerprint whenever an UPDATE changes a dedup key column.
+
+    Repair and enrichment steps rewrite key columns in place (e.g. org name
+    normalisation, appropriation code backfill).  A stale hash would make
+    the next ingest reject or displace rows against the wrong key, so the
+    row is left unfingerprinted for _backfill_row_fingerprints() to rehash.
+    Updates that set a new fingerprint along with the key are left alone.
+    """
+    cols = ", ".join(BUDGET_LINE_DEDUP_KEY)
+    changed = " OR ".join(f"old.{c} IS NOT new.{c}" for c in BUDGET_LINE_DEDUP_KEY)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS budget_lines_fp_au
+        AFTER UPDATE OF {cols} ON budget_lines
+        WHEN new.row_fingerprint IS NOT NULL
+             AND new.row_fingerprint IS old.row_fingerprint
+             AND ({changed})
+        BEGIN
+            UPDATE budget_lines SET row_fingerprint = NULL WHERE id = new.id;
+        END
+    """)
+
+
+def _fy_rank_sql(table: str) -> str:
+    """SQL for the fiscal-year-match half of the dedup precedence."""
+    return (f"(CASE WHEN {table}.source_file LIKE '%' || {table}.fiscal_year"
+            " || '%' THEN 0 ELSE 1 END)")
+
+
+def _stage_incoming_rows(conn: sqlite3.Connection,
+                         groups: list[tuple[str, list]]) -> list[str]:
+    """Load *groups* into a fresh temp._bl_incoming copy of budget_lines.
+
+    The temp table carries the same column affinities and defaults as
+    budget_lines.  Returns its column names.
+    """
+    table_info = conn.execute("PRAGMA table_info(budget_lines)").fetchall()
+    all_cols = [r[1] for r in table_info if r[1] != "id"]
+    col_defs = ", ".join(
+        f"{r[1]} {r[2]}" + (f" DEFAULT {r[4]}" if r[4] is not None else "")
+        for r in table_info if r[1] != "id")
+    conn.execute("DROP TABLE IF EXISTS temp._bl_incoming")
+    conn.execute(f"CREATE TEMP TABLE _bl_incoming ({col_defs})")
+    for cols, rows in groups:
+        if rows:
+            ph = make_placeholders(len(cols.split(",")))
+            conn.executemany(
+                f"INSERT INTO temp._bl_incoming ({cols}) VALUES ({ph})", rows)
+    return all_cols
+
+
+def _insert_incoming_rows(conn: sqlite3.Connection, all_cols: list[str],
+                          fingerprint_missing: bool = True) -> Counter:
+    """Move temp._bl_incoming into budget_lines, resolving fingerprint clashes.
+
+    With *fingerprint_missing*, rows staged without a fingerprint get one
+    here; otherwise they are inserted as-is and left to
+    _backfill_row_fingerprints().  Nothing is committed.
+
+    Returns:
+        Net change in stored rows per source_file: inserted rows count +1
+        for their file, stored rows they displaced count -1 for theirs.
+    """
+    if fingerprint_missing:
+        conn.create_function(
+            "budget_line_fingerprint", len(BUDGET_LINE_DEDUP_KEY),
+            budget_line_fingerprint, deterministic=True)
+        conn.execute(
+            "UPDATE temp._bl_incoming SET row_fingerprint = "
+            f"budget_line_fingerprint({', '.join(BUDGET_LINE_DEDUP_KEY)}) "
+            "WHERE row_fingerprint IS NULL")
+    inc, cur = _fy_rank_sql("_bl_incoming"), _fy_rank_sql("b")
+    # Duplicates within the batch: keep the best row of each fingerprint
+    conn.execute(f"""
+        DELETE FROM temp._bl_incoming WHERE rowid IN (
+            SELECT rowid FROM (
+                SELECT rowid, ROW_NUMBER() OVER (
+                    PARTITION BY row_fingerprint
+                    ORDER BY {inc}, source_file DESC, rowid
+                ) AS rn
+                FROM temp._bl_incoming
+                WHERE row_fingerprint IS NOT NULL
+            )
+            WHERE rn > 1
+        )
+    """)
+    # Incoming rows that do not outrank the stored row are rejected ...
+    conn.execute(f"""
+        DELETE FROM temp._bl_incoming WHERE EXISTS (
+            SELECT 1 FROM main.budget_lines b
+            WHERE b.row_fingerprint = _bl_incoming.row_fingerprint
+              AND ({cur} < {inc}
+                   OR ({cur} = {inc}
+                       AND b.source_file >= _bl_incoming.source_file))
+        )
+    """)
+    # ... the rest displace it.
+    delta: Counter = Counter()
+    displaced = conn.execute("""
+        SELECT source_file, COUNT(*) FROM main.budget_lines
+        WHERE row_fingerprint IN (SELECT row_fingerprint FROM temp._bl_incoming)
+        GROUP BY source_file
+    """).fetchall()
+    if displaced:
+        conn.execute("""
+            DELETE FROM main.budget_lines
+            WHERE row_fingerprint IN (SELECT row_fingerprint FROM temp._bl_incoming)
+        """)
+        conn.executemany(
+            "UPDATE ingested_files SET row_count = MAX(row_count - ?, 0) "
+            "WHERE file_path = ?", [(n, f) for f, n in displaced])
+        for f, n in displaced:
+            delta[f] -= n
+    col_list = ", ".join(all_cols)
+    for (f,) in conn.execute(
+            f"INSERT OR IGNORE INTO budget_lines ({col_list}) "
+            f"SELECT {col_list} FROM temp._bl_incoming ORDER BY rowid "
+            "RETURNING source_file").fetchall():
+        delta[f] += 1
+    conn.execute("DROP TABLE temp._bl_incoming")
+    return delta
+
+
+def _insert_budget_rows(conn: sqlite3.Connection,
+                        groups: list[tuple[str, list]],
+                        fingerprint_missing: bool = True) -> Counter:
+    """Append rows to budget_lines, rejecting duplicates (OPT-BUILD-004).
+
+    Args:
+        conn: Database connection.
+        groups: (comma-separated column list, rows) pairs.
+        fingerprint_missing: Fingerprint rows that arrive without one.
+
+    Returns:
+        Net change in stored rows per source_file (see _insert_incoming_rows).
+    """
+    return _insert_incoming_rows(conn, _stage_incoming_rows(conn, groups),
+                                 fingerprint_missing)
+
+
+def _backfill_row_fingerprints(conn: sqlite3.Connection) -> tuple[int, int]:
+    """Fingerprint budget_lines rows stored without one (OPT-BUILD-004).
+
+    Duplicates among them, or of an already fingerprinted row, are resolved
+    with the same precedence as _insert_incoming_rows(); the losers are
+    deleted and their files' row_count decremented.  Surviving rows keep
+    their ids.  Nothing is committed.
+
+    Returns:
+        (rows fingerprinted, duplicate rows deleted).
+    """
+    if conn.execute("SELECT 1 FROM budget_lines WHERE row_fingerprint IS NULL "
+                    "LIMIT 1").fetchone() is None:
+        return 0, 0
+    key = ", ".join(BUDGET_LINE_DEDUP_KEY)
+    groups: dict[str, list[tuple]] = {}
+    legacy = 0
+    for row in conn.execute(
+            f"SELECT id, source_file, fiscal_year, {key} FROM budget_lines "
+            "WHERE row_fingerprint IS NULL"):
+        legacy += 1
+        groups.setdefault(budget_line_fingerprint(*row[3:]), []).append(
+            (row[0], row[1], row[2], True))
+    for row in conn.execute(
+            "SELECT id, source_file, fiscal_year, row_fingerprint "
+            "FROM budget_lines "
+            "WHERE row_fingerprint IN (SELECT value FROM json_each(?))",
+            (json.dumps(list(groups)),)):
+        groups[row[3]].append((row[0], row[1], row[2], False))
+
+    def _fy_rank(source_file, fiscal_year):
+        # Mirrors _fy_rank_sql(); LIKE is case-insensitive for ASCII
+        if fiscal_year is None or source_file is None:
+            return 1
+        return 0 if str(fiscal_year).lower() in source_file.lower() else 1
+
+    losers: list[tuple[int]] = []
+    updates: list[tuple[str, int]] = []
+    displaced: Counter = Counter()
+    for fp, cands in groups.items():
+        cands.sort(key=lambda c: c[0])
+        cands.sort(key=lambda c: c[1] or "", reverse=True)
+        cands.sort(key=lambda c: _fy_rank(c[1], c[2]))
+        winner, rest = cands[0], cands[1:]
+        if winner[3]:
+            updates.append((fp, winner[0]))
+        for c in rest:
+            losers.append((c[0],))
+            displaced[c[1]] += 1
+    conn.executemany("DELETE FROM budget_lines WHERE id = ?", losers)
+    conn.executemany(
+        "UPDATE budget_lines SET row_fingerprint = ? WHERE id = ?", updates)
+    conn.executemany(
+        "UPDATE ingested_files SET row_count = MAX(row_count - ?, 0) "
+        "WHERE file_path = ?", [(n, f) for f, n in displaced.items()])
+    return legacy, len(losers)
+
+
+def _replace_budget_rows(conn: sqlite3.Connection, rel_path: str,
+                         groups: list[tuple[str, list]]) -> tuple[int, int, int]:
+    """Replace a file's budget_lines with freshly extracted rows, in place.
+
+    OPT-BUILD-002: Rather than deleting every row of a changed file and
+    re-inserting, the new rows are diffed against the stored ones so rows
+    whose values are unchanged keep their ids (and FTS entries).  Only
+    stale rows are deleted and only genuinely new rows inserted, through
+    the fingerprint check of _insert_incoming_rows() (OPT-BUILD-004).
+    Nothing is committed here, so the replacement lands in the caller's
+    transaction.
+
+    budget_type is ignored in the comparison because it is backfilled
+    from appropriation_code after ingestion, and row_fingerprint because
+    it is derived from the compared columns.
+
+    Args:
+        conn: Database connection.
+        rel_path: source_file value of the rows being replaced.
+        groups: (comma-separated column list, rows) pairs, one per insert
+            shape (sheets can differ in their FY columns).
+
+    Returns:
+        (kept, inserted, deleted) row counts.
+    """
+    all_cols = _stage_incoming_rows(conn, groups)
+    key_cols = ", ".join(
+        c for c in all_cols if c not in ("budget_type", "row_fingerprint"))
+
+    existing: dict[tuple, list[int]] = {}
+    for row in conn.execute(
+            f"SELECT id, {key_cols} FROM budget_lines "
+            "WHERE source_file = ? ORDER BY id", (rel_path,)):
+        existing.setdefault(row[1:], []).append(row[0])
+
+    matched: list[tuple[int]] = []
+    if existing:
+        for row in conn.execute(
+                f"SELECT rowid, {key_cols} FROM temp._bl_incoming ORDER BY rowid"):
+            ids = existing.get(row[1:])
+            if ids:
+                ids.pop(0)
+                matched.append((row[0],))
+    stale = [(i,) for ids in existing.values() for i in ids]
+
+    # Delete before inserting so a changed row cannot collide with its own
+    # stale version on idx_bl_fingerprint.
+    conn.executemany("DELETE FROM budget_lines WHERE id = ?", stale)
+    conn.executemany("DELETE FROM temp._bl_incoming WHERE rowid = ?", matched)
+    inserted = _insert_incoming_rows(conn, all_cols)[rel_path]
+    return len(matched), inserted, len(stale)
+
+
 def _recreate_pdf_fts_triggers(conn: sqlite3.Connection):
     """Recreate FTS5 triggers for pdf_pages table.
 
     Used after bulk operations to maintain FTS5 index synchronization.
     """
-    conn.execute("""
-        CREATE TRIGGER IF NOT EXISTS pdf_pages_ai AFTER INSERT ON pdf_pages BEGIN
-            INSERT INTO pdf_pages_fts(rowid, page_text, source_file, table_data)
-            VALUES (new.id, new.page_text, new.source_file, new.table_data);
+    _create_fts_triggers(conn, "pdf_pages")
+
+
+# ── OPT-FTS-002: Incremental FTS5 maintenance ────────────────────────────────
+#
+# A full 'rebuild' re-tokenises every row of the content table, so an
+# incremental build that re-ingests a handful of files used to pay for the
+# whole corpus.  Instead, while a build session is running the regular sync
+# triggers are swapped for tracking triggers: inserts only record the new
+# rowid in fts_pending, deletes of already-indexed rows are applied to the
+# index immediately.  At the end of the session the pending rowids are
+# indexed in one INSERT ... SELECT, followed by a bounded 'merge' (or an
+# 'optimize') of the FTS b-tree segments.
+#
+# fts_pending lives in the main schema so the delta survives a crash or a
+# graceful stop and is picked up by the next session.  A row with id
+# _FTS_NEEDS_REBUILD marks a table whose index must be rebuilt outright
+# (fresh or --rebuild sessions, which drop triggers entirely).
+
+_FTS_COLUMNS: dict[str, tuple[str, ...]] = {
+    "budget_lines": ("account_title", "budget_activity_title",
+                     "sub_activity_title", "line_item_title",
+                     "organization_name", "pe_number"),
+    "pdf_pages": ("page_text", "source_file", "table_data"),
+}
+
+_FTS_NEEDS_REBUILD = -1
+
+# Rebuild instead of applying the delta once more than this fraction of the
+# table is pending — past that point one sequential pass is cheaper.
+FTS_DELTA_MAX_FRACTION = 0.25
+
+# Pages of segment data the post-delta 'merge' command may write.  Small
+# values keep incremental builds fast; 'optimize' merges everything.
+FTS_MERGE_PAGES = 500
+
+FTS_MAINTENANCE_MODES = ("merge", "optimize", "none")
+
+
+def _create_fts_triggers(conn: sqlite3.Connection, table: str) -> None:
+    """Create the regular AFTER INSERT/DELETE FTS5 sync triggers for *table*."""
+    cols = _FTS_COLUMNS[table]
+    col_list = ", ".join(cols)
+    fts = f"{table}_fts"
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {table}_ai AFTER INSERT ON {table} BEGIN
+            INSERT INTO {fts}(rowid, {col_list})
+            VALUES (new.id, {", ".join("new." + c for c in cols)});
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {table}_ad AFTER DELETE ON {table} BEGIN
+            INSERT INTO {fts}({fts}, rowid, {col_list})
+            VALUES ('delete', old.id, {", ".join("old." + c for c in cols)});
         END
     """)
+
+
+def _drop_fts_triggers(conn: sqlite3.Connection, table: str) -> None:
+    """Drop both the regular and the delta-tracking FTS5 triggers for *table*."""
+    for suffix in ("ai", "ad", "track_ai", "track_ad"):
+        conn.execute(f"DROP TRIGGER IF EXISTS {table}_{suffix}")
+
+
+def _reset_fts_tracking(conn: sqlite3.Connection, table: str) -> None:
+    """Forget any pending FTS5 delta for *table* (its index is being rebuilt)."""
+    conn.execute(f"DROP TRIGGER IF EXISTS {table}_track_ai")
+    conn.execute(f"DROP TRIGGER IF EXISTS {table}_track_ad")
+    try:
+        conn.execute("DELETE FROM fts_pending WHERE tbl = ?", (table,))
+    except sqlite3.OperationalError:
+        pass  # No build session has tracked this database yet
+
+
+def _begin_fts_session(conn: sqlite3.Connection, table: str,
+                       full: bool) -> None:
+    """Prepare *table*'s FTS5 index for a bulk ingest session (OPT-FTS-002).
+
+    With ``full`` the sync triggers are simply dropped and the session ends
+    in a 'rebuild'.  Otherwise tracking triggers record which rowids still
+    need indexing so _finish_fts_session() can apply only that delta.
+    """
+    cols = _FTS_COLUMNS[table]
+    fts = f"{table}_fts"
     conn.execute("""
-        CREATE TRIGGER IF NOT EXISTS pdf_pages_ad AFTER DELETE ON pdf_pages BEGIN
-            INSERT INTO pdf_pages_fts(pdf_pages_fts, rowid, page_text, source_file, table_data)
-            VALUES ('delete', old.id, old.page_text, old.source_file, old.table_data);
+        CREATE TABLE IF NOT EXISTS fts_pending (
+            tbl TEXT NOT NULL,
+            id INTEGER NOT NULL,
+            PRIMARY KEY (tbl, id)
+        ) WITHOUT ROWID
+    """)
+    _drop_fts_triggers(conn, table)
+    needs_rebuild = conn.execute(
+        "SELECT 1 FROM fts_pending WHERE tbl = ? AND id = ?",
+        (table, _FTS_NEEDS_REBUILD),
+    ).fetchone() is not None
+    if full or needs_rebuild:
+        conn.execute("INSERT OR IGNORE INTO fts_pending (tbl, id) VALUES (?, ?)",
+                     (table, _FTS_NEEDS_REBUILD))
+        conn.commit()
+        return
+    conn.execute(f"""
+        CREATE TRIGGER {table}_track_ai AFTER INSERT ON {table} BEGIN
+            INSERT OR IGNORE INTO fts_pending (tbl, id) VALUES ('{table}', new.id);
+        END
+    """)
+    # Rows inserted earlier in the session were never indexed, so only
+    # rows that predate it need a 'delete' entry.
+    conn.execute(f"""
+        CREATE TRIGGER {table}_track_ad AFTER DELETE ON {table} BEGIN
+            INSERT INTO {fts}({fts}, rowid, {", ".join(cols)})
+            SELECT 'delete', old.id, {", ".join("old." + c for c in cols)}
+            WHERE NOT EXISTS (
+                SELECT 1 FROM fts_pending WHERE tbl = '{table}' AND id = old.id);
+            DELETE FROM fts_pending WHERE tbl = '{table}' AND id = old.id;
         END
     """)
+    conn.commit()
+
+
+def _finish_fts_session(conn: sqlite3.Connection, table: str,
+                        maintenance: str = "merge") -> dict:
+    """Bring *table*'s FTS5 index up to date and restore the sync triggers.
+
+    Applies the pending delta recorded since _begin_fts_session(), or falls
+    back to a full 'rebuild' when one was requested or the delta exceeds
+    FTS_DELTA_MAX_FRACTION of the table.  *maintenance* selects the
+    follow-up segment work after a delta: ``"merge"`` (bounded by
+    FTS_MERGE_PAGES), ``"optimize"`` or ``"none"``.
+
+    Returns:
+        Dict with ``action`` (``"rebuild"``, ``"delta"`` or ``"none"``) and
+        ``rows`` (rows indexed).
+    """
+    if maintenance not in FTS_MAINTENANCE_MODES:
+        raise ValueError(f"Unknown FTS maintenance mode: {maintenance!r}")
+    cols = ", ".join(_FTS_COLUMNS[table])
+    fts = f"{table}_fts"
+    # Stop tracking before touching the index so nothing below is recorded.
+    _drop_fts_triggers(conn, table)
+    needs_rebuild = conn.execute(
+        "SELECT 1 FROM fts_pending WHERE tbl = ? AND id = ?",
+        (table, _FTS_NEEDS_REBUILD),
+    ).fetchone() is not None
+    pending = conn.execute(
+        "SELECT COUNT(*) FROM fts_pending WHERE tbl = ? AND id >= 0", (table,)
+    ).fetchone()[0]
+    total = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    if needs_rebuild or pending > total * FTS_DELTA_MAX_FRACTION:
+        conn.execute(f"INSERT INTO {fts}({fts}) VALUES('rebuild')")
+        result = {"action": "rebuild", "rows": total}
+    elif pending:
+        conn.execute(f"""
+            INSERT INTO {fts}(rowid, {cols})
+            SELECT id, {cols} FROM {table}
+            WHERE id IN (SELECT id FROM fts_pending WHERE tbl = ?)
+        """, (table,))
+        if maintenance == "merge":
+            conn.execute(f"INSERT INTO {fts}({fts}, rank) VALUES('merge', ?)",
+                         (FTS_MERGE_PAGES,))
+        elif maintenance == "optimize":
+            conn.execute(f"INSERT INTO {fts}({fts}) VALUES('optimize')")
+        result = {"action": "delta", "rows": pending}
+    else:
+        result = {"action": "none", "rows": 0}
+
+    conn.execute("DELETE FROM fts_pending WHERE tbl = ?", (table,))
+    _create_fts_triggers(conn, table)
+    conn.commit()
+    return result
 
 
 _KNOWN_BUDGET_CYCLES = {"PB", "ENACTED", "NDAA", "SUPPLEMENTAL", "AMENDMENT", "APPROPRIATION"}
@@ -2337,7 +3081,8 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
                    pdf_timeout: int = 30,
                    failures_log: Path | None = None,
                    retry_failures: bool = False,
-                   skip_quality_report: bool = False) -> dict:
+                   skip_quality_report: bool = False,
+                   fts_maintenance: str = "merge") -> dict:
     """Build or incrementally update the budget database.
 
     Args:
@@ -2359,6 +3104,8 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
         pdf_timeout: Seconds to wait for table extraction per page (BUILD-003).
         failures_log: Path to write failed_downloads.json (BUILD-001).
         retry_failures: If True, only process files listed in failures_log (BUILD-001).
+        fts_maintenance: FTS5 segment maintenance after an incremental index
+            update: "merge", "optimize" or "none" (OPT-FTS-002).
     """
     # ── Metrics state shared across the build ─────────────────────────────
     _metrics = {
@@ -2432,6 +3179,13 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
         logger.info("Created new database: %s", db_path)
     else:
         logger.info("Updating existing database: %s", db_path)
+        # OPT-BUILD-004: rehash rows whose key columns were rewritten since
+        # the last build so incoming rows are checked against current keys.
+        fingerprinted, dup_count = _backfill_row_fingerprints(conn)
+        conn.commit()
+        if fingerprinted:
+            logger.info("  Re-fingerprinted %s budget_lines rows, removed %s "
+                        "duplicates", f"{fingerprinted:,}", f"{dup_count:,}")
 
     # ── Session and resume setup ───────────────────────────────────────────
     session_id = None
@@ -2530,11 +3284,15 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
     # _file_needs_update() can do O(1) dict lookups instead of one
     # indexed SELECT per file (~5000 round-trips across xlsx + pdf).
     _ingested_cache: dict[str, tuple] = {
-        row[0]: (row[1], row[2])
+        row[0]: (row[1], row[2], row[3])
         for row in conn.execute(
-            "SELECT file_path, file_size, file_modified FROM ingested_files"
+            "SELECT file_path, file_size, file_modified, content_hash"
+            " FROM ingested_files"
         ).fetchall()
     }
+    # OPT-BUILD-002: sha256 digests computed while checking for changes,
+    # reused when the file's content_hash is recorded after ingestion.
+    _content_hashes: dict[str, str] = {}
 
     # Save initial checkpoint so the session exists in build_progress from the start
     _save_checkpoint(conn, session_id, 0, total_files, 0, 0, 0,
@@ -2574,11 +3332,10 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
 
     # Drop budget_lines FTS5 triggers before bulk insert, matching the PDF
     # optimisation. Triggers fire on every row INSERT; with 100k+ rows across
-    # all Excel files the overhead is significant. We rebuild the FTS index in
-    # one pass after all files are ingested.
-    conn.execute("DROP TRIGGER IF EXISTS budget_lines_ai")
-    conn.execute("DROP TRIGGER IF EXISTS budget_lines_ad")
-    conn.commit()
+    # all Excel files the overhead is significant. A fresh build rebuilds the
+    # FTS index in one pass after all files are ingested; an incremental one
+    # only indexes the rows it touched (OPT-FTS-002).
+    _begin_fts_session(conn, "budget_lines", full=initial_bl_count == 0)
 
     # OPT-BUILD-001: Determine which files need processing
     xlsx_to_process: list[Path] = []
@@ -2587,7 +3344,9 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
         rel_path = str(xlsx.relative_to(docs_dir))
         if rel_path in already_processed:
             xlsx_skip_list.append(xlsx)
-        elif not rebuild and not _file_needs_update(conn, rel_path, xlsx):
+        elif not rebuild and not _file_needs_update(
+                conn, rel_path, xlsx, cache=_ingested_cache,
+                hashes=_content_hashes):
             xlsx_skip_list.append(xlsx)
         else:
             xlsx_to_process.append(xlsx)
@@ -2610,22 +3369,9 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
     _excel_use_parallel = num_workers > 1 and len(xlsx_to_process) > 1
 
     if _excel_use_parallel:
-        # Pre-clean: remove old data for files being re-processed to avoid
-        # duplicate budget_lines. Mirrors the PDF pre-clean pattern.
-        if xlsx_to_process:
-            _xl_rel_paths = [str(xl.relative_to(docs_dir)) for xl in xlsx_to_process]
-            conn.execute("CREATE TEMP TABLE IF NOT EXISTS _xl_preclean (path TEXT PRIMARY KEY)")
-            conn.executemany("INSERT OR IGNORE INTO _xl_preclean VALUES (?)",
-                             [(p,) for p in _xl_rel_paths])
-            _xl_del = conn.execute(
-                "DELETE FROM budget_lines WHERE source_file IN "
-                "(SELECT path FROM _xl_preclean)"
-            ).rowcount
-            conn.execute("DROP TABLE _xl_preclean")
-            conn.commit()
-            if _xl_del:
-                logger.info("  Pre-cleaned %d stale budget_lines rows for re-ingestion", _xl_del)
-
+        # OPT-BUILD-002: No pre-clean here — each file's rows are diffed
+        # against the stored ones by _replace_budget_rows() as results land,
+        # so unchanged budget_lines keep their ids.
         logger.info("  Processing %d Excel files with %d parallel workers (OPT-BUILD-001)...",
                     len(xlsx_to_process), num_workers)
         t_excel_start = time.time()
@@ -2642,6 +3388,7 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
                                      int(_metrics["pages"]), total_budget_rows, 0, "", "interrupted")
                     conn.commit()
                     _progress("stopped", xi, len(xlsx_to_process), "Stopped — resume with --resume")
+                    bump_data_generation(conn, "build")
                     conn.close()
                     return {}
 
@@ -2652,6 +3399,7 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
                     result = future.result(timeout=120)
                 except Exception as _xl_err:
                     logger.error("  ERROR: %s: %s", xl.name, _xl_err)
+                    _remove_file_data(conn, rel_path, "xlsx")
                     _failures.append(FailedFileEntry(
                         file_path=rel_path,
                         error_type=type(_xl_err).__name__,
@@ -2669,6 +3417,7 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
                     continue
 
                 if result.get("error"):
+                    _remove_file_data(conn, rel_path, "xlsx")
                     _failures.append(FailedFileEntry(
                         file_path=rel_path,
                         error_type="ParseError",
@@ -2681,28 +3430,28 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
                 if fy_cols:
                     _ensure_fy_columns(conn, fy_cols)
 
-                if rows:
-                    # Reconstruct the INSERT dynamically based on extracted columns
-                    _fixed_c = (
-                        "source_file, source_fiscal_year, exhibit_type, sheet_name, fiscal_year, "
-                        "account, account_title, organization, organization_name, "
-                        "budget_activity, budget_activity_title, "
-                        "sub_activity, sub_activity_title, "
-                        "line_item, line_item_title, classification, "
-                        "cost_type, cost_type_title, add_non_add"
-                    )
-                    _fy_c = ", ".join(sorted(fy_cols)) if fy_cols else ""
-                    _tail_c = (
-                        "extra_fields, pe_number, currency_year, "
-                        "appropriation_code, appropriation_title, "
-                        "amount_unit, budget_type, amount_type"
-                    )
-                    all_c = ", ".join(filter(None, [_fixed_c, _fy_c, _tail_c]))
-                    n_p = len(all_c.split(","))
-                    ph = make_placeholders(n_p)
-                    conn.executemany(f"INSERT OR IGNORE INTO budget_lines ({all_c}) VALUES ({ph})", rows)
-                    total_budget_rows += len(rows)
-                    _metrics["rows"] = total_budget_rows
+                # Reconstruct the column list based on extracted columns; an
+                # empty result still runs the replace to drop stale rows.
+                _fixed_c = (
+                    "source_file, source_fiscal_year, exhibit_type, sheet_name, fiscal_year, "
+                    "account, account_title, organization, organization_name, "
+                    "budget_activity, budget_activity_title, "
+                    "sub_activity, sub_activity_title, "
+                    "line_item, line_item_title, classification, "
+                    "cost_type, cost_type_title, add_non_add"
+                )
+                _fy_c = ", ".join(sorted(fy_cols)) if fy_cols else ""
+                _tail_c = (
+                    "extra_fields, pe_number, currency_year, "
+                    "appropriation_code, appropriation_title, "
+                    "amount_unit, budget_type, amount_type, row_fingerprint"
+                )
+                all_c = ", ".join(filter(None, [_fixed_c, _fy_c, _tail_c]))
+                kept, inserted, _ = _replace_budget_rows(
+                    conn, rel_path, [(all_c, rows)])
+                stored = kept + inserted
+                total_budget_rows += stored
+                _metrics["rows"] = total_budget_rows
 
                 stat = xl.stat()
                 _et, _bc, _so = _derive_ingest_metadata(rel_path, "xlsx")
@@ -2712,13 +3461,15 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
                     " ingested_at, row_count, status,"
                     " exhibit_type, budget_cycle, service_org) "
                     "VALUES (?,?,?,?,datetime('now'),?,?,?,?,?)",
-                    (rel_path, "xlsx", stat.st_size, stat.st_mtime, len(rows), "ok",
+                    (rel_path, "xlsx", stat.st_size, stat.st_mtime, stored, "ok",
                      _et, _bc, _so))
-                _mark_file_processed(conn, session_id, rel_path, "excel", rows_count=len(rows))
+                _record_content_hash(conn, rel_path, xl, _content_hashes,
+                                     result.get("content_hash"))
+                _mark_file_processed(conn, session_id, rel_path, "excel", rows_count=stored)
                 elapsed = time.time() - t_excel_start
                 excel_file_times.append(elapsed / max(xi + 1, 1))
                 _progress("excel", xi + 1 + skipped_xlsx, len(xlsx_files),
-                          f"{xl.name} — {len(rows):,} rows",
+                          f"{xl.name} — {stored:,} rows",
                           {"rows": total_budget_rows,
                            "files_remaining": total_files - files_done_total})
         conn.commit()
@@ -2738,6 +3489,7 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
             _progress("stopped", xi, len(xlsx_files),
                       f"Stopped at {xlsx.name} — resume with --resume",
                       {"files_remaining": total_files - files_done_total})
+            bump_data_generation(conn, "build")
             conn.close()
             return {}
 
@@ -2753,7 +3505,8 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
             continue
 
         if not rebuild and not _file_needs_update(
-                conn, rel_path, xlsx, cache=_ingested_cache):
+                conn, rel_path, xlsx, cache=_ingested_cache,
+                hashes=_content_hashes):
             skipped_xlsx += 1
             files_done_total += 1
             _progress("excel", xi + 1, len(xlsx_files),
@@ -2765,14 +3518,15 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
                   f"Processing: {xlsx.name}",
                   {"files_remaining": total_files - files_done_total})
 
-        _remove_file_data(conn, rel_path, "xlsx")
-
         t0 = time.time()
         try:
-            rows = ingest_excel_file(conn, xlsx, docs_dir=docs_dir)
+            # OPT-BUILD-002: diff against the stored rows instead of
+            # deleting them up front, so unchanged rows keep their ids
+            rows = ingest_excel_file(conn, xlsx, docs_dir=docs_dir, replace=True)
         except Exception as _xl_err:
             file_elapsed = time.time() - t0
             logger.error("  ERROR: %s (%.1fs): %s", xlsx.name, file_elapsed, _xl_err)
+            _remove_file_data(conn, rel_path, "xlsx")
             _failures.append(FailedFileEntry(
                 file_path=rel_path,
                 error_type=type(_xl_err).__name__,
@@ -2808,6 +3562,7 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
             (rel_path, "xlsx", stat.st_size, stat.st_mtime, rows, "ok",
              _et, _bc, _so)
         )
+        _record_content_hash(conn, rel_path, xlsx, _content_hashes)
         total_budget_rows += rows
         files_done_total += 1
         _metrics["rows"] = total_budget_rows
@@ -2836,42 +3591,14 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
     if not _excel_use_parallel:
         conn.commit()
 
-    # Rebuild budget_lines FTS5 index in one pass and restore triggers,
+    # Bring the budget_lines FTS5 index up to date and restore triggers,
     # mirroring what we do for pdf_pages after bulk PDF ingestion.
-    final_bl_count = conn.execute(
-        "SELECT COUNT(*) FROM budget_lines"
-    ).fetchone()[0]
-    if final_bl_count > initial_bl_count:
-        logger.info("  Rebuilding budget_lines FTS index...")
-        conn.execute(
-            "INSERT INTO budget_lines_fts(budget_lines_fts) VALUES('rebuild')"
-        )
-    conn.executescript("""
-        CREATE TRIGGER IF NOT EXISTS budget_lines_ai
-        AFTER INSERT ON budget_lines BEGIN
-            INSERT INTO budget_lines_fts(
-                rowid, account_title, budget_activity_title,
-                sub_activity_title, line_item_title,
-                organization_name, pe_number)
-            VALUES (
-                new.id, new.account_title, new.budget_activity_title,
-                new.sub_activity_title, new.line_item_title,
-                new.organization_name, new.pe_number);
-        END;
-        CREATE TRIGGER IF NOT EXISTS budget_lines_ad
-        AFTER DELETE ON budget_lines BEGIN
-            INSERT INTO budget_lines_fts(
-                budget_lines_fts, rowid, account_title,
-                budget_activity_title, sub_activity_title,
-                line_item_title, organization_name, pe_number)
-            VALUES (
-                'delete', old.id, old.account_title,
-                old.budget_activity_title, old.sub_activity_title,
-                old.line_item_title, old.organization_name,
-                old.pe_number);
-        END;
-    """)
-    conn.commit()
+    _t0 = time.time()
+    _fts = _finish_fts_session(conn, "budget_lines", fts_maintenance)
+    if _fts["action"] != "none":
+        logger.info("  budget_lines FTS index: %s of %s rows (%s)",
+                    _fts["action"], f"{_fts['rows']:,}",
+                    fmt_time(time.time() - _t0))
 
     if not _excel_use_parallel:
         if skipped_xlsx:
@@ -2901,7 +3628,8 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
             files_done_total += 1
             continue
         if not rebuild and not _file_needs_update(
-                conn, rel_path, pdf, cache=_ingested_cache):
+                conn, rel_path, pdf, cache=_ingested_cache,
+                hashes=_content_hashes):
             skipped_pdf += 1
             files_done_total += 1
             continue
@@ -2916,16 +3644,15 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
     if skipped_pdf:
         logger.info("  Skipping %d unchanged/resumed PDF file(s)", skipped_pdf)
 
-    # Drop FTS5 triggers before pre-clean to avoid per-row FTS5 updates on DELETE
+    # Drop FTS5 triggers before pre-clean to avoid per-row FTS5 updates on
+    # DELETE; incremental builds keep only cheap delta tracking (OPT-FTS-002).
     logger.info("  Dropping FTS5 triggers for bulk insert optimization...")
     try:
-        conn.execute("DROP TRIGGER IF EXISTS pdf_pages_ai")
-        conn.execute("DROP TRIGGER IF EXISTS pdf_pages_ad")
-        conn.commit()
+        _begin_fts_session(conn, "pdf_pages", full=initial_page_count == 0)
     except Exception as e:
         logger.warning("    (Warning: %s)", e)
 
-    # Pre-clean: remove old data for files being re-processed (triggers already dropped)
+    # Pre-clean: remove old data for files being re-processed (sync triggers already dropped)
     # Use a single batched DELETE via a temp table to avoid 4000+ individual statements
     if pdfs_to_process:
         logger.info("  Pre-cleaning %d PDF(s) from DB...", len(pdfs_to_process))
@@ -2958,18 +3685,35 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
         # Submitting all tasks upfront would hold every completed result in memory
         # simultaneously — potentially GBs of page text across thousands of PDFs.
         window_size = num_workers * 2
-        pdf_iter = iter(pdfs_to_process)
-        active: dict = {}  # future -> pdf
+        shard_totals: dict[Path, int] = {}
+        shard_results: dict[Path, list[dict]] = {}
+        active: dict = {}  # future -> (pdf, page_range)
 
         def _submit_next():
-            """Submit the next PDF from the iterator into the pool."""
-            pdf = next(pdf_iter, None)
-            if pdf is None:
+            """Submit the next extraction task from the iterator into the pool."""
+            task = next(pdf_iter, None)
+            if task is None:
                 return
-            f = pool.submit(_extract_pdf_data, (str(pdf), str(docs_dir), pdf_timeout))
-            active[f] = pdf
+            pdf, page_range = task
+            # OPT-PDF-002: Pages come back through spill files in spill_dir
+            f = pool.submit(_extract_pdf_data, (str(pdf), str(docs_dir), pdf_timeout,
+                                                page_range, spill_dir))
+            active[f] = task
+
+        with tempfile.TemporaryDirectory(prefix="pdf_spill_") as spill_dir, \
+                ProcessPoolExecutor(max_workers=num_workers) as pool:
+            # OPT-PDF-001: Large PDFs (page-counted in the pool) become
+            # several page-range tasks whose results are collected in
+            # shard_results and merged once complete.
+            pdf_tasks = _plan_pdf_tasks(pdfs_to_process, executor=pool)
+            for pdf, page_range in pdf_tasks:
+                if page_range is not None:
+                    shard_totals[pdf] = shard_totals.get(pdf, 0) + 1
+            if shard_totals:
+                logger.info("  Sharding %d large PDF(s) into %d page-range tasks",
+                            len(shard_totals), sum(shard_totals.values()))
+            pdf_iter = iter(pdf_tasks)
 
-        with ProcessPoolExecutor(max_workers=num_workers) as pool:
             # Seed the window
             for _ in range(window_size):
                 _submit_next()
@@ -3013,16 +3757,38 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
                 if not done:
                     continue  # Timeout with no completions; re-check stop_event
                 for future in done:
-                    pdf = active.pop(future)
+                    pdf, page_range = active.pop(future)
                     rel_path = str(pdf.relative_to(docs_dir))
-                    processed_pdf += 1
-                    files_done_total += 1
 
                     # Immediately submit a replacement to keep window full
                     _submit_next()
 
+                    merged = None
+                    if page_range is not None:
+                        # OPT-PDF-001: Hold shards until the whole file is in.
+                        # An interrupted shard falls through to the stop
+                        # handling below via future.result().
+                        try:
+                            shard = future.result(timeout=300)
+                        except (KeyboardInterrupt, BrokenPipeError):
+                            shard = None
+                        except Exception as e:
+                            shard = {"relative_path": rel_path,
+                                     "page_range": page_range,
+                                     "error": f"{type(e).__name__}: {e}"}
+                        if shard is not None:
+                            parts = shard_results.setdefault(pdf, [])
+                            parts.append(shard)
+                            if len(parts) < shard_totals[pdf]:
+                                continue
+                            merged = _merge_pdf_shards(shard_results.pop(pdf))
+
+                    processed_pdf += 1
+                    files_done_total += 1
+
                     try:
-                        result = future.result(timeout=300)  # 5-min safety timeout
+                        # 5-min safety timeout
+                        result = merged if merged is not None else future.result(timeout=300)
                     except (KeyboardInterrupt, BrokenPipeError):
                         # Worker was killed by Ctrl+C; treat as graceful stop
                         if stop_event:
@@ -3059,7 +3825,6 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
                                              pages_count=0)
                         continue
 
-                    pages_data = result["pages_data"]
                     issues = result["issues"]
                     error = result["error"]
 
@@ -3084,15 +3849,17 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
                                              pages_count=0)
                         continue
 
-                    # Batch insert all pages for this file
-                    pages = len(pages_data)
-                    if pages_data:
+                    # Batch insert the pages for this file, one spilled
+                    # batch at a time (OPT-PDF-002)
+                    pages = 0
+                    for page_batch in iter_pdf_page_batches(result):
                         conn.executemany("""
                             INSERT INTO pdf_pages (source_file, source_category,
                                 fiscal_year, exhibit_type,
                                 page_number, page_text, has_tables, table_data)
                             VALUES (?,?,?,?,?,?,?,?)
-                        """, pages_data)
+                        """, page_batch)
+                        pages += len(page_batch)
 
                     # Record extraction issues
                     if issues:
@@ -3137,6 +3904,8 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
                         "VALUES (?,?,?,?,datetime('now'),?,?,?,?,?)",
                         (rel_path, "pdf", stat.st_size, stat.st_mtime,
                          pages, file_status, _et, _bc, _so))
+                    _record_content_hash(conn, rel_path, pdf, _content_hashes,
+                                         result.get("content_hash"))
 
                     total_pdf_pages += pages
                     _metrics["pages"] = total_pdf_pages
@@ -3238,6 +4007,7 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
                 "VALUES (?,?,?,?,datetime('now'),?,?,?,?,?)",
                 (rel_path, "pdf", stat.st_size, stat.st_mtime, pages,
                  file_status, _et, _bc, _so))
+            _record_content_hash(conn, rel_path, pdf, _content_hashes)
             total_pdf_pages += pages
             _metrics["pages"] = total_pdf_pages
 
@@ -3256,44 +4026,19 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
 
     finally:
         if not _pdf_stopped:
-            # Rebuild FTS5 if new pages were added
-            final_page_count = conn.execute("SELECT COUNT(*) FROM pdf_pages").fetchone()[0]
-            new_pages = final_page_count - initial_page_count
-            if new_pages > 0:
-                _t0 = time.time()
-                logger.info("  Rebuilding full-text search indexes (%s pages)...",
-                            f"{final_page_count:,}")
-                # FTS5 'rebuild' command repopulates the index from the content
-                # table in a single optimized pass — faster than DELETE+INSERT.
-                conn.execute("INSERT INTO pdf_pages_fts(pdf_pages_fts) VALUES('rebuild')")
-                conn.execute("""
-                    CREATE TRIGGER IF NOT EXISTS pdf_pages_ai AFTER INSERT ON pdf_pages BEGIN
-                        INSERT INTO pdf_pages_fts(rowid, page_text, source_file, table_data)
-                        VALUES (new.id, new.page_text, new.source_file, new.table_data);
-                    END
-                """)
-                conn.execute("""
-                    CREATE TRIGGER IF NOT EXISTS pdf_pages_ad
-                    AFTER DELETE ON pdf_pages BEGIN
-                        INSERT INTO pdf_pages_fts(
-                            pdf_pages_fts, rowid,
-                            page_text, source_file, table_data)
-                        VALUES (
-                            'delete', old.id, old.page_text,
-                            old.source_file, old.table_data);
-                    END
-                """)
-                conn.commit()
-                _elapsed = time.time() - _t0
-                logger.info("  FTS5 rebuild complete — %s new pages indexed (%s)",
-                            f"{new_pages:,}", fmt_time(_elapsed))
+            _t0 = time.time()
+            logger.info("  Updating full-text search indexes...")
+            _fts = _finish_fts_session(conn, "pdf_pages", fts_maintenance)
+            if _fts["action"] == "none":
+                logger.info("  Skipped FTS5 update (no pages added)")
             else:
-                _recreate_pdf_fts_triggers(conn)
-                conn.commit()
-                logger.info("  Skipped FTS5 rebuild (no new pages added)")
+                logger.info("  FTS5 %s complete — %s pages indexed (%s)",
+                            _fts["action"], f"{_fts['rows']:,}",
+                            fmt_time(time.time() - _t0))
 
     # If stopped gracefully during PDF loop, close and exit cleanly
     if _pdf_stopped:
+        bump_data_generation(conn, "build")
         conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
         conn.close()
         return {}
@@ -3437,69 +4182,17 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
                 fmt_time(_elapsed))
     logger.info("Backfilled budget_type for %d rows", _bt_updated)
 
-    # ── Deduplicate budget_lines rows ──────────────────────────────────────
-    # Remove exact duplicate rows (same source, fiscal_year, PE, line_item,
-    # org) keeping only the row with the lowest id.
+    # ── Fingerprint legacy budget_lines rows ───────────────────────────────
+    # OPT-BUILD-004: duplicates are rejected as rows are inserted, so only
+    # rows written without a fingerprint (databases built before the column
+    # existed, external writers) still need deduplicating here.
     _t0 = time.time()
     _progress("index", 0, 1, "Deduplicating budget_lines...")
-    logger.info("Deduplicating budget_lines...")
-    dup_count = conn.execute("""
-        DELETE FROM budget_lines WHERE id NOT IN (
-            SELECT id FROM (
-                SELECT id,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY fiscal_year, pe_number, line_item_title,
-                                     organization_name, exhibit_type,
-                                     amount_type, appropriation_code
-                        ORDER BY
-                            CASE WHEN source_file LIKE '%' || fiscal_year || '%'
-                                 THEN 0 ELSE 1 END,
-                            source_file DESC,
-                            id ASC
-                    ) AS rn
-                FROM budget_lines
-            )
-            WHERE rn = 1
-        )
-    """).rowcount
-    if dup_count:
-        logger.info("  Removed %s duplicate budget_lines rows", f"{dup_count:,}")
-        # Rebuild FTS index after deduplication
-        conn.execute(
-            "INSERT INTO budget_lines_fts(budget_lines_fts) VALUES('rebuild')"
-        )
-    else:
-        logger.info("  No duplicates found")
-    conn.commit()
-
-    # ── Reconcile ingested_files row_count after deduplication ────────────
-    # The row_count column was set during ingestion but deduplication may
-    # have removed rows, leaving the counts stale.  Re-derive from actual
-    # data so downstream validation (row_count_consistency) passes.
-    _xlsx_updated = conn.execute("""
-        UPDATE ingested_files SET row_count = (
-            SELECT COUNT(*) FROM budget_lines
-            WHERE budget_lines.source_file = ingested_files.file_path
-        )
-        WHERE file_type = 'xlsx'
-    """).rowcount
-    _pdf_updated = conn.execute("""
-        UPDATE ingested_files SET row_count = (
-            SELECT COUNT(*) FROM pdf_pages
-            WHERE pdf_pages.source_file = ingested_files.file_path
-        )
-        WHERE file_type = 'pdf'
-    """).rowcount
+    fingerprinted, dup_count = _backfill_row_fingerprints(conn)
     conn.commit()
-    _total_updated = _xlsx_updated + _pdf_updated
-    if _total_updated:
-        logger.info(
-            "Reconciled ingested_files.row_count for %d files "
-            "(%d xlsx, %d pdf) after deduplication",
-            _total_updated, _xlsx_updated, _pdf_updated,
-        )
-        logger.info("  Reconciled row_count for %s ingested_files (%s xlsx, %s pdf)",
-                    f"{_total_updated:,}", f"{_xlsx_updated:,}", f"{_pdf_updated:,}")
+    if fingerprinted:
+        logger.info("  Fingerprinted %s legacy budget_lines rows, removed %s "
+                    "duplicates", f"{fingerprinted:,}", f"{dup_count:,}")
 
     # Create a unique index to prevent future duplicates
     try:
@@ -3577,6 +4270,11 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
 
     _progress("done", total_files, total_files, summary,
               {"files_remaining": 0, "eta_sec": 0.0})
+    # OPT-SUGGEST-001: Keep an existing typeahead index in step with the rebuilt
+    # budget_lines (the enricher creates it on first run).
+    refresh_suggestion_index(conn, create=False)
+    # OPT-GEN-001: Invalidate API caches/ETags keyed on the data generation
+    bump_data_generation(conn, "build")
     # Final WAL checkpoint: flush all accumulated WAL pages to the main DB file
     conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
     conn.close()
@@ -3602,7 +4300,10 @@ def build_database(docs_dir: Path, db_path: Path, rebuild: bool = False,
             from pipeline.validator import (  # noqa: PLC0415
                 generate_quality_report,
             )
-            report = generate_quality_report(db_path, print_console=True)
+            # OPT-VAL-002: an incremental build only re-checks its own files
+            report = generate_quality_report(
+                db_path, print_console=True,
+                since_session=None if rebuild else session_id)
             val = report["validation_summary"]
             logger.info("  [QUALITY REPORT] %s budget lines | %d checks | %d warning(s) | %d failure(s)",
                         f"{report['total_budget_lines']:,}",
@@ -3656,6 +4357,12 @@ def main():
                         metavar="PATH",
                         help="Path to write/read the failure log "
                              "(default: failed_downloads.json)")
+    # OPT-FTS-002: Segment maintenance after incremental FTS5 updates
+    parser.add_argument("--fts-maintenance", choices=FTS_MAINTENANCE_MODES,
+                        default="merge",
+                        help="FTS5 index maintenance after an incremental "
+                             "build: bounded merge, full optimize, or none "
+                             "(default: merge)")
     args = parser.parse_args()
 
     # ── Graceful shutdown via Ctrl+C ───────────────────────────────────────
@@ -3683,7 +4390,8 @@ def main():
                        workers=args.workers,
                        pdf_timeout=args.pdf_timeout,
                        failures_log=args.failures_log,
-                       retry_failures=args.retry_failures)
+                       retry_failures=args.retry_failures,
+                       fts_maintenance=args.fts_maintenance)
     except FileNotFoundError as e:
         print(f"ERROR: {e}")
         sys.exit(1)
@@ -11,22 +11,34 @@ Usage:
     python validate_budget_db.py --json               # JSON output
     python validate_budget_db.py --html > report.html # HTML report (TIGER-007)
     python validate_budget_db.py --threshold warning  # Exit non-zero on warnings+
+    python validate_budget_db.py --json --since-session --previous last.json
+                                                     # Re-check only changed files
 
 """
 
 import argparse
 import json
 import logging
+import os
 import sqlite3
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 # Shared utilities: Import from utils package for consistency across codebase
-from utils import get_connection
+from utils import create_connection, get_connection
 from utils.patterns import PE_NUMBER_STRICT as _PE_PATTERN
-from utils.database import _validate_identifier, get_table_schema, table_exists
+from utils.database import (
+    _validate_identifier,
+    get_data_generation,
+    get_table_schema,
+    table_exists,
+)
 from pipeline.schema import check_database_integrity
+from pipeline.validator import file_scope_clause, incremental_file_scope
 
 # Known exhibit types — imported from exhibit_catalog so it stays in sync
 # with the canonical catalog (Step 1.B1-g-validator).
@@ -70,6 +82,53 @@ def _get_amount_columns(conn: sqlite3.Connection) -> list[str]:
     return [c[1] for c in cols if c[1].startswith("amount_fy")]
 
 
+# ── OPT-VAL-001: Fused budget_lines scan ─────────────────────────────────────
+
+_OUTLIER_THRESHOLD = 1_000_000_000  # $1T in thousands (check_extreme_outliers)
+
+
+def budget_line_stats(conn: sqlite3.Connection) -> dict:
+    """Compute the row-level accumulators shared by several checks in one scan.
+
+    Zero amounts, negative amounts, extreme outliers and FY NULL rates each
+    used to scan budget_lines per amount column; one aggregate query now
+    feeds all of them.  The checks only go back to the table for samples
+    when a counter is non-zero.
+
+    Returns:
+        Dict with ``total`` and ``all_zero`` row counts plus per-column
+        ``null``, ``negative`` and ``outlier`` counts.
+    """
+    amount_cols = _get_amount_columns(conn)
+    for col in amount_cols:
+        _validate_identifier(col, "column name")
+    exprs = ["COUNT(*)"]
+    if amount_cols:
+        exprs.append("SUM(" + " AND ".join(
+            f"(COALESCE({col}, 0) = 0)" for col in amount_cols) + ")")
+    for col in amount_cols:
+        exprs += [
+            f"SUM({col} IS NULL)",
+            f"SUM({col} < 0)",
+            f"SUM(ABS({col}) > {_OUTLIER_THRESHOLD})",
+        ]
+    row = conn.execute(f"SELECT {', '.join(exprs)} FROM budget_lines").fetchone()
+    vals = [v or 0 for v in row]
+    stats: dict = {
+        "total": vals[0],
+        "all_zero": vals[1] if amount_cols else 0,
+        "null": {},
+        "negative": {},
+        "outlier": {},
+    }
+    for i, col in enumerate(amount_cols):
+        base = 2 + i * 3
+        stats["null"][col] = vals[base]
+        stats["negative"][col] = vals[base + 1]
+        stats["outlier"][col] = vals[base + 2]
+    return stats
+
+
 # ── Individual checks ────────────────────────────────────────────────────────
 
 def check_missing_years(conn: sqlite3.Connection) -> list[dict]:
@@ -109,25 +168,28 @@ def check_missing_years(conn: sqlite3.Connection) -> list[dict]:
     return issues
 
 
-def check_duplicates(conn: sqlite3.Connection) -> list[dict]:
+def check_duplicates(conn: sqlite3.Connection,
+                     files: set[str] | None = None) -> list[dict]:
     """Find rows with identical content that suggest duplicate ingestion.
 
     Groups by every non-id column so rows that share metadata but differ in
     amounts (e.g. "Gross" vs "Less Reimbursables" lines that share a header)
-    are not flagged.
+    are not flagged.  ``files`` limits the scan to those source files
+    (OPT-VAL-002).
     """
     issues = []
     group_cols = [c["name"] for c in get_table_schema(conn, "budget_lines") if c["name"] != "id"]
     group_sql = ", ".join(group_cols)
+    scope, params = file_scope_clause("source_file", files, keyword="WHERE")
     rows = conn.execute(f"""
         SELECT source_file, exhibit_type, account, line_item, fiscal_year,
                COUNT(*) AS cnt
-        FROM budget_lines
+        FROM budget_lines{scope}
         GROUP BY {group_sql}
         HAVING cnt > 1
         ORDER BY cnt DESC
         LIMIT 50
-    """).fetchall()
+    """, params).fetchall()
 
     for r in rows:
         issues.append({
@@ -144,14 +206,23 @@ def check_duplicates(conn: sqlite3.Connection) -> list[dict]:
     return issues
 
 
-def check_zero_amounts(conn: sqlite3.Connection) -> list[dict]:
-    """Find line items where every amount column is NULL or zero."""
+def check_zero_amounts(conn: sqlite3.Connection,
+                       stats: dict | None = None) -> list[dict]:
+    """Find line items where every amount column is NULL or zero.
+
+    ``stats`` is a :func:`budget_line_stats` result (OPT-VAL-001).
+    """
     issues = []
     amount_cols = _get_amount_columns(conn)
     if not amount_cols:
         return issues
     for col in amount_cols:
         _validate_identifier(col, "column name")
+    if stats is None:
+        stats = budget_line_stats(conn)
+    total = stats["all_zero"]
+    if not total:
+        return issues
     null_checks = " AND ".join(
         f"(COALESCE({col}, 0) = 0)" for col in amount_cols
     )
@@ -160,14 +231,10 @@ def check_zero_amounts(conn: sqlite3.Connection) -> list[dict]:
                organization_name, fiscal_year
         FROM budget_lines
         WHERE {null_checks}
-        LIMIT 100
+        LIMIT 10
     """).fetchall()
 
     if rows:
-        total = conn.execute(f"""
-            SELECT COUNT(*) AS cnt FROM budget_lines WHERE {null_checks}
-        """).fetchone()["cnt"]
-
         issues.append({
             "check": "zero_amounts",
             "severity": "warning",
@@ -183,19 +250,21 @@ def check_zero_amounts(conn: sqlite3.Connection) -> list[dict]:
     return issues
 
 
-def check_column_alignment(conn: sqlite3.Connection) -> list[dict]:
+def check_column_alignment(conn: sqlite3.Connection,
+                           files: set[str] | None = None) -> list[dict]:
     """Find rows where account is populated but organization is missing."""
     issues = []
-    rows = conn.execute("""
+    scope, params = file_scope_clause("source_file", files)
+    rows = conn.execute(f"""
         SELECT source_file, exhibit_type, account, account_title,
                fiscal_year, COUNT(*) AS cnt
         FROM budget_lines
         WHERE account IS NOT NULL AND account != ''
-          AND (organization IS NULL OR organization = '')
+          AND (organization IS NULL OR organization = ''){scope}
         GROUP BY source_file, exhibit_type
         ORDER BY cnt DESC
         LIMIT 20
-    """).fetchall()
+    """, params).fetchall()
 
     for r in rows:
         issues.append({
@@ -273,7 +342,8 @@ def check_ingestion_errors(conn: sqlite3.Connection) -> list[dict]:
     return issues
 
 
-def check_unit_consistency(conn: sqlite3.Connection) -> list[dict]:
+def check_unit_consistency(conn: sqlite3.Connection,
+                           files: set[str] | None = None) -> list[dict]:
     """Flag budget lines where amount_unit is not 'thousands' (Step 1.B3-f).
 
     After normalisation all stored amounts should be in thousands of dollars.
@@ -281,14 +351,15 @@ def check_unit_consistency(conn: sqlite3.Connection) -> list[dict]:
     stored values may be off by a factor of 1,000.
     """
     issues = []
+    scope, params = file_scope_clause("source_file", files)
     try:
-        rows = conn.execute("""
+        rows = conn.execute(f"""
             SELECT exhibit_type, source_file, amount_unit, COUNT(*) AS n
             FROM budget_lines
-            WHERE amount_unit IS NOT NULL AND amount_unit != 'thousands'
+            WHERE amount_unit IS NOT NULL AND amount_unit != 'thousands'{scope}
             GROUP BY exhibit_type, source_file, amount_unit
             ORDER BY n DESC
-        """).fetchall()
+        """, params).fetchall()
     except sqlite3.OperationalError:
         # Column may not exist in pre-1.B3-b databases
         return []
@@ -379,20 +450,27 @@ def check_pe_number_format(conn: sqlite3.Connection) -> list[dict]:
 
 
 # VALDB-002: Negative amount detection
-def check_negative_amounts(conn: sqlite3.Connection) -> list[dict]:
+def check_negative_amounts(conn: sqlite3.Connection,
+                           stats: dict | None = None) -> list[dict]:
     """Surface line items with negative dollar amounts for review.
 
     Negative amounts can be legitimate (e.g., rescissions, reductions), but
     are unusual enough that they warrant explicit review.  Flagged as *info*
     rather than warning so they don't inflate the warning count.
+    ``stats`` is a :func:`budget_line_stats` result (OPT-VAL-001).
     """
     issues = []
     amount_cols = _get_amount_columns(conn)
     if not amount_cols:
         return issues
+    if stats is None:
+        stats = budget_line_stats(conn)
 
     for col in amount_cols:
         _validate_identifier(col, "column name")
+        total = stats["negative"].get(col, 0)
+        if not total:
+            continue
         try:
             rows = conn.execute(f"""
                 SELECT source_file, exhibit_type, account_title,
@@ -400,7 +478,7 @@ def check_negative_amounts(conn: sqlite3.Connection) -> list[dict]:
                 FROM budget_lines
                 WHERE {col} < 0
                 ORDER BY {col}
-                LIMIT 50
+                LIMIT 5
             """).fetchall()
         except sqlite3.OperationalError:
             continue  # Table/column may not exist
@@ -409,9 +487,6 @@ def check_negative_amounts(conn: sqlite3.Connection) -> list[dict]:
             continue
 
         if rows:
-            total = conn.execute(
-                f"SELECT COUNT(*) AS cnt FROM budget_lines WHERE {col} < 0"
-            ).fetchone()["cnt"]
             issues.append({
                 "check": "negative_amounts",
                 "severity": "info",
@@ -1094,21 +1169,27 @@ def check_budget_activity_consistency(conn: sqlite3.Connection) -> list[dict]:
     return issues
 
 
-def check_extreme_outliers(conn: sqlite3.Connection) -> list[dict]:
+def check_extreme_outliers(conn: sqlite3.Connection,
+                           stats: dict | None = None) -> list[dict]:
     """Flag amount values that are implausibly large (> $1 trillion).
 
     Amounts are stored in thousands; $1T = 1,000,000,000 thousands.
     Values exceeding this suggest a parsing error (e.g., reading a
     quantity column as a dollar amount, or a misplaced decimal).
+    ``stats`` is a :func:`budget_line_stats` result (OPT-VAL-001).
 
     Severity: WARNING
     """
     issues = []
     amount_cols = _get_amount_columns(conn)
-    threshold = 1_000_000_000  # $1T in thousands
+    threshold = _OUTLIER_THRESHOLD
+    if amount_cols and stats is None:
+        stats = budget_line_stats(conn)
 
     for col in amount_cols:
         _validate_identifier(col, "column name")
+        if not stats["outlier"].get(col):
+            continue
         try:
             rows = conn.execute(f"""
                 SELECT source_file, exhibit_type, pe_number,
@@ -1391,12 +1472,14 @@ def check_enrichment_staleness(conn: sqlite3.Connection) -> list[dict]:
     return issues
 
 
-def check_fy_column_null_rates(conn: sqlite3.Connection) -> list[dict]:
+def check_fy_column_null_rates(conn: sqlite3.Connection,
+                               stats: dict | None = None) -> list[dict]:
     """Flag FY amount columns where >50% of values are NULL.
 
     High NULL rates in a specific column suggest incomplete data
     extraction (e.g., a parser couldn't read that column from certain
-    exhibit types).
+    exhibit types).  ``stats`` is a :func:`budget_line_stats` result
+    (OPT-VAL-001).
 
     Severity: WARNING if >50%, INFO if >25%
     """
@@ -1405,31 +1488,21 @@ def check_fy_column_null_rates(conn: sqlite3.Connection) -> list[dict]:
     if not amount_cols:
         return issues
 
-    try:
-        total_rows = conn.execute(
-            "SELECT COUNT(*) AS c FROM budget_lines"
-        ).fetchone()["c"]
-    except sqlite3.OperationalError:
-        return []  # Table/column may not exist
-    except Exception as e:
-        logger.debug("Unexpected error in check_fy_column_null_rates: %s", e, exc_info=True)
-        return []
-
-    if total_rows == 0:
-        return []
-
-    for col in amount_cols:
-        _validate_identifier(col, "column name")
+    if stats is None:
         try:
-            null_count = conn.execute(
-                f"SELECT COUNT(*) AS c FROM budget_lines WHERE {col} IS NULL"
-            ).fetchone()["c"]
+            stats = budget_line_stats(conn)
         except sqlite3.OperationalError:
-            continue  # Table/column may not exist
+            return []  # Table/column may not exist
         except Exception as e:
             logger.debug("Unexpected error in check_fy_column_null_rates: %s", e, exc_info=True)
-            continue
+            return []
 
+    total_rows = stats["total"]
+    if total_rows == 0:
+        return []
+
+    for col in amount_cols:
+        null_count = stats["null"].get(col, 0)
         pct = round(null_count / total_rows * 100, 1)
         if pct > 25:
             severity = "warning" if pct > 50 else "info"
@@ -1448,7 +1521,8 @@ def check_fy_column_null_rates(conn: sqlite3.Connection) -> list[dict]:
     return issues
 
 
-def check_duplicate_budget_lines(conn: sqlite3.Connection) -> list[dict]:
+def check_duplicate_budget_lines(conn: sqlite3.Connection,
+                                 files: set[str] | None = None) -> list[dict]:
     """Flag budget lines that appear to be exact duplicates.
 
     Detects rows sharing the same (source_file, exhibit_type, fiscal_year,
@@ -1456,19 +1530,20 @@ def check_duplicate_budget_lines(conn: sqlite3.Connection) -> list[dict]:
     a row was ingested multiple times from the same source.
     """
     issues: list[dict] = []
+    scope, params = file_scope_clause("source_file", files)
     try:
-        rows = conn.execute("""
+        rows = conn.execute(f"""
             SELECT source_file, exhibit_type, fiscal_year,
                    pe_number, line_item_title, organization_name,
                    COUNT(*) AS cnt
             FROM budget_lines
-            WHERE pe_number IS NOT NULL AND line_item_title IS NOT NULL
+            WHERE pe_number IS NOT NULL AND line_item_title IS NOT NULL{scope}
             GROUP BY source_file, exhibit_type, fiscal_year,
                      pe_number, line_item_title, organization_name
             HAVING COUNT(*) > 1
             ORDER BY COUNT(*) DESC
             LIMIT 20
-        """).fetchall()
+        """, params).fetchall()
 
         for r in rows:
             issues.append({
@@ -1609,11 +1684,202 @@ ALL_CHECKS = [
 ]
 
 
-def generate_json_report(conn: sqlite3.Connection) -> dict:
+# OPT-VAL-001: checks fed by the fused budget_line_stats() scan.
+_STATS_CHECKS = frozenset({
+    check_zero_amounts,
+    check_negative_amounts,
+    check_extreme_outliers,
+    check_fy_column_null_rates,
+})
+
+DEFAULT_VALIDATION_WORKERS = min(4, os.cpu_count() or 1)
+
+# OPT-VAL-002: checks whose issues are each tied to one file, mapped to
+# (file key in an issue, sort key, issue cap) so a run restricted to the
+# changed files can be merged into the previous report's issues.
+_FILE_SCOPED_CHECKS = {
+    check_duplicates: ("source_file", "count", 50),
+    check_column_alignment: ("source_file", "count", 20),
+    check_unit_consistency: ("file_path", None, None),
+    check_duplicate_budget_lines: ("source_file", "duplicate_count", 20),
+}
+
+
+def _merge_file_scoped(check_fn, fresh: list[dict], previous: list[dict],
+                       files: set[str], present: set[str]) -> list[dict]:
+    """Replace previous issues for changed or removed files with ``fresh``."""
+    key, sort_key, cap = _FILE_SCOPED_CHECKS[check_fn]
+    issues = [i for i in previous
+              if i.get(key) not in files and i.get(key) in present]
+    issues += fresh
+    if sort_key:
+        issues.sort(key=lambda i: i.get(sort_key) or 0, reverse=True)
+    return issues[:cap] if cap else issues
+
+
+def resolve_validation_scope(
+    conn: sqlite3.Connection,
+    since_session: str | None,
+    previous: dict | None,
+) -> tuple[set[str] | None, dict[str, list[dict]]]:
+    """Work out the changed files and previous issues for an incremental run.
+
+    ``previous`` is an earlier :func:`generate_json_report` result.  Returns
+    ``(None, {})`` — a full run — when ``since_session`` is None, there is no
+    usable previous report, or too many files changed.
+    """
+    if since_session is None:
+        return None, {}
+    prev_issues = {c["name"]: c["issues"] for c in (previous or {}).get("checks", [])
+                   if isinstance(c.get("issues"), list)}
+    if not prev_issues:
+        logger.info("No previous report to merge with — running full validation")
+        return None, {}
+    files = incremental_file_scope(conn, since_session,
+                                   previous.get("validated_through"),
+                                   previous.get("data_generation"))
+    return (files, prev_issues) if files is not None else (None, {})
+
+
+def _database_file(conn: sqlite3.Connection) -> Path | None:
+    """Return the main database file behind ``conn`` (None for :memory:)."""
+    for row in conn.execute("PRAGMA database_list").fetchall():
+        if row[1] == "main":
+            return Path(row[2]) if row[2] else None
+    return None
+
+
+def run_checks(
+    conn: sqlite3.Connection,
+    checks: list | None = None,
+    workers: int | None = None,
+    files: set[str] | None = None,
+    previous: dict[str, list[dict]] | None = None,
+) -> tuple[list[tuple[str, list[dict], float]], dict]:
+    """Run validation checks and return per-check results plus timings.
+
+    OPT-VAL-001: the row-level checks in ``_STATS_CHECKS`` share a single
+    :func:`budget_line_stats` scan run on ``conn``.  The remaining checks are
+    independent queries; with ``workers > 1`` they run concurrently on
+    per-thread read-only connections (SQLite releases the GIL while a query
+    executes).  Checks fall back to running sequentially on ``conn`` for
+    in-memory databases or when ``conn`` holds uncommitted changes the
+    other connections could not see.
+
+    OPT-VAL-002: with ``files`` the checks in ``_FILE_SCOPED_CHECKS`` that
+    have an entry in ``previous`` (check name -> issues) only scan those
+    source files, and their issues are merged with the previous ones for
+    every other file still in ``ingested_files``.
+
+    Returns:
+        ``([(name, issues, duration_ms), ...], timing)`` in ``checks``
+        order, where ``timing`` has ``total_ms``, ``scan_ms`` and ``workers``.
+    """
+    checks = ALL_CHECKS if checks is None else checks
+    workers = DEFAULT_VALIDATION_WORKERS if workers is None else max(1, workers)
+    db_file = _database_file(conn)
+    if db_file is None or conn.in_transaction:
+        workers = 1
+
+    t_start = time.perf_counter()
+    durations: dict[int, float] = {}
+    results: dict[int, list[dict]] = {}
+
+    def _timed(idx: int, check_fn, c: sqlite3.Connection, **kwargs) -> list[dict]:
+        t0 = time.perf_counter()
+        try:
+            return check_fn(c, **kwargs)
+        finally:
+            durations[idx] = round((time.perf_counter() - t0) * 1000, 1)
+
+    local = threading.local()
+    opened: list[sqlite3.Connection] = []
+    opened_lock = threading.Lock()
+
+    def _worker_conn() -> sqlite3.Connection:
+        c = getattr(local, "conn", None)
+        if c is None:
+            c = create_connection(db_file, read_only=True, pragmas=False)
+            local.conn = c
+            with opened_lock:
+                opened.append(c)
+        return c
+
+    scoped = set()
+    if files is not None and previous:
+        scoped = {fn for name, fn in checks
+                  if fn in _FILE_SCOPED_CHECKS and name in previous}
+    scope_kwargs = {"files": files}
+
+    def _run_on_worker(idx: int, check_fn) -> list[dict]:
+        return _timed(idx, check_fn, _worker_conn(),
+                      **(scope_kwargs if check_fn in scoped else {}))
+
+    sql_checks = [(i, fn) for i, (_n, fn) in enumerate(checks)
+                  if fn not in _STATS_CHECKS]
+    stats_checks = [(i, fn) for i, (_n, fn) in enumerate(checks)
+                    if fn in _STATS_CHECKS]
+
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        futures = {}
+        if executor is not None:
+            futures = {i: executor.submit(_run_on_worker, i, fn)
+                       for i, fn in sql_checks}
+
+        scan_ms = 0.0
+        if stats_checks:
+            t0 = time.perf_counter()
+            stats = budget_line_stats(conn)
+            scan_ms = round((time.perf_counter() - t0) * 1000, 1)
+            for i, fn in stats_checks:
+                results[i] = _timed(i, fn, conn, stats=stats)
+
+        if executor is None:
+            for i, fn in sql_checks:
+                results[i] = _timed(i, fn, conn,
+                                    **(scope_kwargs if fn in scoped else {}))
+        else:
+            for i, fut in futures.items():
+                results[i] = fut.result()
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+        for c in opened:
+            c.close()
+
+    if scoped:
+        present = {r[0] for r in conn.execute("SELECT file_path FROM ingested_files")}
+        for i, (name, fn) in enumerate(checks):
+            if fn in scoped:
+                results[i] = _merge_file_scoped(fn, results[i], previous[name],
+                                                files, present)
+
+    ordered = [(name, results[i], durations[i])
+               for i, (name, _fn) in enumerate(checks)]
+    timing = {
+        "total_ms": round((time.perf_counter() - t_start) * 1000, 1),
+        "scan_ms": scan_ms,
+        "workers": workers,
+    }
+    return ordered, timing
+
+
+def generate_json_report(conn: sqlite3.Connection,
+                         workers: int | None = None,
+                         since_session: str | None = None,
+                         previous: dict | None = None) -> dict:
     """Run all checks and return results as a JSON-serialisable dict.
 
     Intended for machine-readable output via ``--json``.  The returned dict
-    contains a ``checks`` list (one entry per check) plus top-level counts.
+    contains a ``checks`` list (one entry per check, each with its
+    ``duration_ms``) plus top-level counts and a ``timing`` block
+    (OPT-VAL-001).  ``workers`` is passed to :func:`run_checks`.
+
+    With ``since_session`` and a ``previous`` report, per-file checks only
+    re-examine changed files (OPT-VAL-002); ``scope`` records which mode ran
+    and ``validated_through`` and ``data_generation`` are the cut-offs for
+    the next incremental run.
     """
     total_lines = conn.execute("SELECT COUNT(*) AS c FROM budget_lines").fetchone()["c"]
     total_pages = conn.execute("SELECT COUNT(*) AS c FROM pdf_pages").fetchone()["c"]
@@ -1624,8 +1890,10 @@ def generate_json_report(conn: sqlite3.Connection) -> dict:
     severity_counts = {"error": 0, "warning": 0, "info": 0}
     pdf_quality_score = None
 
-    for check_name, check_fn in ALL_CHECKS:
-        issues = check_fn(conn)
+    files, prev_issues = resolve_validation_scope(conn, since_session, previous)
+    check_results, timing = run_checks(conn, workers=workers, files=files,
+                                       previous=prev_issues)
+    for check_name, issues, duration_ms in check_results:
         count = len(issues)
         total_issues += count
         for issue in issues:
@@ -1639,6 +1907,7 @@ def generate_json_report(conn: sqlite3.Connection) -> dict:
             "status": status,
             "issue_count": count,
             "issues": issues,
+            "duration_ms": duration_ms,
         })
 
     result = {
@@ -1654,6 +1923,14 @@ def generate_json_report(conn: sqlite3.Connection) -> dict:
             "info": severity_counts["info"],
         },
         "checks": checks_output,
+        "timing": timing,
+        "scope": (
+            {"mode": "incremental", "changed_files": len(files)}
+            if files is not None else {"mode": "full"}
+        ),
+        "validated_through": conn.execute(
+            "SELECT MAX(ingested_at) FROM ingested_files").fetchone()[0],
+        "data_generation": get_data_generation(conn) or 0,
     }
     # TIGER-006: Include PDF quality score in report
     if pdf_quality_score is not None:
@@ -1661,7 +1938,10 @@ def generate_json_report(conn: sqlite3.Connection) -> dict:
     return result
 
 
-def generate_report(conn: sqlite3.Connection, verbose: bool = False) -> int:
+def generate_report(conn: sqlite3.Connection, verbose: bool = False,
+                    workers: int | None = None,
+                    since_session: str | None = None,
+                    previous: dict | None = None) -> int:
     """Run all checks and print a summary report. Returns total issue count."""
     print("=" * 65)
     print("  DoD BUDGET DATABASE VALIDATION REPORT")
@@ -1680,8 +1960,10 @@ def generate_report(conn: sqlite3.Connection, verbose: bool = False) -> int:
     total_issues = 0
     severity_counts = {"error": 0, "warning": 0, "info": 0}
 
-    for check_name, check_fn in ALL_CHECKS:
-        issues = check_fn(conn)
+    files, prev_issues = resolve_validation_scope(conn, since_session, previous)
+    check_results, timing = run_checks(conn, workers=workers, files=files,
+                                       previous=prev_issues)
+    for check_name, issues, duration_ms in check_results:
         count = len(issues)
         total_issues += count
 
@@ -1694,7 +1976,8 @@ def generate_report(conn: sqlite3.Connection, verbose: bool = False) -> int:
                 {i["severity"] for i in issues}, upper=True
             )
 
-        print(f"\n  [{status:>4}] {check_name} — {count} issue(s)")
+        print(f"\n  [{status:>4}] {check_name} — {count} issue(s)"
+              + (f" [{duration_ms:,.0f} ms]" if verbose else ""))
 
         if verbose and issues:
             for issue in issues[:20]:
@@ -1715,6 +1998,9 @@ def generate_report(conn: sqlite3.Connection, verbose: bool = False) -> int:
         print(f"    Errors:   {severity_counts['error']}")
         print(f"    Warnings: {severity_counts['warning']}")
         print(f"    Info:     {severity_counts['info']}")
+    print(f"  Checks ran in {timing['total_ms'] / 1000:.1f}s "
+          f"({timing['workers']} worker(s))"
+          + (f", {len(files)} changed file(s) re-checked" if files is not None else ""))
     print(f"{'=' * 65}")
 
     return total_issues
@@ -1794,9 +2080,15 @@ _HTML_TEMPLATE = """<!DOCTYPE html>
 </html>"""
 
 
-def generate_html_report(conn: sqlite3.Connection) -> str:
-    """Run all checks and return a styled HTML report (TIGER-007)."""
-    report = generate_json_report(conn)
+def generate_html_report(conn: sqlite3.Connection,
+                         report: dict | None = None) -> str:
+    """Run all checks and return a styled HTML report (TIGER-007).
+
+    Pass an existing :func:`generate_json_report` result as ``report`` to
+    render it without re-running the checks.
+    """
+    if report is None:
+        report = generate_json_report(conn)
 
     check_rows = []
     check_details = []
@@ -1871,25 +2163,46 @@ def main():
     parser.add_argument("--threshold", default="error",
                         choices=["info", "warning", "error"],
                         help="Exit non-zero if issues at/above this severity (default: error)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_VALIDATION_WORKERS,
+                        help="Concurrent read-only connections for independent "
+                             f"checks (default: {DEFAULT_VALIDATION_WORKERS}; "
+                             "1 = sequential)")
+    parser.add_argument("--since-session", nargs="?", const="last", default=None,
+                        metavar="SESSION_ID",
+                        help="Re-check per-file findings only for files from this "
+                             "build session (default: the last one), merging "
+                             "with --previous (OPT-VAL-002)")
+    parser.add_argument("--previous", type=Path, default=None,
+                        help="Earlier --json report to merge with for --since-session")
     args = parser.parse_args()
 
+    previous = None
+    if args.since_session is not None and args.previous is not None:
+        try:
+            previous = json.loads(args.previous.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable previous report %s: %s",
+                           args.previous, e)
+    scope = {"since_session": args.since_session, "previous": previous}
+
     conn = get_connection(args.db)
 
     if args.html:
-        html = generate_html_report(conn)
+        report = generate_json_report(conn, workers=args.workers, **scope)
+        html = generate_html_report(conn, report=report)
         print(html)
-        report = generate_json_report(conn)
         should_fail = _exceeds_threshold(report, args.threshold)
         conn.close()
         sys.exit(1 if should_fail else 0)
     elif args.json:
-        report = generate_json_report(conn)
+        report = generate_json_report(conn, workers=args.workers, **scope)
         print(json.dumps(report, indent=2))
         should_fail = _exceeds_threshold(report, args.threshold)
         conn.close()
         sys.exit(1 if should_fail else 0)
     else:
-        issue_count = generate_report(conn, verbose=args.verbose)
+        issue_count = generate_report(conn, verbose=args.verbose,
+                                      workers=args.workers, **scope)
         conn.close()
         sys.exit(1 if issue_count > 0 else 0)
 
@@ -20,23 +20,32 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import itertools
 import json
 import logging
+import multiprocessing
 import os
 import re
 import sqlite3
 import sys
 import threading
 import time
-from collections import Counter
+from collections import Counter, deque
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait,
+)
 from pathlib import Path
+from typing import Any, Callable, Iterable
 
 from utils import get_connection
+from utils.database import bump_data_generation
+from utils.keyword_matcher import KeywordMatcher, fold_text
 from utils.normalization import infer_ba_from_pe
 from utils.patterns import PE_NUMBER, FISCAL_YEAR
 from utils.progress import log_progress
 from utils.query import make_placeholders
 from utils.strings import normalize_fiscal_year
+from utils.suggestions import refresh_suggestion_index
 from pipeline.r2_pdf_extractor import parse_r2_header_metadata
 from pipeline.schema import migrate as _schema_migrate
 from utils.pdf_sections import (
@@ -123,12 +132,6 @@ _TAXONOMY: list[tuple[str, list[str]]] = [
                            r"military\s+health", r"\bDHP\b"]),
 ]
 
-# Pre-compile all taxonomy patterns
-_COMPILED_TAXONOMY: list[tuple[str, list[re.Pattern]]] = [
-    (tag, [re.compile(term, re.IGNORECASE) for term in terms])
-    for tag, terms in _TAXONOMY
-]
-
 # ── Tier-2 taxonomy — broader signal, lower confidence ─────────────────────────
 # Confidence assigned in run_phase3(): 0.7 (budget_lines), 0.65 (PDF narrative).
 # Standalone _tags_from_keywords() uses 0.7 for tier-2 terms.
@@ -181,10 +184,23 @@ _TAXONOMY_TIER2: list[tuple[str, list[str]]] = [
                             r"find,?\s*fix,?\s*track,?\s*target"]),
 ]
 
-_COMPILED_TAXONOMY_TIER2: list[tuple[str, list[re.Pattern]]] = [
-    (tag, [re.compile(term, re.IGNORECASE) for term in terms])
-    for tag, terms in _TAXONOMY_TIER2
-]
+# OPT-ENRICH-002: Both tiers compiled into one multi-pattern matcher; indexes
+# below _TIER1_COUNT are tier-1 tags.
+_TAXONOMY_MATCHER = KeywordMatcher(_TAXONOMY + _TAXONOMY_TIER2)
+_TIER1_COUNT = len(_TAXONOMY)
+
+
+def _keyword_tags(text: str, tier1_conf: float,
+                  tier2_conf: float) -> list[tuple[str, float]]:
+    """Return (tag, confidence) for every taxonomy tag matching *text*.
+
+    Tier-1 tags come first, then tier-2, each in taxonomy order.
+    """
+    tags = _TAXONOMY_MATCHER.tags
+    return [
+        (tags[i], tier1_conf if i < _TIER1_COUNT else tier2_conf)
+        for i in _TAXONOMY_MATCHER.match_indexes(text)
+    ]
 
 # ── Structured field → tag mappings ───────────────────────────────────────────
 
@@ -338,6 +354,123 @@ def _log_progress(
     log_progress(phase_name, completed, total, start_time, logger=logger)
 
 
+# ── Parallel chunk runner ─────────────────────────────────────────────────────
+# OPT-ENRICH-004: The text phases (2, 4, 5, 9) spend their time in pure-Python
+# parsing and regex scans; only their SQLite writes must be serialized.
+# _map_chunks() maps chunks of input rows over a process pool and reduces the
+# results, in input order, into the caller's single writer connection.
+
+_WORKER_CONTEXT: Any = None
+
+
+def _init_worker(context: Any) -> None:
+    """Pool initializer: receive the phase's read-only lookup data once."""
+    global _WORKER_CONTEXT
+    _WORKER_CONTEXT = context
+
+
+def _call_in_worker(map_fn: Callable[[Any, list], Any], items: list) -> Any:
+    return map_fn(_WORKER_CONTEXT, items)
+
+
+def _default_workers() -> int:
+    """Worker processes used by enrich() when none are requested (0 = auto)."""
+    return min(os.cpu_count() or 1, 4)
+
+
+def _pool_context() -> multiprocessing.context.BaseContext | None:
+    """Start method for worker pools (None = platform default).
+
+    fork() while other threads hold locks (logging, SQLite) can deadlock
+    the child, so once enrich() runs phases in threads, workers are started
+    from a forkserver instead.
+    """
+    if (threading.active_count() > 1
+            and "forkserver" in multiprocessing.get_all_start_methods()):
+        ctx = multiprocessing.get_context("forkserver")
+        # Import this module once in the server, not in every worker
+        ctx.set_forkserver_preload([__name__])
+        return ctx
+    return None
+
+
+def _map_chunks(
+    conn: sqlite3.Connection,
+    chunks: Iterable[tuple[int | None, list]],
+    map_fn: Callable[[Any, list], Any],
+    write_fn: Callable[[Any], None],
+    *,
+    context: Any = None,
+    phase: int | None = None,
+    stop_event: threading.Event | None = None,
+    workers: int = 1,
+) -> bool:
+    """Run ``map_fn(context, items)`` for each chunk and write the results.
+
+    *chunks* yields ``(checkpoint_rowid, items)``; *map_fn* must be a
+    module-level function so it can be sent to worker processes.  Results
+    are passed to *write_fn* strictly in chunk order, each followed by
+    ``_save_checkpoint(conn, phase, checkpoint_rowid)`` (when both are set)
+    and a commit, so an interrupted run resumes exactly as the serial loop
+    did.  At most ``2 * workers`` chunks are in flight.
+
+    With ``workers <= 1`` everything runs in-process.  Returns True if
+    *stop_event* interrupted the run; chunks not yet written are discarded.
+    """
+    def _write(checkpoint: int | None, result: Any) -> None:
+        write_fn(result)
+        if phase is not None and checkpoint is not None:
+            _save_checkpoint(conn, phase, checkpoint)
+        conn.commit()
+
+    def _stopped() -> bool:
+        return bool(stop_event and stop_event.is_set())
+
+    if workers <= 1:
+        for checkpoint, items in chunks:
+            if _stopped():
+                return True
+            _write(checkpoint, map_fn(context, items))
+        return False
+
+    pending: deque = deque()
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context(),
+                               initializer=_init_worker, initargs=(context,))
+    try:
+        for checkpoint, items in chunks:
+            if _stopped():
+                return True
+            pending.append((checkpoint, pool.submit(_call_in_worker, map_fn, items)))
+            if len(pending) >= 2 * workers:
+                checkpoint, future = pending.popleft()
+                _write(checkpoint, future.result())
+        while pending:
+            if _stopped():
+                return True
+            checkpoint, future = pending.popleft()
+            _write(checkpoint, future.result())
+        return False
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _rowid_chunks(conn: sqlite3.Connection, sql: str, after_rowid: int, size: int):
+    """Yield ``(last_rowid, rows)`` pages of *sql*, whose first column is rowid.
+
+    *sql* must end in ``rowid > ? ORDER BY rowid LIMIT ?``.  Every page is
+    a fresh, fully fetched query, so no read cursor stays open across the
+    caller's commits: when enrich() runs phases concurrently, a write on a
+    stale read snapshot fails with SQLITE_BUSY_SNAPSHOT.  Rows are plain
+    tuples: sqlite3.Row cannot be pickled to a worker.
+    """
+    while True:
+        rows = conn.execute(sql, (after_rowid, size)).fetchall()
+        if not rows:
+            return
+        after_rowid = rows[-1][0]
+        yield after_rowid, [tuple(r) for r in rows]
+
+
 def _drop_enrichment_tables(conn: sqlite3.Connection) -> None:
     # Drop FTS5 table first (depends on pe_descriptions content table)
     conn.execute("DROP TABLE IF EXISTS pe_descriptions_fts")
@@ -347,6 +480,18 @@ def _drop_enrichment_tables(conn: sqlite3.Connection) -> None:
         conn.execute(f"DROP TABLE IF EXISTS {table}")
     conn.commit()
     # Recreate the tables so enrichment phases can INSERT into them.
+    _create_enrichment_tables(conn)
+    logger.info("Dropped enrichment tables.")
+
+
+def _create_enrichment_tables(conn: sqlite3.Connection) -> None:
+    """Create any missing enrichment table, index and FTS trigger.
+
+    enrich() calls this before scheduling phases: a phase creating its
+    table lazily would change the schema under a concurrent phase, and a
+    statement whose triggers write pe_descriptions_fts fails with
+    SQLITE_SCHEMA instead of being re-prepared.
+    """
     # Import create_database's DDL for enrichment tables.
     conn.executescript("""
         CREATE TABLE IF NOT EXISTS pe_index (
@@ -499,7 +644,6 @@ def _drop_enrichment_tables(conn: sqlite3.Connection) -> None:
         CREATE INDEX IF NOT EXISTS idx_bli_desc_fy ON bli_descriptions(fiscal_year);
     """)
     conn.executescript(_BLI_PE_MAP_DDL)
-    logger.info("Dropped enrichment tables.")
 
 
 # ── Phase 1: Build pe_index ───────────────────────────────────────────────────
@@ -719,66 +863,86 @@ def run_phase1(conn: sqlite3.Connection, stop_event: threading.Event | None = No
 
 
 # ── Phase 2: Link PDFs to PEs ─────────────────────────────────────────────────
+#
+# OPT-ENRICH-001: The builder already records every PE mention per page in
+# pdf_pe_numbers (LION-103), so Phase 2 reads the mentions from there and
+# only pulls the text of pages that mention a PE in pe_index.  Pages without
+# a known PE never leave SQLite.  Databases whose pdf_pe_numbers is empty or
+# missing (built before LION-103) fall back to scanning every page with
+# PE_NUMBER.
+
+def _scan_pages(conn: sqlite3.Connection, source_file: str):
+    """Yield (page_number, page_text, None) for every page with text.
+
+    Without pdf_pe_numbers the PEs are found by regex-scanning the text,
+    which _phase2_map() does in the worker.
+    """
+    for page_num, page_text in conn.execute("""
+        SELECT page_number, page_text FROM pdf_pages
+        WHERE source_file = ?
+        ORDER BY page_number
+    """, (source_file,)):
+        if page_text:
+            yield page_num, page_text, None
 
-def run_phase2(conn: sqlite3.Connection, stop_event: threading.Event | None = None) -> int:
-    """Scan pdf_pages text for PE number mentions and populate pe_descriptions."""
-    logger.info("[Phase 2] Linking PDF pages to PE numbers...")
 
-    # Build set of known PE numbers for fast membership test
-    known_pes = {
-        r[0] for r in conn.execute("SELECT pe_number FROM pe_index").fetchall()
-    }
-    if not known_pes:
-        logger.info("pe_index is empty -- run Phase 1 first.")
-        return 0
+def _linked_pages(conn: sqlite3.Connection, source_file: str):
+    """Yield (page_number, page_text, pes) for pages pdf_pe_numbers links to
+    a PE in pe_index.
 
-    # Get all source files already processed (for incremental runs)
-    done_files = {
-        r[0] for r in conn.execute(
-            "SELECT DISTINCT source_file FROM pe_descriptions"
-        ).fetchall()
-    }
+    pdf_pe_numbers also covers table_data; a PE is kept only if it appears
+    in page_text, which is what the narrative runs are built from.
+    """
+    by_page: dict[int, tuple[int, list[str]]] = {}
+    for page_num, page_id, pe in conn.execute("""
+        SELECT n.page_number, n.pdf_page_id, n.pe_number
+        FROM pdf_pe_numbers n
+        JOIN pe_index pi ON pi.pe_number = n.pe_number
+        WHERE n.source_file = ?
+        ORDER BY n.page_number, n.pdf_page_id, n.pe_number
+    """, (source_file,)):
+        by_page.setdefault(page_id, (page_num, []))[1].append(pe)
+    if not by_page:
+        return
+    texts = dict(conn.execute(
+        "SELECT id, page_text FROM pdf_pages "
+        "WHERE id IN (SELECT value FROM json_each(?))",
+        (json.dumps(list(by_page)),)))
+    for page_id, (page_num, pes) in by_page.items():
+        page_text = texts.get(page_id)
+        if not page_text:
+            continue
+        pes = [pe for pe in dict.fromkeys(pes) if pe in page_text]
+        if pes:
+            yield page_num, page_text, pes
 
-    # Get all distinct source files in pdf_pages
-    pdf_files = conn.execute("""
-        SELECT DISTINCT source_file FROM pdf_pages ORDER BY source_file
-    """).fetchall()
-    pdf_files = [r[0] for r in pdf_files if r[0] not in done_files]
 
-    if not pdf_files:
-        logger.info("All PDF files already processed -- nothing to do.")
-        return 0
+_PHASE2_FILES_PER_CHUNK = 25  # PDF files per worker task
 
-    logger.info("Processing %d PDF file(s)...", len(pdf_files))
-    total_desc = 0
-    insert_buf: list[tuple] = []
-    t0_mono = time.monotonic()
 
-    errors: list[str] = []
-    for i, source_file in enumerate(pdf_files, 1):
-        if stop_event and stop_event.is_set():
-            logger.info("  Phase 2 stopped at file %d/%d.", i - 1, len(pdf_files))
-            break
+def _phase2_map(known_pes: set[str] | None,
+                files: list[tuple[str, list[tuple]]]) -> tuple[int, list[tuple], list]:
+    """Phase 2 worker: pe_descriptions rows for a chunk of PDF files.
+
+    *files* holds (source_file, pages) with pages from _linked_pages() or
+    _scan_pages(); a page whose PE list is None is regex-scanned against
+    *known_pes*.  Returns (files seen, pe_descriptions rows,
+    [(source_file, error)]).
+    """
+    inserts: list[tuple] = []
+    errors: list[tuple[str, str]] = []
+    for source_file, pages in files:
         try:
             fy = _extract_fy_from_path(source_file)
 
-            pages = conn.execute("""
-                SELECT page_number, page_text FROM pdf_pages
-                WHERE source_file = ?
-                ORDER BY page_number
-            """, (source_file,)).fetchall()
-
-            # Group consecutive pages that mention the same PE into runs
+            # Group pages that mention the same PE into runs
             # pe_number → (first_page, last_page, text_parts[])
             pe_runs: dict[str, dict] = {}
 
-            for page_num, page_text in pages:
-                if not page_text:
-                    continue
-                found = set(PE_NUMBER.findall(page_text))
+            for page_num, page_text, found in pages:
+                if found is None:
+                    found = sorted(set(PE_NUMBER.findall(page_text)) & known_pes)
                 for pe in found:
-                    if pe not in known_pes:
-                        continue
                     if pe not in pe_runs:
                         pe_runs[pe] = {
                             "page_start": page_num,
@@ -790,6 +954,7 @@ def run_phase2(conn: sqlite3.Connection, stop_event: threading.Event | None = No
                         pe_runs[pe]["parts"].append(page_text)
 
             # For each PE run in this file, extract narrative sections
+            file_rows: list[tuple] = []
             for pe, run in pe_runs.items():
                 run_text = "\n\n".join(run["parts"])
                 run_text = strip_exhibit_headers(run_text)
@@ -798,7 +963,7 @@ def run_phase2(conn: sqlite3.Connection, stop_event: threading.Event | None = No
                 sections = parse_narrative_sections(run_text)
                 if sections:
                     for sec in sections:
-                        insert_buf.append((
+                        file_rows.append((
                             pe, fy, source_file,
                             run["page_start"], run["page_end"],
                             sec["header"], sec["text"],
@@ -807,37 +972,107 @@ def run_phase2(conn: sqlite3.Connection, stop_event: threading.Event | None = No
                     # No recognised section headers — store full text under blank header
                     text = run_text[:_MAX_NARRATIVE_TEXT_CHARS]
                     if text.strip():
-                        insert_buf.append((
+                        file_rows.append((
                             pe, fy, source_file,
                             run["page_start"], run["page_end"],
                             None, text,
                         ))
         except Exception as exc:
-            errors.append(f"{source_file}: {exc}")
-            logger.warning("Error processing %s: %s", source_file, exc)
+            errors.append((source_file, str(exc)))
             continue
+        inserts.extend(file_rows)
+    return len(files), inserts, errors
+
+
+def run_phase2(conn: sqlite3.Connection, stop_event: threading.Event | None = None,
+               workers: int = 1) -> int:
+    """Link PDF pages to PE numbers and populate pe_descriptions."""
+    logger.info("[Phase 2] Linking PDF pages to PE numbers...")
 
-        if insert_buf and (i % 50 == 0 or i == len(pdf_files)):
+    # Build set of known PE numbers for fast membership test
+    known_pes = {
+        r[0] for r in conn.execute("SELECT pe_number FROM pe_index").fetchall()
+    }
+    if not known_pes:
+        logger.info("pe_index is empty -- run Phase 1 first.")
+        return 0
+
+    # Get all source files already processed (for incremental runs)
+    done_files = {
+        r[0] for r in conn.execute(
+            "SELECT DISTINCT source_file FROM pe_descriptions"
+        ).fetchall()
+    }
+
+    try:
+        use_junction = conn.execute(
+            "SELECT 1 FROM pdf_pe_numbers LIMIT 1").fetchone() is not None
+    except sqlite3.OperationalError:
+        # pdf_pe_numbers table may not exist
+        use_junction = False
+    if use_junction:
+        # Only files with at least one known-PE mention can yield runs
+        pdf_files = conn.execute("""
+            SELECT DISTINCT n.source_file FROM pdf_pe_numbers n
+            JOIN pe_index pi ON pi.pe_number = n.pe_number
+            ORDER BY n.source_file
+        """).fetchall()
+    else:
+        logger.info("  pdf_pe_numbers is empty -- scanning page text instead.")
+        pdf_files = conn.execute("""
+            SELECT DISTINCT source_file FROM pdf_pages ORDER BY source_file
+        """).fetchall()
+    pdf_files = [r[0] for r in pdf_files if r[0] not in done_files]
+
+    if not pdf_files:
+        logger.info("All PDF files already processed -- nothing to do.")
+        return 0
+
+    logger.info("Processing %d PDF file(s)...", len(pdf_files))
+    total_desc = 0
+    files_done = 0
+    t0_mono = time.monotonic()
+    errors: list[str] = []
+
+    def _file_chunks():
+        # Page text is read here; run building and section parsing happen
+        # in _phase2_map().
+        for start in range(0, len(pdf_files), _PHASE2_FILES_PER_CHUNK):
+            batch = []
+            for source_file in pdf_files[start:start + _PHASE2_FILES_PER_CHUNK]:
+                try:
+                    if use_junction:
+                        pages = list(_linked_pages(conn, source_file))
+                    else:
+                        pages = list(_scan_pages(conn, source_file))
+                except Exception as exc:
+                    errors.append(f"{source_file}: {exc}")
+                    logger.warning("Error processing %s: %s", source_file, exc)
+                    continue
+                batch.append((source_file, pages))
+            yield None, batch
+
+    def _write(result: tuple[int, list[tuple], list[tuple[str, str]]]) -> None:
+        nonlocal files_done, total_desc
+        n_files, inserts, file_errors = result
+        files_done += n_files
+        for source_file, exc in file_errors:
+            errors.append(f"{source_file}: {exc}")
+            logger.warning("Error processing %s: %s", source_file, exc)
+        if inserts:
             conn.executemany("""
                 INSERT INTO pe_descriptions
                     (pe_number, fiscal_year, source_file, page_start, page_end,
                      section_header, description_text)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, insert_buf)
-            conn.commit()
-            total_desc += len(insert_buf)
-            insert_buf = []
-            _log_progress("Phase 2", i, len(pdf_files), t0_mono)
+            """, inserts)
+            total_desc += len(inserts)
+        _log_progress("Phase 2", files_done, len(pdf_files), t0_mono)
 
-    if insert_buf:
-        conn.executemany("""
-            INSERT INTO pe_descriptions
-                (pe_number, fiscal_year, source_file, page_start, page_end,
-                 section_header, description_text)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, insert_buf)
-        conn.commit()
-        total_desc += len(insert_buf)
+    if _map_chunks(conn, _file_chunks(), _phase2_map, _write,
+                   context=None if use_junction else known_pes,
+                   stop_event=stop_event, workers=workers):
+        logger.info("  Phase 2 stopped at file %d/%d.", files_done, len(pdf_files))
 
     if errors:
         logger.warning("%d file(s) had errors during Phase 2:", len(errors))
@@ -908,21 +1143,11 @@ def _tags_from_keywords(pe_number: str, text: str) -> list[tuple]:
     """Match description text against predefined domain taxonomy.
 
     Checks tier-1 taxonomy (confidence 0.9) then tier-2 broader terms
-    (confidence 0.7).  run_phase3() inlines equivalent loops with source-
-    differentiated confidence (budget_lines vs PDF narrative).
+    (confidence 0.7).  run_phase3() calls _keyword_tags() directly with
+    source-differentiated confidence (budget_lines vs PDF narrative).
     """
-    tags: list[tuple] = []
-    for tag, patterns in _COMPILED_TAXONOMY:
-        for pat in patterns:
-            if pat.search(text):
-                tags.append((pe_number, tag, "keyword", 0.9))
-                break
-    for tag, patterns in _COMPILED_TAXONOMY_TIER2:
-        for pat in patterns:
-            if pat.search(text):
-                tags.append((pe_number, tag, "keyword", 0.7))
-                break
-    return tags
+    return [(pe_number, tag, "keyword", conf)
+            for tag, conf in _keyword_tags(text, 0.9, 0.7)]
 
 
 def _tags_from_llm(
@@ -1144,47 +1369,23 @@ def run_phase3(conn: sqlite3.Connection, with_llm: bool = False,
         # LION-105: confidence=0.9 tier-1, 0.7 tier-2 (field-level match)
         bl_text = bl_texts.get(pe, "")
         if bl_text:
-            for tag, patterns in _COMPILED_TAXONOMY:
-                for pat in patterns:
-                    if pat.search(bl_text):
-                        insert_buf.append((pe, None, tag, "keyword", 0.9, pe_src_json))
-                        break
-            for tag, patterns in _COMPILED_TAXONOMY_TIER2:
-                for pat in patterns:
-                    if pat.search(bl_text):
-                        insert_buf.append((pe, None, tag, "keyword", 0.7, pe_src_json))
-                        break
+            for tag, conf in _keyword_tags(bl_text, 0.9, 0.7):
+                insert_buf.append((pe, None, tag, "keyword", conf, pe_src_json))
 
         # 3c: keyword tags from PDF narrative text (PE-level)
         # LION-105: confidence=0.8 tier-1, 0.65 tier-2 (narrative context, more noise)
         combined_desc = " ".join(desc_texts.get(pe, []))
         desc_src_json = json.dumps(desc_sources.get(pe, []))
         if combined_desc:
-            for tag, patterns in _COMPILED_TAXONOMY:
-                for pat in patterns:
-                    if pat.search(combined_desc):
-                        insert_buf.append((pe, None, tag, "keyword", 0.8, desc_src_json))
-                        break
-            for tag, patterns in _COMPILED_TAXONOMY_TIER2:
-                for pat in patterns:
-                    if pat.search(combined_desc):
-                        insert_buf.append((pe, None, tag, "keyword", 0.65, desc_src_json))
-                        break
+            for tag, conf in _keyword_tags(combined_desc, 0.8, 0.65):
+                insert_buf.append((pe, None, tag, "keyword", conf, desc_src_json))
 
         # HAWK-2: 3e: project-level keyword tags from project_descriptions
         # When project-level text is available, apply tags at the project level
         pe_projects = project_texts.get(pe, [])
         for proj_num, proj_text in pe_projects:
-            for tag, patterns in _COMPILED_TAXONOMY:
-                for pat in patterns:
-                    if pat.search(proj_text):
-                        insert_buf.append((pe, proj_num, tag, "keyword", 0.85, desc_src_json))
-                        break
-            for tag, patterns in _COMPILED_TAXONOMY_TIER2:
-                for pat in patterns:
-                    if pat.search(proj_text):
-                        insert_buf.append((pe, proj_num, tag, "keyword", 0.65, desc_src_json))
-                        break
+            for tag, conf in _keyword_tags(proj_text, 0.85, 0.65):
+                insert_buf.append((pe, proj_num, tag, "keyword", conf, desc_src_json))
 
         # Per-PE debug logging for rule-based tagger diagnostics
         pe_tags = insert_buf[buf_start:]
@@ -1279,7 +1480,126 @@ _MAX_NAME_MATCHES_PER_ROW = 3    # Cap name_match links per description row
 _MIN_TITLE_WORDS = 5             # Require at least 5 words in title for name matching
 
 
-def run_phase4(conn: sqlite3.Connection, stop_event: threading.Event | None = None) -> int:
+class _TitleIndex:
+    """Inverted index over PE titles for Phase 4 name matching (4b).
+
+    OPT-ENRICH-003: A title's pattern is its first _MIN_TITLE_WORDS words
+    joined by ``\\s+``, so every word but the first and last must be a whole
+    whitespace-delimited token of the text.  Titles are keyed by those inner
+    words (case-folded); candidates() tokenizes a description once and looks
+    up each token n-gram, so the work scales with text length rather than
+    with the size of the PE catalog.  Candidates are still confirmed with
+    the title's regex, so results match a full scan exactly.
+    """
+
+    def __init__(self, rows: list[tuple[str, str]]):
+        # (pe_number, pattern) in catalog order; the per-row cap relies on it.
+        self.entries: list[tuple[str, re.Pattern]] = []
+        self._by_ngram: dict[tuple[str, ...], list[int]] = {}
+        # Titles whose inner words are not ASCII (case-folding them exactly
+        # is not worth it) or that have no inner words: always verified.
+        self._unindexed: list[int] = []
+        for pe, title in rows:
+            words = title.split()
+            if len(words) < _MIN_TITLE_WORDS:
+                continue
+            match_words = words[:_MIN_TITLE_WORDS]
+            phrase = r"\s+".join(re.escape(w) for w in match_words)
+            idx = len(self.entries)
+            self.entries.append((pe, re.compile(phrase, re.IGNORECASE)))
+            inner = match_words[1:-1]
+            if inner and all(w.isascii() for w in inner):
+                self._by_ngram.setdefault(tuple(w.lower() for w in inner), []).append(idx)
+            else:
+                self._unindexed.append(idx)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def candidates(self, text: str) -> list[tuple[str, re.Pattern]]:
+        """Return (pe_number, pattern) for titles that may occur in *text*."""
+        hits = set(self._unindexed)
+        by_ngram = self._by_ngram
+        if by_ngram:
+            n = _MIN_TITLE_WORDS - 2
+            tokens = fold_text(text).split()
+            # The first title word ends the token before the n-gram and the
+            # last one starts the token after it.
+            for i in range(1, len(tokens) - n):
+                ids = by_ngram.get(tuple(tokens[i:i + n]))
+                if ids:
+                    hits.update(ids)
+        return [self.entries[i] for i in sorted(hits)]
+
+
+def _phase4_map(context, rows: list[tuple]) -> tuple[int, int, list[tuple]]:
+    """Phase 4 worker: lineage links for a chunk of pe_descriptions rows.
+
+    Returns (rows seen, rows skipped via done_pairs, pe_lineage rows).
+    """
+    known_pes, title_index, done_pairs = context
+    inserts: list[tuple] = []
+    skipped = 0
+    for _rowid, pe_num, fy, source_file, page_start, text in rows:
+        if (pe_num, source_file) in done_pairs:
+            skipped += 1
+            continue
+
+        # 4a: Explicit PE number references
+        # Collect explicit refs for dedup against name_match (strategy 5)
+        explicit_refs: set[str] = set()
+        for m in PE_NUMBER.finditer(text):
+            ref_pe = m.group()
+            if ref_pe == pe_num:
+                continue
+            if ref_pe not in known_pes:
+                continue
+            explicit_refs.add(ref_pe)
+            snippet = _context_window(text, m.start())
+            inserts.append((
+                pe_num, ref_pe, fy, source_file, page_start,
+                snippet, "explicit_pe_ref", 0.95,
+            ))
+
+        # 4b: Program name matching (title index candidates + noise reduction)
+        #
+        # Noise reduction strategies applied here:
+        #   Strategy 1: Skip name_match on very short text blocks
+        #   Strategy 2: Skip if text is a PE listing page (many PE refs)
+        #   Strategy 3: Cap name_match links per row
+        #   Strategy 5: Dedup — skip PEs already found via explicit_pe_ref
+
+        # Strategy 1: minimum text length for name matching
+        if len(text) < _MIN_TEXT_FOR_NAME_MATCH:
+            continue  # skip 4b entirely for this row — text too short
+
+        # Strategy 2: PE density filter — listing pages mention many PEs
+        if len(explicit_refs) > _MAX_PE_REFS_FOR_NAME_MATCH:
+            continue  # skip 4b — this is likely a summary/listing page
+
+        name_match_count = 0
+        for ref_pe, pattern in title_index.candidates(text):
+            if ref_pe == pe_num:
+                continue
+            # Strategy 5: skip name_match for PEs already found via 4a
+            if ref_pe in explicit_refs:
+                continue
+            # Strategy 3: cap name_match links per row
+            if name_match_count >= _MAX_NAME_MATCHES_PER_ROW:
+                break
+            name_m = pattern.search(text)
+            if name_m:
+                snippet = _context_window(text, name_m.start())
+                inserts.append((
+                    pe_num, ref_pe, fy, source_file, page_start,
+                    snippet, "name_match", 0.6,
+                ))
+                name_match_count += 1
+    return len(rows), skipped, inserts
+
+
+def run_phase4(conn: sqlite3.Connection, stop_event: threading.Event | None = None,
+               workers: int = 1) -> int:
     """Scan description text for PE number cross-references and name matches.
 
     Uses rowid-based checkpointing so interrupted runs can resume from where
@@ -1329,21 +1649,9 @@ def run_phase4(conn: sqlite3.Connection, stop_event: threading.Event | None = No
 
     # Build title index for name matching (phase 4b)
     # Only titles with >= _MIN_TITLE_WORDS words are useful to avoid false positives.
-    # Each entry includes lowercase keyword tokens for a fast pre-filter:
-    # skip the expensive regex unless ALL keywords appear in the text.
-    # This eliminates ~95% of regex calls (most titles don't match most texts).
-    title_index: list[tuple[str, tuple[str, ...], re.Pattern]] = []
-    for row in conn.execute(
+    title_index = _TitleIndex(conn.execute(
         "SELECT pe_number, display_title FROM pe_index WHERE display_title IS NOT NULL"
-    ).fetchall():
-        pe, title = row
-        words = title.split()
-        if len(words) >= _MIN_TITLE_WORDS:
-            match_words = words[:_MIN_TITLE_WORDS]
-            phrase = r"\s+".join(re.escape(w) for w in match_words)
-            # Pre-filter keywords: the first N words, lowered, for fast 'in' check
-            keywords = tuple(w.lower() for w in match_words)
-            title_index.append((pe, keywords, re.compile(phrase, re.IGNORECASE)))
+    ).fetchall())
 
     insert_buf: list[tuple] = []
     total = 0
@@ -1372,122 +1680,42 @@ def run_phase4(conn: sqlite3.Connection, stop_event: threading.Event | None = No
             f"{desc_remaining:,}", len(known_pes), len(title_index),
         )
 
-    # Stream pe_descriptions in chunks, ordered by rowid for deterministic
-    # checkpoint resumption.  Only fetch rows beyond the saved checkpoint.
-    cur = conn.execute("""
+    # Page through pe_descriptions by rowid for deterministic checkpoint
+    # resumption.  Only fetch rows beyond the saved checkpoint.
+    desc_sql = """
         SELECT rowid, pe_number, fiscal_year, source_file, page_start, description_text
         FROM pe_descriptions
         WHERE description_text IS NOT NULL AND rowid > ?
-        ORDER BY rowid
-    """, (checkpoint_rowid,))
+        ORDER BY rowid LIMIT ?
+    """
 
     rows_processed = 0
     skipped = 0
-    chunk_max_rowid = checkpoint_rowid
     t0_mono = time.monotonic()
-    while True:
-        if stop_event and stop_event.is_set():
-            logger.info("  Phase 4 stopped at row %s.", f"{rows_processed:,}")
-            # Flush pending inserts + save checkpoint before stopping
-            if insert_buf:
-                conn.executemany("""
-                    INSERT OR IGNORE INTO pe_lineage
-                        (source_pe, referenced_pe, fiscal_year, source_file,
-                         page_number, context_snippet, link_type, confidence)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, insert_buf)
-                total += len(insert_buf)
-                insert_buf = []
-            if chunk_max_rowid > checkpoint_rowid:
-                _save_checkpoint(conn, 4, chunk_max_rowid)
-            conn.commit()
-            break
-
-        chunk = cur.fetchmany(CHUNK)
-        if not chunk:
-            break
-
-        for rowid, pe_num, fy, source_file, page_start, text in chunk:
-            chunk_max_rowid = rowid  # ordered by rowid, so last = max
 
-            if use_done_pairs and (pe_num, source_file) in done_pairs:
-                skipped += 1
-                continue
-
-            # 4a: Explicit PE number references
-            # Collect explicit refs for dedup against name_match (strategy 5)
-            explicit_refs: set[str] = set()
-            for m in PE_NUMBER.finditer(text):
-                ref_pe = m.group()
-                if ref_pe == pe_num:
-                    continue
-                if ref_pe not in known_pes:
-                    continue
-                explicit_refs.add(ref_pe)
-                snippet = _context_window(text, m.start())
-                insert_buf.append((
-                    pe_num, ref_pe, fy, source_file, page_start,
-                    snippet, "explicit_pe_ref", 0.95,
-                ))
-
-            # 4b: Program name matching (with keyword pre-filter + noise reduction)
-            #
-            # Noise reduction strategies applied here:
-            #   Strategy 1: Skip name_match on very short text blocks
-            #   Strategy 2: Skip if text is a PE listing page (many PE refs)
-            #   Strategy 3: Cap name_match links per row
-            #   Strategy 5: Dedup — skip PEs already found via explicit_pe_ref
-
-            # Strategy 1: minimum text length for name matching
-            if len(text) < _MIN_TEXT_FOR_NAME_MATCH:
-                continue  # skip 4b entirely for this row — text too short
-
-            # Strategy 2: PE density filter — listing pages mention many PEs
-            if len(explicit_refs) > _MAX_PE_REFS_FOR_NAME_MATCH:
-                continue  # skip 4b — this is likely a summary/listing page
-
-            text_lower = text.lower()
-            name_match_count = 0
-            for ref_pe, keywords, pattern in title_index:
-                if ref_pe == pe_num:
-                    continue
-                # Strategy 5: skip name_match for PEs already found via 4a
-                if ref_pe in explicit_refs:
-                    continue
-                # Strategy 3: cap name_match links per row
-                if name_match_count >= _MAX_NAME_MATCHES_PER_ROW:
-                    break
-                # Fast pre-filter: skip regex unless all keywords appear
-                if not all(kw in text_lower for kw in keywords):
-                    continue
-                name_m = pattern.search(text)
-                if name_m:
-                    snippet = _context_window(text, name_m.start())
-                    insert_buf.append((
-                        pe_num, ref_pe, fy, source_file, page_start,
-                        snippet, "name_match", 0.6,
-                    ))
-                    name_match_count += 1
-
-        rows_processed += len(chunk)
-
-        # Flush insert buffer and save checkpoint atomically
-        if insert_buf:
+    def _write(result: tuple[int, int, list[tuple]]) -> None:
+        nonlocal rows_processed, skipped, total
+        n_rows, n_skipped, inserts = result
+        rows_processed += n_rows
+        skipped += n_skipped
+        if inserts:
             conn.executemany("""
                 INSERT OR IGNORE INTO pe_lineage
                     (source_pe, referenced_pe, fiscal_year, source_file,
                      page_number, context_snippet, link_type, confidence)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, insert_buf)
-            total += len(insert_buf)
-            insert_buf = []
-        _save_checkpoint(conn, 4, chunk_max_rowid)
-        conn.commit()
-
+            """, inserts)
+            total += len(inserts)
         # Progress every 10,000 rows
         if rows_processed % 10_000 < CHUNK:
             _log_progress("Phase 4", rows_processed, desc_remaining, t0_mono)
 
+    if _map_chunks(conn, _rowid_chunks(conn, desc_sql, checkpoint_rowid, CHUNK),
+                   _phase4_map, _write,
+                   context=(known_pes, title_index, done_pairs), phase=4,
+                   stop_event=stop_event, workers=workers):
+        logger.info("  Phase 4 stopped at row %s.", f"{rows_processed:,}")
+
     if skipped:
         logger.info("Skipped %s already-processed (PE, file) pairs.", f"{skipped:,}")
 
@@ -1541,7 +1769,69 @@ def run_phase4(conn: sqlite3.Connection, stop_event: threading.Event | None = No
 
 # ── Phase 5: Project-Level Narrative Decomposition ────────────────────────────
 
-def run_phase5(conn: sqlite3.Connection, stop_event: threading.Event | None = None) -> int:
+def _phase5_map(done_files: set[str], rows: list[tuple]) -> tuple[int, int, list[tuple]]:
+    """Phase 5 worker: project_descriptions rows for a chunk of pe_descriptions.
+
+    Returns (rows seen, PE-level fallbacks, project_descriptions rows).
+    """
+    inserts: list[tuple] = []
+    pe_level_fallback = 0
+    for _rowid, pe_num, fy, source_file, page_start, page_end, section_header, desc_text in rows:
+        if source_file and source_file in done_files:
+            continue
+
+        desc_text = strip_exhibit_headers(desc_text)
+        if not desc_text:
+            continue
+
+        # Attempt project-level decomposition
+        projects = detect_project_boundaries(desc_text)
+
+        if projects:
+            # Parse each project's text into narrative sections
+            for proj in projects:
+                sections = parse_narrative_sections(proj["text"])
+                if sections:
+                    for sec in sections:
+                        inserts.append((
+                            pe_num, proj["project_number"], proj["project_title"],
+                            fy, sec["header"], sec["text"],
+                            source_file, page_start, page_end,
+                        ))
+                else:
+                    # No sub-sections found — store the project text as-is
+                    text = proj["text"][:4000]
+                    if text.strip():
+                        inserts.append((
+                            pe_num, proj["project_number"], proj["project_title"],
+                            fy, section_header or "Project Description", text,
+                            source_file, page_start, page_end,
+                        ))
+        else:
+            # PE-level fallback: no project boundaries detected
+            sections = parse_narrative_sections(desc_text)
+            if sections:
+                for sec in sections:
+                    inserts.append((
+                        pe_num, None, None,
+                        fy, sec["header"], sec["text"],
+                        source_file, page_start, page_end,
+                    ))
+            else:
+                # Store as single PE-level entry
+                text = desc_text[:4000]
+                if text.strip():
+                    inserts.append((
+                        pe_num, None, None,
+                        fy, section_header or "Description", text,
+                        source_file, page_start, page_end,
+                    ))
+            pe_level_fallback += 1
+    return len(rows), pe_level_fallback, inserts
+
+
+def run_phase5(conn: sqlite3.Connection, stop_event: threading.Event | None = None,
+               workers: int = 1) -> int:
     """Decompose PE descriptions into project-level sections.
 
     Iterates pe_descriptions, uses detect_project_boundaries() to find
@@ -1612,129 +1902,42 @@ def run_phase5(conn: sqlite3.Connection, stop_event: threading.Event | None = No
         logger.info("  Scanning %s description rows for project boundaries...", f"{desc_remaining:,}")
 
     CHUNK = 500
-    cur = conn.execute("""
+    desc_sql = """
         SELECT rowid, pe_number, fiscal_year, source_file, page_start, page_end,
                section_header, description_text
         FROM pe_descriptions
         WHERE description_text IS NOT NULL AND rowid > ?
-        ORDER BY rowid
-    """, (checkpoint_rowid,))
+        ORDER BY rowid LIMIT ?
+    """
 
-    insert_buf: list[tuple] = []
     total_rows = 0
     pe_level_fallback = 0
     rows_processed = 0
-    chunk_max_rowid = checkpoint_rowid
     t0_mono = time.monotonic()
 
-    while True:
-        if stop_event and stop_event.is_set():
-            logger.info("  Phase 5 stopped at row %s.", f"{rows_processed:,}")
-            # Flush pending inserts + save checkpoint before stopping
-            if insert_buf:
-                conn.executemany("""
-                    INSERT INTO project_descriptions
-                        (pe_number, project_number, project_title, fiscal_year,
-                         section_header, description_text, source_file,
-                         page_start, page_end)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, insert_buf)
-                total_rows += len(insert_buf)
-                insert_buf = []
-            if chunk_max_rowid > checkpoint_rowid:
-                _save_checkpoint(conn, 5, chunk_max_rowid)
-            conn.commit()
-            break
-
-        chunk = cur.fetchmany(CHUNK)
-        if not chunk:
-            break
-
-        for rowid, pe_num, fy, source_file, page_start, page_end, section_header, desc_text in chunk:
-            chunk_max_rowid = rowid  # ordered by rowid, so last = max
-
-            if source_file and source_file in done_files:
-                continue
-
-            desc_text = strip_exhibit_headers(desc_text)
-            if not desc_text:
-                continue
-
-            # Attempt project-level decomposition
-            projects = detect_project_boundaries(desc_text)
-
-            if projects:
-                # Parse each project's text into narrative sections
-                for proj in projects:
-                    sections = parse_narrative_sections(proj["text"])
-                    if sections:
-                        for sec in sections:
-                            insert_buf.append((
-                                pe_num, proj["project_number"], proj["project_title"],
-                                fy, sec["header"], sec["text"],
-                                source_file, page_start, page_end,
-                            ))
-                    else:
-                        # No sub-sections found — store the project text as-is
-                        text = proj["text"][:4000]
-                        if text.strip():
-                            insert_buf.append((
-                                pe_num, proj["project_number"], proj["project_title"],
-                                fy, section_header or "Project Description", text,
-                                source_file, page_start, page_end,
-                            ))
-            else:
-                # PE-level fallback: no project boundaries detected
-                sections = parse_narrative_sections(desc_text)
-                if sections:
-                    for sec in sections:
-                        insert_buf.append((
-                            pe_num, None, None,
-                            fy, sec["header"], sec["text"],
-                            source_file, page_start, page_end,
-                        ))
-                else:
-                    # Store as single PE-level entry
-                    text = desc_text[:4000]
-                    if text.strip():
-                        insert_buf.append((
-                            pe_num, None, None,
-                            fy, section_header or "Description", text,
-                            source_file, page_start, page_end,
-                        ))
-                pe_level_fallback += 1
-
-        rows_processed += len(chunk)
-
-        # Flush buffer and save checkpoint atomically
-        if insert_buf:
+    def _write(result: tuple[int, int, list[tuple]]) -> None:
+        nonlocal rows_processed, pe_level_fallback, total_rows
+        n_rows, n_fallback, inserts = result
+        rows_processed += n_rows
+        pe_level_fallback += n_fallback
+        if inserts:
             conn.executemany("""
                 INSERT INTO project_descriptions
                     (pe_number, project_number, project_title, fiscal_year,
                      section_header, description_text, source_file,
                      page_start, page_end)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, insert_buf)
-            total_rows += len(insert_buf)
-            insert_buf = []
-        _save_checkpoint(conn, 5, chunk_max_rowid)
-        conn.commit()
-
+            """, inserts)
+            total_rows += len(inserts)
         # Progress every 10,000 rows
         if rows_processed % 10_000 < CHUNK and desc_remaining > 0:
             _log_progress("Phase 5", rows_processed, desc_remaining, t0_mono)
 
-    if insert_buf:
-        conn.executemany("""
-            INSERT INTO project_descriptions
-                (pe_number, project_number, project_title, fiscal_year,
-                 section_header, description_text, source_file,
-                 page_start, page_end)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, insert_buf)
-        _save_checkpoint(conn, 5, chunk_max_rowid)
-        conn.commit()
-        total_rows += len(insert_buf)
+    if _map_chunks(conn, _rowid_chunks(conn, desc_sql, checkpoint_rowid, CHUNK),
+                   _phase5_map, _write,
+                   context=done_files, phase=5,
+                   stop_event=stop_event, workers=workers):
+        logger.info("  Phase 5 stopped at row %s.", f"{rows_processed:,}")
 
     proj_rows = conn.execute(
         "SELECT COUNT(*) FROM project_descriptions WHERE project_number IS NOT NULL"
@@ -1832,16 +2035,8 @@ def run_phase6(conn: sqlite3.Connection, stop_event: threading.Event | None = No
             break
 
         src_json = json.dumps(sorted(src_files))
-        for tag, patterns in _COMPILED_TAXONOMY:
-            for pat in patterns:
-                if pat.search(proj_text):
-                    insert_buf.append((pe, proj_num, tag, "keyword", 0.85, src_json))
-                    break
-        for tag, patterns in _COMPILED_TAXONOMY_TIER2:
-            for pat in patterns:
-                if pat.search(proj_text):
-                    insert_buf.append((pe, proj_num, tag, "keyword", 0.65, src_json))
-                    break
+        for tag, conf in _keyword_tags(proj_text, 0.85, 0.65):
+            insert_buf.append((pe, proj_num, tag, "keyword", conf, src_json))
 
     if insert_buf:
         conn.executemany("""
@@ -2036,16 +2231,8 @@ def run_phase8(conn: sqlite3.Connection, stop_event: threading.Event | None = No
         # 8d: Keyword tags from budget_lines text
         bl_text = bli_texts.get(bli_key, "")
         if bl_text:
-            for tag, patterns in _COMPILED_TAXONOMY:
-                for pat in patterns:
-                    if pat.search(bl_text):
-                        insert_buf.append((bli_key, tag, "keyword", 0.9))
-                        break
-            for tag, patterns in _COMPILED_TAXONOMY_TIER2:
-                for pat in patterns:
-                    if pat.search(bl_text):
-                        insert_buf.append((bli_key, tag, "keyword", 0.7))
-                        break
+            for tag, conf in _keyword_tags(bl_text, 0.9, 0.7):
+                insert_buf.append((bli_key, tag, "keyword", conf))
 
     if insert_buf:
         conn.executemany("""
@@ -2068,7 +2255,37 @@ _P5_ACCT_LINE_RE = re.compile(
 _P5_HEADER_SCAN_CHARS = 1200  # account/line-item appears within first ~1200 chars
 
 
-def run_phase9(conn: sqlite3.Connection, stop_event: threading.Event | None = None) -> int:
+_PHASE9_CHUNK = 500  # P-5 pages per worker task
+
+
+def _phase9_map(known_blis: set[str], pages: list[tuple]) -> tuple[int, int, list[tuple]]:
+    """Phase 9 worker: bli_descriptions rows for a chunk of P-5 pages.
+
+    Returns (pages matched, pages unmatched, bli_descriptions rows).
+    """
+    inserts: list[tuple] = []
+    unmatched = 0
+    for src_file, page_num, fy, text in pages:
+        m = _P5_ACCT_LINE_RE.search(text[:_P5_HEADER_SCAN_CHARS])
+        if not m:
+            unmatched += 1
+            continue
+
+        bli_key = f"{m.group(1)}:{m.group(2)}"
+
+        if bli_key not in known_blis:
+            unmatched += 1
+            continue
+
+        inserts.append((
+            bli_key, fy, src_file, page_num, page_num,
+            "P-5 Justification", text.strip(),
+        ))
+    return len(inserts), unmatched, inserts
+
+
+def run_phase9(conn: sqlite3.Connection, stop_event: threading.Event | None = None,
+               workers: int = 1) -> int:
     """Extract BLI descriptions from procurement exhibit PDF pages.
 
     Scans pdf_pages tagged as exhibit_type='p5', extracts account code
@@ -2120,48 +2337,35 @@ def run_phase9(conn: sqlite3.Connection, stop_event: threading.Event | None = No
 
     logger.info("  Scanning %d procurement exhibit pages...", len(pages))
 
-    insert_buf: list[tuple] = []
+    inserted = 0
     matched = 0
     unmatched = 0
 
-    for src_file, page_num, fy, text in pages:
-        if stop_event and stop_event.is_set():
-            logger.info("  Phase 9 stopped — flushing %d buffered rows.", len(insert_buf))
-            break
-
-        m = _P5_ACCT_LINE_RE.search(text[:_P5_HEADER_SCAN_CHARS])
-        if not m:
-            unmatched += 1
-            continue
-
-        bli_key = f"{m.group(1)}:{m.group(2)}"
-
-        if bli_key not in known_blis:
-            unmatched += 1
-            continue
-
-        matched += 1
-        desc_text = text.strip()
-
-        insert_buf.append((
-            bli_key, fy, src_file, page_num, page_num,
-            "P-5 Justification", desc_text,
-        ))
+    def _write(result: tuple[int, int, list[tuple]]) -> None:
+        nonlocal inserted, matched, unmatched
+        n_matched, n_unmatched, inserts = result
+        matched += n_matched
+        unmatched += n_unmatched
+        if inserts:
+            conn.executemany("""
+                INSERT INTO bli_descriptions
+                    (bli_key, fiscal_year, source_file, page_start, page_end,
+                     section_header, description_text)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, inserts)
+            inserted += len(inserts)
 
-    if insert_buf:
-        conn.executemany("""
-            INSERT INTO bli_descriptions
-                (bli_key, fiscal_year, source_file, page_start, page_end,
-                 section_header, description_text)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, insert_buf)
-        conn.commit()
+    chunks = ((None, [tuple(p) for p in pages[i:i + _PHASE9_CHUNK]])
+              for i in range(0, len(pages), _PHASE9_CHUNK))
+    if _map_chunks(conn, chunks, _phase9_map, _write, context=known_blis,
+                   stop_event=stop_event, workers=workers):
+        logger.info("  Phase 9 stopped — %d rows written.", inserted)
 
     logger.info(
         "Done. %d description rows inserted (%d pages matched, %d unmatched).",
-        len(insert_buf), matched, unmatched,
+        inserted, matched, unmatched,
     )
-    return len(insert_buf)
+    return inserted
 
 
 # ── Phase 10: R-2 Metadata Backfill ────────────────────────────────────────────
@@ -2528,21 +2732,203 @@ def _invalidate_explorer_caches(conn: sqlite3.Connection) -> None:
     )
 
 
+# OPT-ENRICH-005: Phases declare the tables they read and write, and enrich()
+# derives a dependency graph from them.  Phase B waits for an earlier phase
+# A when B writes a table A reads or writes, or reads a table A writes —
+# every phase then sees exactly the tables it would in numeric order, while
+# independent chains (the BLI phases 7 → 8 → 9 alongside the PE narrative
+# phases 2 → 4/5 → 6) run at the same time, each on its own connection.
+# SQLite serializes their commits; the long busy timeout makes a writer
+# wait for the lock instead of failing.
+
+_PHASE_TABLES: dict[int, tuple[frozenset[str], frozenset[str]]] = {
+    # phase: (tables read, tables written)
+    1: (frozenset({"budget_lines", "pdf_pages", "pdf_pe_numbers"}),
+        frozenset({"pe_index"})),
+    2: (frozenset({"pe_index", "budget_lines", "pdf_pages", "pdf_pe_numbers"}),
+        frozenset({"pe_descriptions", "pe_descriptions_fts"})),
+    3: (frozenset({"pe_index", "budget_lines", "pe_descriptions",
+                   "project_descriptions"}),
+        frozenset({"pe_tags"})),
+    4: (frozenset({"pe_index", "budget_lines", "pe_descriptions"}),
+        frozenset({"pe_lineage"})),
+    5: (frozenset({"pe_descriptions"}),
+        frozenset({"project_descriptions"})),
+    6: (frozenset(),
+        frozenset({"pe_tags", "project_descriptions"})),
+    7: (frozenset({"budget_lines"}),
+        frozenset({"bli_index"})),
+    8: (frozenset({"bli_index", "budget_lines"}),
+        frozenset({"bli_tags"})),
+    9: (frozenset({"bli_index", "pdf_pages"}),
+        frozenset({"bli_descriptions"})),
+    10: (frozenset({"pdf_pages"}),
+         frozenset({"budget_lines"})),
+    11: (frozenset({"bli_index", "pdf_pages"}),
+         frozenset({"bli_pe_map", "budget_lines"})),
+}
+
+_PHASE_BUSY_TIMEOUT_MS = 30 * 60 * 1000  # a phase may hold the write lock for minutes
+
+
+def _phase_dependencies(phases: Iterable[int]) -> dict[int, set[int]]:
+    """Map each selected phase to the earlier selected phases it must wait for."""
+    selected = sorted(p for p in phases if p in _PHASE_TABLES)
+    deps: dict[int, set[int]] = {}
+    for i, phase in enumerate(selected):
+        reads, writes = _PHASE_TABLES[phase]
+        deps[phase] = {
+            earlier for earlier in selected[:i]
+            if writes & (_PHASE_TABLES[earlier][0] | _PHASE_TABLES[earlier][1])
+            or reads & _PHASE_TABLES[earlier][1]
+        }
+    return deps
+
+
+def _critical_path(deps: dict[int, set[int]],
+                   timings: dict[int, float]) -> tuple[list[int], float]:
+    """Return the longest chain of dependent phases by wall time, and its length."""
+    finish: dict[int, float] = {}
+    prev: dict[int, int | None] = {}
+    for phase in sorted(timings):
+        before = [d for d in deps.get(phase, ()) if d in finish]
+        prev[phase] = max(before, key=finish.__getitem__, default=None)
+        finish[phase] = timings[phase] + finish.get(prev[phase], 0.0)
+    if not finish:
+        return [], 0.0
+    phase: int | None = max(finish, key=finish.__getitem__)
+    length = finish[phase]
+    path: list[int] = []
+    while phase is not None:
+        path.append(phase)
+        phase = prev[phase]
+    return path[::-1], length
+
+
+# Phases that fan text processing out to a worker pool (see _map_chunks).
+_POOLED_PHASES = frozenset({2, 4, 5, 9})
+
+
+def _phase_worker_shares(deps: dict[int, set[int]], workers: int,
+                         parallel: bool = True) -> dict[int, int]:
+    """Split *workers* among the pooled phases that may run at the same time.
+
+    Two pooled phases can overlap unless one (transitively) waits for the
+    other; each gets ``workers // n`` processes (at least 1), where n is the
+    largest set of mutually independent pooled phases, so concurrent pools
+    never add up to more than the budget.
+    """
+    pooled = sorted(p for p in deps if p in _POOLED_PHASES)
+    if not parallel:
+        return {p: workers for p in pooled}
+    before: dict[int, set[int]] = {}
+    for phase in sorted(deps):
+        before[phase] = set(deps[phase])
+        for dep in deps[phase]:
+            before[phase] |= before.get(dep, set())
+    width = max(
+        (len(group) for r in range(1, len(pooled) + 1)
+         for group in itertools.combinations(pooled, r)
+         if not any(a in before[b] for a, b in itertools.combinations(group, 2))),
+        default=1,
+    )
+    return {p: max(1, workers // width) for p in pooled}
+
+
+def _bulk_pragmas(conn: sqlite3.Connection) -> None:
+    # init_pragmas already applied by get_connection; add bulk overrides
+    conn.execute("PRAGMA cache_size=-262144")      # 256MB cache (overrides 64MB)
+    conn.execute("PRAGMA mmap_size=536870912")     # 512MB mmap
+
+
+def _schedule_phases(
+    runners: dict[int, Callable[[sqlite3.Connection], Any]],
+    deps: dict[int, set[int]],
+    open_conn: Callable[[], sqlite3.Connection],
+    stop_event: threading.Event | None = None,
+    parallel: bool = True,
+) -> tuple[dict[int, int], dict[int, float]]:
+    """Run *runners* in dependency order; return per-phase results and wall seconds.
+
+    Each phase runs on its own connection from *open_conn*.  A phase starts
+    as soon as every phase in ``deps[phase]`` has finished; with *parallel*
+    False they run one at a time in numeric order.  Once *stop_event* is
+    set no further phase starts.  If a phase raises, the running phases
+    are allowed to finish and the first exception is re-raised.
+    """
+    results: dict[int, int] = {}
+    timings: dict[int, float] = {}
+
+    def _stopped() -> bool:
+        return bool(stop_event and stop_event.is_set())
+
+    def _run(phase: int) -> tuple[int, float]:
+        t_start = time.monotonic()
+        phase_conn = open_conn()
+        try:
+            result = runners[phase](phase_conn)
+        finally:
+            phase_conn.close()
+        elapsed = time.monotonic() - t_start
+        logger.info("Phase %d finished in %.1fs", phase, elapsed)
+        return (result if isinstance(result, int) else 0), elapsed
+
+    pending = sorted(runners)
+    if not parallel:
+        for phase in pending:
+            results[phase], timings[phase] = _run(phase)
+            if _stopped():
+                break
+        return results, timings
+
+    running: dict[Future, int] = {}
+    error: BaseException | None = None
+    with ThreadPoolExecutor(max_workers=len(pending) or 1,
+                            thread_name_prefix="enrich-phase") as pool:
+        while pending or running:
+            if error is None and not _stopped():
+                for phase in [p for p in pending if deps.get(p, set()) <= results.keys()]:
+                    pending.remove(phase)
+                    running[pool.submit(_run, phase)] = phase
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                phase = running.pop(future)
+                try:
+                    results[phase], timings[phase] = future.result()
+                except BaseException as exc:  # noqa: BLE001 - re-raised below
+                    error = error or exc
+    if error is not None:
+        raise error
+    return results, timings
+
+
 def enrich(
     db_path: Path,
     phases: set[int],
     with_llm: bool = False,
     rebuild: bool = False,
     stop_event: threading.Event | None = None,
+    workers: int = 0,
+    parallel_phases: bool = True,
 ) -> dict:
     """Run enrichment phases and return a structured summary.
 
+    Phases 2, 4, 5 and 9 process text in *workers* processes (0 = auto,
+    up to 4), split between those that run concurrently.  With *parallel_phases*, phases whose tables do not conflict
+    run concurrently (see _PHASE_TABLES); otherwise they run in numeric order.
+
     Returns a dict with keys:
         phases_run   — list of phase numbers that executed
         phases_skipped — list of {phase, reason} for phases that did nothing
         phase_results — dict mapping phase number to rows-inserted count
         table_counts — dict mapping table name to final row count
         stopped_after — phase number if gracefully stopped, else None
+        phase_timings — dict mapping phase number to wall seconds
+        critical_path — longest chain of dependent phases that ran
+        critical_path_sec — summed wall seconds along critical_path
+        elapsed_sec  — wall seconds for the whole phase schedule
     """
     if not db_path.exists():
         logger.error("Database not found: %s", db_path)
@@ -2550,9 +2936,7 @@ def enrich(
         sys.exit(1)
 
     conn = get_connection(db_path)
-    # init_pragmas already applied by get_connection; add bulk overrides
-    conn.execute("PRAGMA cache_size=-262144")      # 256MB cache (overrides 64MB)
-    conn.execute("PRAGMA mmap_size=536870912")     # 512MB mmap
+    _bulk_pragmas(conn)
 
     # Bring the schema up to the latest migration before any phase runs —
     # ensures FTS5 virtual tables, reference data, and future schema
@@ -2563,57 +2947,95 @@ def enrich(
     if rebuild:
         logger.info("--rebuild: dropping enrichment tables...")
         _drop_enrichment_tables(conn)
+    # All DDL happens here, before any phase connection is opened.
+    _create_enrichment_tables(conn)
+    _ensure_checkpoint_table(conn)
+    _ensure_pe_index_source_column(conn)
+    conn.commit()
 
     t0 = time.time()
     logger.info("Enriching database: %s", db_path)
     logger.info("Phases: %s", sorted(phases))
 
-    # Track what each phase accomplished
-    phase_results: dict[int, int] = {}
-    phases_skipped: list[dict[str, str | int]] = []
-    stopped_after: int | None = None
-
-    _phase_runners = {
-        1: lambda: run_phase1(conn, stop_event=stop_event),
-        2: lambda: run_phase2(conn, stop_event=stop_event),
-        3: lambda: run_phase3(conn, with_llm=with_llm, stop_event=stop_event),
-        4: lambda: run_phase4(conn, stop_event=stop_event),
-        5: lambda: run_phase5(conn, stop_event=stop_event),
-        6: lambda: run_phase6(conn, stop_event=stop_event),
-        7: lambda: run_phase7(conn, stop_event=stop_event),
-        8: lambda: run_phase8(conn, stop_event=stop_event),
-        9: lambda: run_phase9(conn, stop_event=stop_event),
-        10: lambda: run_phase10(conn, stop_event=stop_event),
-        11: lambda: run_phase11(conn, stop_event=stop_event),
+    num_workers = workers if workers > 0 else _default_workers()
+    deps = _phase_dependencies(phases)
+    # Concurrent pooled phases share the worker budget instead of each
+    # starting a full-size pool.
+    shares = _phase_worker_shares(deps, num_workers, parallel_phases)
+
+    _phase_runners: dict[int, Callable[[sqlite3.Connection], Any]] = {
+        1: lambda c: run_phase1(c, stop_event=stop_event),
+        2: lambda c: run_phase2(c, stop_event=stop_event, workers=shares[2]),
+        3: lambda c: run_phase3(c, with_llm=with_llm, stop_event=stop_event),
+        4: lambda c: run_phase4(c, stop_event=stop_event, workers=shares[4]),
+        5: lambda c: run_phase5(c, stop_event=stop_event, workers=shares[5]),
+        6: lambda c: run_phase6(c, stop_event=stop_event),
+        7: lambda c: run_phase7(c, stop_event=stop_event),
+        8: lambda c: run_phase8(c, stop_event=stop_event),
+        9: lambda c: run_phase9(c, stop_event=stop_event, workers=shares[9]),
+        10: lambda c: run_phase10(c, stop_event=stop_event),
+        11: lambda c: run_phase11(c, stop_event=stop_event),
     }
 
+    def _open_phase_conn() -> sqlite3.Connection:
+        phase_conn = get_connection(db_path)
+        _bulk_pragmas(phase_conn)
+        phase_conn.execute(f"PRAGMA busy_timeout={_PHASE_BUSY_TIMEOUT_MS}")
+        # Autocheckpoint stays on here: the phases do the writing, and with
+        # it off the WAL would grow for the whole run.
+        return phase_conn
+
+    selected = {n: fn for n, fn in _phase_runners.items() if n in phases}
+    results, timings = _schedule_phases(
+        selected, deps, _open_phase_conn,
+        stop_event=stop_event, parallel=parallel_phases,
+    )
+    elapsed = time.time() - t0
+
+    # Track what each phase accomplished, in numeric order
+    phase_results = {n: results[n] for n in sorted(results)}
+    phases_skipped: list[dict[str, str | int]] = []
     for phase_num in sorted(_phase_runners):
         if phase_num not in phases:
             phases_skipped.append({"phase": phase_num, "reason": "not selected"})
-            continue
-
-        result = _phase_runners[phase_num]()
-        phase_results[phase_num] = result if isinstance(result, int) else 0
-
-        # A return of 0 from a phase that was requested means it had nothing to do
-        if result == 0 and phase_num in phases:
+        elif phase_results.get(phase_num) == 0:
+            # A return of 0 from a phase that was requested means it had nothing to do
             phases_skipped.append({"phase": phase_num, "reason": "nothing to do (empty input or already done)"})
 
-        if stop_event and stop_event.is_set():
-            logger.info("Enrichment stopped gracefully after Phase %d", phase_num)
-            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
-            conn.close()
-            stopped_after = phase_num
-            return {
-                "phases_run": list(phase_results.keys()),
-                "phases_skipped": phases_skipped,
-                "phase_results": phase_results,
-                "table_counts": {},
-                "stopped_after": stopped_after,
-            }
+    path, path_sec = _critical_path(deps, timings)
+    if timings:
+        logger.info("Critical path: %s (%.1fs of %.1fs wall)",
+                    " → ".join(str(n) for n in path), path_sec, elapsed)
+    summary = {
+        "phases_run": list(phase_results.keys()),
+        "phases_skipped": phases_skipped,
+        "phase_results": phase_results,
+        "table_counts": {},
+        "stopped_after": None,
+        "phase_timings": {n: round(timings[n], 3) for n in sorted(timings)},
+        "critical_path": path,
+        "critical_path_sec": round(path_sec, 3),
+        "elapsed_sec": round(elapsed, 3),
+    }
 
-    elapsed = time.time() - t0
-    logger.info("Enrichment complete in %.1fs", elapsed)
+    if stop_event and stop_event.is_set():
+        # Concurrent phases all wind down on the same event; report the
+        # highest-numbered phase that ran.
+        stopped_after = max(phase_results, default=None)
+        logger.info("Enrichment stopped gracefully after Phase %s", stopped_after)
+        bump_data_generation(conn, "enrich")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.close()
+        summary["stopped_after"] = stopped_after
+        return summary
+
+    # OPT-SUGGEST-001: Sync the typeahead index with pe_index/bli_index and
+    # budget_lines (only changed terms are written).
+    refresh_suggestion_index(conn)
+
+    logger.info("Enrichment complete in %.1fs", time.time() - t0)
+    # OPT-GEN-001: Invalidate API caches/ETags keyed on the data generation
+    bump_data_generation(conn, "enrich")
     conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
 
     _invalidate_explorer_caches(conn)
@@ -2621,7 +3043,8 @@ def enrich(
     # Summary counts
     table_counts: dict[str, int] = {}
     for table in ("pe_index", "pe_descriptions", "pe_tags", "pe_lineage", "project_descriptions",
-                   "bli_index", "bli_tags", "bli_descriptions", "bli_pe_map"):
+                   "bli_index", "bli_tags", "bli_descriptions", "bli_pe_map",
+                   "search_suggestions"):
         try:
             n = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
             logger.info("  %s: %s rows", table, f"{n:,}")
@@ -2632,13 +3055,8 @@ def enrich(
 
     conn.close()
 
-    return {
-        "phases_run": list(phase_results.keys()),
-        "phases_skipped": phases_skipped,
-        "phase_results": phase_results,
-        "table_counts": table_counts,
-        "stopped_after": None,
-    }
+    summary["table_counts"] = table_counts
+    return summary
 
 
 def main() -> None:
@@ -2655,6 +3073,12 @@ def main() -> None:
                         help="Comma-separated phases to run (default: all 1-11)")
     parser.add_argument("--rebuild", action="store_true",
                         help="Drop and rebuild all enrichment tables")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Worker processes for text phases 2, 4, 5 and 9 "
+                             "(default: 0 = auto)")
+    parser.add_argument("--serial-phases", action="store_true",
+                        help="Run phases one at a time in numeric order instead "
+                             "of concurrently by table dependencies")
     args = parser.parse_args()
 
     try:
@@ -2663,7 +3087,8 @@ def main() -> None:
         logger.error("--phases must be comma-separated integers, e.g. '1,2,3'")
         sys.exit(1)
 
-    enrich(args.db, phases, with_llm=args.with_llm, rebuild=args.rebuild)
+    enrich(args.db, phases, with_llm=args.with_llm, rebuild=args.rebuild,
+           workers=args.workers, parallel_phases=not args.serial_phases)
 
 
 if __name__ == "__main__":
@@ -25,6 +25,7 @@ from collections import defaultdict
 from pathlib import Path
 
 from utils import get_connection
+from utils.database import BUDGET_LINE_DEDUP_KEY, budget_line_fingerprint
 from utils.normalization import clean_r2_title
 from utils.organization import infer_org
 from utils.query import make_placeholders
@@ -153,7 +154,12 @@ def extract_r2_from_pdfs(
                 "appropriation_title": result.get("appropriation_title"),
                 "budget_type": "RDT&E",
                 "amount_unit": "thousands",
+                "amount_type": "budget_authority",
             }
+            # OPT-BUILD-004: idx_bl_fingerprint makes INSERT OR IGNORE skip
+            # lines already stored (including by an earlier run)
+            row_data["row_fingerprint"] = budget_line_fingerprint(
+                *(row_data.get(c) for c in BUDGET_LINE_DEDUP_KEY))
 
             for fy_year, amount in fy_pairs:
                 col = _fy_to_amount_col(fy_year)
@@ -197,11 +203,10 @@ def extract_r2_from_pdfs(
     for cols, val_lists in groups.items():
         placeholders = make_placeholders(len(cols))
         col_names = ", ".join(cols)
-        conn.executemany(
+        inserted += conn.executemany(
             f"INSERT OR IGNORE INTO budget_lines ({col_names}) VALUES ({placeholders})",
             val_lists,
-        )
-        inserted += len(val_lists)
+        ).rowcount
 
     conn.commit()
     elapsed = time.time() - t0
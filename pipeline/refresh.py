@@ -349,8 +349,16 @@ class RefreshWorkflow:
             return True
 
         try:
-            from pipeline.validator import validate_all, print_report  # noqa: PLC0415
-            summary = validate_all(self.db_path)
+            from pipeline.validator import (  # noqa: PLC0415
+                load_report,
+                print_report,
+                validate_all,
+            )
+            # OPT-VAL-002: only files touched by the last build are re-checked
+            summary = validate_all(
+                self.db_path, since_session="last",
+                previous=load_report(Path("logs/data_quality_report.json")),
+            )
             print_report(summary)
             success = summary["total_failures"] == 0
             self.log("Completed: Data validation", "ok" if success else "warn")
@@ -400,6 +408,7 @@ class RefreshWorkflow:
                 self.db_path,
                 output_path=Path("logs/data_quality_report.json"),
                 print_console=self.verbose,
+                since_session="last",
             )
 
             # Also write a lean refresh_report.json with workflow metadata
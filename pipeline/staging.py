@@ -8,6 +8,7 @@ by writing parsed data to Parquet files as an intermediate format.
     With staging: Excel/PDF → parse (hours) → Parquet staging → SQLite (minutes)
 
 Phase 1: Parse source files → Parquet + sidecar .meta.json
+          (optionally compacted into a partitioned dataset + manifest)
 Phase 2: Read Parquet staging → bulk INSERT into SQLite
 
 Usage:
@@ -20,17 +21,22 @@ Usage:
 
 from __future__ import annotations
 
+import itertools
 import json
 import logging
 import os
+import shutil
 import sqlite3
+import tempfile
 import threading
 import time
+from collections import Counter
 from collections.abc import Callable
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
+from urllib.parse import quote
 
 # Workaround for pyarrow 23+ / pandas 3.0+ incompatibility:
 # pyarrow's pandas shim checks pandas.__version__ which was removed in pandas 3.0.
@@ -43,15 +49,18 @@ except ImportError:
     pass  # pandas is optional; pyarrow works without it
 
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 
-from utils.query import make_placeholders
+from utils.database import bump_data_generation
+from utils.suggestions import refresh_suggestion_index
 
 logger = logging.getLogger(__name__)
 
 # ── Constants ────────────────────────────────────────────────────────────────
 
-STAGING_VERSION = 1
+# v2: source_fiscal_year and row_fingerprint staged (OPT-BUILD-004)
+STAGING_VERSION = 2
 
 # Fixed columns for Excel Parquet files (matches builder.py tuple order)
 EXCEL_FIXED_COLUMNS = [
@@ -87,6 +96,35 @@ EXCEL_TAIL_COLUMNS = [
     "amount_type",
 ]
 
+# Staged after the tail columns (OPT-BUILD-004).  Parquets written before
+# these existed load them as NULL; such rows are fingerprinted (and
+# deduplicated) by the next build_database() run instead.
+EXCEL_EXTRA_COLUMNS = [
+    "source_fiscal_year",
+    "row_fingerprint",
+]
+
+# _extract_excel_rows() tuple layout around the FY values: source_fiscal_year
+# is the second fixed value and row_fingerprint follows amount_type.
+_ROW_FIXED_COLUMNS = (
+    EXCEL_FIXED_COLUMNS[:1] + ["source_fiscal_year"] + EXCEL_FIXED_COLUMNS[1:]
+)
+_ROW_TAIL_COLUMNS = EXCEL_TAIL_COLUMNS + ["row_fingerprint"]
+
+# OPT-STAGE-001: Rows per Parquet record batch and per SQLite commit when
+# loading staged data.
+_LOAD_BATCH_ROWS = 50_000
+_LOAD_COMMIT_ROWS = 250_000
+
+# OPT-STAGE-002: Compacted staging layout.  compact_staging() merges the
+# per-file Parquets into staging/compacted/{excel,pdf}/fiscal_year=…/
+# exhibit_type=…/part-N.parquet and replaces the sidecars with one manifest.
+COMPACTED_DIRNAME = "compacted"
+COMPACT_MANIFEST_NAME = "_manifest.parquet"
+_COMPACT_ROW_GROUP_ROWS = 131_072
+_COMPACT_PDF_ROW_GROUP_ROWS = 8_192  # page_text makes PDF rows much wider
+_HIVE_NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
 # PDF page columns (matches _extract_pdf_data pages_data tuple order)
 PDF_COLUMNS = [
     "source_file",
@@ -181,31 +219,24 @@ def stage_excel_file(
             "skipped": False,
         }
 
-    # Build column names: fixed + sorted FY columns + tail
-    all_col_names = EXCEL_FIXED_COLUMNS + fy_columns + EXCEL_TAIL_COLUMNS
-    n_fixed = len(EXCEL_FIXED_COLUMNS)
-    n_fy = len(fy_columns)
+    # Build column names: fixed + sorted FY columns + tail + extra
+    all_col_names = (EXCEL_FIXED_COLUMNS + fy_columns + EXCEL_TAIL_COLUMNS
+                     + EXCEL_EXTRA_COLUMNS)
+    row_layout = _ROW_FIXED_COLUMNS + fy_columns + _ROW_TAIL_COLUMNS
 
     # Transpose rows (list of tuples) into columnar dict for Arrow
     columns: dict[str, list] = {col: [] for col in all_col_names}
     for row_tuple in rows:
-        # row_tuple layout: (fixed..., fy_values..., tail...)
-        for i, col in enumerate(EXCEL_FIXED_COLUMNS):
+        for i, col in enumerate(row_layout):
             columns[col].append(row_tuple[i] if i < len(row_tuple) else None)
-        for j, col in enumerate(fy_columns):
-            idx = n_fixed + j
-            columns[col].append(row_tuple[idx] if idx < len(row_tuple) else None)
-        for k, col in enumerate(EXCEL_TAIL_COLUMNS):
-            idx = n_fixed + n_fy + k
-            columns[col].append(row_tuple[idx] if idx < len(row_tuple) else None)
-
-    # Build Arrow schema: strings for fixed/tail, float64 for FY columns
+
+    # Build Arrow schema: strings for fixed/tail/extra, float64 for FY columns
     fields = []
     for col in EXCEL_FIXED_COLUMNS:
         fields.append(pa.field(col, pa.string()))
     for col in fy_columns:
         fields.append(pa.field(col, pa.float64()))
-    for col in EXCEL_TAIL_COLUMNS:
+    for col in EXCEL_TAIL_COLUMNS + EXCEL_EXTRA_COLUMNS:
         fields.append(pa.field(col, pa.string()))
 
     schema = pa.schema(fields)
@@ -267,51 +298,34 @@ def stage_pdf_file(
 
     from pipeline.builder import _extract_pdf_data
 
-    result = _extract_pdf_data((str(file_path), str(docs_dir), pdf_timeout))
+    # OPT-PDF-002: Pages are spilled in batches and streamed into the Parquet
+    # writer, so a large book is never held in memory whole.
+    with tempfile.TemporaryDirectory(prefix="pdf_spill_") as spill_dir:
+        result = _extract_pdf_data((str(file_path), str(docs_dir), pdf_timeout,
+                                    None, spill_dir))
+        return _write_staged_pdf(file_path, staging_dir, rel_path, result)
 
-    parquet_path = _parquet_path(file_path, staging_dir, "pdf")
-    meta_path = _sidecar_path(file_path, staging_dir, "pdf")
-    parquet_path.parent.mkdir(parents=True, exist_ok=True)
 
-    error = result.get("error")
-    pages_data = result.get("pages_data", [])
-    pe_mentions = result.get("pe_mentions", [])
-    issues = result.get("issues", [])
+_PDF_SCHEMA = pa.schema([
+    pa.field("source_file", pa.string()),
+    pa.field("source_category", pa.string()),
+    pa.field("fiscal_year", pa.string()),
+    pa.field("exhibit_type", pa.string()),
+    pa.field("page_number", pa.int32()),
+    pa.field("page_text", pa.string()),
+    pa.field("has_tables", pa.int32()),
+    pa.field("table_data", pa.string()),
+])
 
-    if error or not pages_data:
-        _write_pdf_sidecar(meta_path, file_path, rel_path,
-                            result.get("category"), 0,
-                            result.get("num_pages", 0),
-                            pe_mentions, issues, error)
-        if parquet_path.exists():
-            parquet_path.unlink()
-        return {
-            "relative_path": rel_path,
-            "row_count": 0,
-            "pe_mentions": pe_mentions,
-            "error": error,
-            "skipped": False,
-        }
 
+def _pdf_pages_to_table(pages_data: list[tuple]) -> pa.Table:
+    """Convert a batch of page tuples to an Arrow table with _PDF_SCHEMA."""
     # Transpose pages_data (list of tuples) into columnar dict
     columns: dict[str, list] = {col: [] for col in PDF_COLUMNS}
     for page_tuple in pages_data:
         for i, col in enumerate(PDF_COLUMNS):
             columns[col].append(page_tuple[i] if i < len(page_tuple) else None)
 
-    # Build Arrow table
-    fields = [
-        pa.field("source_file", pa.string()),
-        pa.field("source_category", pa.string()),
-        pa.field("fiscal_year", pa.string()),
-        pa.field("exhibit_type", pa.string()),
-        pa.field("page_number", pa.int32()),
-        pa.field("page_text", pa.string()),
-        pa.field("has_tables", pa.int32()),
-        pa.field("table_data", pa.string()),
-    ]
-    schema = pa.schema(fields)
-
     arrays = []
     for col in PDF_COLUMNS:
         data = columns[col]
@@ -325,18 +339,68 @@ def stage_pdf_file(
                 [str(v) if v is not None else None for v in data],
                 type=pa.string(),
             ))
+    return pa.table(arrays, schema=_PDF_SCHEMA)
 
-    table = pa.table(arrays, schema=schema)
-    pq.write_table(table, str(parquet_path), compression="snappy")
+
+def _write_staged_pdf(
+    file_path: Path,
+    staging_dir: Path,
+    rel_path: str,
+    result: dict[str, Any],
+) -> dict[str, Any]:
+    """Write an _extract_pdf_data() result as Parquet + sidecar.
+
+    Shared by stage_pdf_file() and the sharded path of stage_all_files(),
+    which merges page-range results in the parent process (OPT-PDF-001).
+    Page batches (in memory or spilled, OPT-PDF-002) are appended to the
+    Parquet file one at a time.
+    """
+    from pipeline.builder import _discard_pdf_spill, iter_pdf_page_batches
+
+    parquet_path = _parquet_path(file_path, staging_dir, "pdf")
+    meta_path = _sidecar_path(file_path, staging_dir, "pdf")
+    parquet_path.parent.mkdir(parents=True, exist_ok=True)
+
+    error = result.get("error")
+    pe_mentions = result.get("pe_mentions", [])
+    issues = result.get("issues", [])
+    expected_pages = result.get("page_count", len(result.get("pages_data", [])))
+
+    page_count = 0
+    if not error and expected_pages:
+        tmp_path = parquet_path.with_suffix(".parquet.tmp")
+        with pq.ParquetWriter(str(tmp_path), _PDF_SCHEMA,
+                              compression="snappy") as writer:
+            for batch in iter_pdf_page_batches(result):
+                writer.write_table(_pdf_pages_to_table(batch))
+                page_count += len(batch)
+        os.replace(tmp_path, parquet_path)
+    else:
+        _discard_pdf_spill(result)
+
+    if error or not page_count:
+        _write_pdf_sidecar(meta_path, file_path, rel_path,
+                            result.get("category"), 0,
+                            result.get("num_pages", 0),
+                            pe_mentions, issues, error)
+        if parquet_path.exists():
+            parquet_path.unlink()
+        return {
+            "relative_path": rel_path,
+            "row_count": 0,
+            "pe_mentions": pe_mentions,
+            "error": error,
+            "skipped": False,
+        }
 
     _write_pdf_sidecar(meta_path, file_path, rel_path,
-                        result.get("category"), len(pages_data),
+                        result.get("category"), page_count,
                         result.get("num_pages", 0),
                         pe_mentions, issues, None)
 
     return {
         "relative_path": rel_path,
-        "row_count": len(pages_data),
+        "row_count": page_count,
         "pe_mentions": pe_mentions,
         "error": None,
         "skipped": False,
@@ -365,6 +429,29 @@ def _stage_excel_worker(args: tuple) -> dict[str, Any]:
         }
 
 
+def _stage_merged_pdf(
+    file_path: Path,
+    docs_dir: Path,
+    staging_dir: Path,
+    shards: list[dict],
+) -> dict[str, Any]:
+    """Merge page-range shard results of one PDF and stage the file."""
+    from pipeline.builder import _merge_pdf_shards
+
+    rel_path = str(file_path.relative_to(docs_dir))
+    try:
+        return _write_staged_pdf(file_path, staging_dir, rel_path,
+                                 _merge_pdf_shards(shards))
+    except Exception as e:
+        return {
+            "relative_path": rel_path,
+            "row_count": 0,
+            "pe_mentions": [],
+            "error": f"{type(e).__name__}: {e}",
+            "skipped": False,
+        }
+
+
 def _stage_pdf_worker(args: tuple) -> dict[str, Any]:
     """Subprocess-safe wrapper for stage_pdf_file."""
     file_path_str, docs_dir_str, staging_dir_str, pdf_timeout, force = args
@@ -492,18 +579,55 @@ def stage_all_files(
             for f in pdf_files
         ]
         if num_workers > 1 and len(pdf_files) > 1:
-            with ProcessPoolExecutor(max_workers=num_workers) as pool:
+            from pipeline.builder import _extract_pdf_data, _plan_pdf_tasks
+
+            # OPT-PDF-001: Large PDFs that need staging are split into
+            # page-range extraction tasks; the rest stage in one worker call.
+            to_shard = [f for f in pdf_files
+                        if force or needs_restaging(f, staging_dir, "pdf")]
+            shard_results: dict[Path, list[dict]] = {}
+            with tempfile.TemporaryDirectory(prefix="pdf_spill_") as spill_dir, \
+                    ProcessPoolExecutor(max_workers=num_workers) as pool:
+                shard_tasks = [(pdf, rng) for pdf, rng
+                               in _plan_pdf_tasks(to_shard, executor=pool)
+                               if rng is not None]
+                sharded = {pdf for pdf, _ in shard_tasks}
+                shard_totals = {pdf: 0 for pdf in sharded}
+                for pdf, _ in shard_tasks:
+                    shard_totals[pdf] += 1
                 futures = {
-                    pool.submit(_stage_pdf_worker, a): a[0]
-                    for a in pdf_args
+                    pool.submit(_extract_pdf_data,
+                                (str(pdf), str(docs_dir), pdf_timeout, rng,
+                                 spill_dir)): pdf
+                    for pdf, rng in shard_tasks
                 }
-                for i, future in enumerate(as_completed(futures)):
+                futures.update({
+                    pool.submit(_stage_pdf_worker, a): Path(a[0])
+                    for a in pdf_args if Path(a[0]) not in sharded
+                })
+                done_files = 0
+                for future in as_completed(futures):
                     if stop_event and stop_event.is_set():
                         for f in futures:
                             f.cancel()
                         logger.info("Staging stopped gracefully (PDF phase)")
                         break
-                    result = future.result()
+                    pdf = futures[future]
+                    if pdf in sharded:
+                        try:
+                            shard = future.result()
+                        except Exception as e:
+                            shard = {"relative_path": str(pdf.relative_to(docs_dir)),
+                                     "error": f"{type(e).__name__}: {e}"}
+                        parts = shard_results.setdefault(pdf, [])
+                        parts.append(shard)
+                        if len(parts) < shard_totals[pdf]:
+                            continue
+                        result = _stage_merged_pdf(
+                            pdf, docs_dir, staging_dir, shard_results.pop(pdf))
+                    else:
+                        result = future.result()
+                    done_files += 1
                     if result.get("skipped"):
                         skipped_count += 1
                     elif result.get("error"):
@@ -516,7 +640,7 @@ def stage_all_files(
                         staged_count += 1
                     if progress_callback:
                         progress_callback(
-                            "pdf", i + 1, len(pdf_files),
+                            "pdf", done_files, len(pdf_files),
                             f"{'Skipped' if result.get('skipped') else 'Staged'}: "
                             f"{Path(result['relative_path']).name}"
                         )
@@ -545,6 +669,10 @@ def stage_all_files(
 
     elapsed = time.time() - t_start
 
+    # OPT-STAGE-002: A compacted dataset no longer reflects the staged files
+    if staged_count or error_count:
+        _drop_compacted(staging_dir)
+
     # Write staging metadata
     _write_staging_metadata(staging_dir, sorted(all_fy_columns),
                              total_files, staged_count, skipped_count,
@@ -570,15 +698,330 @@ def stage_all_files(
     return summary
 
 
+# ── Phase 1b: Compaction (optional) ─────────────────────────────────────────
+
+_MANIFEST_SCHEMA = pa.schema([
+    pa.field("file_type", pa.string()),
+    pa.field("source_file", pa.string()),
+    pa.field("source_file_size", pa.int64()),
+    pa.field("source_file_mtime", pa.float64()),
+    pa.field("exhibit_type", pa.string()),
+    pa.field("source_category", pa.string()),
+    pa.field("fy_columns", pa.list_(pa.string())),
+    pa.field("row_count", pa.int64()),
+    pa.field("total_pages", pa.int64()),
+    pa.field("first_fiscal_year", pa.string()),
+    pa.field("pe_mentions", pa.string()),        # JSON list
+    pa.field("extraction_issues", pa.string()),  # JSON list
+    pa.field("parse_timestamp", pa.string()),
+    pa.field("error", pa.string()),
+])
+
+
+def _compacted_dir(staging_dir: Path) -> Path:
+    """Return the root of the compacted dataset inside *staging_dir*."""
+    return staging_dir / COMPACTED_DIRNAME
+
+
+def _drop_compacted(staging_dir: Path) -> None:
+    """Remove a compacted dataset that is out of date with the staged files."""
+    compacted = _compacted_dir(staging_dir)
+    if compacted.exists():
+        shutil.rmtree(compacted, ignore_errors=True)
+        logger.info("Removed stale compacted staging dataset: %s", compacted)
+
+
+def _partition_path(root: Path, fiscal_year: str | None,
+                    exhibit_type: str | None) -> Path:
+    """Hive-style partition directory for a (fiscal_year, exhibit_type) key."""
+    def _segment(name: str, value: str | None) -> str:
+        if value is None or value == "":
+            return f"{name}={_HIVE_NULL_PARTITION}"
+        return f"{name}={quote(str(value), safe='')}"
+    return root / _segment("fiscal_year", fiscal_year) / _segment("exhibit_type", exhibit_type)
+
+
+class _PartitionedWriter:
+    """Buffer tables per partition and write them out in large row groups."""
+
+    def __init__(self, root: Path, schema: pa.Schema, row_group_rows: int):
+        self.root = root
+        self.schema = schema
+        self.row_group_rows = row_group_rows
+        self._buffers: dict[tuple, list[pa.Table]] = {}
+        self._buffered_rows: dict[tuple, int] = {}
+        self._writers: dict[tuple, pq.ParquetWriter] = {}
+        self.rows_written = 0
+
+    def add(self, table: pa.Table) -> None:
+        """Split *table* by partition key and buffer each slice."""
+        keys = table.group_by(["fiscal_year", "exhibit_type"]).aggregate([]).to_pylist()
+        for key in keys:
+            fy, et = key["fiscal_year"], key["exhibit_type"]
+            mask = pc.and_(
+                pc.is_null(table["fiscal_year"]) if fy is None
+                else pc.equal(table["fiscal_year"], fy),
+                pc.is_null(table["exhibit_type"]) if et is None
+                else pc.equal(table["exhibit_type"], et),
+            )
+            part = table.filter(pc.fill_null(mask, False))
+            self._buffers.setdefault((fy, et), []).append(part)
+            self._buffered_rows[(fy, et)] = self._buffered_rows.get((fy, et), 0) + part.num_rows
+            if self._buffered_rows[(fy, et)] >= self.row_group_rows:
+                self._flush((fy, et))
+
+    def _flush(self, key: tuple) -> None:
+        parts = self._buffers.pop(key, [])
+        self._buffered_rows.pop(key, None)
+        if not parts:
+            return
+        writer = self._writers.get(key)
+        if writer is None:
+            part_dir = _partition_path(self.root, *key)
+            part_dir.mkdir(parents=True, exist_ok=True)
+            writer = pq.ParquetWriter(
+                str(part_dir / "part-0.parquet"), self.schema,
+                compression="snappy", write_statistics=True,
+            )
+            self._writers[key] = writer
+        table = pa.concat_tables(parts)
+        writer.write_table(table, row_group_size=self.row_group_rows)
+        self.rows_written += table.num_rows
+
+    def close(self) -> int:
+        """Flush every partition and return the number of files written."""
+        for key in list(self._buffers):
+            self._flush(key)
+        for writer in self._writers.values():
+            writer.close()
+        return len(self._writers)
+
+
+class CompactionError(Exception):
+    """A staged file could not be carried into the compacted dataset."""
+
+
+def _conform_table(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Reorder/cast *table* to *schema*, NULL-filling columns it lacks."""
+    arrays = []
+    for field in schema:
+        if field.name in table.column_names:
+            arrays.append(table[field.name].cast(field.type))
+        else:
+            arrays.append(pa.nulls(table.num_rows, type=field.type))
+    return pa.table(arrays, schema=schema)
+
+
+def _manifest_row(file_type: str, meta: dict) -> dict[str, Any]:
+    """Flatten a sidecar dict into a manifest row."""
+    return {
+        "file_type": file_type,
+        "source_file": meta.get("source_file"),
+        "source_file_size": meta.get("source_file_size"),
+        "source_file_mtime": meta.get("source_file_mtime"),
+        "exhibit_type": meta.get("exhibit_type"),
+        "source_category": meta.get("source_category"),
+        "fy_columns": meta.get("fy_columns") or [],
+        "row_count": meta.get("row_count", meta.get("page_count", 0)) or 0,
+        "total_pages": meta.get("total_pages"),
+        "first_fiscal_year": None,
+        "pe_mentions": json.dumps(meta.get("pe_mentions") or []),
+        "extraction_issues": json.dumps(meta.get("extraction_issues") or []),
+        "parse_timestamp": meta.get("parse_timestamp"),
+        "error": meta.get("error"),
+    }
+
+
+def _compact_file_type(
+    staging_dir: Path,
+    out_root: Path,
+    file_type: str,
+    schema: pa.Schema,
+    row_group_rows: int,
+    manifest: list[dict],
+    stop_event: threading.Event | None = None,
+) -> tuple[int, int]:
+    """Compact every staged file of *file_type*; return (rows, files_written)."""
+    src_dir = staging_dir / file_type
+    if not src_dir.exists():
+        return 0, 0
+    writer = _PartitionedWriter(out_root / file_type, schema, row_group_rows)
+    try:
+        for meta_path in sorted(src_dir.rglob("*.meta.json")):
+            if stop_event and stop_event.is_set():
+                break
+            # Any file that cannot be carried over aborts the run: the loader
+            # prefers the compacted dataset, so a skipped file would silently
+            # lose its rows instead of falling back to its per-file parquet.
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            except (json.JSONDecodeError, OSError) as e:
+                raise CompactionError(
+                    f"Unreadable sidecar {meta_path}: {e}") from e
+            row = _manifest_row(file_type, meta)
+            parquet_path = meta_path.with_name(
+                meta_path.name[: -len(".meta.json")] + ".parquet"
+            )
+            if parquet_path.exists():
+                try:
+                    table = _conform_table(pq.read_table(str(parquet_path)), schema)
+                except (OSError, pa.ArrowException) as e:
+                    raise CompactionError(
+                        f"Failed to read {parquet_path}: {e}") from e
+                if table.num_rows:
+                    writer.add(table)
+                    row["row_count"] = table.num_rows
+                    row["first_fiscal_year"] = table["fiscal_year"][0].as_py()
+                else:
+                    row["row_count"] = 0
+            else:
+                row["row_count"] = 0
+            manifest.append(row)
+    finally:
+        n_files = writer.close()
+    return writer.rows_written, n_files
+
+
+def compact_staging(
+    staging_dir: Path,
+    row_group_rows: int = _COMPACT_ROW_GROUP_ROWS,
+    pdf_row_group_rows: int = _COMPACT_PDF_ROW_GROUP_ROWS,
+    stop_event: threading.Event | None = None,
+) -> dict[str, Any]:
+    """Merge per-file staged Parquets into a partitioned dataset.
+
+    OPT-STAGE-002: Staging writes one ``.parquet`` + ``.meta.json`` per
+    source file, so loading and ad-hoc analysis open thousands of small
+    files.  This optional step rewrites them as
+    ``staging/compacted/{excel,pdf}/fiscal_year=…/exhibit_type=…/part-0.parquet``
+    with large row groups and column statistics, and collects every sidecar
+    into a single ``_manifest.parquet``.  Phase 2 and discover_fy_columns()
+    prefer the compacted dataset when it exists; the per-file outputs are
+    kept as the change-detection cache for incremental re-staging, and
+    stage_all_files() drops the compacted copy whenever it re-stages a file.
+
+    The dataset is built in a temporary directory and swapped in at the end,
+    so an interrupted run leaves any previous compaction intact.  A staged
+    file that cannot be read aborts the run the same way (CompactionError),
+    leaving loading on the per-file outputs rather than dropping its rows.
+
+    Args:
+        staging_dir: Path to the staging directory.
+        row_group_rows: Target rows per row group for Excel partitions.
+        pdf_row_group_rows: Target rows per row group for PDF partitions.
+        stop_event: Optional threading.Event for graceful shutdown.
+
+    Returns:
+        Summary dict with excel_rows, pdf_pages, source_files, partition_files,
+        fy_columns, elapsed_sec.
+    """
+    if not staging_dir.exists():
+        raise FileNotFoundError(f"Staging directory not found: {staging_dir}")
+
+    t_start = time.time()
+    fy_columns = discover_fy_columns(staging_dir, use_manifest=False)
+    excel_schema = pa.schema(
+        [pa.field(c, pa.string()) for c in EXCEL_FIXED_COLUMNS]
+        + [pa.field(c, pa.float64()) for c in fy_columns]
+        + [pa.field(c, pa.string())
+           for c in EXCEL_TAIL_COLUMNS + EXCEL_EXTRA_COLUMNS]
+    )
+    pdf_schema = pa.schema([
+        pa.field(c, pa.int32() if c in ("page_number", "has_tables") else pa.string())
+        for c in PDF_COLUMNS
+    ])
+
+    tmp_root = staging_dir / f"{COMPACTED_DIRNAME}.tmp"
+    if tmp_root.exists():
+        shutil.rmtree(tmp_root)
+    tmp_root.mkdir(parents=True)
+
+    manifest: list[dict] = []
+    try:
+        excel_rows, excel_parts = _compact_file_type(
+            staging_dir, tmp_root, "excel", excel_schema, row_group_rows,
+            manifest, stop_event)
+        pdf_pages, pdf_parts = _compact_file_type(
+            staging_dir, tmp_root, "pdf", pdf_schema, pdf_row_group_rows,
+            manifest, stop_event)
+    except CompactionError:
+        shutil.rmtree(tmp_root, ignore_errors=True)
+        raise
+
+    if stop_event and stop_event.is_set():
+        shutil.rmtree(tmp_root, ignore_errors=True)
+        logger.info("Compaction stopped gracefully; previous dataset kept")
+        return {"stopped": True}
+
+    manifest_table = pa.Table.from_pylist(manifest, schema=_MANIFEST_SCHEMA)
+    manifest_table = manifest_table.replace_schema_metadata(
+        {"staging_version": str(STAGING_VERSION)}
+    )
+    pq.write_table(manifest_table, str(tmp_root / COMPACT_MANIFEST_NAME),
+                   compression="snappy")
+
+    final_root = _compacted_dir(staging_dir)
+    if final_root.exists():
+        shutil.rmtree(final_root)
+    tmp_root.rename(final_root)
+
+    elapsed = time.time() - t_start
+    summary = {
+        "excel_rows": excel_rows,
+        "pdf_pages": pdf_pages,
+        "source_files": len(manifest),
+        "partition_files": excel_parts + pdf_parts,
+        "fy_columns": fy_columns,
+        "elapsed_sec": round(elapsed, 1),
+    }
+    logger.info("Compacted %d staged files into %d partition files in %.1fs",
+                len(manifest), excel_parts + pdf_parts, elapsed)
+    return summary
+
+
+def read_compaction_manifest(staging_dir: Path) -> list[dict] | None:
+    """Return the compacted manifest rows, or None if there is no usable one.
+
+    JSON-encoded ``pe_mentions`` / ``extraction_issues`` are decoded, so each
+    row has the same shape as the sidecar it replaced.
+    """
+    path = _compacted_dir(staging_dir) / COMPACT_MANIFEST_NAME
+    if not path.exists():
+        return None
+    try:
+        table = pq.read_table(str(path))
+    except (OSError, pa.ArrowException) as e:
+        logger.warning("Ignoring unreadable staging manifest %s: %s", path, e)
+        return None
+    meta = table.schema.metadata or {}
+    if meta.get(b"staging_version") != str(STAGING_VERSION).encode():
+        logger.info("Ignoring compacted staging from another staging version")
+        return None
+    rows = table.to_pylist()
+    for row in rows:
+        row["pe_mentions"] = json.loads(row["pe_mentions"] or "[]")
+        row["extraction_issues"] = json.loads(row["extraction_issues"] or "[]")
+    return rows
+
+
 # ── Phase 2: Parquet → SQLite ────────────────────────────────────────────────
 
 
-def discover_fy_columns(staging_dir: Path) -> list[str]:
+def discover_fy_columns(staging_dir: Path, use_manifest: bool = True) -> list[str]:
     """Scan all Excel sidecar .meta.json files to collect union of FY columns.
 
+    OPT-STAGE-002: When a compacted dataset exists (and *use_manifest* is
+    True) the single manifest is read instead of every sidecar.
+
     Returns sorted list of all FY column names across all staged Excel files.
     """
     all_fy: set[str] = set()
+    manifest = read_compaction_manifest(staging_dir) if use_manifest else None
+    if manifest is not None:
+        for row in manifest:
+            if row["file_type"] == "excel":
+                all_fy.update(row["fy_columns"] or [])
+        return sorted(all_fy)
     excel_dir = staging_dir / "excel"
     if not excel_dir.exists():
         return []
@@ -621,10 +1064,20 @@ def load_staging_to_db(
         logger.info("Removed existing database for rebuild: %s", db_path)
 
     # Import create_database for schema setup
-    from pipeline.builder import create_database, _ensure_fy_columns
+    from pipeline.builder import (
+        _ensure_fy_columns,
+        _reset_fts_tracking,
+        create_database,
+    )
 
     t_start = time.time()
 
+    # OPT-STAGE-002: Prefer the compacted dataset + manifest when present
+    manifest = read_compaction_manifest(staging_dir)
+    if manifest is not None:
+        logger.info("Loading from compacted staging dataset (%d source files)",
+                    len(manifest))
+
     # Discover all FY columns first
     all_fy_columns = discover_fy_columns(staging_dir)
     logger.info("Discovered %d FY columns across staged files", len(all_fy_columns))
@@ -640,6 +1093,10 @@ def load_staging_to_db(
     conn.execute("DROP TRIGGER IF EXISTS budget_lines_ad")
     conn.execute("DROP TRIGGER IF EXISTS pdf_pages_ai")
     conn.execute("DROP TRIGGER IF EXISTS pdf_pages_ad")
+    # Both indexes are rebuilt below, so a delta left by an interrupted
+    # incremental build no longer applies (OPT-FTS-002).
+    _reset_fts_tracking(conn, "budget_lines")
+    _reset_fts_tracking(conn, "pdf_pages")
     conn.commit()
 
     if rebuild:
@@ -652,11 +1109,12 @@ def load_staging_to_db(
 
     # ── Load Excel Parquets ──────────────────────────────────────────────
     total_rows = _load_excel_parquets(conn, staging_dir, all_fy_columns,
-                                       progress_callback, stop_event)
+                                       progress_callback, stop_event,
+                                       manifest=manifest)
 
     # ── Load PDF Parquets ────────────────────────────────────────────────
     total_pages = _load_pdf_parquets(conn, staging_dir, progress_callback,
-                                      stop_event)
+                                      stop_event, manifest=manifest)
 
     # ── Rebuild FTS indexes ──────────────────────────────────────────────
     if progress_callback:
@@ -685,6 +1143,10 @@ def load_staging_to_db(
         except (json.JSONDecodeError, OSError):
             pass
 
+    # OPT-SUGGEST-001: Keep an existing typeahead index in step with the data
+    refresh_suggestion_index(conn, create=False)
+    # OPT-GEN-001: Invalidate API caches/ETags keyed on the data generation
+    bump_data_generation(conn, "load_staging")
     conn.close()
 
     summary = {
@@ -692,6 +1154,7 @@ def load_staging_to_db(
         "total_pages": total_pages,
         "elapsed_sec": round(elapsed, 1),
         "fy_columns": all_fy_columns,
+        "compacted": manifest is not None,
     }
 
     logger.info("Loaded %d budget rows + %d PDF pages in %.1fs",
@@ -839,20 +1302,80 @@ def _tally_result(
         })
 
 
+def _iter_parquet_rows(
+    path: Path,
+    columns: list[str],
+    int_columns: tuple[str, ...] = (),
+    batch_rows: int = _LOAD_BATCH_ROWS,
+):
+    """Yield lists of row tuples from a Parquet file, ordered as *columns*.
+
+    OPT-STAGE-001: Reads record batches instead of the whole table, converts
+    each column with a single ``to_pylist()`` and zips the columns into rows,
+    so no per-cell Python work is done.  Columns missing from the file (FY
+    columns another file introduced) are NULL-filled; *int_columns* are cast
+    to int64 in Arrow.
+    """
+    pf = pq.ParquetFile(str(path))
+    present = set(pf.schema_arrow.names)
+    read_cols = [c for c in columns if c in present]
+    for batch in pf.iter_batches(batch_size=batch_rows, columns=read_cols):
+        n = batch.num_rows
+        if n == 0:
+            continue
+        col_values = []
+        for name in columns:
+            if name not in present:
+                col_values.append(itertools.repeat(None, n))
+                continue
+            arr = batch.column(name)
+            if name in int_columns and not pa.types.is_integer(arr.type):
+                arr = arr.cast(pa.int64(), safe=False)
+            col_values.append(arr.to_pylist())
+        yield list(zip(*col_values))
+
+
+_PDF_FY_INDEX = PDF_COLUMNS.index("fiscal_year")
+
+
+def _begin_file_savepoint(conn: sqlite3.Connection) -> None:
+    """Open the per-file ``parquet_file`` savepoint inside the load transaction.
+
+    Opening the transaction first keeps RELEASE from committing, so commits
+    stay governed by _LOAD_COMMIT_ROWS.
+    """
+    if not conn.in_transaction:
+        conn.execute("BEGIN")
+    conn.execute("SAVEPOINT parquet_file")
+
+
 def _load_excel_parquets(
     conn: sqlite3.Connection,
     staging_dir: Path,
     all_fy_columns: list[str],
     progress_callback: Callable[[str, int, int, str], None] | None = None,
     stop_event: threading.Event | None = None,
+    manifest: list[dict] | None = None,
 ) -> int:
     """Load all Excel Parquet files into the budget_lines table.
 
     Handles dynamic FY columns by NULL-filling columns absent in each file.
-
-    Returns total rows inserted.
+    OPT-STAGE-001: Files are streamed in record batches and converted
+    column-at-a-time (see _iter_parquet_rows).
+    OPT-STAGE-002: With a compaction *manifest*, the partition files are
+    loaded instead and ingested_files comes from the manifest.
+    OPT-BUILD-004: Rows go through the builder's fingerprint check, so
+    duplicate lines are rejected as they load and row_count records the
+    rows actually stored.
+
+    Returns total rows stored.
     """
-    excel_dir = staging_dir / "excel"
+    from pipeline.builder import _insert_budget_rows
+
+    if manifest is not None:
+        excel_dir = _compacted_dir(staging_dir) / "excel"
+    else:
+        excel_dir = staging_dir / "excel"
     if not excel_dir.exists():
         return 0
 
@@ -860,13 +1383,12 @@ def _load_excel_parquets(
     if not parquet_files:
         return 0
 
-    total_rows = 0
+    rows_since_commit = 0
     # Build the full column list for INSERT
-    all_col_names = EXCEL_FIXED_COLUMNS + all_fy_columns + EXCEL_TAIL_COLUMNS
-
+    all_col_names = (EXCEL_FIXED_COLUMNS + all_fy_columns + EXCEL_TAIL_COLUMNS
+                     + EXCEL_EXTRA_COLUMNS)
     col_str = ", ".join(all_col_names)
-    placeholders = make_placeholders(all_col_names)
-    insert_sql = f"INSERT INTO budget_lines ({col_str}) VALUES ({placeholders})"
+    stored: Counter = Counter()
 
     for fi, pf in enumerate(parquet_files):
         if stop_event and stop_event.is_set():
@@ -876,60 +1398,48 @@ def _load_excel_parquets(
             progress_callback("load_excel", fi + 1, len(parquet_files),
                               f"Loading: {pf.stem}")
 
+        # A file that fails mid-stream is rolled back as a whole
+        _begin_file_savepoint(conn)
         try:
-            table = pq.read_table(str(pf))
-        except Exception as e:
+            n_rows = 0
+            for rows in _iter_parquet_rows(pf, all_col_names):
+                stored.update(_insert_budget_rows(
+                    conn, [(col_str, rows)], fingerprint_missing=False))
+                n_rows += len(rows)
+        except (OSError, pa.ArrowException) as e:
+            conn.execute("ROLLBACK TO parquet_file")
+            conn.execute("RELEASE parquet_file")
             logger.warning("Failed to read %s: %s", pf, e)
             continue
-
-        pf_col_names = table.column_names
-        n_rows = table.num_rows
+        conn.execute("RELEASE parquet_file")
         if n_rows == 0:
             continue
-
-        # Read each column into a Python list
-        col_data: dict[str, list] = {}
-        for col_name in pf_col_names:
-            col_data[col_name] = table.column(col_name).to_pylist()
-
-        # Build rows with NULL-fill for missing FY columns
-        batch = []
-        for row_idx in range(n_rows):
-            row_values = []
-            for col_name in all_col_names:
-                if col_name in col_data:
-                    row_values.append(col_data[col_name][row_idx])
-                else:
-                    row_values.append(None)
-            batch.append(tuple(row_values))
-
-        conn.executemany(insert_sql, batch)
-        total_rows += n_rows
+        rows_since_commit += n_rows
 
         # Record in ingested_files
         meta_path = pf.with_suffix(".meta.json")
-        if meta_path.exists():
+        if manifest is None and meta_path.exists():
             try:
                 meta = json.loads(meta_path.read_text(encoding="utf-8"))
-                rel_path = meta.get("source_file", pf.stem)
-                conn.execute(
-                    "INSERT OR REPLACE INTO ingested_files "
-                    "(file_path, file_type, file_size, file_modified, "
-                    "ingested_at, row_count, status) "
-                    "VALUES (?, ?, ?, ?, datetime('now'), ?, ?)",
-                    (rel_path, "xlsx",
-                     meta.get("source_file_size"),
-                     meta.get("source_file_mtime"),
-                     n_rows, "ok" if not meta.get("error") else f"error: {meta['error']}")
-                )
+                meta.setdefault("source_file", pf.stem)
+                _record_ingested_file(conn, meta, "xlsx",
+                                      stored[meta["source_file"]])
             except (json.JSONDecodeError, OSError):
                 pass
 
-        # Commit in batches for performance
-        if fi % 50 == 0:
+        # OPT-STAGE-001: Commit on row volume rather than file count
+        if rows_since_commit >= _LOAD_COMMIT_ROWS:
             conn.commit()
+            rows_since_commit = 0
+
+    if manifest is not None and not (stop_event and stop_event.is_set()):
+        for meta in manifest:
+            if meta["file_type"] == "excel" and meta["row_count"]:
+                _record_ingested_file(conn, meta, "xlsx",
+                                      stored[meta["source_file"]])
 
     conn.commit()
+    total_rows = sum(stored.values())
     logger.info("Loaded %d budget rows from %d Excel parquets", total_rows, len(parquet_files))
     return total_rows
 
@@ -939,14 +1449,19 @@ def _load_pdf_parquets(
     staging_dir: Path,
     progress_callback: Callable[[str, int, int, str], None] | None = None,
     stop_event: threading.Event | None = None,
+    manifest: list[dict] | None = None,
 ) -> int:
     """Load all PDF Parquet files into the pdf_pages table.
 
-    Also loads PE mentions from sidecars into pdf_pe_numbers.
+    Also loads PE mentions from sidecars (or the compaction *manifest*,
+    OPT-STAGE-002) into pdf_pe_numbers.
 
     Returns total pages inserted.
     """
-    pdf_dir = staging_dir / "pdf"
+    if manifest is not None:
+        pdf_dir = _compacted_dir(staging_dir) / "pdf"
+    else:
+        pdf_dir = staging_dir / "pdf"
     if not pdf_dir.exists():
         return 0
 
@@ -955,17 +1470,13 @@ def _load_pdf_parquets(
         return 0
 
     total_pages = 0
+    rows_since_commit = 0
     insert_sql = (
         "INSERT INTO pdf_pages "
         "(source_file, source_category, fiscal_year, exhibit_type, "
         "page_number, page_text, has_tables, table_data) "
         "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
     )
-    pe_insert_sql = (
-        "INSERT INTO pdf_pe_numbers "
-        "(pdf_page_id, pe_number, page_number, source_file, fiscal_year) "
-        "VALUES (?, ?, ?, ?, ?)"
-    )
 
     for fi, pf in enumerate(parquet_files):
         if stop_event and stop_event.is_set():
@@ -975,106 +1486,123 @@ def _load_pdf_parquets(
             progress_callback("load_pdf", fi + 1, len(parquet_files),
                               f"Loading: {pf.stem}")
 
+        first_fiscal_year = None
+        _begin_file_savepoint(conn)
         try:
-            table = pq.read_table(str(pf))
-        except Exception as e:
+            n_rows = 0
+            for rows in _iter_parquet_rows(pf, PDF_COLUMNS,
+                                           int_columns=("page_number", "has_tables")):
+                if n_rows == 0:
+                    first_fiscal_year = rows[0][_PDF_FY_INDEX]
+                conn.executemany(insert_sql, rows)
+                n_rows += len(rows)
+        except (OSError, pa.ArrowException) as e:
+            conn.execute("ROLLBACK TO parquet_file")
+            conn.execute("RELEASE parquet_file")
             logger.warning("Failed to read %s: %s", pf, e)
             continue
-
-        n_rows = table.num_rows
+        conn.execute("RELEASE parquet_file")
         if n_rows == 0:
             continue
-
-        # Read columns
-        col_data: dict[str, list] = {}
-        for col_name in table.column_names:
-            col_data[col_name] = table.column(col_name).to_pylist()
-
-        # Build batch
-        batch = []
-        for row_idx in range(n_rows):
-            row_values = []
-            for col_name in PDF_COLUMNS:
-                if col_name in col_data:
-                    val = col_data[col_name][row_idx]
-                    if col_name in ("page_number", "has_tables") and val is not None:
-                        val = int(val)
-                    row_values.append(val)
-                else:
-                    row_values.append(None)
-            batch.append(tuple(row_values))
-
-        conn.executemany(insert_sql, batch)
         total_pages += n_rows
+        rows_since_commit += n_rows
 
         # Load PE mentions from sidecar
         meta_path = pf.with_suffix(".meta.json")
-        if meta_path.exists():
+        if manifest is None and meta_path.exists():
             try:
                 meta = json.loads(meta_path.read_text(encoding="utf-8"))
-                pe_mentions = meta.get("pe_mentions", [])
-                rel_path = meta.get("source_file", "")
-                fiscal_year = None
-
-                # Get fiscal year from the first page's data if available
-                if "fiscal_year" in col_data and col_data["fiscal_year"]:
-                    fiscal_year = col_data["fiscal_year"][0]
-
-                if pe_mentions:
-                    # We need the pdf_page_id for each PE mention.
-                    # Query for recently inserted pages for this source file.
-                    page_id_map = {}
-                    cursor = conn.execute(
-                        "SELECT id, page_number FROM pdf_pages "
-                        "WHERE source_file = ? ORDER BY page_number",
-                        (rel_path,)
-                    )
-                    for row in cursor:
-                        page_id_map[row[1]] = row[0]
-
-                    pe_batch = []
-                    for pm in pe_mentions:
-                        pe_num = pm.get("pe_number") if isinstance(pm, dict) else pm[0]
-                        page_num = pm.get("page_number") if isinstance(pm, dict) else pm[1]
-                        page_id = page_id_map.get(page_num)
-                        pe_batch.append((page_id, pe_num, page_num, rel_path, fiscal_year))
-
-                    if pe_batch:
-                        conn.executemany(pe_insert_sql, pe_batch)
-
-                # Record in ingested_files
-                conn.execute(
-                    "INSERT OR REPLACE INTO ingested_files "
-                    "(file_path, file_type, file_size, file_modified, "
-                    "ingested_at, row_count, status) "
-                    "VALUES (?, ?, ?, ?, datetime('now'), ?, ?)",
-                    (rel_path, "pdf",
-                     meta.get("source_file_size"),
-                     meta.get("source_file_mtime"),
-                     n_rows, "ok" if not meta.get("error") else f"error: {meta['error']}")
-                )
-
-                # Record extraction issues
-                for issue in meta.get("extraction_issues", []):
-                    conn.execute(
-                        "INSERT INTO extraction_issues "
-                        "(file_path, page_number, issue_type, issue_detail) "
-                        "VALUES (?, ?, ?, ?)",
-                        (issue.get("file"), issue.get("page"),
-                         issue.get("type"), issue.get("detail"))
-                    )
-
+                # Fiscal year from the first page's data, if available
+                _record_pdf_meta(conn, meta, n_rows, first_fiscal_year)
             except (json.JSONDecodeError, OSError):
                 pass
 
-        if fi % 50 == 0:
+        if rows_since_commit >= _LOAD_COMMIT_ROWS:
             conn.commit()
+            rows_since_commit = 0
+
+    # Pages of one source file may span partitions, so the manifest is
+    # applied once every partition is loaded.
+    if manifest is not None and not (stop_event and stop_event.is_set()):
+        for meta in manifest:
+            if meta["file_type"] == "pdf" and meta["row_count"]:
+                _record_pdf_meta(conn, meta, meta["row_count"],
+                                 meta["first_fiscal_year"])
 
     conn.commit()
     logger.info("Loaded %d PDF pages from %d parquets", total_pages, len(parquet_files))
     return total_pages
 
 
+def _record_ingested_file(
+    conn: sqlite3.Connection,
+    meta: dict,
+    file_type: str,
+    n_rows: int,
+) -> None:
+    """Upsert the ingested_files row for a staged source file."""
+    conn.execute(
+        "INSERT OR REPLACE INTO ingested_files "
+        "(file_path, file_type, file_size, file_modified, "
+        "ingested_at, row_count, status) "
+        "VALUES (?, ?, ?, ?, datetime('now'), ?, ?)",
+        (meta.get("source_file", ""), file_type,
+         meta.get("source_file_size"),
+         meta.get("source_file_mtime"),
+         n_rows, "ok" if not meta.get("error") else f"error: {meta['error']}")
+    )
+
+
+def _record_pdf_meta(
+    conn: sqlite3.Connection,
+    meta: dict,
+    n_rows: int,
+    fiscal_year: str | None,
+) -> None:
+    """Insert PE mentions, ingested_files and extraction issues for a PDF."""
+    pe_mentions = meta.get("pe_mentions", [])
+    rel_path = meta.get("source_file", "")
+
+    if pe_mentions:
+        # We need the pdf_page_id for each PE mention.
+        # Query for the inserted pages of this source file.
+        page_id_map = {}
+        cursor = conn.execute(
+            "SELECT id, page_number FROM pdf_pages "
+            "WHERE source_file = ? ORDER BY page_number",
+            (rel_path,)
+        )
+        for row in cursor:
+            page_id_map[row[1]] = row[0]
+
+        pe_batch = []
+        for pm in pe_mentions:
+            pe_num = pm.get("pe_number") if isinstance(pm, dict) else pm[0]
+            page_num = pm.get("page_number") if isinstance(pm, dict) else pm[1]
+            page_id = page_id_map.get(page_num)
+            pe_batch.append((page_id, pe_num, page_num, rel_path, fiscal_year))
+
+        if pe_batch:
+            conn.executemany(
+                "INSERT INTO pdf_pe_numbers "
+                "(pdf_page_id, pe_number, page_number, source_file, fiscal_year) "
+                "VALUES (?, ?, ?, ?, ?)",
+                pe_batch,
+            )
+
+    _record_ingested_file(conn, {**meta, "source_file": rel_path}, "pdf", n_rows)
+
+    # Record extraction issues
+    for issue in meta.get("extraction_issues", []):
+        conn.execute(
+            "INSERT INTO extraction_issues "
+            "(file_path, page_number, issue_type, issue_detail) "
+            "VALUES (?, ?, ?, ?)",
+            (issue.get("file"), issue.get("page"),
+             issue.get("type"), issue.get("detail"))
+        )
+
+
 def _rebuild_fts_indexes(conn: sqlite3.Connection) -> None:
     """Rebuild FTS5 indexes and recreate triggers for both tables."""
     # Rebuild budget_lines FTS
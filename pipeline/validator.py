@@ -10,10 +10,16 @@ Usage:
     python validate_budget_data.py --db path/to/db      # Custom DB path
     python validate_budget_data.py --strict              # Non-zero exit on warnings
     python validate_budget_data.py --json                # Output as JSON
+    python validate_budget_data.py --since-session       # Only re-check files from the last build
 
 Checks: fiscal year coverage, column types, null/zero percentages, row counts,
 and full validation results.  Integrates as a post-build step via validate_all()
 and can generate data_quality_report.json via generate_quality_report().
+
+OPT-VAL-002: with ``since_session`` the per-file checks only re-examine rows
+from files touched by a build session (or ingested since the previous
+report, or rewritten in place by a repair/enrich step since its data
+generation) and merge their findings with the previous report for the rest.
 """
 
 import json
@@ -29,7 +35,11 @@ from utils.normalization import normalize_org_loose as _normalize_org
 
 # Shared utilities: Import from utils package for consistency across codebase
 from utils import get_connection
-from utils.database import _validate_identifier
+from utils.database import (
+    _validate_identifier,
+    get_data_generation,
+    source_files_changed_since,
+)
 from utils.query import make_placeholders
 
 logger = logging.getLogger(__name__)
@@ -90,6 +100,107 @@ KNOWN_EXHIBIT_TYPES = CORE_SUMMARY_TYPES | DETAIL_EXHIBIT_KEYS
 ## _normalize_org imported from utils.normalization.normalize_org_loose
 
 
+# ── OPT-VAL-002: Changed-file scope ─────────────────────────────────────────
+
+# Above this share of ingested files an incremental run is no cheaper than a
+# full one (and the merged details lose more to the detail caps).
+VALIDATION_DELTA_MAX_FRACTION = 0.5
+
+
+def changed_source_files(
+    conn: sqlite3.Connection,
+    session_id: str | None = "last",
+    since: str | None = None,
+) -> set[str] | None:
+    """Return the source files touched since the last validation.
+
+    Combines the ``processed_files`` of build session ``session_id``
+    (``"last"`` = the most recent ``build_progress`` session) with every
+    ``ingested_files`` row whose ``ingested_at`` is later than ``since``
+    (a SQLite ``datetime('now')`` value such as a previous report's
+    ``validated_through``).
+
+    Returns None when neither source can be resolved, in which case the
+    caller should fall back to a full validation.
+    """
+    files: set[str] = set()
+    resolved = False
+    try:
+        if session_id == "last":
+            row = conn.execute(
+                "SELECT session_id FROM build_progress "
+                "ORDER BY checkpoint_time DESC, id DESC LIMIT 1"
+            ).fetchone()
+            session_id = row[0] if row else None
+        if session_id:
+            files.update(r[0] for r in conn.execute(
+                "SELECT file_path FROM processed_files WHERE session_id = ?",
+                (session_id,)))
+            resolved = True
+    except sqlite3.OperationalError:
+        pass  # Database predates build_progress tracking
+    if since:
+        files.update(r[0] for r in conn.execute(
+            "SELECT file_path FROM ingested_files WHERE ingested_at > ?",
+            (since,)))
+        resolved = True
+    return files if resolved else None
+
+
+def file_scope_clause(column: str, files: set[str] | None,
+                      keyword: str = "AND") -> tuple[str, list]:
+    """Return an SQL fragment restricting ``column`` to ``files``.
+
+    The file list is bound as a single JSON parameter (``json_each``) so
+    large change sets do not run into SQLite's host-parameter limit.
+    Returns ``("", [])`` when ``files`` is None (no restriction).
+    """
+    if files is None:
+        return "", []
+    _validate_identifier(column.split(".")[-1], "column name")
+    return (f" {keyword} {column} IN (SELECT value FROM json_each(?))",
+            [json.dumps(sorted(files))])
+
+
+def _validated_through(conn: sqlite3.Connection) -> str | None:
+    """Latest ``ingested_at`` covered by a validation run."""
+    return conn.execute("SELECT MAX(ingested_at) FROM ingested_files").fetchone()[0]
+
+
+def incremental_file_scope(conn: sqlite3.Connection, since_session: str,
+                           since: str | None = None,
+                           since_generation: int | None = None) -> set[str] | None:
+    """Resolve the changed files for an incremental run (None = run in full).
+
+    Besides the files from changed_source_files(), every ingested file whose
+    budget_lines were updated or deleted in place since data generation
+    ``since_generation`` (the previous report's ``data_generation``) is
+    re-checked, so repair and enrichment writes are not carried over from
+    a stale report.
+
+    Falls back to a full run when no build session can be found, when the
+    previous report or the database predates that change tracking, or when
+    more than ``VALIDATION_DELTA_MAX_FRACTION`` of ingested files changed.
+    """
+    rewritten = (None if since_generation is None
+                 else source_files_changed_since(conn, since_generation))
+    if rewritten is None:
+        logger.info("  In-place changes not tracked since the previous report"
+                    " — running full validation")
+        return None
+    files = changed_source_files(conn, session_id=since_session, since=since)
+    if files is None:
+        logger.info("  No build session found — running full validation")
+        return None
+    ingested = {r[0] for r in conn.execute("SELECT file_path FROM ingested_files")}
+    files |= rewritten & ingested
+    if ingested and len(files) > len(ingested) * VALIDATION_DELTA_MAX_FRACTION:
+        logger.info("  %d of %d files changed — running full validation",
+                    len(files), len(ingested))
+        return None
+    return files
+
+
 # ── Individual checks ────────────────────────────────────────────────────────
 
 def check_database_stats(conn: sqlite3.Connection) -> dict:
@@ -122,30 +233,37 @@ def check_database_stats(conn: sqlite3.Connection) -> dict:
     }
 
 
-def check_duplicate_rows(conn: sqlite3.Connection) -> dict:
+def check_duplicate_rows(conn: sqlite3.Connection,
+                         files: set[str] | None = None) -> dict:
     """1.B6-b: Detect rows with identical key fields (likely parsing bugs).
 
     Includes cost_type in the key (when available) so that P-1
     multi-cost-type rows (e.g. 'Weapon System Cost' vs 'Advance
-    Procurement') are not flagged as duplicates.
+    Procurement') are not flagged as duplicates.  ``files`` limits the
+    scan to those source files (OPT-VAL-002).
     """
     # Check if cost_type column exists (may be absent in older databases)
     _cols = {row[1] for row in conn.execute("PRAGMA table_info(budget_lines)")}
     _has_cost_type = "cost_type" in _cols
     _cost_type_sel = ", cost_type" if _has_cost_type else ""
     _cost_type_grp = ", cost_type" if _has_cost_type else ""
+    scope, params = file_scope_clause("source_file", files, keyword="WHERE")
     cur = conn.execute(f"""
         SELECT source_file, exhibit_type, account, organization,
                budget_activity, line_item{_cost_type_sel}, sheet_name,
                COUNT(*) as cnt
-        FROM budget_lines
+        FROM budget_lines{scope}
         GROUP BY source_file, exhibit_type, account, organization,
                  budget_activity, line_item{_cost_type_grp}, sheet_name
         HAVING cnt > 1
         ORDER BY cnt DESC
         LIMIT 50
-    """)
+    """, params)
     dupes = [dict(zip([d[0] for d in cur.description], row)) for row in cur.fetchall()]
+    return _duplicate_rows_result(dupes)
+
+
+def _duplicate_rows_result(dupes: list[dict]) -> dict:
     total_dupes = sum(d["cnt"] - 1 for d in dupes)
     return {
         "name": "duplicate_rows",
@@ -230,27 +348,34 @@ def check_unknown_exhibit_types(conn: sqlite3.Connection) -> dict:
     }
 
 
-def check_value_ranges(conn: sqlite3.Connection) -> dict:
+def check_value_ranges(conn: sqlite3.Connection,
+                       files: set[str] | None = None) -> dict:
     """1.B6-f: Flag extreme monetary values (likely unit-of-measure errors)."""
     threshold = _EXTREME_VALUE_THRESHOLD
     outliers = []
     amount_cols = _get_amount_columns(conn)
     for col in amount_cols:
         _validate_identifier(col, "column name")
+    scope, scope_params = file_scope_clause("source_file", files)
     # Single UNION ALL query replaces N separate table scans.
     union_parts = " UNION ALL ".join(
         f"SELECT source_file, exhibit_type, account, organization,"
         f" '{col}' AS col_name, {col} AS val"
-        f" FROM budget_lines WHERE ABS({col}) > {threshold}"
+        f" FROM budget_lines WHERE ABS({col}) > {threshold}{scope}"
         for col in amount_cols
     )
-    cur = conn.execute(f"SELECT * FROM ({union_parts}) LIMIT 70")
+    cur = conn.execute(f"SELECT * FROM ({union_parts}) LIMIT 70",
+                       scope_params * len(amount_cols))
     for row in cur.fetchall():
         outliers.append({
             "source_file": row[0], "exhibit_type": row[1],
             "account": row[2], "organization": row[3],
             "column": row[4], "value": row[5],
         })
+    return _value_ranges_result(outliers)
+
+
+def _value_ranges_result(outliers: list[dict]) -> dict:
     return {
         "name": "value_ranges",
         "status": "warn" if outliers else "pass",
@@ -260,25 +385,33 @@ def check_value_ranges(conn: sqlite3.Connection) -> dict:
     }
 
 
-def check_row_count_consistency(conn: sqlite3.Connection) -> dict:
+def check_row_count_consistency(conn: sqlite3.Connection,
+                                files: set[str] | None = None) -> dict:
     """1.B6-g: Cross-check ingested_files.row_count against actual counts."""
     # Use GROUP BY aggregates instead of correlated subqueries to avoid
     # one COUNT(*) per file (which is extremely slow on thousands of PDFs).
-    cur = conn.execute("""
+    scope, scope_params = file_scope_clause("source_file", files, keyword="WHERE")
+    cur = conn.execute(f"""
         SELECT i.file_path, i.row_count, i.file_type, actual.cnt
         FROM ingested_files i
         JOIN (
-            SELECT source_file, COUNT(*) AS cnt FROM budget_lines GROUP BY source_file
+            SELECT source_file, COUNT(*) AS cnt FROM budget_lines{scope}
+            GROUP BY source_file
             UNION ALL
-            SELECT source_file, COUNT(*) AS cnt FROM pdf_pages GROUP BY source_file
+            SELECT source_file, COUNT(*) AS cnt FROM pdf_pages{scope}
+            GROUP BY source_file
         ) actual ON actual.source_file = i.file_path
         WHERE i.row_count IS NOT NULL
           AND i.row_count != actual.cnt
-    """)
+    """, scope_params * 2)
     mismatches = [
         {"file_path": row[0], "expected": row[1], "file_type": row[2], "actual": row[3]}
         for row in cur.fetchall()
     ]
+    return _row_count_consistency_result(mismatches)
+
+
+def _row_count_consistency_result(mismatches: list[dict]) -> dict:
     return {
         "name": "row_count_consistency",
         "status": "warn" if mismatches else "pass",
@@ -344,22 +477,25 @@ def check_fiscal_year_coverage(conn: sqlite3.Connection) -> dict:
     }
 
 
-def check_column_types(conn: sqlite3.Connection) -> dict:
+def check_column_types(conn: sqlite3.Connection,
+                       files: set[str] | None = None) -> dict:
     """1.B6-d: Detect text values stored in numeric amount columns."""
     misaligned = []
     amount_cols = _get_amount_columns(conn)
     for col in amount_cols:
         _validate_identifier(col, "column name")
+    scope, scope_params = file_scope_clause("source_file", files)
     # Single UNION ALL query replaces N separate table scans.
     union_parts = " UNION ALL ".join(
         f"SELECT source_file, exhibit_type, '{col}' AS col_name, {col} AS val"
         f" FROM budget_lines"
         f" WHERE {col} IS NOT NULL"
-        f"   AND TYPEOF({col}) NOT IN ('real', 'integer')"
+        f"   AND TYPEOF({col}) NOT IN ('real', 'integer'){scope}"
         for col in amount_cols
     )
     try:
-        cur = conn.execute(f"SELECT * FROM ({union_parts}) LIMIT 70")
+        cur = conn.execute(f"SELECT * FROM ({union_parts}) LIMIT 70",
+                           scope_params * len(amount_cols))
         for row in cur.fetchall():
             misaligned.append({
                 "source_file": row[0],
@@ -372,6 +508,10 @@ def check_column_types(conn: sqlite3.Connection) -> dict:
     except Exception:
         logger.debug("check_column_types query failed", exc_info=True)
 
+    return _column_types_result(misaligned)
+
+
+def _column_types_result(misaligned: list[dict]) -> dict:
     return {
         "name": "column_types",
         "status": "warn" if misaligned else "pass",
@@ -397,11 +537,56 @@ ALL_CHECKS = [
 ]
 
 
+# OPT-VAL-002: checks whose details are all tied to one file.  Each maps to
+# (file key in a detail, sort key, detail cap, result builder) so a scoped
+# run can be merged back into the previous report's details.
+_FILE_SCOPED_CHECKS = {
+    check_duplicate_rows: ("source_file", "cnt", 50, _duplicate_rows_result),
+    check_value_ranges: ("source_file", None, 70, _value_ranges_result),
+    check_row_count_consistency: ("file_path", None, None, _row_count_consistency_result),
+    check_column_types: ("source_file", None, 70, _column_types_result),
+}
+
+
+def _check_name(check_fn) -> str:
+    """Report name of a check (``check_duplicate_rows`` -> ``duplicate_rows``)."""
+    return check_fn.__name__.removeprefix("check_")
+
+
+def _previous_checks(previous: dict | None) -> dict[str, dict]:
+    """Index a previous validate_all() summary or quality report by check name."""
+    if not previous:
+        return {}
+    checks = previous.get("checks")
+    if checks is None:
+        checks = (previous.get("validation_summary") or {}).get("checks", [])
+    return {c["name"]: c for c in checks if isinstance(c.get("details"), list)}
+
+
+def _merge_file_scoped(check_fn, fresh: dict, previous: dict,
+                       files: set[str], present: set[str]) -> dict:
+    """Combine a scoped check result with the previous result for other files.
+
+    Previous details for changed or no-longer-ingested files are dropped and
+    replaced by the fresh ones.  Detail caps still apply, so a merged list
+    can only be as complete as the capped lists it came from.
+    """
+    key, sort_key, cap, build = _FILE_SCOPED_CHECKS[check_fn]
+    details = [d for d in previous["details"]
+               if d.get(key) not in files and d.get(key) in present]
+    details += fresh["details"]
+    if sort_key:
+        details.sort(key=lambda d: d.get(sort_key) or 0, reverse=True)
+    return build(details[:cap] if cap else details)
+
+
 def validate_all(
     db_path: Path = DEFAULT_DB_PATH,
     strict: bool = False,
     pedantic: bool = False,
     stop_event: threading.Event | None = None,
+    since_session: str | None = None,
+    previous: dict | None = None,
 ) -> dict:
     """Run all validation checks and return a summary dict.
 
@@ -410,6 +595,11 @@ def validate_all(
         strict:    Exit non-zero on any *failures* (status="fail").
         pedantic:  Exit non-zero on any *warnings or failures*.
         stop_event: Optional threading.Event for graceful shutdown.
+        since_session: Build session id (or ``"last"``) whose files the
+                   per-file checks are restricted to (OPT-VAL-002).  Requires
+                   ``previous``; otherwise all checks run in full.
+        previous:  A previous summary or data_quality_report.json dict whose
+                   per-file findings are kept for untouched files.
     """
     if not db_path.exists():
         raise FileNotFoundError(
@@ -418,14 +608,40 @@ def validate_all(
         )
 
     conn = get_connection(db_path)
+    # OPT-VAL-002: resolve the changed-file scope, or fall back to a full run
+    files = None
+    prev_checks: dict[str, dict] = {}
+    present: set[str] = set()
+    if since_session is not None:
+        previous = previous or {}
+        prev_checks = _previous_checks(previous)
+        if not prev_checks:
+            logger.info("  No previous report to merge with — running full validation")
+        else:
+            files = incremental_file_scope(conn, since_session,
+                                           previous.get("validated_through"),
+                                           previous.get("data_generation"))
+        if files is None:
+            prev_checks = {}
+        else:
+            present = {r[0] for r in conn.execute("SELECT file_path FROM ingested_files")}
+            logger.info("  Incremental validation: %d changed file(s)", len(files))
+
     results = []
     for check_fn in ALL_CHECKS:
         if stop_event and stop_event.is_set():
             logger.info("  Validation stopped gracefully")
             break
-        result = check_fn(conn)
+        prev = prev_checks.get(_check_name(check_fn))
+        if check_fn in _FILE_SCOPED_CHECKS and prev is not None and files is not None:
+            result = _merge_file_scoped(check_fn, check_fn(conn, files=files),
+                                        prev, files, present)
+        else:
+            result = check_fn(conn)
         logger.info("  Checking %s... %s", check_fn.__name__, result["status"].upper())
         results.append(result)
+    validated_through = _validated_through(conn)
+    data_generation = get_data_generation(conn) or 0
     conn.close()
 
     total_warnings = sum(1 for r in results if r["status"] == "warn")
@@ -447,6 +663,12 @@ def validate_all(
         "total_warnings": total_warnings,
         "total_failures": total_failures,
         "exit_code": exit_code,
+        "validated_through": validated_through,
+        "data_generation": data_generation,
+        "scope": (
+            {"mode": "incremental", "changed_files": len(files)}
+            if files is not None else {"mode": "full"}
+        ),
     }
     return summary
 
@@ -474,10 +696,19 @@ def print_report(summary: dict) -> None:
           f"{summary['total_failures']} failure(s)\n")
 
 
+def load_report(path: Path) -> dict | None:
+    """Load a previous validation summary or quality report (None if unusable)."""
+    try:
+        return json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return None
+
+
 def generate_quality_report(
     db_path: Path = DEFAULT_DB_PATH,
     output_path: Path = Path("logs/data_quality_report.json"),
     print_console: bool = True,
+    since_session: str | None = None,
 ) -> dict:
     """Generate a JSON data-quality report after a build (2.B3-a).
 
@@ -492,6 +723,9 @@ def generate_quality_report(
         db_path:       Path to the SQLite database.
         output_path:   JSON file to write (default: data_quality_report.json).
         print_console: If True, also print the human-readable validation report.
+        since_session: Build session id (or ``"last"``) for an incremental
+                       validation merged with the report already at
+                       output_path (OPT-VAL-002).
 
     Returns:
         Report dict with keys: timestamp, database, total_budget_lines,
@@ -553,7 +787,9 @@ def generate_quality_report(
     conn.close()
 
     # 3. Run validation checks
-    val_summary = validate_all(db_path)
+    previous = load_report(output_path) if since_session is not None else None
+    val_summary = validate_all(db_path, since_session=since_session,
+                               previous=previous)
     if print_console:
         print_report(val_summary)
 
@@ -561,6 +797,9 @@ def generate_quality_report(
         "timestamp": datetime.now().isoformat(),
         "database": str(db_path),
         "total_budget_lines": total_rows,
+        "validated_through": val_summary["validated_through"],
+        "data_generation": val_summary["data_generation"],
+        "validation_scope": val_summary["scope"],
         "row_counts_by_service_fy_exhibit": row_counts,
         "amount_column_stats": amount_stats,
         "validation_summary": {
@@ -589,9 +828,21 @@ def main() -> None:
                         help="Exit non-zero on any warnings or failures")
     parser.add_argument("--json", action="store_true", dest="output_json",
                         help="Output results as JSON")
+    parser.add_argument("--since-session", nargs="?", const="last", default=None,
+                        metavar="SESSION_ID",
+                        help="Re-check only files from this build session "
+                             "(default: the last one) and merge with --previous")
+    parser.add_argument("--previous", type=Path,
+                        default=Path("logs/data_quality_report.json"),
+                        help="Previous report to merge with for --since-session "
+                             "(default: logs/data_quality_report.json)")
     args = parser.parse_args()
 
-    summary = validate_all(args.db, strict=args.strict, pedantic=args.pedantic)
+    summary = validate_all(
+        args.db, strict=args.strict, pedantic=args.pedantic,
+        since_session=args.since_session,
+        previous=load_report(args.previous) if args.since_session else None,
+    )
 
     if args.output_json:
         print(json.dumps(summary, indent=2))
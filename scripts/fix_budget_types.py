@@ -15,7 +15,7 @@ import sys
 import time
 
 
-from utils.database import APPROP_TO_BUDGET_TYPE
+from utils.database import APPROP_TO_BUDGET_TYPE, bump_data_generation
 
 # Composite indexes to ensure exist (may already be created by builder.py)
 INDEXES = [
@@ -29,6 +29,9 @@ INDEXES = [
 def fix_budget_types(conn: sqlite3.Connection) -> int:
     """Backfill budget_type from appropriation_code where NULL.
 
+    Bumps the data generation when rows changed, so API caches and ETags
+    keyed on it pick up the new budget types.
+
     Returns the number of rows updated.
     """
     total_updated = 0
@@ -42,6 +45,8 @@ def fix_budget_types(conn: sqlite3.Connection) -> int:
             print(f"  {approp} -> {bt}: {cur.rowcount:,} rows")
             total_updated += cur.rowcount
     conn.commit()
+    if total_updated:
+        bump_data_generation(conn, "fix_budget_types")
     return total_updated
 
 
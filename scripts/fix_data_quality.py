@@ -33,6 +33,7 @@ import time
 from datetime import datetime
 from pathlib import Path
 
+from utils.database import bump_data_generation
 from utils.normalization import (
     APPROPRIATION_KEYWORDS as _ALL_KEYWORDS,
     TITLE_TO_CODE as _TITLE_TO_CODE,
@@ -589,6 +590,8 @@ def run_all(
         val = conn.execute(sql).fetchone()[0]
         logger.info("  %s: %d", label, val)
 
+    if not dry_run:
+        bump_data_generation(conn, "fix_data_quality")
     conn.close()
     return results
 
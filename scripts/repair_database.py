@@ -40,6 +40,7 @@ if _PROJECT_ROOT not in sys.path:
     sys.path.insert(0, _PROJECT_ROOT)
 
 from utils.config import CORE_SUMMARY_TYPES  # noqa: E402
+from utils.database import bump_data_generation  # noqa: E402
 from utils.query import make_placeholders  # noqa: E402
 from utils.normalization import (  # noqa: E402
     APPROPRIATION_KEYWORDS as _APPROPRIATION_KEYWORDS,
@@ -859,6 +860,7 @@ def repair(db_path: Path, dry_run: bool = False) -> dict:
         summary["bad_org_codes_nulled"] = step_14_null_mismatched_org_codes(conn, dry_run)
         if not dry_run:
             step_15_rebuild_fts(conn)
+            bump_data_generation(conn, "repair")
     finally:
         conn.close()
 
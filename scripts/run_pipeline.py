@@ -28,6 +28,7 @@ Usage:
     python scripts/run_pipeline.py --repair-only              # only run the repair step
     python scripts/run_pipeline.py --report                   # generate data_quality_report.json
     python scripts/run_pipeline.py --skip-validate            # skip validation step
+    python scripts/run_pipeline.py --since-session --report   # validate only files from the last build
     python scripts/run_pipeline.py --skip-enrich              # stop after validation
     python scripts/run_pipeline.py --skip-repair              # skip the repair step
     python scripts/run_pipeline.py --no-rollback              # disable automatic rollback
@@ -543,6 +544,12 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         "--report-path", default="logs/data_quality_report.json", metavar="PATH",
         help="Path for the quality report (default: logs/data_quality_report.json)",
     )
+    val_group.add_argument(
+        "--since-session", nargs="?", const="last", default=None,
+        metavar="SESSION_ID",
+        help="Only re-check files from this build session (default: the last "
+             "one) and merge with the report at --report-path",
+    )
 
     # Enrich options
     enr_group = p.add_argument_group("enrich options")
@@ -1075,7 +1082,7 @@ def main(argv: list[str] | None = None) -> int:
 
     # ── Step 4 / 5: Validate ─────────────────────────────────────────────
     if not args.skip_validate:
-        from pipeline.validator import validate_all
+        from pipeline.validator import load_report, validate_all
 
         val_report = pl.start_step("validate")
 
@@ -1086,6 +1093,9 @@ def main(argv: list[str] | None = None) -> int:
             strict=args.strict,
             pedantic=args.pedantic,
             stop_event=_stop_event,
+            since_session=args.since_session,
+            previous=(load_report(Path(args.report_path))
+                      if args.since_session else None),
         )
 
         if ok and val_summary:
@@ -1134,6 +1144,7 @@ def main(argv: list[str] | None = None) -> int:
                 db_path=db_path,
                 output_path=report_path,
                 print_console=True,
+                since_session=args.since_session,
             )
             if ok_report:
                 print(f"  Report: {report_path.resolve()}")
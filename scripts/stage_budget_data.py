@@ -13,6 +13,9 @@ Usage:
     # Both: stage then load
     python scripts/stage_budget_data.py --docs-dir DoD_Budget_Documents --staging-dir staging --db dod_budget.sqlite
 
+    # Stage, then compact into a partitioned dataset before loading
+    python scripts/stage_budget_data.py --docs-dir DoD_Budget_Documents --staging-dir staging --compact
+
     # Force re-stage everything
     python scripts/stage_budget_data.py --docs-dir DoD_Budget_Documents --staging-dir staging --force
 
@@ -72,6 +75,11 @@ def main():
         "--rebuild", action="store_true",
         help="Delete existing database before loading (Phase 2)"
     )
+    parser.add_argument(
+        "--compact", action="store_true",
+        help="Merge staged files into a partitioned dataset + manifest "
+             "(loading then reads the compacted dataset)"
+    )
     parser.add_argument(
         "--dry-run", action="store_true",
         help="Preview what would be staged without parsing any files"
@@ -83,7 +91,9 @@ def main():
         print("ERROR: Cannot use both --stage-only and --load-only")
         sys.exit(1)
 
-    from pipeline.staging import stage_all_files, load_staging_to_db, needs_restaging
+    from pipeline.staging import (
+        CompactionError, compact_staging, load_staging_to_db, needs_restaging, stage_all_files,
+    )
     from utils.progress import log_progress
 
     _THROTTLE_INTERVAL = 0.5  # seconds between progress updates
@@ -189,6 +199,30 @@ def main():
             if len(summary['errors']) > 20:
                 print(f"    ... and {len(summary['errors']) - 20} more")
 
+    # ── Phase 1b: Compact (optional) ─────────────────────────────────────
+    if args.compact:
+        print(f"\n{'='*60}")
+        print("  COMPACTION: Merging staged Parquet into a partitioned dataset")
+        print(f"{'='*60}")
+
+        try:
+            summary = compact_staging(args.staging_dir)
+        except FileNotFoundError as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+        except CompactionError as e:
+            # The load below falls back to the per-file staged outputs
+            print(f"WARNING: Compaction aborted: {e}")
+            summary = None
+
+        if summary is not None:
+            print("\n  Compaction complete:")
+            print(f"    Source files:    {summary['source_files']}")
+            print(f"    Partition files: {summary['partition_files']}")
+            print(f"    Budget rows:     {summary['excel_rows']:,}")
+            print(f"    PDF pages:       {summary['pdf_pages']:,}")
+            print(f"    Elapsed:         {summary['elapsed_sec']}s")
+
     # ── Phase 2: Load ────────────────────────────────────────────────────
     if not args.stage_only:
         print(f"\n{'='*60}")
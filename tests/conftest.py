@@ -511,10 +511,18 @@ def _clear_api_caches():
     try:
         from api.routes.aggregations import _agg_cache, _hierarchy_cache
         from api.routes.dashboard import _summary_cache
-
-        _agg_cache.clear()
-        _hierarchy_cache.clear()
-        _summary_cache.clear()
+        from api.routes.facets import _facets_cache
+        from api.routes.frontend import (
+            _exhibit_types_cache,
+            _fiscal_years_cache,
+            _services_cache,
+        )
+        from utils.query import _count_cache
+
+        for cache in (_agg_cache, _hierarchy_cache, _summary_cache, _facets_cache,
+                      _services_cache, _exhibit_types_cache, _fiscal_years_cache,
+                      _count_cache):
+            cache.clear()
     except ImportError:
         pass
     yield
@@ -0,0 +1,157 @@
+"""
+Tests for the journaled download manifest in downloader/manifest.py.
+
+Covers append-only updates, crash replay (including a torn last line),
+periodic compaction, flush_manifest() and load_manifest_ok_urls() reading
+through the journal.
+"""
+import json
+import threading
+
+import pytest
+
+import downloader.manifest as dm
+from downloader.manifest import (
+    flush_manifest,
+    load_manifest_ok_urls,
+    read_manifest,
+    update_manifest_entry,
+    write_manifest,
+)
+
+
+def _all_files(n: int) -> dict:
+    return {
+        "2026": {
+            "Comptroller": [
+                {"url": f"https://example.mil/f{i}.xlsx",
+                 "filename": f"p1_display_{i}.xlsx",
+                 "name": f"P-1 {i}", "extension": ".xlsx"}
+                for i in range(n)
+            ]
+        }
+    }
+
+
+@pytest.fixture()
+def manifest_path(tmp_path):
+    path = tmp_path / "manifest.json"
+    yield path
+    with dm._manifest_lock:
+        dm._close_journal()
+        dm._manifest_path = None
+        dm._manifest.clear()
+
+
+def _snapshot_status(path, url):
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return data["files"][url]["status"]
+
+
+class TestJournaledUpdates:
+    def test_update_appends_instead_of_rewriting(self, manifest_path):
+        write_manifest(manifest_path.parent, _all_files(3), manifest_path)
+        before = manifest_path.read_text(encoding="utf-8")
+
+        update_manifest_entry("https://example.mil/f0.xlsx", "ok", 10, "abc")
+
+        assert manifest_path.read_text(encoding="utf-8") == before
+        journal = manifest_path.with_name("manifest.json.journal")
+        lines = journal.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["url"] == "https://example.mil/f0.xlsx"
+
+    def test_read_manifest_replays_journal(self, manifest_path):
+        write_manifest(manifest_path.parent, _all_files(3), manifest_path)
+        update_manifest_entry("https://example.mil/f1.xlsx", "fail", 0, None)
+        update_manifest_entry("https://example.mil/f1.xlsx", "ok", 42, "h")
+
+        files = read_manifest(manifest_path)["files"]
+        assert files["https://example.mil/f1.xlsx"]["status"] == "ok"
+        assert files["https://example.mil/f1.xlsx"]["file_size"] == 42
+        assert files["https://example.mil/f0.xlsx"]["status"] == "pending"
+
+    def test_torn_last_line_is_ignored(self, manifest_path):
+        write_manifest(manifest_path.parent, _all_files(2), manifest_path)
+        update_manifest_entry("https://example.mil/f0.xlsx", "ok", 1, "h")
+        journal = manifest_path.with_name("manifest.json.journal")
+        with open(journal, "a", encoding="utf-8") as fh:
+            fh.write('{"url": "https://example.mil/f1.xlsx", "sta')
+
+        files = read_manifest(manifest_path)["files"]
+        assert files["https://example.mil/f0.xlsx"]["status"] == "ok"
+        assert files["https://example.mil/f1.xlsx"]["status"] == "pending"
+
+    def test_unknown_url_ignored(self, manifest_path):
+        write_manifest(manifest_path.parent, _all_files(1), manifest_path)
+        update_manifest_entry("https://example.mil/other.xlsx", "ok", 1, None)
+        assert not manifest_path.with_name("manifest.json.journal").exists()
+
+
+class TestCompaction:
+    def test_journal_compacted_past_threshold(self, manifest_path, monkeypatch):
+        monkeypatch.setattr(dm, "_JOURNAL_COMPACT_MIN", 4)
+        write_manifest(manifest_path.parent, _all_files(4), manifest_path)
+        for i in range(4):
+            update_manifest_entry(f"https://example.mil/f{i}.xlsx", "ok", i, None)
+
+        assert _snapshot_status(manifest_path, "https://example.mil/f3.xlsx") == "ok"
+        assert not manifest_path.with_name("manifest.json.journal").exists()
+        assert not manifest_path.with_name("manifest.json.journal.1").exists()
+
+    def test_rotated_segment_replayed_after_crash(self, manifest_path):
+        write_manifest(manifest_path.parent, _all_files(2), manifest_path)
+        rotated = manifest_path.with_name("manifest.json.journal.1")
+        rotated.write_text(json.dumps(
+            {"url": "https://example.mil/f0.xlsx", "status": "fail"}) + "\n")
+        journal = manifest_path.with_name("manifest.json.journal")
+        journal.write_text(json.dumps(
+            {"url": "https://example.mil/f0.xlsx", "status": "ok"}) + "\n")
+
+        files = read_manifest(manifest_path)["files"]
+        assert files["https://example.mil/f0.xlsx"]["status"] == "ok"
+
+    def test_flush_writes_complete_snapshot(self, manifest_path):
+        write_manifest(manifest_path.parent, _all_files(3), manifest_path)
+        update_manifest_entry("https://example.mil/f2.xlsx", "skip", 5, None)
+
+        flush_manifest()
+
+        assert _snapshot_status(manifest_path, "https://example.mil/f2.xlsx") == "skip"
+        assert not manifest_path.with_name("manifest.json.journal").exists()
+        data = json.loads(manifest_path.read_text(encoding="utf-8"))
+        assert data["generated_at"]
+
+    def test_concurrent_updates_all_recorded(self, manifest_path, monkeypatch):
+        monkeypatch.setattr(dm, "_JOURNAL_COMPACT_MIN", 16)
+        write_manifest(manifest_path.parent, _all_files(200), manifest_path)
+
+        def worker(start):
+            for i in range(start, 200, 4):
+                update_manifest_entry(f"https://example.mil/f{i}.xlsx", "ok", i, None)
+
+        threads = [threading.Thread(target=worker, args=(s,)) for s in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        files = read_manifest(manifest_path)["files"]
+        assert all(e["status"] == "ok" for e in files.values())
+        flush_manifest()
+        data = json.loads(manifest_path.read_text(encoding="utf-8"))
+        assert all(e["status"] == "ok" for e in data["files"].values())
+
+
+class TestOkUrls:
+    def test_ok_urls_include_journaled_entries(self, manifest_path):
+        write_manifest(manifest_path.parent, _all_files(3), manifest_path)
+        update_manifest_entry("https://example.mil/f0.xlsx", "ok", 1, "h")
+        update_manifest_entry("https://example.mil/f1.xlsx", "fail", 0, None)
+
+        assert load_manifest_ok_urls(manifest_path) == {"https://example.mil/f0.xlsx"}
+
+    def test_write_manifest_shares_core_reference(self, manifest_path):
+        from downloader.core import _manifest as core_manifest
+        write_manifest(manifest_path.parent, _all_files(1), manifest_path)
+        assert "https://example.mil/f0.xlsx" in core_manifest
@@ -145,6 +145,24 @@ class TestCheckpointing:
         conn.close()
         assert completed >= 1
 
+    def test_data_generation_bumped(self, tmp_workspace):
+        """OPT-GEN-001: each build advances the data generation stamp."""
+        from utils.database import get_data_generation
+
+        tmp_path, docs, db_path, docs_root = tmp_workspace
+        _make_xlsx(docs / "p1_army.xlsx")
+
+        build_database(docs_root, db_path)
+        conn = sqlite3.connect(str(db_path))
+        first = get_data_generation(conn)
+        conn.close()
+        build_database(docs_root, db_path)
+        conn = sqlite3.connect(str(db_path))
+        second = get_data_generation(conn)
+        conn.close()
+        assert first is not None
+        assert second > first
+
     def test_files_tracked_in_processed_files(self, tmp_workspace):
         tmp_path, docs, db_path, docs_root = tmp_workspace
         _make_xlsx(docs / "p1_army.xlsx")
@@ -0,0 +1,193 @@
+"""
+Tests for content-hash change detection and row-diffed replacement
+(OPT-BUILD-002) in pipeline/builder.py.
+
+Covers _file_needs_update() with recorded hashes, _replace_budget_rows(),
+hashes returned by the extraction workers, and the incremental path of
+build_database() keeping ids of unchanged budget_lines.
+"""
+import os
+import shutil
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+openpyxl = pytest.importorskip("openpyxl")
+
+import pipeline.builder as builder  # noqa: E402
+from pipeline.builder import (  # noqa: E402
+    _extract_excel_rows,
+    _file_needs_update,
+    _merge_pdf_shards,
+    _record_content_hash,
+    _replace_budget_rows,
+    build_database,
+    create_database,
+)
+from utils import compute_file_hash  # noqa: E402
+
+_COLS = "source_file, line_item_title, amount_fy2026_request, amount_type"
+
+
+def _rows(conn):
+    return conn.execute(
+        "SELECT id, line_item_title, amount_fy2026_request FROM budget_lines "
+        "ORDER BY id").fetchall()
+
+
+class TestFileNeedsUpdate:
+    @pytest.fixture()
+    def setup(self, tmp_path):
+        conn = create_database(tmp_path / "db.sqlite")
+        f = tmp_path / "p1.xlsx"
+        f.write_bytes(b"budget bytes")
+        st = f.stat()
+        conn.execute(
+            "INSERT INTO ingested_files (file_path, file_size, file_modified,"
+            " content_hash) VALUES (?, ?, ?, ?)",
+            ("p1.xlsx", st.st_size, st.st_mtime, compute_file_hash(f)))
+        conn.commit()
+        yield conn, f
+        conn.close()
+
+    def test_touched_identical_file_skipped(self, setup):
+        conn, f = setup
+        st = f.stat()
+        os.utime(f, (st.st_atime, st.st_mtime + 3600))
+        hashes = {}
+
+        assert not _file_needs_update(conn, "p1.xlsx", f, hashes=hashes)
+        assert hashes == {"p1.xlsx": compute_file_hash(f)}
+        stored = conn.execute(
+            "SELECT file_modified FROM ingested_files").fetchone()[0]
+        assert stored == pytest.approx(f.stat().st_mtime)
+
+    def test_changed_content_detected(self, setup):
+        conn, f = setup
+        st = f.stat()
+        f.write_bytes(b"budget BYTES")
+        os.utime(f, (st.st_atime, st.st_mtime + 3600))
+        assert _file_needs_update(conn, "p1.xlsx", f)
+
+    def test_no_hash_falls_back_to_mtime(self, setup):
+        conn, f = setup
+        conn.execute("UPDATE ingested_files SET content_hash = NULL")
+        st = f.stat()
+        os.utime(f, (st.st_atime, st.st_mtime + 3600))
+        assert _file_needs_update(conn, "p1.xlsx", f)
+
+
+class TestReplaceBudgetRows:
+    def test_unchanged_rows_keep_ids(self, tmp_path):
+        conn = create_database(tmp_path / "db.sqlite")
+        conn.executemany(
+            f"INSERT INTO budget_lines ({_COLS}) VALUES (?,?,?,?)",
+            [("a.xlsx", "Apache", 10, "budget_authority"),
+             ("a.xlsx", "Black Hawk", 20, "budget_authority"),
+             ("a.xlsx", "Chinook", 30, "budget_authority"),
+             ("b.xlsx", "Other file", 1, "budget_authority")])
+        conn.commit()
+        before = {r[1]: r[0] for r in _rows(conn)}
+
+        kept, inserted, deleted = _replace_budget_rows(conn, "a.xlsx", [
+            (_COLS, [("a.xlsx", "Apache", 10.0, "budget_authority"),
+                     ("a.xlsx", "Black Hawk", 25, "budget_authority"),
+                     ("a.xlsx", "Gray Eagle", 5, "budget_authority")]),
+        ])
+        conn.commit()
+
+        assert (kept, inserted, deleted) == (1, 2, 2)
+        after = {r[1]: (r[0], r[2]) for r in _rows(conn)}
+        assert after["Apache"][0] == before["Apache"]
+        assert after["Other file"][0] == before["Other file"]
+        assert after["Black Hawk"][1] == 25.0
+        assert after["Black Hawk"][0] != before["Black Hawk"]
+        assert "Chinook" not in after
+        conn.close()
+
+    def test_duplicate_rows_matched_one_to_one(self, tmp_path):
+        conn = create_database(tmp_path / "db.sqlite")
+        row = ("a.xlsx", "Spares", 1, "budget_authority")
+        conn.executemany(f"INSERT INTO budget_lines ({_COLS}) VALUES (?,?,?,?)",
+                         [row, row])
+        conn.commit()
+
+        assert _replace_budget_rows(conn, "a.xlsx", [(_COLS, [row])]) == (1, 0, 1)
+        assert len(_rows(conn)) == 1
+        conn.close()
+
+
+class TestWorkerHashes:
+    def test_excel_worker_returns_hash(self, fixtures_dir_excel_only):
+        path = fixtures_dir_excel_only / "p1.xlsx"
+        result = _extract_excel_rows((str(path), str(fixtures_dir_excel_only)))
+        assert result["content_hash"] == compute_file_hash(path)
+
+    def test_merged_shards_keep_first_shard_hash(self):
+        shards = [{"relative_path": "a.pdf", "page_range": (50, 100),
+                   "content_hash": None},
+                  {"relative_path": "a.pdf", "page_range": (0, 50),
+                   "content_hash": "abc"}]
+        assert _merge_pdf_shards(shards)["content_hash"] == "abc"
+
+    def test_worker_digest_recorded_without_rereading(self, tmp_path, monkeypatch):
+        conn = create_database(tmp_path / "t.sqlite")
+        conn.execute("INSERT INTO ingested_files (file_path, file_type) "
+                     "VALUES ('a.xlsx', 'xlsx')")
+
+        def _no_read(_path):
+            raise AssertionError("file re-read in the writer")
+
+        monkeypatch.setattr(builder, "compute_file_hash", _no_read)
+        _record_content_hash(conn, "a.xlsx", tmp_path / "a.xlsx", {}, "abc")
+        assert conn.execute(
+            "SELECT content_hash FROM ingested_files").fetchone()[0] == "abc"
+        conn.close()
+
+
+def test_incremental_build_preserves_unchanged_ids(fixtures_dir_excel_only, tmp_path):
+    docs = tmp_path / "docs"
+    shutil.copytree(fixtures_dir_excel_only, docs)
+    db_path = tmp_path / "build.sqlite"
+    build_database(docs, db_path, rebuild=True, workers=1,
+                   skip_quality_report=True)
+
+    conn = sqlite3.connect(db_path)
+    before = conn.execute(
+        "SELECT id, line_item_title FROM budget_lines "
+        "WHERE source_file = 'p1.xlsx' ORDER BY id").fetchall()
+    hash_before = conn.execute(
+        "SELECT content_hash FROM ingested_files WHERE file_path = 'p1.xlsx'"
+    ).fetchone()[0]
+    conn.close()
+    assert len(before) >= 2 and hash_before
+
+    # Change the amount on the last data row only
+    wb = openpyxl.load_workbook(docs / "p1.xlsx")
+    ws = wb.active
+    ws.cell(row=ws.max_row, column=ws.max_column).value = 99_999.0
+    wb.save(docs / "p1.xlsx")
+
+    build_database(docs, db_path, workers=1, skip_quality_report=True)
+
+    conn = sqlite3.connect(db_path)
+    after = conn.execute(
+        "SELECT id, line_item_title FROM budget_lines "
+        "WHERE source_file = 'p1.xlsx' ORDER BY id").fetchall()
+    hash_after = conn.execute(
+        "SELECT content_hash FROM ingested_files WHERE file_path = 'p1.xlsx'"
+    ).fetchone()[0]
+    fts_hits = conn.execute(
+        "SELECT COUNT(*) FROM budget_lines_fts WHERE budget_lines_fts MATCH ?",
+        (f'"{after[-1][1]}"',)).fetchone()[0]
+    conn.close()
+
+    assert hash_after != hash_before
+    assert len(after) == len(before)
+    assert after[:-1] == before[:-1]
+    assert after[-1][0] > before[-1][0]
+    assert fts_hits >= 1
@@ -671,6 +671,13 @@ class TestFixBudgetTypesMappings:
         assert result["RDTE"] == "RDT&E"
         assert result["O&M"] == "O&M"  # Unchanged
 
+        # API caches keyed on the data generation see the new types
+        from utils.database import get_data_generation
+        first = get_data_generation(conn)
+        assert first is not None
+        assert fix_budget_types(conn) == 0
+        assert get_data_generation(conn) == first
+
         conn.close()
 
 
@@ -705,6 +712,12 @@ class TestRunAll:
         assert row[0] is None  # Not backfilled
         conn.close()
 
+        # A dry run leaves the data generation alone
+        from utils.database import get_data_generation
+        conn = sqlite3.connect(str(db_path))
+        assert get_data_generation(conn) is None
+        conn.close()
+
     def test_run_single_step(self, tmp_path):
         """run_all with only_step runs just that one step."""
         from scripts.fix_data_quality import run_all
@@ -731,6 +744,12 @@ class TestRunAll:
         conn.close()
         assert code == "O&M"
 
+        # API caches keyed on the data generation see the repair
+        from utils.database import get_data_generation
+        conn = sqlite3.connect(str(db_path))
+        assert get_data_generation(conn) is not None
+        conn.close()
+
         # Only step 2 should be in results
         assert 2 in results
         assert 0 not in results
@@ -8,9 +8,12 @@ from __future__ import annotations
 import json
 import sqlite3
 import threading
+from pathlib import Path
 
 import pytest
 
+import pipeline.enricher as enricher
+from pipeline.builder import create_database
 from pipeline.enricher import (
     _invalidate_explorer_caches,
     run_phase1,
@@ -29,6 +32,12 @@ from pipeline.enricher import (
     _MIN_TEXT_FOR_NAME_MATCH,
     _MAX_NAME_MATCHES_PER_ROW,
     _MIN_TITLE_WORDS,
+    _TitleIndex,
+    _map_chunks,
+    _critical_path,
+    _phase_dependencies,
+    _phase_worker_shares,
+    enrich,
 )
 
 
@@ -485,6 +494,58 @@ class TestPhase2:
         count_after_second = conn.execute("SELECT COUNT(*) FROM pe_descriptions").fetchone()[0]
         assert count_after_first == count_after_second
 
+    def _linked_book(self, conn):
+        _insert_budget_line(conn, pe_number="0602120A")
+        _insert_budget_line(conn, pe_number="0603001A", title="Missiles")
+        run_phase1(conn)
+        src = "army/FY2026/r2.pdf"
+        texts = {
+            1: "0602120A radar technology development",
+            2: "0602120A radar continued; see also 0603001A missiles",
+            3: "cover page with no program elements",
+            4: "0603001A missile flight testing",
+        }
+        for page, text in texts.items():
+            page_id = _insert_pdf_page(conn, source_file=src, page_number=page,
+                                       page_text=text)
+            for pe in ("0602120A", "0603001A", "0604999A"):
+                if pe in text:
+                    _insert_pdf_pe_number(conn, pe, page_id, page, src)
+        return src
+
+    def _descriptions(self, conn):
+        return conn.execute(
+            "SELECT pe_number, page_start, page_end, description_text "
+            "FROM pe_descriptions ORDER BY pe_number").fetchall()
+
+    def test_junction_matches_text_scan(self, conn):
+        self._linked_book(conn)
+        run_phase2(conn)
+        from_junction = [tuple(r) for r in self._descriptions(conn)]
+
+        conn.execute("DELETE FROM pe_descriptions")
+        conn.execute("DELETE FROM pdf_pe_numbers")
+        run_phase2(conn)
+
+        assert [tuple(r) for r in self._descriptions(conn)] == from_junction
+        assert [r[:3] for r in from_junction] == [
+            ("0602120A", 1, 2), ("0603001A", 2, 4)]
+
+    def test_junction_drives_page_selection(self, conn):
+        src = self._linked_book(conn)
+        # Pages pdf_pe_numbers does not link are never read, and a mention
+        # that only exists in table_data is not turned into a run.
+        _insert_pdf_page(conn, source_file=src, page_number=5,
+                         page_text="0602120A appendix without a junction row")
+        page_id = _insert_pdf_page(conn, source_file=src, page_number=6,
+                                   page_text="funding table")
+        _insert_pdf_pe_number(conn, "0602120A", page_id, 6, src)
+
+        run_phase2(conn)
+
+        assert [r[:3] for r in self._descriptions(conn)] == [
+            ("0602120A", 1, 2), ("0603001A", 2, 4)]
+
 
 # ── Phase 3 tests ─────────────────────────────────────────────────────────────
 
@@ -805,6 +866,44 @@ class TestPhase4NoiseReduction:
         assert name_matches >= 1
 
 
+class TestTitleIndex:
+    """OPT-ENRICH-003: title candidates must match a full regex scan."""
+
+    _TITLES = [
+        ("0602000A", "Advanced Technology Development Program Number 1"),
+        ("0602001A", "Advanced Technology Development Program Alpha"),
+        ("0602002A", "Joint Counter-UAS Test Range Upgrades"),
+        ("0602003A", "Short Title Here"),
+        ("0602004A", "Über Größe Radar Ärray Programme"),
+    ]
+
+    def _full_scan(self, index, text):
+        return [pe for pe, pattern in index.entries if pattern.search(text)]
+
+    def test_candidates_match_full_scan(self):
+        import random
+        index = _TitleIndex(self._TITLES)
+        assert len(index) == 4
+        rng = random.Random(4)
+        words = ("Advanced Technology Development Program Number 1 Alpha "
+                 "Joint Counter-UAS Test Range Upgrades ÜBER GRÖSSE radar "
+                 "Ärray Programme xjoint uas ſHORT").split()
+        for _ in range(300):
+            text = rng.choice([" ", "\n", "  "]).join(
+                rng.choice(words) for _ in range(rng.randint(3, 15)))
+            if rng.random() < 0.3:
+                text = text.upper()
+            found = [pe for pe, pattern in index.candidates(text)
+                     if pattern.search(text)]
+            assert found == self._full_scan(index, text), text
+
+    def test_partial_edge_words_match(self):
+        index = _TitleIndex(self._TITLES)
+        text = "xJOINT counter-uas\ttest RANGE upgradesx"
+        # The non-ASCII title is never indexed, so it is always a candidate
+        assert [pe for pe, _ in index.candidates(text)] == ["0602002A", "0602004A"]
+
+
 # ── Utility function tests ────────────────────────────────────────────────────
 
 class TestHelpers:
@@ -1573,6 +1672,176 @@ class TestPhase5Checkpoint:
         assert rows1 == rows2
 
 
+class TestParallelPhases:
+    """OPT-ENRICH-004: text phases give the same rows in a process pool."""
+
+    _PES = [("0602120A", "Advanced Radar Technology Development Program"),
+            ("0603000A", "Fighter Systems Integration and Test Program"),
+            ("0604000A", "Ground Vehicle Survivability Research Effort")]
+
+    @classmethod
+    def _populate_inputs(cls, conn):
+        for pe, title in cls._PES:
+            _insert_budget_line(conn, pe_number=pe, title=title)
+        for i in range(12):
+            pe, _ = cls._PES[i % 3]
+            other_pe, other_title = cls._PES[(i + 1) % 3]
+            text = (
+                f"Program Element: {pe}\n"
+                f"Project 12{i}: Sensor Upgrade\n"
+                "Accomplishments/Planned Program\n"
+                f"Builds on {other_title} and shares test assets with "
+                f"{other_pe if i % 2 else 'partner programs'}. " * 4
+            )
+            _insert_pdf_page(conn, source_file=f"army/FY2026/r2_{i}.pdf",
+                             page_number=1, page_text=text)
+
+    def _populate(self, conn):
+        self._populate_inputs(conn)
+        run_phase1(conn)
+
+    def _snapshot(self, conn):
+        return {
+            table: conn.execute(f"SELECT {cols} FROM {table} ORDER BY {cols}").fetchall()
+            for table, cols in [
+                ("pe_descriptions", "pe_number, source_file, section_header, description_text"),
+                ("pe_lineage", "source_pe, referenced_pe, source_file, link_type"),
+                ("project_descriptions", "pe_number, project_number, section_header, description_text"),
+            ]
+        }
+
+    def test_pool_matches_serial(self):
+        results = []
+        for workers in (1, 2):
+            db = _make_db()
+            self._populate(db)
+            counts = (run_phase2(db, workers=workers, stop_event=None),
+                      run_phase4(db, workers=workers),
+                      run_phase5(db, workers=workers))
+            results.append((counts, self._snapshot(db)))
+            db.close()
+        assert results[0][0][0] > 0 and results[0][0][1] > 0
+        assert results[0] == results[1]
+
+    def test_stop_keeps_checkpoint_of_written_chunks(self, conn):
+        stop = threading.Event()
+        written = []
+
+        def _write(result):
+            written.append(result)
+            stop.set()
+
+        chunks = [(10, [1, 2]), (20, [3, 4])]
+        stopped = _map_chunks(conn, iter(chunks), _len_of, _write,
+                              phase=4, stop_event=stop)
+        assert stopped
+        assert written == [2]
+        assert _get_checkpoint(conn, 4) == 10
+
+
+def _len_of(_context, items):
+    return len(items)
+
+
+class TestPhaseScheduler:
+    """OPT-ENRICH-005: phases scheduled by their declared table dependencies."""
+
+    def test_chains_independent_after_phase1(self):
+        deps = _phase_dependencies(range(1, 12))
+        assert deps[7] == set()
+        assert deps[8] == {7} and deps[9] == {7}
+        assert deps[2] == {1} and deps[4] == {1, 2}
+        assert deps[6] == {3, 5}
+        # Phase 10 rewrites budget_lines, so every earlier reader goes first
+        assert {1, 2, 3, 4, 7, 8} <= deps[10]
+        assert 9 not in deps[11]
+
+    def test_dependencies_skip_unselected_phases(self):
+        assert _phase_dependencies({4, 8, 42}) == {4: set(), 8: set()}
+
+    def test_critical_path(self):
+        deps = {1: set(), 2: {1}, 7: set(), 8: {7}}
+        assert _critical_path(deps, {1: 1.0, 2: 5.0, 7: 2.0, 8: 1.0}) == ([1, 2], 6.0)
+        assert _critical_path(deps, {}) == ([], 0.0)
+
+    def test_worker_budget_split_between_concurrent_pools(self):
+        # 4, 5 and 9 can all run at once; 2 and 4 never overlap
+        assert _phase_worker_shares(_phase_dependencies(range(1, 12)), 6) == {
+            2: 2, 4: 2, 5: 2, 9: 2}
+        assert _phase_worker_shares(_phase_dependencies({2, 4}), 4) == {2: 4, 4: 4}
+        assert _phase_worker_shares(_phase_dependencies({2, 9}), 4) == {2: 2, 9: 2}
+        assert _phase_worker_shares(_phase_dependencies({2, 9}), 1) == {2: 1, 9: 1}
+        assert _phase_worker_shares(_phase_dependencies({2, 9}), 4,
+                                    parallel=False) == {2: 4, 9: 4}
+
+    def _make_file_db(self, path: Path) -> Path:
+        db = create_database(path)
+        TestParallelPhases._populate_inputs(db)
+        db.execute("""
+            INSERT INTO budget_lines
+                (source_file, exhibit_type, fiscal_year, organization_name,
+                 account, account_title, line_item, line_item_title)
+            VALUES ('army/p1.xlsx', 'p1', '2026', 'Army',
+                    '2035A', 'Other Procurement, Army', '1000',
+                    'Tactical Radio Systems')
+        """)
+        db.commit()
+        db.close()
+        return path
+
+    def _snapshot(self, path: Path):
+        db = sqlite3.connect(path)
+        try:
+            return {
+                table: db.execute(f"SELECT {cols} FROM {table} ORDER BY {cols}").fetchall()
+                for table, cols in [
+                    ("pe_index", "pe_number, display_title, fiscal_years"),
+                    ("pe_tags", "pe_number, tag, tag_source"),
+                    ("pe_lineage", "source_pe, referenced_pe, link_type"),
+                    ("bli_index", "bli_key, display_title, row_count"),
+                    ("bli_tags", "bli_key, tag, tag_source"),
+                ]
+            }
+        finally:
+            db.close()
+
+    def test_concurrent_run_matches_serial(self, tmp_path):
+        runs = []
+        for parallel in (False, True):
+            path = self._make_file_db(tmp_path / f"enrich_{parallel}.sqlite")
+            summary = enrich(path, set(range(1, 12)), workers=1,
+                             parallel_phases=parallel)
+            runs.append((summary, self._snapshot(path)))
+        (serial, serial_rows), (concurrent, concurrent_rows) = runs
+        assert serial_rows == concurrent_rows
+        assert serial_rows["pe_lineage"] and serial_rows["bli_index"]
+        assert concurrent["phase_results"] == serial["phase_results"]
+        assert concurrent["phases_run"] == list(range(1, 12))
+        assert set(concurrent["phase_timings"]) == set(range(1, 12))
+        path = concurrent["critical_path"]
+        deps = _phase_dependencies(range(1, 12))
+        assert path and all(a in deps[b] for a, b in zip(path, path[1:]))
+        assert concurrent["critical_path_sec"] <= sum(concurrent["phase_timings"].values())
+
+    def test_stop_prevents_later_phases(self, tmp_path, monkeypatch):
+        path = self._make_file_db(tmp_path / "stopped.sqlite")
+        stop = threading.Event()
+        real_phase1 = enricher.run_phase1
+
+        def _phase1_then_stop(conn, stop_event=None):
+            result = real_phase1(conn, stop_event=stop_event)
+            stop.set()
+            return result
+
+        monkeypatch.setattr(enricher, "run_phase1", _phase1_then_stop)
+        summary = enrich(path, set(range(1, 12)), workers=1, stop_event=stop)
+        # Phase 7 starts alongside Phase 1; nothing waiting on Phase 1 runs
+        assert summary["phases_run"][:2] == [1, 7]
+        assert set(summary["phases_run"]) <= {1, 7, 8, 9}
+        assert summary["stopped_after"] == max(summary["phases_run"])
+        assert set(summary["phase_timings"]) == set(summary["phases_run"])
+
+
 class TestInvalidateExplorerCaches:
     """_invalidate_explorer_caches drops cached keyword-search tables after
     enrichment so the next Explorer request rebuilds with fresh data."""
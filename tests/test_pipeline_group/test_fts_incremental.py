@@ -0,0 +1,214 @@
+"""
+Tests for incremental FTS5 maintenance (OPT-FTS-002) in pipeline/builder.py.
+
+Covers _begin_fts_session() / _finish_fts_session(): delta application on
+incremental sessions, the full-rebuild fallbacks, crash carry-over through
+fts_pending, and the tunable post-delta maintenance command.
+"""
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+import pipeline.builder as builder  # noqa: E402
+from pipeline.builder import (  # noqa: E402
+    _begin_fts_session,
+    _finish_fts_session,
+    create_database,
+)
+
+
+@pytest.fixture()
+def conn(tmp_path):
+    c = create_database(tmp_path / "fts.sqlite")
+    yield c
+    c.close()
+
+
+def _add_page(conn, source, text):
+    conn.execute(
+        "INSERT INTO pdf_pages (source_file, page_number, page_text) "
+        "VALUES (?, 1, ?)", (source, text))
+
+
+def _seed(conn, n=20):
+    for i in range(n):
+        _add_page(conn, f"base_{i}.pdf", f"baseline page {i}")
+    conn.commit()
+
+
+def _hits(conn, term):
+    return sorted(r[0] for r in conn.execute(
+        "SELECT p.source_file FROM pdf_pages_fts f "
+        "JOIN pdf_pages p ON p.id = f.rowid "
+        "WHERE pdf_pages_fts MATCH ?", (term,)))
+
+
+def _integrity_ok(conn):
+    conn.execute(
+        "INSERT INTO pdf_pages_fts(pdf_pages_fts, rank) VALUES('integrity-check', 1)")
+    return True
+
+
+def _triggers(conn):
+    return {r[0] for r in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'trigger' "
+        "AND tbl_name = 'pdf_pages'")}
+
+
+class TestDeltaSession:
+    def test_reingest_applies_only_delta(self, conn):
+        _seed(conn)
+        _begin_fts_session(conn, "pdf_pages", full=False)
+        conn.execute("DELETE FROM pdf_pages WHERE source_file = 'base_3.pdf'")
+        _add_page(conn, "base_3.pdf", "rewritten hypersonic page")
+        _add_page(conn, "new.pdf", "hypersonic glide body")
+        # Deleting a row added earlier in the same session must not emit
+        # an FTS 'delete' for a row that was never indexed.
+        _add_page(conn, "gone.pdf", "transient")
+        conn.execute("DELETE FROM pdf_pages WHERE source_file = 'gone.pdf'")
+        conn.commit()
+
+        result = _finish_fts_session(conn, "pdf_pages", "none")
+
+        assert result == {"action": "delta", "rows": 2}
+        assert _hits(conn, "hypersonic") == ["base_3.pdf", "new.pdf"]
+        assert _hits(conn, "baseline AND 3") == []
+        assert _hits(conn, "transient") == []
+        assert _integrity_ok(conn)
+        assert _triggers(conn) == {"pdf_pages_ai", "pdf_pages_ad"}
+        assert conn.execute("SELECT COUNT(*) FROM fts_pending").fetchone()[0] == 0
+
+    def test_same_row_count_reingest_is_reindexed(self, conn):
+        _seed(conn)
+        _begin_fts_session(conn, "pdf_pages", full=False)
+        conn.execute("DELETE FROM pdf_pages WHERE source_file = 'base_0.pdf'")
+        _add_page(conn, "base_0.pdf", "revised appropriation")
+        conn.commit()
+
+        _finish_fts_session(conn, "pdf_pages")
+
+        assert _hits(conn, "revised") == ["base_0.pdf"]
+        assert _integrity_ok(conn)
+
+    def test_large_delta_falls_back_to_rebuild(self, conn, monkeypatch):
+        monkeypatch.setattr(builder, "FTS_DELTA_MAX_FRACTION", 0.1)
+        _seed(conn)
+        _begin_fts_session(conn, "pdf_pages", full=False)
+        for i in range(5):
+            _add_page(conn, f"bulk_{i}.pdf", "bulk insert")
+        conn.commit()
+
+        result = _finish_fts_session(conn, "pdf_pages")
+
+        assert result["action"] == "rebuild"
+        assert len(_hits(conn, "bulk")) == 5
+        assert _integrity_ok(conn)
+
+    def test_no_changes(self, conn):
+        _seed(conn)
+        _begin_fts_session(conn, "pdf_pages", full=False)
+        assert _finish_fts_session(conn, "pdf_pages") == {"action": "none", "rows": 0}
+
+
+class TestFullSession:
+    def test_full_session_rebuilds(self, conn):
+        _begin_fts_session(conn, "pdf_pages", full=True)
+        assert _triggers(conn) == set()
+        _seed(conn, 3)
+
+        result = _finish_fts_session(conn, "pdf_pages")
+
+        assert result == {"action": "rebuild", "rows": 3}
+        assert len(_hits(conn, "baseline")) == 3
+
+    def test_interrupted_full_session_forces_rebuild(self, conn):
+        _begin_fts_session(conn, "pdf_pages", full=True)
+        _seed(conn, 3)
+        # Process stops here; the next session sees a populated table but
+        # must still rebuild the never-indexed rows.
+        _begin_fts_session(conn, "pdf_pages", full=False)
+        _add_page(conn, "later.pdf", "baseline later")
+        conn.commit()
+
+        assert _finish_fts_session(conn, "pdf_pages")["action"] == "rebuild"
+        assert len(_hits(conn, "baseline")) == 4
+
+    def test_interrupted_delta_carried_over(self, conn):
+        _seed(conn)
+        _begin_fts_session(conn, "pdf_pages", full=False)
+        _add_page(conn, "first.pdf", "carried over")
+        conn.commit()
+
+        _begin_fts_session(conn, "pdf_pages", full=False)
+        _add_page(conn, "second.pdf", "carried too")
+        conn.commit()
+        result = _finish_fts_session(conn, "pdf_pages")
+
+        assert result == {"action": "delta", "rows": 2}
+        assert _hits(conn, "carried") == ["first.pdf", "second.pdf"]
+
+
+class TestMaintenance:
+    @pytest.mark.parametrize("mode", ["merge", "optimize", "none"])
+    def test_modes_keep_index_consistent(self, conn, mode):
+        _seed(conn)
+        _begin_fts_session(conn, "pdf_pages", full=False)
+        _add_page(conn, "m.pdf", "maintenance probe")
+        conn.commit()
+
+        _finish_fts_session(conn, "pdf_pages", mode)
+
+        assert _hits(conn, "probe") == ["m.pdf"]
+        assert _integrity_ok(conn)
+
+    def test_unknown_mode_rejected(self, conn):
+        _begin_fts_session(conn, "pdf_pages", full=False)
+        with pytest.raises(ValueError):
+            _finish_fts_session(conn, "pdf_pages", "vacuum")
+
+
+def test_budget_lines_delta(conn):
+    conn.execute(
+        "INSERT INTO budget_lines (source_file, line_item_title, pe_number) "
+        "VALUES ('a.xlsx', 'Legacy radar', '0604001A')")
+    conn.commit()
+    _begin_fts_session(conn, "budget_lines", full=False)
+    conn.execute("DELETE FROM budget_lines WHERE source_file = 'a.xlsx'")
+    conn.execute(
+        "INSERT INTO budget_lines (source_file, line_item_title, pe_number) "
+        "VALUES ('a.xlsx', 'Quantum radar', '0604001A')")
+    conn.commit()
+
+    _finish_fts_session(conn, "budget_lines")
+
+    rows = conn.execute(
+        "SELECT rowid FROM budget_lines_fts WHERE budget_lines_fts MATCH 'quantum'"
+    ).fetchall()
+    assert len(rows) == 1
+    assert conn.execute(
+        "SELECT COUNT(*) FROM budget_lines_fts WHERE budget_lines_fts MATCH 'legacy'"
+    ).fetchone()[0] == 0
+    conn.execute(
+        "INSERT INTO budget_lines_fts(budget_lines_fts, rank) "
+        "VALUES('integrity-check', 1)")
+
+
+def test_tracking_survives_reconnect(tmp_path):
+    db = tmp_path / "fts.sqlite"
+    c = create_database(db)
+    _seed(c)
+    _begin_fts_session(c, "pdf_pages", full=False)
+    _add_page(c, "x.pdf", "persisted delta")
+    c.commit()
+    c.close()
+
+    c = sqlite3.connect(str(db))
+    try:
+        assert _finish_fts_session(c, "pdf_pages")["action"] == "delta"
+        assert _hits(c, "persisted") == ["x.pdf"]
+    finally:
+        c.close()
@@ -0,0 +1,231 @@
+"""
+Tests for ingest-time deduplication by row fingerprint (OPT-BUILD-004).
+
+Covers budget_line_fingerprint(), the precedence applied by
+_insert_budget_rows() when a fingerprint is already stored, the legacy
+backfill in _backfill_row_fingerprints(), and row_count staying in step
+with budget_lines without a post-build reconciliation pass.
+"""
+import shutil
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from pipeline.builder import (  # noqa: E402
+    _backfill_row_fingerprints,
+    _insert_budget_rows,
+    build_database,
+    create_database,
+)
+from utils.database import budget_line_fingerprint  # noqa: E402
+
+_COLS = ("source_file, fiscal_year, pe_number, line_item_title, "
+         "organization_name, exhibit_type, amount_fy2026_request")
+
+
+def _row(source, title="Apache", amount=10.0, pe="0604001A"):
+    return (source, "2026", pe, title, "Army", "p1", amount)
+
+
+def _stored(conn):
+    return conn.execute(
+        "SELECT source_file, line_item_title, amount_fy2026_request "
+        "FROM budget_lines ORDER BY id").fetchall()
+
+
+def _record(conn, path, row_count):
+    conn.execute("INSERT INTO ingested_files (file_path, file_type, row_count) "
+                 "VALUES (?, 'xlsx', ?)", (path, row_count))
+
+
+@pytest.fixture()
+def conn(tmp_path):
+    c = create_database(tmp_path / "dedup.sqlite")
+    yield c
+    c.close()
+
+
+class TestFingerprint:
+    def test_nulls_collide_but_differ_from_empty(self):
+        key = ("2026", None, "Apache", "Army", "p1", "budget_authority", None)
+        assert budget_line_fingerprint(*key) == budget_line_fingerprint(*key)
+        assert budget_line_fingerprint(*key) != budget_line_fingerprint(
+            "2026", "", "Apache", "Army", "p1", "budget_authority", None)
+
+    def test_wrong_arity_rejected(self):
+        with pytest.raises(ValueError):
+            budget_line_fingerprint("2026", "Apache")
+
+
+class TestInsertPrecedence:
+    def test_fy_matching_source_displaces_stored_row(self, conn):
+        _record(conn, "FY2025/p1.xlsx", 2)
+        _insert_budget_rows(conn, [(_COLS, [
+            _row("FY2025/p1.xlsx"), _row("FY2025/p1.xlsx", "Chinook")])])
+
+        delta = _insert_budget_rows(conn, [(_COLS, [
+            _row("FY2026/p1.xlsx", amount=12.0)])])
+
+        assert delta == {"FY2026/p1.xlsx": 1, "FY2025/p1.xlsx": -1}
+        assert sorted(_stored(conn)) == [
+            ("FY2025/p1.xlsx", "Chinook", 10.0),
+            ("FY2026/p1.xlsx", "Apache", 12.0),
+        ]
+        assert conn.execute(
+            "SELECT row_count FROM ingested_files").fetchone()[0] == 1
+
+    def test_lower_priority_row_rejected(self, conn):
+        _insert_budget_rows(conn, [(_COLS, [_row("FY2026/p1.xlsx")])])
+        delta = _insert_budget_rows(conn, [(_COLS, [_row("FY2025/p1.xlsx")])])
+
+        assert +delta == {}
+        assert _stored(conn) == [("FY2026/p1.xlsx", "Apache", 10.0)]
+
+    def test_greater_source_file_wins_tie(self, conn):
+        _insert_budget_rows(conn, [(_COLS, [_row("a_2026.xlsx")])])
+        _insert_budget_rows(conn, [(_COLS, [_row("b_2026.xlsx", amount=2.0)])])
+        _insert_budget_rows(conn, [(_COLS, [_row("a_2026.xlsx", amount=3.0)])])
+
+        assert _stored(conn) == [("b_2026.xlsx", "Apache", 2.0)]
+
+    def test_null_key_duplicates_rejected_within_batch(self, conn):
+        delta = _insert_budget_rows(conn, [(_COLS, [
+            _row("x.xlsx", pe=None), _row("x.xlsx", pe=None, amount=99.0)])])
+
+        assert delta == {"x.xlsx": 1}
+        assert _stored(conn) == [("x.xlsx", "Apache", 10.0)]
+
+
+class TestBackfill:
+    def test_legacy_rows_fingerprinted_and_deduplicated(self, conn):
+        conn.executemany(
+            f"INSERT INTO budget_lines ({_COLS}) VALUES (?,?,?,?,?,?,?)",
+            [_row("FY2025/p1.xlsx"), _row("FY2025/p1.xlsx", "Chinook")])
+        _record(conn, "FY2025/p1.xlsx", 2)
+        kept_id = conn.execute(
+            "SELECT id FROM budget_lines WHERE line_item_title = 'Chinook'"
+        ).fetchone()[0]
+        _insert_budget_rows(conn, [(_COLS, [_row("FY2026/p1.xlsx")])])
+
+        assert _backfill_row_fingerprints(conn) == (2, 1)
+        assert sorted(_stored(conn)) == [
+            ("FY2025/p1.xlsx", "Chinook", 10.0),
+            ("FY2026/p1.xlsx", "Apache", 10.0),
+        ]
+        assert conn.execute(
+            "SELECT id FROM budget_lines WHERE line_item_title = 'Chinook'"
+        ).fetchone()[0] == kept_id
+        assert conn.execute(
+            "SELECT COUNT(*) FROM budget_lines WHERE row_fingerprint IS NULL"
+        ).fetchone()[0] == 0
+        assert conn.execute(
+            "SELECT row_count FROM ingested_files").fetchone()[0] == 1
+
+    def test_nothing_to_backfill(self, conn):
+        _insert_budget_rows(conn, [(_COLS, [_row("a.xlsx")])])
+        assert _backfill_row_fingerprints(conn) == (0, 0)
+
+
+class TestKeyColumnUpdates:
+    def test_key_update_clears_fingerprint(self, conn):
+        _insert_budget_rows(conn, [(_COLS, [_row("a.xlsx")])])
+        conn.execute("UPDATE budget_lines SET amount_fy2026_request = 5.0")
+        assert conn.execute(
+            "SELECT row_fingerprint FROM budget_lines").fetchone()[0] is not None
+
+        conn.execute("UPDATE budget_lines SET organization_name = 'Army'")
+        assert conn.execute(
+            "SELECT row_fingerprint FROM budget_lines").fetchone()[0] is not None
+
+        conn.execute("UPDATE budget_lines SET organization_name = 'Department of the Army'")
+        assert conn.execute(
+            "SELECT row_fingerprint FROM budget_lines").fetchone()[0] is None
+
+    def test_reingest_after_key_update(self, conn):
+        _insert_budget_rows(conn, [(_COLS, [
+            _row("FY2026/p1.xlsx"), _row("FY2026/p1.xlsx", "Chinook")])])
+        # A repair renames the stored lines: one to a fresh key, the other
+        # onto the key the incoming Apache row will carry.
+        conn.execute("UPDATE budget_lines SET line_item_title = 'AH-64 Apache' "
+                     "WHERE line_item_title = 'Apache'")
+        conn.execute("UPDATE budget_lines SET line_item_title = 'Black Hawk' "
+                     "WHERE line_item_title = 'Chinook'")
+
+        assert _backfill_row_fingerprints(conn) == (2, 0)
+        delta = _insert_budget_rows(conn, [(_COLS, [
+            _row("FY2025/p1.xlsx"), _row("FY2025/p1.xlsx", "Black Hawk")])])
+
+        # Apache no longer shares a key with the stored row, Black Hawk does
+        assert delta == {"FY2025/p1.xlsx": 1}
+        assert sorted(_stored(conn)) == [
+            ("FY2025/p1.xlsx", "Apache", 10.0),
+            ("FY2026/p1.xlsx", "AH-64 Apache", 10.0),
+            ("FY2026/p1.xlsx", "Black Hawk", 10.0),
+        ]
+
+    def test_incremental_build_rehashes_updated_rows(
+            self, fixtures_dir_excel_only, tmp_path):
+        docs = tmp_path / "docs"
+        shutil.copytree(fixtures_dir_excel_only, docs)
+        db_path = tmp_path / "build.sqlite"
+        build_database(docs, db_path, rebuild=True, workers=1,
+                       skip_quality_report=True)
+        c = sqlite3.connect(db_path)
+        c.execute("UPDATE budget_lines SET organization_name = "
+                  "'Repaired ' || organization_name")
+        c.commit()
+        c.close()
+
+        build_database(docs, db_path, workers=1, skip_quality_report=True)
+
+        c = sqlite3.connect(db_path)
+        try:
+            rows = c.execute(
+                "SELECT row_fingerprint, fiscal_year, pe_number, line_item_title, "
+                "organization_name, exhibit_type, amount_type, appropriation_code "
+                "FROM budget_lines").fetchall()
+        finally:
+            c.close()
+        assert rows
+        assert all(r[0] == budget_line_fingerprint(*r[1:]) for r in rows)
+
+
+def test_build_row_counts_match_without_reconciliation(fixtures_dir_excel_only,
+                                                       tmp_path):
+    docs = tmp_path / "docs"
+    shutil.copytree(fixtures_dir_excel_only, docs)
+    (docs / "FY2026").mkdir()
+    shutil.copy(docs / "p1.xlsx", docs / "FY2026" / "p1.xlsx")
+    db_path = tmp_path / "build.sqlite"
+    build_database(docs, db_path, rebuild=True, workers=1,
+                   skip_quality_report=True)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        mismatched = conn.execute("""
+            SELECT f.file_path, f.row_count, COUNT(b.id)
+            FROM ingested_files f
+            LEFT JOIN budget_lines b ON b.source_file = f.file_path
+            WHERE f.file_type = 'xlsx'
+            GROUP BY f.file_path
+            HAVING f.row_count != COUNT(b.id)
+        """).fetchall()
+        copies = dict(conn.execute(
+            "SELECT source_file, COUNT(*) FROM budget_lines "
+            "WHERE source_file IN ('p1.xlsx', 'FY2026/p1.xlsx') "
+            "GROUP BY source_file").fetchall())
+        dup_fps = conn.execute(
+            "SELECT COUNT(*) - COUNT(DISTINCT row_fingerprint) FROM budget_lines"
+        ).fetchone()[0]
+    finally:
+        conn.close()
+
+    assert mismatched == []
+    assert dup_fps == 0
+    # The copy under the matching FY directory outranks the original
+    assert copies.get("FY2026/p1.xlsx", 0) > 0
+    assert "p1.xlsx" not in copies
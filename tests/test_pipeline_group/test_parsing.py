@@ -28,6 +28,8 @@ from pipeline.builder import (  # noqa: E402
     _normalise_fiscal_year,
     _parse_appropriation,
     _detect_currency_year,
+    _sniff_header,
+    _CalamineSheet,
 )
 from utils.common import sanitize_filename  # noqa: E402
 from pipeline.exhibit_catalog import find_matching_columns  # noqa: E402
@@ -971,3 +973,61 @@ class TestMapColumnsRegressionFY2024:
         ]
         mapping = _map_columns(headers, "p1")
         assert mapping["line_item"] == 2, "First match should be preserved by setdefault"
+
+
+# ── OPT-BUILD-003: Streaming calamine rows and header sniffing ───────────────
+
+class _FakeLegacyCalamineSheet:
+    """python-calamine < 0.2: only to_python()."""
+
+    def __init__(self, rows):
+        self._rows = rows
+        self.pulled = 0
+
+    def to_python(self):
+        return [list(r) for r in self._rows]
+
+
+class _FakeCalamineSheet(_FakeLegacyCalamineSheet):
+    def iter_rows(self):
+        for r in self._rows:
+            self.pulled += 1
+            yield list(r)
+
+
+class _FakeCalamineBook:
+    def __init__(self, sheet):
+        self.sheet = sheet
+
+    def get_sheet_by_name(self, name):
+        return self.sheet
+
+
+class TestCalamineStreaming:
+    def test_empty_cells_normalised(self):
+        book = _FakeCalamineBook(_FakeCalamineSheet([["a", "", 0], [1.5, 2, "x"]]))
+        rows = list(_CalamineSheet(book, "S").iter_rows(values_only=True))
+        assert rows == [("a", None, 0), (1.5, 2, "x")]
+
+    def test_headerless_sheet_reads_only_sniff_window(self):
+        sheet = _FakeCalamineSheet([["notes"]] * 10_000)
+        book = _FakeCalamineBook(sheet)
+        header_idx, first_rows = _sniff_header(
+            _CalamineSheet(book, "S").iter_rows(values_only=True))
+        assert header_idx is None
+        assert len(first_rows) == 5
+        assert sheet.pulled == 5
+
+    def test_header_plus_merge_row(self):
+        rows = [["Title"], ["Account", "FY 2026"], ["", "Request"], ["2035", 1.0]]
+        it = _CalamineSheet(_FakeCalamineBook(_FakeCalamineSheet(rows)),
+                            "S").iter_rows(values_only=True)
+        header_idx, first_rows = _sniff_header(it)
+        assert header_idx == 1
+        assert first_rows[-1] == (None, "Request")
+        assert next(it) == ("2035", 1.0)
+
+    def test_falls_back_to_to_python(self):
+        sheet = _FakeLegacyCalamineSheet([["", "b"]])
+        rows = list(_CalamineSheet(_FakeCalamineBook(sheet), "S").iter_rows())
+        assert rows == [(None, "b")]
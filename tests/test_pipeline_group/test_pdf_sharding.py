@@ -0,0 +1,207 @@
+"""
+Tests for page-range sharding (OPT-PDF-001) and spilled page batches
+(OPT-PDF-002) of PDF extraction.
+
+Covers _extract_pdf_data() with a page range and a spill directory,
+_pdf_page_count(), _plan_pdf_tasks(), _merge_pdf_shards(),
+iter_pdf_page_batches(), and the sharded paths of build_database() and
+stage_all_files().
+"""
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+pytest.importorskip("pdfplumber")
+fpdf = pytest.importorskip("fpdf")
+
+import pipeline.builder as builder  # noqa: E402
+from pipeline.builder import (  # noqa: E402
+    _extract_pdf_data,
+    _merge_pdf_shards,
+    _pdf_page_count,
+    _plan_pdf_tasks,
+    iter_pdf_page_batches,
+)
+
+N_PAGES = 12
+
+
+def _make_book(path: Path, n_pages: int = N_PAGES) -> Path:
+    """Write a PDF whose page N mentions PE 06027NNE."""
+    pdf = fpdf.FPDF()
+    pdf.set_font("Helvetica", size=11)
+    for i in range(1, n_pages + 1):
+        pdf.add_page()
+        pdf.cell(0, 10, f"Justification page {i} program element 06027{i:02d}E")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pdf.output(str(path))
+    return path
+
+
+@pytest.fixture()
+def book(tmp_path):
+    docs = tmp_path / "docs"
+    return docs, _make_book(docs / "FY2026" / "PB" / "US_Army" / "detail" / "r2_book.pdf")
+
+
+class TestExtractPageRange:
+    def test_range_limits_pages(self, book):
+        docs, pdf = book
+        result = _extract_pdf_data((str(pdf), str(docs), 30, (3, 6)))
+        assert result["error"] is None
+        assert [p[4] for p in result["pages_data"]] == [4, 5, 6]
+        assert result["num_pages"] == N_PAGES
+        assert result["page_range"] == (3, 6)
+        assert {pe for pe, _ in result["pe_mentions"]} == {
+            "0602704E", "0602705E", "0602706E"}
+
+    def test_merged_shards_match_whole_file(self, book):
+        docs, pdf = book
+        whole = _extract_pdf_data((str(pdf), str(docs), 30))
+        shards = [
+            _extract_pdf_data((str(pdf), str(docs), 30, rng))
+            for rng in [(8, 12), (0, 4), (4, 8)]
+        ]
+        merged = _merge_pdf_shards(shards)
+        assert merged["pages_data"] == whole["pages_data"]
+        assert merged["pe_mentions"] == whole["pe_mentions"]
+        assert merged["num_pages"] == whole["num_pages"]
+
+    def test_failed_shard_fails_file(self, book):
+        docs, pdf = book
+        ok = _extract_pdf_data((str(pdf), str(docs), 30, (0, 6)))
+        bad = {"relative_path": ok["relative_path"], "page_range": (6, 12),
+               "error": "RuntimeError: boom"}
+        merged = _merge_pdf_shards([ok, bad])
+        assert merged["error"] == "RuntimeError: boom"
+        assert merged["pages_data"] == []
+
+
+class TestSpilledPages:
+    @pytest.fixture(autouse=True)
+    def small_batches(self, monkeypatch):
+        monkeypatch.setattr(builder, "_PDF_PAGE_BATCH", 5)
+
+    def test_pages_streamed_through_spill_file(self, book, tmp_path):
+        docs, pdf = book
+        whole = _extract_pdf_data((str(pdf), str(docs), 30))
+        spill_dir = tmp_path / "spill"
+        spill_dir.mkdir()
+
+        result = _extract_pdf_data((str(pdf), str(docs), 30, None, str(spill_dir)))
+
+        assert result["pages_data"] == []
+        assert result["page_count"] == N_PAGES
+        assert len(result["pages_spill"]) == 1
+        batches = list(iter_pdf_page_batches(result))
+        assert [len(b) for b in batches] == [5, 5, 2]
+        assert [p for b in batches for p in b] == whole["pages_data"]
+        assert list(spill_dir.iterdir()) == []
+
+    def test_spilled_shards_replay_in_page_order(self, book, tmp_path):
+        docs, pdf = book
+        shards = [
+            _extract_pdf_data((str(pdf), str(docs), 30, rng, str(tmp_path)))
+            for rng in [(10, 12), (0, 10)]
+        ]
+        merged = _merge_pdf_shards(shards)
+        pages = [p[4] for b in iter_pdf_page_batches(merged) for p in b]
+        assert merged["page_count"] == N_PAGES
+        assert pages == list(range(1, N_PAGES + 1))
+
+    def test_failed_merge_discards_spill(self, book, tmp_path):
+        docs, pdf = book
+        ok = _extract_pdf_data((str(pdf), str(docs), 30, (0, 6), str(tmp_path)))
+        bad = {"relative_path": ok["relative_path"], "page_range": (6, 12),
+               "error": "boom"}
+        merged = _merge_pdf_shards([ok, bad])
+        assert merged["pages_spill"] == []
+        assert not list(tmp_path.glob("*.pages"))
+
+
+class TestPlanTasks:
+    def test_large_pdf_split_into_ranges(self, book, tmp_path):
+        _, pdf = book
+        small = _make_book(tmp_path / "small.pdf", n_pages=2)
+        tasks = _plan_pdf_tasks([small, pdf], shard_pages=5, min_bytes=0)
+        assert tasks == [
+            (pdf, (0, 5)), (pdf, (5, 10)), (pdf, (10, 12)), (small, None),
+        ]
+
+    def test_page_count_read_from_page_tree(self, book):
+        _, pdf = book
+        assert _pdf_page_count(pdf) == 12
+        assert _pdf_page_count(pdf.with_name("missing.pdf")) == 0
+
+    def test_large_files_counted_in_executor(self, book, tmp_path):
+        _, pdf = book
+        small = _make_book(tmp_path / "small.pdf", n_pages=2)
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            tasks = _plan_pdf_tasks([small, pdf], shard_pages=5, min_bytes=0,
+                                    executor=pool)
+        assert tasks == [
+            (pdf, (0, 5)), (pdf, (5, 10)), (pdf, (10, 12)), (small, None),
+        ]
+
+    def test_small_files_not_page_counted(self, book, monkeypatch):
+        _, pdf = book
+        monkeypatch.setattr(builder, "_pdf_page_count",
+                            lambda p: pytest.fail("should not open"))
+        assert _plan_pdf_tasks([pdf], shard_pages=5,
+                               min_bytes=10 ** 9) == [(pdf, None)]
+
+
+class TestShardedPipelines:
+    @pytest.fixture()
+    def force_sharding(self, monkeypatch):
+        monkeypatch.setattr(builder, "_PDF_SHARD_PAGES", 5)
+        monkeypatch.setattr(builder, "_PDF_SHARD_MIN_BYTES", 0)
+
+    def test_build_database_reassembles_shards(self, book, tmp_path, force_sharding):
+        docs, pdf = book
+        _make_book(docs / "FY2026" / "PB" / "US_Army" / "detail" / "r2_small.pdf", 2)
+        db_path = tmp_path / "build.sqlite"
+        builder.build_database(docs, db_path, rebuild=True, workers=2,
+                               skip_quality_report=True)
+
+        conn = sqlite3.connect(str(db_path))
+        try:
+            pages = conn.execute(
+                "SELECT page_number FROM pdf_pages WHERE source_file LIKE ? "
+                "ORDER BY id", ("%r2_book.pdf",)).fetchall()
+            assert [p[0] for p in pages] == list(range(1, N_PAGES + 1))
+            linked = conn.execute(
+                "SELECT n.pe_number, p.page_number FROM pdf_pe_numbers n "
+                "JOIN pdf_pages p ON p.id = n.pdf_page_id "
+                "WHERE n.source_file LIKE ?", ("%r2_book.pdf",)).fetchall()
+            assert sorted(linked) == [
+                (f"06027{i:02d}E", i) for i in range(1, N_PAGES + 1)]
+            row_count = conn.execute(
+                "SELECT row_count FROM ingested_files WHERE file_path LIKE ?",
+                ("%r2_book.pdf",)).fetchone()[0]
+            assert row_count == N_PAGES
+        finally:
+            conn.close()
+
+    def test_stage_all_files_reassembles_shards(self, book, tmp_path, force_sharding):
+        pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+        from pipeline.staging import stage_all_files
+
+        docs, pdf = book
+        _make_book(docs / "FY2026" / "PB" / "US_Army" / "detail" / "r2_small.pdf", 2)
+        staging = tmp_path / "staging"
+        summary = stage_all_files(docs, staging, workers=2)
+
+        assert summary["staged_count"] == 2
+        table = pq.read_table(str(staging / "pdf" / "FY2026" / "PB" / "US_Army"
+                                  / "detail" / "r2_book.parquet"))
+        assert table["page_number"].to_pylist() == list(range(1, N_PAGES + 1))
+
+        again = stage_all_files(docs, staging, workers=2)
+        assert again["skipped_count"] == 2
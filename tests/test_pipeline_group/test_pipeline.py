@@ -155,7 +155,8 @@ def test_incremental_update_behavior(fixtures_dir, tmp_path):
     1. Build database from fixture files
     2. Record ingested_files state
     3. Run build again — should skip all unchanged files
-    4. Touch one fixture file (update mtime) — should re-ingest only that file
+    4. Touch one fixture file (update mtime) — same content, still skipped
+    5. Rewrite that file's content — should re-ingest only that file
     """
     # Copy fixtures to a temporary location
     work_dir = tmp_path / "work_fixtures"
@@ -196,26 +197,47 @@ def test_incremental_update_behavior(fixtures_dir, tmp_path):
     assert len(xlsx_files) > 0, "No Excel files found"
     touched_file = xlsx_files[0]
 
-    # Update the file's modification time to trigger re-ingestion
+    # Update the file's modification time only — identical bytes are
+    # detected by content hash and skipped (OPT-BUILD-002)
     touched_file.touch()
 
-    time.sleep(0.5)
+    # ingested_at has one-second resolution
+    time.sleep(1.1)
 
-    # Third build (one file changed)
+    # Third build (mtime changed, content unchanged)
     build_database(work_dir, db_path, rebuild=False)
     conn = sqlite3.connect(db_path)
 
     third_state = conn.execute(
         "SELECT file_path, ingested_at FROM ingested_files ORDER BY file_path"
     ).fetchall()
+    assert third_state == second_state, "Touched but unchanged file was re-ingested"
+    conn.close()
+
+    # Rewrite the file with different content
+    openpyxl = pytest.importorskip("openpyxl")
+    wb = openpyxl.load_workbook(touched_file)
+    wb.active["A1"].value = wb.active["A1"].value
+    wb.properties.title = "edited"
+    wb.save(touched_file)
+
+    time.sleep(1.1)
+
+    # Fourth build (one file changed)
+    build_database(work_dir, db_path, rebuild=False)
+    conn = sqlite3.connect(db_path)
+
+    fourth_state = conn.execute(
+        "SELECT file_path, ingested_at FROM ingested_files ORDER BY file_path"
+    ).fetchall()
 
     # Find which file changed — there should be at least one with newer timestamp
     changes = 0
-    for (path2, time2), (path3, time3) in zip(second_state, third_state):
-        if path2 == path3 and time2 != time3:
+    for (path3, time3), (path4, time4) in zip(third_state, fourth_state):
+        if path3 == path4 and time3 != time4:
             changes += 1
 
-    assert changes > 0, "No files were re-ingested even though one was touched"
+    assert changes > 0, "No files were re-ingested even though one was changed"
 
     conn.close()
 
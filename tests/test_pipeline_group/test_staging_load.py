@@ -30,12 +30,16 @@ except ImportError:
 pytestmark = pytest.mark.skipif(not HAS_PYARROW, reason="pyarrow not installed")
 
 from pipeline.staging import (  # noqa: E402
+    CompactionError,
     EXCEL_FIXED_COLUMNS,
     EXCEL_TAIL_COLUMNS,
     _load_excel_parquets,
     _load_pdf_parquets,
     _rebuild_fts_indexes,
+    compact_staging,
+    discover_fy_columns,
     load_staging_to_db,
+    read_compaction_manifest,
 )
 
 
@@ -291,6 +295,44 @@ class TestLoadExcelParquets:
         conn.close()
 
 
+    def test_streams_multiple_record_batches(self, tmp_path, monkeypatch):
+        """OPT-STAGE-001: rows spanning several record batches all load in order."""
+        import pipeline.staging as staging_mod
+        monkeypatch.setattr(staging_mod, "_LOAD_BATCH_ROWS", 3)
+        staging = tmp_path / "staging"
+        _create_excel_parquet(staging, n_rows=10)
+
+        conn = _create_test_db(tmp_path / "test.sqlite")
+        from pipeline.builder import _ensure_fy_columns
+        fy = ["amount_fy2025_enacted", "amount_fy2026_request"]
+        _ensure_fy_columns(conn, fy)
+        batches = list(staging_mod._iter_parquet_rows(
+            staging / "excel" / "FY2026/Army/p1_army.parquet",
+            EXCEL_FIXED_COLUMNS + fy + EXCEL_TAIL_COLUMNS, batch_rows=3,
+        ))
+        assert [len(b) for b in batches] == [3, 3, 3, 1]
+
+        assert _load_excel_parquets(conn, staging, fy) == 10
+        accounts = [r[0] for r in conn.execute(
+            "SELECT account FROM budget_lines ORDER BY id")]
+        assert accounts == [f"0100{i}" for i in range(10)]
+        conn.close()
+
+    def test_unreadable_file_is_skipped_whole(self, tmp_path):
+        staging = tmp_path / "staging"
+        _create_excel_parquet(staging, rel_subpath="FY2026/Army/good", n_rows=4)
+        bad, _ = _create_excel_parquet(staging, rel_subpath="FY2026/Army/zbad", n_rows=4)
+        bad.write_bytes(b"not a parquet file")
+
+        conn = _create_test_db(tmp_path / "test.sqlite")
+        from pipeline.builder import _ensure_fy_columns
+        fy = ["amount_fy2025_enacted", "amount_fy2026_request"]
+        _ensure_fy_columns(conn, fy)
+        assert _load_excel_parquets(conn, staging, fy) == 4
+        assert not conn.in_transaction  # final commit still happened
+        conn.close()
+
+
 # ── Load PDF Parquets ────────────────────────────────────────────────────────
 
 class TestLoadPdfParquets:
@@ -429,3 +471,133 @@ class TestLoadStagingToDb:
         # Second load with rebuild — should replace, not accumulate
         summary = load_staging_to_db(staging, db_path, rebuild=True)
         assert summary["total_rows"] == 3  # Not 6
+
+
+# ── Compacted staging (OPT-STAGE-002) ────────────────────────────────────────
+
+class TestCompactStaging:
+    """Tests for compact_staging() and loading from the compacted dataset."""
+
+    def _stage(self, staging):
+        _create_excel_parquet(staging, "FY2026/Army/p1_army", n_rows=4)
+        _create_excel_parquet(staging, "FY2026/Navy/p1_navy", n_rows=3,
+                              fy_columns=["amount_fy2027_request"])
+        _create_pdf_parquet(staging, n_pages=3)
+
+    def test_merges_files_into_partitions(self, tmp_path):
+        staging = tmp_path / "staging"
+        self._stage(staging)
+
+        summary = compact_staging(staging)
+
+        assert summary["source_files"] == 3
+        assert summary["excel_rows"] == 7
+        assert summary["pdf_pages"] == 3
+        part_files = sorted((staging / "compacted").rglob("part-*.parquet"))
+        assert len(part_files) == 2
+        excel_part = (staging / "compacted" / "excel" / "fiscal_year=FY%202026"
+                      / "exhibit_type=p1" / "part-0.parquet")
+        meta = pq.ParquetFile(str(excel_part)).metadata
+        assert meta.num_rows == 7
+        assert meta.num_row_groups == 1
+        assert meta.row_group(0).column(0).statistics.has_min_max
+
+    def test_manifest_replaces_sidecars(self, tmp_path):
+        staging = tmp_path / "staging"
+        self._stage(staging)
+        compact_staging(staging)
+        for sidecar in staging.rglob("*.meta.json"):
+            if "compacted" not in sidecar.parts:
+                sidecar.unlink()
+
+        manifest = read_compaction_manifest(staging)
+        assert {r["source_file"] for r in manifest} == {
+            "FY2026/Army/p1_army.xlsx", "FY2026/Navy/p1_navy.xlsx",
+            "FY2026/Army/r2_detail.pdf",
+        }
+        pdf = next(r for r in manifest if r["file_type"] == "pdf")
+        assert pdf["pe_mentions"][0]["pe_number"] == "0602702E"
+        assert pdf["first_fiscal_year"] == "FY 2026"
+        assert discover_fy_columns(staging) == [
+            "amount_fy2025_enacted", "amount_fy2026_request",
+            "amount_fy2027_request",
+        ]
+
+    def test_load_matches_per_file_load(self, tmp_path):
+        staging = tmp_path / "staging"
+        self._stage(staging)
+        loose = load_staging_to_db(staging, tmp_path / "loose.sqlite", rebuild=True)
+        compact_staging(staging)
+        compacted = load_staging_to_db(staging, tmp_path / "compact.sqlite",
+                                       rebuild=True)
+
+        assert loose["compacted"] is False
+        assert compacted["compacted"] is True
+        assert compacted["total_rows"] == loose["total_rows"] == 7
+        assert compacted["total_pages"] == loose["total_pages"] == 3
+
+        def snapshot(db_path):
+            conn = sqlite3.connect(str(db_path))
+            try:
+                return {
+                    "lines": sorted(conn.execute(
+                        "SELECT source_file, account, amount_fy2027_request "
+                        "FROM budget_lines").fetchall(), key=repr),
+                    "files": sorted(conn.execute(
+                        "SELECT file_path, file_type, row_count, status "
+                        "FROM ingested_files").fetchall()),
+                    "pes": sorted(conn.execute(
+                        "SELECT n.pe_number, n.page_number, n.fiscal_year, "
+                        "p.page_number FROM pdf_pe_numbers n "
+                        "JOIN pdf_pages p ON p.id = n.pdf_page_id").fetchall()),
+                }
+            finally:
+                conn.close()
+
+        assert snapshot(tmp_path / "compact.sqlite") == snapshot(tmp_path / "loose.sqlite")
+
+    def test_null_partition_keys(self, tmp_path):
+        staging = tmp_path / "staging"
+        parquet_path, _ = _create_excel_parquet(staging, n_rows=2)
+        table = pq.read_table(str(parquet_path))
+        idx = table.schema.get_field_index("exhibit_type")
+        table = table.set_column(idx, "exhibit_type",
+                                 pa.nulls(2, type=pa.string()))
+        pq.write_table(table, str(parquet_path))
+
+        compact_staging(staging)
+
+        assert list((staging / "compacted" / "excel").rglob(
+            "exhibit_type=__HIVE_DEFAULT_PARTITION__/part-0.parquet"))
+
+    def test_unreadable_parquet_aborts_compaction(self, tmp_path):
+        staging = tmp_path / "staging"
+        self._stage(staging)
+        bad = staging / "excel" / "FY2026" / "Navy" / "p1_navy.parquet"
+        bad.write_bytes(b"not a parquet file")
+
+        with pytest.raises(CompactionError):
+            compact_staging(staging)
+
+        assert not (staging / "compacted").exists()
+        assert not (staging / "compacted.tmp").exists()
+        assert read_compaction_manifest(staging) is None
+
+    def test_unreadable_sidecar_aborts_compaction(self, tmp_path):
+        staging = tmp_path / "staging"
+        self._stage(staging)
+        compact_staging(staging)
+        sidecar = staging / "excel" / "FY2026" / "Army" / "p1_army.meta.json"
+        sidecar.write_text("{not json", encoding="utf-8")
+
+        with pytest.raises(CompactionError):
+            compact_staging(staging)
+
+        # The previous dataset is left in place
+        assert len(read_compaction_manifest(staging)) == 3
+
+    def test_no_manifest_without_compaction(self, tmp_path):
+        staging = tmp_path / "staging"
+        self._stage(staging)
+        assert read_compaction_manifest(staging) is None
+
@@ -36,6 +36,10 @@ from pipeline.db_validator import (  # noqa: E402
     check_expected_indexes,
     _get_amount_columns,
     generate_report,
+    ALL_CHECKS,
+    budget_line_stats,
+    generate_json_report,
+    run_checks,
 )
 
 
@@ -857,3 +861,85 @@ def test_expected_indexes_missing(conn):
     assert issues[0]["severity"] == "warning"
     assert issues[0]["count"] > 0
     assert len(issues[0]["missing_indexes"]) > 0
+
+
+# ── OPT-VAL-001: fused scan and parallel check engine ────────────────────────
+
+
+def _seed_mixed(conn):
+    _insert_line(conn, amount_fy2026_request=-5.0, line_item="neg")
+    _insert_line(conn, amount_fy2024_actual=0, amount_fy2025_enacted=None,
+                 amount_fy2026_request=0, line_item="zero")
+    _insert_line(conn, amount_fy2026_request=2_000_000_000, line_item="big")
+    conn.commit()
+
+
+def test_budget_line_stats_single_scan_counts(conn):
+    _seed_mixed(conn)
+    stats = budget_line_stats(conn)
+    assert stats["total"] == 3
+    assert stats["all_zero"] == 1
+    assert stats["negative"]["amount_fy2026_request"] == 1
+    assert stats["outlier"]["amount_fy2026_request"] == 1
+    assert stats["null"]["amount_fy2025_enacted"] == 1
+    assert stats["null"]["amount_fy2025_total"] == 3
+
+
+def test_parallel_run_matches_sequential(conn):
+    _seed_mixed(conn)
+    parallel, timing = run_checks(conn, workers=4)
+    sequential, seq_timing = run_checks(conn, workers=1)
+
+    assert timing["workers"] == 4 and seq_timing["workers"] == 1
+    assert [(n, i) for n, i, _ in parallel] == [(n, i) for n, i, _ in sequential]
+    assert [n for n, _, _ in parallel] == [n for n, _ in ALL_CHECKS]
+    assert all(ms >= 0 for _, _, ms in parallel)
+
+
+def test_uncommitted_changes_run_sequentially(conn):
+    _insert_line(conn)
+    # Left uncommitted: worker connections would not see this row.
+    conn.execute("UPDATE budget_lines SET amount_fy2026_request = -1.0")
+    assert conn.in_transaction
+    results, timing = run_checks(conn, workers=4)
+    assert timing["workers"] == 1
+    negatives = dict((n, i) for n, i, _ in results)["Negative Amounts"]
+    assert len(negatives) == 1
+
+
+def test_json_report_includes_timings(conn):
+    _seed_mixed(conn)
+    report = generate_json_report(conn, workers=2)
+    assert set(report["timing"]) == {"total_ms", "scan_ms", "workers"}
+    assert all("duration_ms" in c for c in report["checks"])
+
+
+# ── OPT-VAL-002: incremental validation ──────────────────────────────────────
+
+def test_incremental_json_report_merges_previous(conn):
+    for name in ("a.xlsx", "b.xlsx"):
+        _insert_line(conn, source_file=name)
+        _insert_line(conn, source_file=name)
+    for name in ("a.xlsx", "b.xlsx", "c.xlsx", "d.xlsx"):
+        _insert_ingested(conn, file_path=name)
+    conn.commit()
+    full = generate_json_report(conn, workers=1)
+    dupes = {c["name"]: c for c in full["checks"]}["Duplicate Rows"]["issues"]
+    assert {i["source_file"] for i in dupes} == {"a.xlsx", "b.xlsx"}
+
+    # Session s1 re-ingests a.xlsx without its duplicate; b.xlsx gains a
+    # third copy outside any session, which the scoped run must not see.
+    conn.execute("DELETE FROM budget_lines WHERE id = (SELECT MAX(id) "
+                 "FROM budget_lines WHERE source_file = 'a.xlsx')")
+    conn.execute("INSERT INTO build_progress (session_id) VALUES ('s1')")
+    conn.execute("INSERT INTO processed_files (session_id, file_path) "
+                 "VALUES ('s1', 'a.xlsx')")
+    _insert_line(conn, source_file="b.xlsx")
+
+    report = generate_json_report(conn, workers=2, since_session="last",
+                                  previous=full)
+
+    assert report["scope"] == {"mode": "incremental", "changed_files": 1}
+    dupes = {c["name"]: c for c in report["checks"]}["Duplicate Rows"]["issues"]
+    assert [(i["source_file"], i["count"]) for i in dupes] == [("b.xlsx", 2)]
+    assert generate_json_report(conn, since_session="last")["scope"] == {"mode": "full"}
@@ -26,7 +26,9 @@ from pipeline.validator import (
     check_column_types,
     validate_all,
     generate_quality_report,
+    changed_source_files,
 )
+from utils.database import bump_data_generation
 
 
 @pytest.fixture
@@ -252,3 +254,153 @@ def test_generate_quality_report(populated_db_path):
     assert "total_budget_lines" in report
     assert report["total_budget_lines"] == 2
     assert output_path.exists()
+
+
+# ── OPT-VAL-002: incremental validation ──────────────────────────────────────
+
+@pytest.fixture()
+def incremental_db(tmp_path):
+    """Four ingested files; a.xlsx and b.xlsx each hold one duplicated row."""
+    db_path = tmp_path / "inc.sqlite"
+    conn = create_database(db_path)
+    for name in ("a", "b"):
+        for _ in range(2):
+            _insert_budget_line(conn, source_file=f"{name}.xlsx")
+    _insert_budget_line(conn, source_file="c.xlsx", line_item="002",
+                        amount_fy2026_request=5_000_000_000.0)
+    _insert_budget_line(conn, source_file="d.xlsx", line_item="003")
+    conn.executemany(
+        "INSERT INTO ingested_files (file_path, file_type, row_count, ingested_at)"
+        " VALUES (?, 'xlsx', ?, '2026-01-01 00:00:00')",
+        [("a.xlsx", 2), ("b.xlsx", 2), ("c.xlsx", 1), ("d.xlsx", 1)])
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+def _reingest(db_path, session_id, rel_path, sql, params=()):
+    """Apply ``sql`` and record rel_path as processed by ``session_id``."""
+    conn = sqlite3.connect(str(db_path))
+    conn.execute(sql, params)
+    conn.execute("INSERT OR IGNORE INTO build_progress (session_id) VALUES (?)",
+                 (session_id,))
+    conn.execute("INSERT INTO processed_files (session_id, file_path) VALUES (?, ?)",
+                 (session_id, rel_path))
+    conn.execute("UPDATE ingested_files SET ingested_at = '2026-02-01 00:00:00', "
+                 "row_count = (SELECT COUNT(*) FROM budget_lines WHERE source_file = ?) "
+                 "WHERE file_path = ?", (rel_path, rel_path))
+    conn.commit()
+    conn.close()
+
+
+def _check(report, name):
+    return next(c for c in report["validation_summary"]["checks"] if c["name"] == name)
+
+
+def test_changed_source_files(incremental_db):
+    conn = sqlite3.connect(str(incremental_db))
+    assert changed_source_files(conn) is None
+    assert changed_source_files(conn, since="2025-12-31 00:00:00") == {
+        "a.xlsx", "b.xlsx", "c.xlsx", "d.xlsx"}
+    assert changed_source_files(conn, since="2026-01-01 00:00:00") == set()
+    conn.close()
+    _reingest(incremental_db, "s1", "a.xlsx", "SELECT 1")
+    conn = sqlite3.connect(str(incremental_db))
+    assert changed_source_files(conn) == {"a.xlsx"}
+    assert changed_source_files(conn, session_id=None,
+                                since="2026-01-15 00:00:00") == {"a.xlsx"}
+    conn.close()
+
+
+def test_incremental_report_rechecks_only_changed_files(incremental_db):
+    report_path = incremental_db.parent / "report.json"
+    full = generate_quality_report(incremental_db, report_path, print_console=False)
+    assert full["validation_scope"] == {"mode": "full"}
+    assert {d["source_file"] for d in _check(full, "duplicate_rows")["details"]} == {
+        "a.xlsx", "b.xlsx"}
+
+    # a.xlsx is re-ingested without its duplicate.  b.xlsx gains another
+    # copy behind the builder's back, which an incremental run must not see.
+    _reingest(incremental_db, "s1", "a.xlsx",
+              "DELETE FROM budget_lines WHERE id = (SELECT MAX(id) FROM "
+              "budget_lines WHERE source_file = 'a.xlsx')")
+    conn = sqlite3.connect(str(incremental_db))
+    _insert_budget_line(conn, source_file="b.xlsx")
+    conn.close()
+
+    inc = generate_quality_report(incremental_db, report_path,
+                                  print_console=False, since_session="last")
+
+    assert inc["validation_scope"] == {"mode": "incremental", "changed_files": 1}
+    dupes = _check(inc, "duplicate_rows")
+    assert [(d["source_file"], d["cnt"]) for d in dupes["details"]] == [("b.xlsx", 2)]
+    assert dupes["message"].startswith("1 duplicate row(s)")
+    assert _check(inc, "value_ranges")["details"][0]["source_file"] == "c.xlsx"
+    assert _check(inc, "row_count_consistency")["status"] == "pass"
+
+
+def test_in_place_rewrites_are_rechecked(incremental_db):
+    report_path = incremental_db.parent / "report.json"
+    full = generate_quality_report(incremental_db, report_path, print_console=False)
+    assert full["data_generation"] == 0
+    assert [d["source_file"] for d in _check(full, "value_ranges")["details"]] == [
+        "c.xlsx"]
+
+    # A repair step rewrites d.xlsx in place after the build that touched
+    # a.xlsx; d.xlsx is in no build session but must still be re-checked.
+    _reingest(incremental_db, "s1", "a.xlsx", "SELECT 1")
+    conn = sqlite3.connect(str(incremental_db))
+    bump_data_generation(conn, "build")
+    conn.execute("UPDATE budget_lines SET amount_fy2026_request = 7000000000.0 "
+                 "WHERE source_file = 'd.xlsx'")
+    bump_data_generation(conn, "repair")
+    conn.close()
+
+    inc = generate_quality_report(incremental_db, report_path,
+                                  print_console=False, since_session="last")
+
+    assert inc["validation_scope"] == {"mode": "incremental", "changed_files": 2}
+    assert inc["data_generation"] > 0
+    assert {d["source_file"] for d in _check(inc, "value_ranges")["details"]} == {
+        "c.xlsx", "d.xlsx"}
+
+
+def test_report_without_generation_runs_full(incremental_db):
+    previous = validate_all(incremental_db)
+    del previous["data_generation"]
+    _reingest(incremental_db, "s1", "a.xlsx", "SELECT 1")
+
+    summary = validate_all(incremental_db, since_session="last", previous=previous)
+    assert summary["scope"] == {"mode": "full"}
+
+
+def test_removed_file_findings_dropped(incremental_db):
+    report_path = incremental_db.parent / "report.json"
+    generate_quality_report(incremental_db, report_path, print_console=False)
+    # The builder drops a deleted file's rows without recording it as
+    # processed; its previous findings must still go.
+    _reingest(incremental_db, "s1", "d.xlsx",
+              "DELETE FROM ingested_files WHERE file_path = 'c.xlsx'")
+    conn = sqlite3.connect(str(incremental_db))
+    conn.execute("DELETE FROM budget_lines WHERE source_file = 'c.xlsx'")
+    conn.commit()
+    conn.close()
+
+    inc = generate_quality_report(incremental_db, report_path,
+                                  print_console=False, since_session="last")
+
+    assert inc["validation_scope"]["mode"] == "incremental"
+    assert _check(inc, "value_ranges")["status"] == "pass"
+
+
+def test_incremental_falls_back_to_full(incremental_db):
+    # No previous report to merge with
+    summary = validate_all(incremental_db, since_session="last", previous=None)
+    assert summary["scope"] == {"mode": "full"}
+
+    # More than half of the files changed
+    previous = validate_all(incremental_db)
+    for name in ("a.xlsx", "b.xlsx", "c.xlsx"):
+        _reingest(incremental_db, "s1", name, "SELECT 1")
+    summary = validate_all(incremental_db, since_session="last", previous=previous)
+    assert summary["scope"] == {"mode": "full"}
@@ -1,6 +1,9 @@
 """Tests for utils/cache.py — lightweight TTL cache."""
 import time
-from utils.cache import TTLCache
+
+import pytest
+
+from utils.cache import SQLiteCacheBackend, TTLCache, make_cache_key, set_shared_backend
 
 
 class TestTTLCache:
@@ -96,3 +99,167 @@ class TestTTLCache:
         for t in threads:
             t.join()
         assert not errors
+
+
+class TestSharedBackend:
+    @pytest.fixture()
+    def generation(self):
+        return {"value": "g1"}
+
+    @pytest.fixture()
+    def backend(self, tmp_path, generation):
+        backend = SQLiteCacheBackend(
+            tmp_path / "shared.sqlite", generation=lambda: generation["value"]
+        )
+        set_shared_backend(backend)
+        yield backend
+        set_shared_backend(None)
+
+    def test_shared_between_instances(self, backend):
+        """Two caches with the same namespace act like two workers."""
+        worker_a = TTLCache(namespace="agg")
+        worker_b = TTLCache(namespace="agg")
+        key = make_cache_key("agg", ["B", "A"], None)
+        worker_a.set(key, {"rows": [1, 2]})
+        assert worker_b.get(key) == {"rows": [1, 2]}
+        assert worker_b.stats()["shared_hits"] == 1
+
+    def test_second_process_sees_entries(self, tmp_path, backend):
+        TTLCache(namespace="agg").set(("k",), "v")
+        other = SQLiteCacheBackend(tmp_path / "shared.sqlite", generation=lambda: "g1")
+        assert other.get("agg", ("k",)) == "v"
+        other.close()
+
+    def test_namespaces_isolated(self, backend):
+        TTLCache(namespace="agg").set("k", 1)
+        assert TTLCache(namespace="facets").get("k") is None
+
+    def test_local_cache_does_not_share(self, backend):
+        TTLCache().set("k", 1)
+        assert backend.stats()["entries"] == 0
+
+    def test_generation_change_invalidates(self, backend, generation):
+        TTLCache(namespace="agg").set("k", 1)
+        generation["value"] = "g2"
+        assert TTLCache(namespace="agg").get("k") is None
+        TTLCache(namespace="agg").set("k2", 2)
+        assert backend.stats()["entries"] == 1
+
+    def test_shared_ttl_expiry(self, backend):
+        TTLCache(namespace="agg", ttl_seconds=0.05).set("k", 1)
+        time.sleep(0.1)
+        assert TTLCache(namespace="agg").get("k") is None
+
+    def test_clear_clears_namespace(self, backend):
+        TTLCache(namespace="agg").set("k", 1)
+        TTLCache(namespace="facets").set("k", 2)
+        TTLCache(namespace="agg").clear()
+        assert backend.get("agg", "k") is None
+        assert backend.get("facets", "k") == 2
+
+    def test_size_bound_evicts_oldest(self, tmp_path):
+        backend = SQLiteCacheBackend(tmp_path / "small.sqlite", max_bytes=2_000)
+        for i in range(10):
+            backend.set("ns", i, "x" * 500, ttl_seconds=60)
+        assert backend.stats()["bytes"] <= 2_000
+        assert backend.get("ns", 9) is not None
+        assert backend.get("ns", 0) is None
+        backend.close()
+
+    def test_errors_are_misses(self, backend):
+        backend.close()
+        cache = TTLCache(namespace="agg")
+        cache.set("k", 1)  # must not raise
+        cache.clear()
+        assert cache.get("k") is None
+
+
+class TestLRUAndSizeAccounting:
+    def test_lru_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")      # "b" is now least recently used
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_overwrite_does_not_evict(self):
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 10)
+        assert cache.stats()["evictions"] == 0
+        assert cache.get("b") == 2
+
+    def test_max_bytes_evicts(self):
+        cache = TTLCache(maxsize=100, max_bytes=5_000)
+        for i in range(10):
+            cache.set(i, "x" * 1_000)
+        stats = cache.stats()
+        assert stats["bytes"] <= 5_000
+        assert stats["evictions"] > 0
+        assert cache.get(9) is not None
+        assert cache.get(0) is None
+
+    def test_oversized_value_not_cached(self):
+        cache = TTLCache(max_bytes=100)
+        cache.set("big", "x" * 1_000)
+        assert cache.get("big") is None
+        assert cache.stats()["bytes"] == 0
+
+    def test_delete_releases_bytes(self):
+        cache = TTLCache(max_bytes=10_000)
+        cache.set("k", ["x" * 100] * 5)
+        assert cache.stats()["bytes"] > 500
+        cache.delete("k")
+        assert cache.stats()["bytes"] == 0
+
+    def test_expired_entries_swept_lazily(self):
+        cache = TTLCache(ttl_seconds=0.05)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        time.sleep(0.1)
+        cache.set("c", 3)   # sweeps the expired head
+        stats = cache.stats()
+        assert stats["size"] == 1
+        assert stats["expirations"] == 2
+
+    def test_estimate_size_orders_payloads(self):
+        from utils.cache import estimate_size
+        small = {"rows": [1]}
+        large = {"rows": [{"name": "x" * 50, "value": i} for i in range(100)]}
+        assert estimate_size(large) > estimate_size(small)
+
+    def test_registry_reports_namespaced_caches(self):
+        from utils.cache import all_cache_stats
+        cache = TTLCache(namespace="test_registry_ns")
+        cache.set("k", 1)
+        assert all_cache_stats()["test_registry_ns"]["size"] == 1
+
+
+class TestGenerationInvalidation:
+    @pytest.fixture()
+    def generation(self):
+        from utils.cache import set_generation_provider
+        state = {"value": "g1"}
+        set_generation_provider(lambda: state["value"])
+        yield state
+        set_generation_provider(None)
+
+    def test_generation_change_empties_cache(self, generation):
+        cache = TTLCache(ttl_seconds=None)
+        cache.set("k", 1)
+        assert cache.get("k") == 1
+        generation["value"] = "g2"
+        assert cache.get("k") is None
+        assert cache.stats()["invalidations"] == 1
+
+    def test_no_ttl_never_expires_by_age(self, generation):
+        cache = TTLCache(ttl_seconds=None)
+        cache.set("k", 1)
+        time.sleep(0.05)
+        assert cache.get("k") == 1
+        assert cache.stats()["expirations"] == 0
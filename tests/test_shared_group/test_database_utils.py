@@ -23,6 +23,8 @@ from utils.database import (
     enable_fts5_triggers,
     query_to_dicts,
     vacuum_database,
+    bump_data_generation,
+    get_data_generation,
 )
 
 
@@ -225,3 +227,28 @@ class TestVacuumDatabase:
         conn.close()
         # Should not raise
         vacuum_database(db_path)
+
+
+# ── data generation (OPT-GEN-001) ─────────────────────────────────────────────
+
+class TestDataGeneration:
+    def test_unstamped_database_returns_none(self, db):
+        assert get_data_generation(db) is None
+
+    def test_bump_is_monotonic(self, db):
+        first = bump_data_generation(db, "build")
+        second = bump_data_generation(db, "enrich")
+        assert second > first
+        assert get_data_generation(db) == second
+        source = db.execute("SELECT source FROM data_generation").fetchone()[0]
+        assert source == "enrich"
+
+    def test_fresh_database_does_not_reuse_old_generation(self, tmp_path):
+        path = tmp_path / "gen.sqlite"
+        conn = sqlite3.connect(str(path))
+        old = bump_data_generation(conn, "build")
+        conn.close()
+        path.unlink()
+        conn = sqlite3.connect(str(path))
+        assert bump_data_generation(conn, "build") >= old
+        conn.close()
@@ -0,0 +1,88 @@
+"""Tests for utils/keyword_matcher.py — multi-pattern taxonomy matching (OPT-ENRICH-002)."""
+
+import random
+import re
+
+import pytest
+
+from pipeline.enricher import _TAXONOMY, _TAXONOMY_TIER2
+from utils.keyword_matcher import KeywordMatcher, fold_text, term_anchor
+
+_FULL_TAXONOMY = _TAXONOMY + _TAXONOMY_TIER2
+
+
+def _reference(taxonomy, text):
+    """Per-pattern regex search — the behaviour KeywordMatcher must reproduce."""
+    return [
+        tag for tag, terms in taxonomy
+        if any(re.search(term, text, re.IGNORECASE) for term in terms)
+    ]
+
+
+class TestTermAnchor:
+    @pytest.mark.parametrize("term,expected", [
+        ("hypersonic", ("hypersonic", True)),
+        (r"\bISR\b", ("isr", False)),
+        (r"launch\s+vehicle", ("vehicle", False)),
+        (r"cyber(?:security)?", ("cyber", False)),
+        (r"positioning,?\s+navigation", ("positioning", False)),
+        (r"(?:air|sea)", (None, False)),
+        (r"\bAIM-\d", ("aim-", False)),
+    ])
+    def test_anchor(self, term, expected):
+        assert term_anchor(term) == expected
+
+
+class TestFoldText:
+    def test_matches_ignorecase_equivalents(self):
+        # re.IGNORECASE treats these as i, s and k; folding must keep length
+        assert fold_text("İıſKAb") == "iiskab"
+
+    def test_fold_table_complete(self):
+        every_char = "".join(
+            chr(c) for c in range(0x110000) if not 0xD800 <= c < 0xE000)
+        for c in "abcdefghijklmnopqrstuvwxyz":
+            equivalents = set(re.findall(c, every_char, re.IGNORECASE))
+            assert {fold_text(e) for e in equivalents} == {c}
+
+
+class TestKeywordMatcher:
+    def test_overlapping_terms_all_reported(self):
+        matcher = KeywordMatcher([
+            ("missile-defense", [r"missile\s+defense"]),
+            ("missile", [r"\bmissile\b"]),
+            ("cruise", [r"cruise\s+missile"]),
+        ])
+        assert matcher.match("Cruise Missile  Defense") == [
+            "missile-defense", "missile", "cruise"]
+
+    def test_anchor_seen_but_regex_fails(self):
+        matcher = KeywordMatcher([("isr", [r"\bISR\b"])])
+        assert matcher.match("misread") == []
+        assert matcher.match("an ISR program") == ["isr"]
+
+    def test_anchorless_term_always_searched(self):
+        matcher = KeywordMatcher([("air-sea", [r"(?:air|sea)"])])
+        assert matcher.match("SEA control") == ["air-sea"]
+
+    def test_empty_text(self):
+        assert KeywordMatcher(_FULL_TAXONOMY).match("") == []
+
+    def test_parity_with_per_pattern_search(self):
+        matcher = KeywordMatcher(_FULL_TAXONOMY)
+        rng = random.Random(20261016)
+        fragments = [
+            "ISR", "misread", "launch", "vehicle", "\n", "  ", "-", ",",
+            "Missile", "defense", "cruise", "C2", "C4ISR", "AIM-9", "EO/IR",
+            "high", "energy", "laser", "counter", "UAS", "sub", "warfare",
+            "CT", "mission", "IO", "program", "İSR", "ſatellite",
+            "Kill chain", "find, fix, track, target", "cloud-native",
+            "positioning navigation and timing", "EMP protection", "5G",
+        ]
+        fragments += [term.replace("\\b", "").replace("\\s+", " ")
+                      for _, terms in _FULL_TAXONOMY for term in terms]
+        for _ in range(500):
+            text = " ".join(rng.choice(fragments) for _ in range(rng.randint(1, 12)))
+            if rng.random() < 0.5:
+                text = text.upper()
+            assert matcher.match(text) == _reference(_FULL_TAXONOMY, text), text
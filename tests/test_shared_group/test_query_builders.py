@@ -3,6 +3,7 @@ Tests for SQL query builder functions.
 
 Covers the shared query builder utilities:
 - utils/query.py :: build_where_clause(), build_order_clause()
+- utils/query.py :: encode_cursor(), decode_cursor(), build_keyset_condition()
 
 The _build_where alias exercises build_where_clause with the same 5-arg
 signature that the budget_lines route uses.
@@ -10,6 +11,7 @@ signature that the budget_lines route uses.
 import sys
 from pathlib import Path
 
+import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
@@ -218,3 +220,68 @@ class TestBuildOrderClause:
     def test_custom_default_sort(self):
         order = build_order_clause("invalid", "asc", default_sort="fiscal_year")
         assert "fiscal_year" in order
+
+
+class TestKeysetCursor:
+    def test_round_trip(self):
+        from utils.query import decode_cursor, encode_cursor
+        token = encode_cursor("pe_number", "desc", "0602702E", 42)
+        assert decode_cursor(token, "pe_number", "DESC") == ("0602702E", 42)
+
+    def test_mismatched_sort_rejected(self):
+        from utils.query import decode_cursor, encode_cursor
+        token = encode_cursor("pe_number", "asc", None, 1)
+        with pytest.raises(ValueError):
+            decode_cursor(token, "pe_number", "desc")
+
+    def test_garbage_rejected(self):
+        from utils.query import decode_cursor
+        with pytest.raises(ValueError):
+            decode_cursor("%%%", "id", "asc")
+
+    def test_id_sort_is_plain_seek(self):
+        from utils.query import build_keyset_condition
+        assert build_keyset_condition("id", "desc", 7, 7) == ("id < ?", [7])
+
+    def test_rejects_unsafe_column(self):
+        from utils.query import build_keyset_condition
+        with pytest.raises(ValueError):
+            build_keyset_condition("id; DROP TABLE x", "asc", 1, 1)
+
+
+class TestFtsMatchSubquery:
+    @pytest.fixture()
+    def fts_db(self):
+        import sqlite3
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE budget_lines (id INTEGER PRIMARY KEY, title TEXT)")
+        conn.execute(
+            "CREATE VIRTUAL TABLE budget_lines_fts USING fts5("
+            "title, content='budget_lines', content_rowid='id')"
+        )
+        conn.executemany(
+            "INSERT INTO budget_lines VALUES (?, ?)",
+            [(i, "aircraft" if i % 2 else "ship") for i in range(1, 40_001)],
+        )
+        conn.execute(
+            "INSERT INTO budget_lines_fts(rowid, title) SELECT id, title FROM budget_lines"
+        )
+        yield conn
+        conn.close()
+
+    def test_binds_single_parameter(self):
+        where, params = build_where_clause(fiscal_year=["FY 2026"], fts_match="army")
+        assert "budget_lines_fts MATCH ?" in where
+        assert params == ["FY 2026", "army"]
+
+    def test_broad_match_stays_one_parameter(self, fts_db):
+        where, params = build_where_clause(fts_match="aircraft")
+        count = fts_db.execute(f"SELECT COUNT(*) FROM budget_lines {where}", params)
+        assert count.fetchone()[0] == 20_000
+        assert len(params) == 1
+
+    def test_probe(self, fts_db):
+        from utils.query import probe_fts_match
+        assert probe_fts_match(fts_db, "ship") is True
+        assert probe_fts_match(fts_db, "submarine") is False
+        assert probe_fts_match(fts_db, 'bad "syntax') is False
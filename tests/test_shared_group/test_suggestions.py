@@ -0,0 +1,108 @@
+"""Tests for utils/suggestions.py — typeahead suggestion index."""
+import sqlite3
+
+import pytest
+
+from utils.suggestions import query_suggestions, refresh_suggestion_index
+
+
+@pytest.fixture()
+def db():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.executescript("""
+        CREATE TABLE budget_lines (
+            id INTEGER PRIMARY KEY, line_item_title TEXT,
+            account_title TEXT, organization_name TEXT
+        );
+        CREATE TABLE pe_index (pe_number TEXT PRIMARY KEY, display_title TEXT);
+        INSERT INTO budget_lines (line_item_title, account_title, organization_name) VALUES
+            ('Apache Helicopter', 'Aircraft Procurement, Army', 'Army'),
+            ('Apache Helicopter', 'Aircraft Procurement, Army', 'Army'),
+            ('Black Hawk', 'Aircraft Procurement, Army', 'Army'),
+            ('apache helicopter', 'Missile Procurement, Army', 'Army'),
+            ('Heavy Lift Helicopter', 'Aircraft Procurement, Navy', 'Navy');
+        INSERT INTO pe_index VALUES ('0207449A', 'Apache Helicopter Upgrades');
+    """)
+    yield conn
+    conn.close()
+
+
+class TestRefresh:
+    def test_builds_deduplicated_terms(self, db):
+        counts = refresh_suggestion_index(db)
+        assert counts["inserted"] == 9
+        row = db.execute(
+            "SELECT freq FROM search_suggestions "
+            "WHERE field = 'line_item_title' AND term = 'APACHE HELICOPTER'"
+        ).fetchone()
+        assert row["freq"] == 3  # case variants collapse into one term
+
+    def test_second_refresh_is_a_no_op(self, db):
+        refresh_suggestion_index(db)
+        assert refresh_suggestion_index(db) == {"inserted": 0, "updated": 0, "deleted": 0}
+
+    def test_refresh_applies_only_the_delta(self, db):
+        refresh_suggestion_index(db)
+        db.execute("DELETE FROM budget_lines WHERE line_item_title = 'Black Hawk'")
+        db.execute("INSERT INTO budget_lines (line_item_title, organization_name) "
+                   "VALUES ('Chinook', 'Army')")
+        counts = refresh_suggestion_index(db)
+        # Black Hawk gone, Chinook new, one fewer "Aircraft Procurement, Army"
+        assert counts == {"inserted": 1, "updated": 1, "deleted": 1}
+        assert query_suggestions(db, "Black", 5) == []
+        assert query_suggestions(db, "Chinook", 5)[0]["value"] == "Chinook"
+
+    def test_create_false_leaves_db_untouched(self, db):
+        refresh_suggestion_index(db, create=False)
+        assert query_suggestions(db, "Apache", 5) is None
+
+    def test_index_tables_without_budget_line_columns(self):
+        conn = sqlite3.connect(":memory:")
+        conn.row_factory = sqlite3.Row
+        conn.executescript("""
+            CREATE TABLE budget_lines (id INTEGER PRIMARY KEY);
+            CREATE TABLE pe_index (pe_number TEXT PRIMARY KEY, display_title TEXT);
+            CREATE TABLE bli_index (bli_key TEXT PRIMARY KEY, display_title TEXT,
+                                    row_count INTEGER);
+            INSERT INTO pe_index VALUES ('0207449A', 'Apache Helicopter Upgrades');
+            INSERT INTO bli_index VALUES ('2031A:AZ3000', 'Black Hawk', 4);
+        """)
+        try:
+            assert refresh_suggestion_index(conn)["inserted"] == 2
+            assert query_suggestions(conn, "0207", 5)[0]["value"] == "0207449A"
+            assert query_suggestions(conn, "2031A", 5)[0]["field"] == "bli_key"
+        finally:
+            conn.close()
+
+
+class TestQuery:
+    def test_ranked_by_field_then_prefix_then_freq(self, db):
+        refresh_suggestion_index(db)
+        result = query_suggestions(db, "heli", 10)
+        assert result[0] == {
+            "value": "0207449A", "field": "pe_number",
+            "label": "Apache Helicopter Upgrades",
+        }
+        titles = [s["value"] for s in result if s["field"] == "line_item_title"]
+        assert titles == ["Apache Helicopter", "Heavy Lift Helicopter"]
+
+    def test_short_prefix_matches_contains(self, db):
+        refresh_suggestion_index(db)
+        values = [s["value"] for s in query_suggestions(db, "Na", 10)]
+        assert values == ["Aircraft Procurement, Navy", "Navy"]
+        # Labels match too, and values starting with the input rank first
+        result = query_suggestions(db, "Up", 10)
+        assert [s["value"] for s in result] == ["0207449A"]
+        assert [s["value"] for s in query_suggestions(db, "he", 10)
+                if s["field"] == "line_item_title"] == [
+            "Heavy Lift Helicopter", "Apache Helicopter"]
+
+    def test_quotes_and_wildcards_are_literal(self, db):
+        refresh_suggestion_index(db)
+        assert query_suggestions(db, 'a"b%', 5) == []
+        assert query_suggestions(db, "%", 5) == []
+
+    def test_limit(self, db):
+        refresh_suggestion_index(db)
+        assert len(query_suggestions(db, "Army", 1)) == 1
@@ -1,8 +1,8 @@
 """
-Tests for api/database.py — get_db() and get_db_path()
+Tests for api/database.py — get_db(), get_db_path() and ConnectionPool
 
 Verifies the FastAPI database dependency yields a properly configured
-SQLite connection and closes it on exit.
+read-only SQLite connection and returns it to the pool on exit.
 """
 import sqlite3
 import sys
@@ -13,7 +13,8 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from api.database import get_db, get_db_path
+from api.database import ConnectionPool, get_db, get_db_generation, get_db_path, get_db_rw
+from utils.database import bump_data_generation
 
 
 class TestGetDbPath:
@@ -48,7 +49,7 @@ class TestGetDb:
             except StopIteration:
                 pass
 
-    def test_connection_closed_after_yield(self, tmp_path):
+    def test_connection_returned_to_pool_after_yield(self, tmp_path):
         db_path = tmp_path / "test.sqlite"
         conn = sqlite3.connect(str(db_path))
         conn.execute("CREATE TABLE t (x INTEGER)")
@@ -56,17 +57,23 @@ class TestGetDb:
 
         with patch("api.database._DB_PATH", db_path):
             gen = get_db()
-            conn = next(gen)
+            first = next(gen)
             # Exhaust the generator to trigger finally block
             try:
                 next(gen)
             except StopIteration:
                 pass
-            # Connection should be closed (attempting to use it should fail)
-            with pytest.raises(Exception):
-                conn.execute("SELECT 1")
+            # The next request reuses the same (still open) connection
+            gen = get_db()
+            second = next(gen)
+            assert second is first
+            assert second.execute("SELECT 1").fetchone()[0] == 1
+            try:
+                next(gen)
+            except StopIteration:
+                pass
 
-    def test_wal_mode_set(self, tmp_path):
+    def test_connection_is_read_only(self, tmp_path):
         db_path = tmp_path / "test.sqlite"
         conn = sqlite3.connect(str(db_path))
         conn.execute("CREATE TABLE t (x INTEGER)")
@@ -75,9 +82,151 @@ class TestGetDb:
         with patch("api.database._DB_PATH", db_path):
             gen = get_db()
             conn = next(gen)
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("INSERT INTO t VALUES (1)")
+            try:
+                next(gen)
+            except StopIteration:
+                pass
+
+
+class TestGetDbRw:
+    def test_wal_mode_set(self, tmp_path):
+        db_path = tmp_path / "test.sqlite"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.close()
+
+        with patch("api.database._DB_PATH", db_path):
+            gen = get_db_rw()
+            conn = next(gen)
             mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
             assert mode == "wal"
+            conn.execute("INSERT INTO t VALUES (1)")
             try:
                 next(gen)
             except StopIteration:
                 pass
+            # Writable connections are closed, not pooled
+            with pytest.raises(Exception):
+                conn.execute("SELECT 1")
+
+
+class TestConnectionPool:
+    @pytest.fixture()
+    def db_path(self, tmp_path):
+        path = tmp_path / "pool.sqlite"
+        conn = sqlite3.connect(str(path))
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.close()
+        return path
+
+    def test_bounded_size(self, db_path):
+        pool = ConnectionPool(db_path, max_size=2, timeout=0.05)
+        a = pool.acquire()
+        b = pool.acquire()
+        with pytest.raises(TimeoutError):
+            pool.acquire()
+        pool.release(a)
+        c = pool.acquire()
+        assert c is a
+        pool.release(b)
+        pool.release(c)
+        stats = pool.stats()
+        assert stats["open"] == 2
+        assert stats["idle"] == 2
+        assert stats["in_use"] == 0
+        assert stats["created"] == 2
+        assert stats["checkouts"] == 3
+        assert stats["timeouts"] == 1
+        pool.close()
+
+    def test_mmap_configured(self, db_path):
+        pool = ConnectionPool(db_path, max_size=1)
+        with pool.connection() as conn:
+            assert conn.execute("PRAGMA mmap_size").fetchone()[0] > 0
+        pool.close()
+
+    def test_replaced_file_discards_idle(self, db_path):
+        pool = ConnectionPool(db_path, max_size=1)
+        with pool.connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+        # Rebuild: a new file is renamed over the old one
+        new_path = db_path.with_name("new.sqlite")
+        new = sqlite3.connect(str(new_path))
+        new.execute("CREATE TABLE t2 (y INTEGER)")
+        new.close()
+        new_path.replace(db_path)
+        with pool.connection() as conn:
+            conn.execute("SELECT COUNT(*) FROM t2")
+        assert pool.stats()["discarded"] == 1
+        pool.close()
+
+    def test_closed_pool_closes_on_release(self, db_path):
+        pool = ConnectionPool(db_path, max_size=1)
+        conn = pool.acquire()
+        pool.close()
+        pool.release(conn)
+        with pytest.raises(Exception):
+            conn.execute("SELECT 1")
+        assert pool.stats()["open"] == 0
+
+
+class TestGetDbGeneration:
+    def test_reads_stamp_and_tracks_bumps(self, tmp_path):
+        db_path = tmp_path / "gen.sqlite"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        gen = bump_data_generation(conn, "build")
+
+        with patch("api.database._DB_PATH", db_path):
+            first = get_db_generation()
+            assert first == f"g{gen:x}"
+            assert get_db_generation() == first
+            bump_data_generation(conn, "enrich")
+            assert get_db_generation() != first
+        conn.close()
+
+    def test_falls_back_without_stamp(self, tmp_path):
+        db_path = tmp_path / "old.sqlite"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.close()
+        with patch("api.database._DB_PATH", db_path):
+            assert get_db_generation().startswith("f")
+
+    def test_missing_database(self, tmp_path):
+        with patch("api.database._DB_PATH", tmp_path / "nope.sqlite"):
+            assert get_db_generation() == "missing"
+
+    def test_full_pool_does_not_block_or_stick(self, tmp_path):
+        db_path = tmp_path / "busy.sqlite"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        gen = bump_data_generation(conn, "build")
+        conn.close()
+
+        pool = ConnectionPool(db_path, max_size=1, timeout=0.05)
+        held = pool.acquire()
+        try:
+            with patch("api.database._DB_PATH", db_path), \
+                    patch("api.database._pool", pool):
+                assert get_db_generation() == f"g{gen:x}"
+        finally:
+            pool.release(held)
+            pool.close()
+        assert pool.stats()["timeouts"] == 0
+
+    def test_read_error_not_memoized(self, tmp_path):
+        db_path = tmp_path / "err.sqlite"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        gen = bump_data_generation(conn, "build")
+        conn.close()
+
+        with patch("api.database._DB_PATH", db_path):
+            with patch("api.database.get_data_generation",
+                       side_effect=sqlite3.OperationalError("disk I/O error")):
+                assert get_db_generation().startswith("f")
+            assert get_db_generation() == f"g{gen:x}"
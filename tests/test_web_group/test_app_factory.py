@@ -97,3 +97,19 @@ class TestHealthEndpoint:
         client = TestClient(app)
         resp = client.get("/health")
         assert resp.status_code == 503
+
+
+class TestSharedCacheBackend:
+    def test_default_cache_path_next_to_database(self, test_db, monkeypatch):
+        import api.app as app_mod
+        from utils.cache import get_shared_backend, set_shared_backend
+
+        monkeypatch.setattr(app_mod._cfg, "cache_backend", "sqlite")
+        monkeypatch.setattr(app_mod._cfg, "cache_path", None)
+        try:
+            create_app(db_path=test_db)
+            backend = get_shared_backend()
+            assert backend is not None
+            assert backend.path == test_db.parent / "test_api_cache.sqlite"
+        finally:
+            set_shared_backend(None)
@@ -231,6 +231,7 @@ def _list(db, **kwargs):
         sort_dir="asc",
         limit=25,
         offset=0,
+        cursor=None,
         conn=db,
     )
     defaults.update(kwargs)
@@ -356,6 +357,70 @@ class TestListBudgetLines:
         assert result.total >= 1
 
 
+class TestCursorPagination:
+    """OPT-PAGE-001: keyset cursors walk the same rows as offset paging."""
+
+    def _walk(self, db, **kwargs):
+        ids, cursor = [], None
+        for _ in range(10):
+            page = _list(db, limit=2, cursor=cursor, **kwargs)
+            ids += [item.id for item in page.items]
+            cursor = page.next_cursor
+            if cursor is None:
+                assert page.has_next is False
+                break
+        return ids
+
+    @pytest.mark.parametrize("sort_by", ["id", "pe_number", "amount_fy2026_request"])
+    @pytest.mark.parametrize("sort_dir", ["asc", "desc"])
+    def test_cursor_walk_matches_offset(self, db, sort_by, sort_dir):
+        # Add NULL and duplicate sort values to exercise the tie-break paths
+        cols = [r[1] for r in db.execute("PRAGMA table_info(budget_lines)")][1:]
+        copy = ", ".join(cols)
+        db.execute(f"INSERT INTO budget_lines (id, {copy}) SELECT 5, {copy} "
+                   "FROM budget_lines WHERE id = 1")
+        db.execute(f"INSERT INTO budget_lines (id, {copy}) SELECT 6, {copy} "
+                   "FROM budget_lines WHERE id = 2")
+        db.execute("UPDATE budget_lines SET pe_number = NULL, "
+                   "amount_fy2026_request = NULL WHERE id = 6")
+        full = _list(db, limit=25, sort_by=sort_by, sort_dir=sort_dir)
+        expected = [item.id for item in full.items]
+        assert len(expected) == 6
+        assert self._walk(db, sort_by=sort_by, sort_dir=sort_dir) == expected
+
+    def test_cursor_keeps_filters_and_total(self, db):
+        first = _list(db, limit=1, service=["Army"])
+        second = _list(db, limit=1, service=["Army"], cursor=first.next_cursor)
+        assert second.total == first.total == 3
+        assert second.items[0].id != first.items[0].id
+
+    def test_last_page_has_no_cursor(self, db):
+        assert _list(db, limit=25).next_cursor is None
+
+    def test_invalid_cursor_rejected(self, db):
+        from fastapi import HTTPException
+
+        with pytest.raises(HTTPException) as exc_info:
+            _list(db, cursor="not-a-cursor")
+        assert exc_info.value.status_code == 400
+
+    def test_cursor_for_other_sort_rejected(self, db):
+        from fastapi import HTTPException
+
+        cursor = _list(db, limit=1).next_cursor
+        with pytest.raises(HTTPException) as exc_info:
+            _list(db, limit=1, sort_by="pe_number", cursor=cursor)
+        assert exc_info.value.status_code == 400
+
+    def test_cursor_with_offset_rejected(self, db):
+        from fastapi import HTTPException
+
+        cursor = _list(db, limit=1).next_cursor
+        with pytest.raises(HTTPException) as exc_info:
+            _list(db, limit=1, offset=1, cursor=cursor)
+        assert exc_info.value.status_code == 400
+
+
 class TestGetBudgetLine:
     def test_existing_item(self, db):
         item = get_budget_line(1, conn=db)
@@ -12,6 +12,8 @@ import io
 import json
 import sqlite3
 import sys
+import threading
+import zipfile
 from pathlib import Path
 
 import pytest
@@ -19,7 +21,12 @@ import pytest
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from api.models import FilterParams
-from api.routes.download import _iter_rows, _DOWNLOAD_COLUMNS, _build_download_sql
+from api.routes.download import (
+    _iter_rows,
+    _DOWNLOAD_COLUMNS,
+    _build_download_sql,
+    _stream_from_worker,
+)
 from utils.query import ALLOWED_SORT_COLUMNS as _ALLOWED_SORT
 from fastapi.testclient import TestClient
 from api.app import create_app
@@ -130,6 +137,14 @@ class TestBuildDownloadSql:
         )
         assert total == 1  # Only id=2 with amount=1500
 
+    def test_count_optional(self, dl_db):
+        filters = FilterParams()
+        _, _, total = _build_download_sql(
+            filters=filters, conn=dl_db, limit=100,
+            export_cols=_DOWNLOAD_COLUMNS, count=False,
+        )
+        assert total is None
+
     def test_sort_order_applied(self, dl_db):
         """sort_by and sort_dir affect result ordering."""
         sql_desc, params_desc, _ = _build_download_sql(
@@ -319,6 +334,72 @@ class TestNDJSONDownload:
         assert len(data_lines) == 0
 
 
+# ── XLSX format tests (OPT-XLSX-002) ────────────────────────────────────────
+
+
+class TestXLSXDownload:
+    def test_xlsx_streams_all_rows(self, dl_client):
+        resp = dl_client.get("/api/v1/download?fmt=xlsx")
+        assert resp.status_code == 200
+        assert "content-length" not in resp.headers
+        assert resp.headers["X-Total-Count"] == "20"
+        with zipfile.ZipFile(io.BytesIO(resp.content)) as zf:
+            sheet = zf.read("xl/worksheets/sheet2.xml").decode()
+        assert sheet.count("<row ") == 21  # header + 20 rows
+        assert "Line Item 19" in sheet
+
+    def test_count_disabled_omits_total_header(self, dl_client):
+        for fmt in ("csv", "xlsx"):
+            resp = dl_client.get(f"/api/v1/download?fmt={fmt}&count=false")
+            assert resp.status_code == 200
+            assert "X-Total-Count" not in resp.headers
+
+    def test_count_disabled_metadata_says_not_counted(self, dl_client):
+        import openpyxl
+
+        csv_resp = dl_client.get("/api/v1/download?fmt=csv&count=false")
+        assert "# Total Records: not counted" in csv_resp.text
+
+        resp = dl_client.get("/api/v1/download?fmt=xlsx&count=false")
+        wb = openpyxl.load_workbook(io.BytesIO(resp.content), read_only=True)
+        meta = {r[0]: r[1] for r in wb["Metadata"].iter_rows(values_only=True)}
+        wb.close()
+        assert meta["Total Records"] == "not counted"
+
+
+class TestStreamFromWorker:
+    def test_chunks_arrive_in_order(self):
+        def produce(pipe):
+            for i in range(200):
+                pipe.write(bytes([i]) * 1000)
+
+        assert b"".join(_stream_from_worker(produce)) == b"".join(
+            bytes([i]) * 1000 for i in range(200))
+
+    def test_worker_error_propagates(self):
+        def produce(pipe):
+            pipe.write(b"partial")
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            list(_stream_from_worker(produce))
+
+    def test_closing_stream_stops_worker(self):
+        stopped = threading.Event()
+
+        def produce(pipe):
+            try:
+                while True:
+                    pipe.write(b"x" * 65536)
+            finally:
+                stopped.set()
+
+        stream = _stream_from_worker(produce)
+        assert next(stream)
+        stream.close()
+        assert stopped.is_set()
+
+
 # ── Filter parameter tests ───────────────────────────────────────────────────
 
 
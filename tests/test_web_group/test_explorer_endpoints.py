@@ -4,6 +4,7 @@ Covers: _keyword_set_id, _cache_table_name, _parse_keywords, _parse_extra_pes,
 _resolve_keyword_set, _ensure_meta_table, _prune_old_caches, _prune_stale_progress,
 and the explorer API endpoints (build, status, list, download, presets).
 """
+import asyncio
 import sqlite3
 import sys
 import time
@@ -397,3 +398,92 @@ class TestExplorerDescEndpoint:
         assert resp.status_code == 200
         body = resp.json()
         assert body["description"] is None
+
+
+class TestExplorerDownloadXlsxEndpoint:
+    def test_saturated_export_slots_return_503(self, explorer_client, monkeypatch):
+        import threading
+
+        import api.routes.explorer as explorer
+
+        monkeypatch.setattr(explorer, "_xlsx_export_slots", threading.BoundedSemaphore(1))
+        explorer._xlsx_export_slots.acquire()
+        resp = explorer_client.post(
+            "/api/v1/explorer/download/xlsx", json={"keywords": "missile"}
+        )
+        assert resp.status_code == 503
+        assert resp.headers["Retry-After"] == "5"
+
+    def test_slot_released_after_failed_export(self, explorer_client, monkeypatch):
+        import threading
+
+        import api.routes.explorer as explorer
+
+        monkeypatch.setattr(explorer, "_xlsx_export_slots", threading.BoundedSemaphore(1))
+        for _ in range(2):
+            resp = explorer_client.post(
+                "/api/v1/explorer/download/xlsx", json={"keywords": "missile"}
+            )
+            assert resp.status_code == 400
+            assert resp.content == b"Cache not built"
+
+    def test_export_streamed_with_length(self, explorer_client, tmp_path, monkeypatch):
+        import io
+        import zipfile
+
+        import api.routes.explorer as explorer
+
+        kw_id = _resolve_keyword_set("missile")[2]
+        conn = sqlite3.connect(str(tmp_path / "explorer_test.sqlite"))
+        conn.execute(
+            f"CREATE TABLE {_cache_table_name(kw_id)} "
+            "(pe_number TEXT, exhibit_type TEXT, line_item_title TEXT)"
+        )
+        conn.commit()
+        conn.close()
+        item = {"pe_number": "0602120A", "exhibit_type": "r1",
+                "line_item_title": "Missile Defense", "fy2026": 10.0,
+                "matched_keywords_row": ["missile"]}
+        monkeypatch.setattr(explorer, "cache_rows_to_dicts", lambda rows: [item])
+        monkeypatch.setattr(explorer, "load_per_fy_descriptions", lambda c, pes: {})
+
+        resp = explorer_client.post(
+            "/api/v1/explorer/download/xlsx", json={"keywords": "missile"}
+        )
+
+        assert resp.status_code == 200
+        assert int(resp.headers["Content-Length"]) == len(resp.content)
+        with zipfile.ZipFile(io.BytesIO(resp.content)) as zf:
+            assert b"Missile Defense" in zf.read("xl/worksheets/sheet1.xml")
+
+    def test_slot_held_until_stream_closes(self, tmp_path, monkeypatch):
+        import threading
+
+        import api.routes.explorer as explorer
+
+        monkeypatch.setattr(explorer, "_xlsx_export_slots", threading.BoundedSemaphore(1))
+        kw_id = _resolve_keyword_set("missile")[2]
+        conn = sqlite3.connect(":memory:")
+        conn.execute(
+            f"CREATE TABLE {_cache_table_name(kw_id)} "
+            "(pe_number TEXT, exhibit_type TEXT, line_item_title TEXT)"
+        )
+        item = {"pe_number": "0602120A", "exhibit_type": "r1",
+                "line_item_title": "Missile Defense", "fy2026": 10.0,
+                "matched_keywords_row": ["missile"]}
+        monkeypatch.setattr(explorer, "cache_rows_to_dicts", lambda rows: [item])
+        monkeypatch.setattr(explorer, "load_per_fy_descriptions", lambda c, pes: {})
+
+        resp = explorer.download_explorer_xlsx(
+            keywords="missile", matching_only=False, include_intotal=True,
+            include_source=True, include_description=True,
+            include_desc_keywords=True, fiscal_years="", extra_pes="", conn=conn,
+        )
+        assert not explorer._xlsx_export_slots.acquire(blocking=False)
+
+        async def _drain():
+            return b"".join([chunk async for chunk in resp.body_iterator])
+
+        assert asyncio.run(_drain())
+        assert explorer._xlsx_export_slots.acquire(blocking=False)
+        conn.close()
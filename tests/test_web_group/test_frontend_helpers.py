@@ -296,6 +296,30 @@ class TestQueryResults:
         ids = [item["id"] for item in result["items"]]
         assert ids == sorted(ids, reverse=True)
 
+    def test_next_cursor_matches_offset_page(self, db):
+        """OPT-PAGE-001: a keyset cursor lands on the same page as OFFSET."""
+        filters = {
+            "q": "", "fiscal_year": [], "service": [], "exhibit_type": [],
+            "pe_number": [], "sort_by": "pe_number", "sort_dir": "desc", "page": 1,
+        }
+        first = _query_results(filters, db, page_size=2)
+        assert first["next_cursor"]
+        by_offset = _query_results({**filters, "page": 2}, db, page_size=2)
+        by_cursor = _query_results(
+            {**filters, "page": 2, "cursor": first["next_cursor"]}, db, page_size=2
+        )
+        assert [r["id"] for r in by_cursor["items"]] == [r["id"] for r in by_offset["items"]]
+        assert by_cursor["next_cursor"] == ""
+
+    def test_stale_cursor_falls_back_to_offset(self, db):
+        filters = {
+            "q": "", "fiscal_year": [], "service": [], "exhibit_type": [],
+            "pe_number": [], "sort_by": "id", "sort_dir": "asc", "page": 2,
+            "cursor": "garbage",
+        }
+        result = _query_results(filters, db, page_size=2)
+        assert [r["id"] for r in result["items"]] == [3, 4]
+
 
 # ── set_templates / _tmpl ─────────────────────────────────────────────────────
 
@@ -4,8 +4,11 @@ Tests the pure utility functions that don't require a full xlsxwriter workbook.
 The build_keyword_xlsx integration requires actual data; we test the helpers and
 style definitions that make up the presentation layer.
 """
+import io
 import sys
+import zipfile
 from pathlib import Path
+from xml.etree import ElementTree
 
 import pytest
 
@@ -14,6 +17,9 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 xlsxwriter = pytest.importorskip("xlsxwriter")
 
 from api.routes.keyword_xlsx import (  # noqa: E402
+    build_keyword_xlsx,
+    iter_file_chunks,
+    write_keyword_xlsx,
     xlsx_base_styles,
     _col_letter,
     _COL_WIDTH_DEFAULTS,
@@ -183,3 +189,86 @@ class TestBuildKeywordXlsx:
         )
         assert isinstance(result, bytes)
         assert len(result) > 100
+
+
+# ── Constant-memory streamed workbook (OPT-XLSX-001) ─────────────────────────
+
+_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+
+def _sheet_cells(data: bytes) -> list[dict[str, tuple]]:
+    """Return {ref: (value, formula)} per worksheet, resolving shared and
+    inline strings so in-memory and constant_memory output compare equal."""
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        names = zf.namelist()
+        sst = []
+        if "xl/sharedStrings.xml" in names:
+            root = ElementTree.fromstring(zf.read("xl/sharedStrings.xml"))
+            sst = ["".join(t.text or "" for t in si.iter(f"{_NS}t"))
+                   for si in root.iter(f"{_NS}si")]
+        sheets = sorted(n for n in names if n.startswith("xl/worksheets/sheet"))
+        result = []
+        for name in sheets:
+            cells = {}
+            for c in ElementTree.fromstring(zf.read(name)).iter(f"{_NS}c"):
+                v, f = c.find(f"{_NS}v"), c.find(f"{_NS}f")
+                if c.get("t") == "s":
+                    value = sst[int(v.text)]
+                elif c.get("t") == "inlineStr":
+                    value = "".join(t.text or "" for t in c.iter(f"{_NS}t"))
+                else:
+                    value = v.text if v is not None else None
+                cells[c.get("r")] = (value, f.text if f is not None else None)
+            result.append(cells)
+        return result
+
+
+class TestStreamedKeywordXlsx:
+    def _kwargs(self):
+        from api.routes.explorer import _FIXED_COLUMNS
+
+        items = [
+            {**TestBuildKeywordXlsx()._make_item(pe=f"06021{i:02d}A",
+                                                 title=f"Cyber {i}"),
+             "refs": {"fy2025": f"p{i}.pdf"}}
+            for i in range(30)
+        ]
+        return dict(
+            items=items,
+            active_years=[2024, 2025, 2026],
+            desc_by_pe_fy={("0602101A", "2025"): "cyber resilience work"},
+            fixed_columns=list(_FIXED_COLUMNS),
+            fy_desc_kws={("0602101A", "2025"): ["cyber"]},
+            keywords=["cyber", "missile"],
+        )
+
+    def test_constant_memory_matches_in_memory(self, tmp_path, monkeypatch):
+        import api.routes.keyword_xlsx as keyword_xlsx
+
+        # The About sheet stamps the build time; pin it so both builds match.
+        monkeypatch.setattr(keyword_xlsx.time, "strftime",
+                            lambda fmt, *a: "2026-01-01 00:00:00")
+        kwargs = self._kwargs()
+        expected = build_keyword_xlsx(**kwargs)
+        out = tmp_path / "streamed.xlsx"
+        write_keyword_xlsx(str(out), constant_memory=True,
+                           tmpdir=str(tmp_path), **kwargs)
+
+        got, want = _sheet_cells(out.read_bytes()), _sheet_cells(expected)
+        assert len(got) == len(want) > 1
+        assert got == want
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["streamed.xlsx"]
+
+    def test_constant_memory_headers_not_merged_vertically(self, tmp_path):
+        out = tmp_path / "streamed.xlsx"
+        write_keyword_xlsx(str(out), constant_memory=True, **self._kwargs())
+        with zipfile.ZipFile(out) as zf:
+            sheet = zf.read("xl/worksheets/sheet1.xml").decode()
+        assert 'ref="A1:A2"' not in sheet
+        assert "<mergeCell " in sheet  # FY groups are still merged in row 1
+
+    def test_iter_file_chunks_streams_and_closes(self):
+        fh = io.BytesIO(b"x" * 10)
+        fh.seek(7)
+        assert b"".join(iter_file_chunks(fh, chunk_size=3)) == b"x" * 10
+        assert fh.closed
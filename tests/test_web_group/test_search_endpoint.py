@@ -463,3 +463,22 @@ class TestFtsScanLimit:
             offset=_FTS_SCAN_LIMIT + 1000,
         )
         assert f"LIMIT {_FTS_SCAN_LIMIT}" in sql
+
+
+class TestSuggestIndexed:
+    """OPT-SUGGEST-001: suggest is served from the suggestion index when built."""
+
+    def test_uses_index_when_present(self, suggest_db):
+        from utils.suggestions import refresh_suggestion_index
+        refresh_suggestion_index(suggest_db)
+        # Drop a source row: the index (not budget_lines) answers the query
+        suggest_db.execute("DELETE FROM pe_index WHERE pe_number = '0207449A'")
+        result = suggest(q="020", limit=5, conn=suggest_db)
+        assert any(s["value"] == "0207449A" for s in result)
+
+    def test_indexed_results_match_fields(self, suggest_db):
+        from utils.suggestions import refresh_suggestion_index
+        refresh_suggestion_index(suggest_db)
+        result = suggest(q="Helicopter", limit=5, conn=suggest_db)
+        assert result[0]["field"] == "pe_number"
+        assert any(s["field"] == "line_item_title" for s in result)
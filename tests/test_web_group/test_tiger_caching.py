@@ -131,3 +131,18 @@ class TestCacheHeaders:
             headers={"If-None-Match": '"wrong-etag"'},
         )
         assert response.status_code == 200
+
+    def test_explorer_status_has_no_etag(self, client):
+        """Explorer responses skip the generation ETag and are never stored."""
+        response = client.get("/api/v1/explorer/status?keywords=hypersonic")
+        assert response.status_code == 200
+        assert "ETag" not in response.headers
+        assert response.headers.get("Cache-Control") == "no-store"
+
+        # The data-generation ETag from another endpoint must not yield a 304
+        etag = client.get("/api/v1/reference/services").headers["ETag"]
+        response2 = client.get(
+            "/api/v1/explorer/status?keywords=hypersonic",
+            headers={"If-None-Match": etag},
+        )
+        assert response2.status_code == 200
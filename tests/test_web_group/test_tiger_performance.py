@@ -139,3 +139,10 @@ class TestHealthQueriesEndpoint:
         data = response.json()
         assert "slow_query_count" in data
         assert "avg_query_time_ms" in data
+        # OPT-DB-003: connection-pool metrics
+        pool = data["db_pool"]
+        assert pool["max_size"] >= 1
+        assert pool["checkouts"] >= 1
+        assert pool["in_use"] == 0
+        # OPT-CACHE-002: per-cache counters
+        assert "evictions" in data["caches"]["agg"]
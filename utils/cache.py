@@ -2,18 +2,87 @@
 
 Provides a simple TTLCache class for caching reference data, aggregations,
 and other expensive queries with configurable expiry.
+
+OPT-CACHE-001: Optional shared second-level backend.  A TTLCache created with
+a ``namespace`` reads through to, and writes through to, the process-wide
+shared backend installed with :func:`set_shared_backend`.  The bundled
+:class:`SQLiteCacheBackend` stores pickled values in an on-disk SQLite file so
+several uvicorn workers (and restarted processes) share one warm cache.
+Entries are stamped with a generation string supplied by the caller (e.g. a
+database identity) and are ignored once the generation changes.
+
+OPT-GEN-001: Generation-aware local caches.  When a generation provider is
+installed with :func:`set_generation_provider`, every TTLCache drops its
+entries as soon as the provider returns a new value, so caches can be given
+``ttl_seconds=None`` and live until the underlying data actually changes.
 """
 
+import logging
+import math
+import pickle
+import sqlite3
+import sys
 import time
 import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
 from typing import Any
 
+_logger = logging.getLogger(__name__)
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """Return a rough in-memory size estimate for *value* in bytes.
+
+    Walks containers, pydantic models and plain objects (via ``__dict__``)
+    and sums ``sys.getsizeof`` of the leaves.  Shared references are counted
+    each time they appear; the estimate only needs to rank large payloads
+    (aggregation and hierarchy responses) against small ones.
+
+    Args:
+        value: Object to measure.
+
+    Returns:
+        Estimated size in bytes.
+    """
+    size = sys.getsizeof(value)
+    if _depth > 20 or isinstance(value, (str, bytes, int, float, bool, type(None))):
+        return size
+    if isinstance(value, dict):
+        return size + sum(
+            estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1)
+            for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(estimate_size(v, _depth + 1) for v in value)
+    attrs = getattr(value, "__dict__", None)
+    if isinstance(attrs, dict):
+        return size + estimate_size(attrs, _depth + 1)
+    return size
+
 
 class TTLCache:
-    """Thread-safe in-memory cache with time-to-live (TTL) expiry.
+    """Thread-safe in-memory cache with LRU eviction and TTL expiry.
 
     Entries expire after ``ttl_seconds`` seconds. A maximum of ``maxsize``
-    entries are retained; when the cache is full the oldest entry is evicted.
+    entries are retained; when the cache is full the least recently used
+    entry is evicted.  If ``max_bytes`` is set, entries are also evicted (LRU
+    first) until the estimated size of all values fits.
+
+    OPT-CACHE-002: Every operation is O(1).  Entries live in two ordered
+    dicts — one in recency order for LRU eviction and one in write order,
+    which equals expiry order because the TTL is uniform.  Expired entries
+    are swept lazily from the head of the write-order dict on ``set`` and
+    ``stats`` instead of scanning the whole store under the lock.
+
+    When created with a ``namespace``, local misses fall through to the
+    shared backend (if one is installed) and ``set``/``delete``/``clear`` are
+    written through to it (OPT-CACHE-001).
+
+    If a generation provider is installed, the cache empties itself whenever
+    the generation changes (OPT-GEN-001).
 
     Usage::
 
@@ -22,20 +91,69 @@ class TTLCache:
         value = cache.get("my_key")  # returns dict or None if expired/missing
     """
 
-    def __init__(self, maxsize: int = 128, ttl_seconds: float = 300.0) -> None:
+    def __init__(self, maxsize: int = 128, ttl_seconds: float | None = 300.0,
+                 namespace: str | None = None,
+                 max_bytes: int | None = None) -> None:
         """Initialise the cache.
 
         Args:
             maxsize: Maximum number of entries to store (default 128).
             ttl_seconds: Seconds before a cached entry expires (default 300).
+                ``None`` means entries never expire by age; they are removed
+                by LRU eviction or a generation change.
+            namespace: Name used to partition entries in the shared backend.
+                ``None`` keeps the cache strictly process-local.
+            max_bytes: Optional bound on the estimated size of all cached
+                values (see :func:`estimate_size`).  ``None`` disables size
+                accounting.
         """
         self._maxsize = maxsize
         self._ttl = ttl_seconds
-        # Maps key -> (value, expires_at)
-        self._store: dict[Any, tuple[Any, float]] = {}
+        self._namespace = namespace
+        self._max_bytes = max_bytes
+        # Recency order: key -> (value, expires_at, size); last = most recent
+        self._store: OrderedDict[Any, tuple[Any, float, int]] = OrderedDict()
+        # Write order (== expiry order): key -> expires_at
+        self._expiry: OrderedDict[Any, float] = OrderedDict()
+        self._bytes = 0
         self._lock = threading.Lock()
         self._hits = 0
         self._misses = 0
+        self._shared_hits = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+        self._generation: str | None = None
+        if namespace:
+            # First live instance wins (the module-level cache in production)
+            _registry.setdefault(namespace, self)
+
+    def _check_generation_locked(self, generation: str | None) -> None:
+        """Empty the store if the data generation moved on."""
+        if generation == self._generation:
+            return
+        if self._store:
+            self._invalidations += 1
+        self._store.clear()
+        self._expiry.clear()
+        self._bytes = 0
+        self._generation = generation
+
+    def _remove_locked(self, key: Any) -> None:
+        """Drop *key* from both orderings (caller holds the lock)."""
+        _value, _exp, size = self._store.pop(key)
+        self._expiry.pop(key, None)
+        self._bytes -= size
+
+    def _sweep_expired_locked(self, now: float) -> None:
+        """Remove expired entries from the head of the expiry order."""
+        expiry = self._expiry
+        while expiry:
+            key, expires_at = next(iter(expiry.items()))
+            if expires_at >= now:
+                break
+            self._remove_locked(key)
+            self._expirations += 1
 
     def get(self, key: Any) -> Any | None:
         """Return cached value for *key*, or ``None`` if absent or expired.
@@ -46,60 +164,110 @@ class TTLCache:
         Returns:
             Cached value, or ``None``.
         """
+        generation = _current_generation()
         with self._lock:
+            self._check_generation_locked(generation)
             entry = self._store.get(key)
-            if entry is None:
-                self._misses += 1
-                return None
-            value, expires_at = entry
-            if time.monotonic() > expires_at:
-                del self._store[key]
-                self._misses += 1
-                return None
-            self._hits += 1
-            return value
+            if entry is not None:
+                value, expires_at, _size = entry
+                if time.monotonic() <= expires_at:
+                    self._store.move_to_end(key)
+                    self._hits += 1
+                    return value
+                self._remove_locked(key)
+                self._expirations += 1
+        backend = _shared_backend if self._namespace else None
+        if backend is not None:
+            value = backend.get(self._namespace, key)  # type: ignore[arg-type]
+            if value is not None:
+                self._set_local(key, value)
+                with self._lock:
+                    self._hits += 1
+                    self._shared_hits += 1
+                return value
+        with self._lock:
+            self._misses += 1
+        return None
 
     def set(self, key: Any, value: Any) -> None:
         """Store *value* under *key* with the configured TTL.
 
-        If the cache is full, the entry with the earliest expiry is evicted
-        before inserting the new one.
+        If the cache is full (by entry count or ``max_bytes``), least
+        recently used entries are evicted after inserting the new one.  A
+        value larger than ``max_bytes`` on its own is not cached locally.
 
         Args:
             key: Cache key (must be hashable).
             value: Value to cache (any type).
         """
-        expires_at = time.monotonic() + self._ttl
+        self._set_local(key, value)
+        backend = _shared_backend if self._namespace else None
+        if backend is not None:
+            backend.set(self._namespace, key, value, self._ttl)  # type: ignore[arg-type]
+
+    def _set_local(self, key: Any, value: Any) -> None:
+        """Store *value* in the in-process store only."""
+        # Size estimation walks the value, so do it outside the lock
+        size = estimate_size(value) if self._max_bytes is not None else 0
+        generation = _current_generation()
+        now = time.monotonic()
+        expires_at = now + self._ttl if self._ttl is not None else math.inf
         with self._lock:
-            if key not in self._store and len(self._store) >= self._maxsize:
-                # Evict the entry that expires soonest
-                oldest_key = min(self._store, key=lambda k: self._store[k][1])
-                del self._store[oldest_key]
-            self._store[key] = (value, expires_at)
+            self._check_generation_locked(generation)
+            self._sweep_expired_locked(now)
+            if key in self._store:
+                self._remove_locked(key)
+            if self._max_bytes is not None and size > self._max_bytes:
+                return
+            self._store[key] = (value, expires_at, size)
+            self._expiry[key] = expires_at
+            self._bytes += size
+            while len(self._store) > self._maxsize or (
+                self._max_bytes is not None and self._bytes > self._max_bytes
+            ):
+                self._remove_locked(next(iter(self._store)))
+                self._evictions += 1
 
     def clear(self) -> None:
-        """Remove all entries from the cache."""
+        """Remove all entries from the cache (and its shared namespace)."""
         with self._lock:
             self._store.clear()
+            self._expiry.clear()
+            self._bytes = 0
             self._hits = 0
             self._misses = 0
+            self._shared_hits = 0
+            self._evictions = 0
+            self._expirations = 0
+            self._invalidations = 0
+        backend = _shared_backend if self._namespace else None
+        if backend is not None:
+            backend.clear(self._namespace)
 
-    def stats(self) -> dict[str, int]:
+    def stats(self) -> dict[str, Any]:
         """Return cache statistics.
 
         Returns:
-            Dict with keys ``hits``, ``misses``, and ``size``.
+            Dict with keys ``hits``, ``misses``, ``shared_hits``, ``size``,
+            ``maxsize``, ``evictions``, ``expirations``, ``invalidations``
+            (generation changes), ``bytes`` and ``max_bytes`` (the last two
+            are 0/``None`` without size accounting).
         """
+        generation = _current_generation()
         with self._lock:
-            # Purge expired entries before reporting size
-            now = time.monotonic()
-            expired = [k for k, (_, exp) in self._store.items() if now > exp]
-            for k in expired:
-                del self._store[k]
+            self._check_generation_locked(generation)
+            self._sweep_expired_locked(time.monotonic())
             return {
                 "hits": self._hits,
                 "misses": self._misses,
+                "shared_hits": self._shared_hits,
                 "size": len(self._store),
+                "maxsize": self._maxsize,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
             }
 
     def delete(self, key: Any) -> None:
@@ -109,7 +277,42 @@ class TTLCache:
             key: Cache key to remove (no-op if not present).
         """
         with self._lock:
-            self._store.pop(key, None)
+            if key in self._store:
+                self._remove_locked(key)
+        backend = _shared_backend if self._namespace else None
+        if backend is not None:
+            backend.delete(self._namespace, key)  # type: ignore[arg-type]
+
+
+# OPT-GEN-001: Callable returning the current data generation (None = unset)
+_generation_provider: Callable[[], str] | None = None
+
+
+def set_generation_provider(provider: Callable[[], str] | None) -> None:
+    """Install the callable TTLCache uses to detect data changes."""
+    global _generation_provider
+    _generation_provider = provider
+
+
+def _current_generation() -> str | None:
+    """Return the provider's current generation, or None if none installed."""
+    provider = _generation_provider
+    if provider is None:
+        return None
+    try:
+        return provider()
+    except Exception as exc:  # noqa: BLE001
+        _logger.debug("generation provider failed: %s", exc)
+        return None
+
+
+# Namespaced caches, for monitoring (weak so short-lived caches can be freed)
+_registry: "weakref.WeakValueDictionary[str, TTLCache]" = weakref.WeakValueDictionary()
+
+
+def all_cache_stats() -> dict[str, dict[str, Any]]:
+    """Return :meth:`TTLCache.stats` for every live namespaced cache."""
+    return {name: cache.stats() for name, cache in sorted(_registry.items())}
 
 
 def make_cache_key(name: str, *args: Any) -> tuple:
@@ -137,3 +340,189 @@ def make_cache_key(name: str, *args: Any) -> tuple:
         else:
             parts.append(arg)
     return tuple(parts)
+
+
+# ── OPT-CACHE-001: Shared cross-process backend ──────────────────────────────
+
+
+class SQLiteCacheBackend:
+    """Size-bounded, generation-stamped cache store in an SQLite file.
+
+    Every process that points at the same file shares entries, so work done
+    by one uvicorn worker benefits the others and survives restarts.  Values
+    are pickled; the file must only be writable by the application itself.
+
+    Each entry records the generation returned by ``generation()`` when it
+    was written.  Reads ignore entries from another generation, and the first
+    write after a generation change purges them.  When the stored payload
+    exceeds ``max_bytes`` the oldest entries are evicted first.
+
+    All errors are logged and treated as cache misses so a locked or
+    unwritable cache file never fails a request.
+
+    Args:
+        path: Cache file location (created if missing).
+        generation: Callable returning the current data generation stamp.
+        max_bytes: Upper bound on the summed size of pickled values.
+    """
+
+    def __init__(self, path: Path, generation: Callable[[], str] | None = None,
+                 max_bytes: int = 256 * 1024 * 1024) -> None:
+        self.path = Path(path)
+        self._generation = generation or (lambda: "")
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._last_generation: str | None = None
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False,
+                                     timeout=5, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                namespace  TEXT NOT NULL,
+                key        TEXT NOT NULL,
+                generation TEXT NOT NULL,
+                value      BLOB NOT NULL,
+                size       INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_created ON cache_entries(created_at)"
+        )
+
+    @staticmethod
+    def _key(key: Any) -> str:
+        """Serialise a :func:`make_cache_key` tuple to a stable string."""
+        return repr(key)
+
+    def get(self, namespace: str, key: Any) -> Any | None:
+        """Return the live value for *key* in *namespace*, or ``None``."""
+        try:
+            gen = self._generation()
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value FROM cache_entries "
+                    "WHERE namespace = ? AND key = ? AND generation = ? AND expires_at > ?",
+                    (namespace, self._key(key), gen, time.time()),
+                ).fetchone()
+            return pickle.loads(row[0]) if row else None
+        except Exception as exc:  # noqa: BLE001
+            _logger.debug("shared cache get failed: %s", exc)
+            return None
+
+    def set(self, namespace: str, key: Any, value: Any,
+            ttl_seconds: float | None) -> None:
+        """Store *value* under *key* for ``ttl_seconds`` (``None`` = no expiry)."""
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            if len(blob) > self._max_bytes:
+                return
+            gen = self._generation()
+            now = time.time()
+            with self._lock:
+                if gen != self._last_generation:
+                    self._conn.execute(
+                        "DELETE FROM cache_entries WHERE generation != ? OR expires_at <= ?",
+                        (gen, now),
+                    )
+                    self._last_generation = gen
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries "
+                    "(namespace, key, generation, value, size, expires_at, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (namespace, self._key(key), gen, blob, len(blob),
+                     now + ttl_seconds if ttl_seconds is not None else math.inf, now),
+                )
+                self._evict_locked()
+        except Exception as exc:  # noqa: BLE001
+            _logger.debug("shared cache set failed: %s", exc)
+
+    def _evict_locked(self) -> None:
+        """Drop oldest entries until the stored payload fits ``max_bytes``."""
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM cache_entries"
+        ).fetchone()[0]
+        if total <= self._max_bytes:
+            return
+        excess = total - self._max_bytes
+        rows = self._conn.execute(
+            "SELECT namespace, key, size FROM cache_entries ORDER BY created_at"
+        ).fetchall()
+        doomed = []
+        for ns, k, size in rows:
+            if excess <= 0:
+                break
+            doomed.append((ns, k))
+            excess -= size
+        self._conn.executemany(
+            "DELETE FROM cache_entries WHERE namespace = ? AND key = ?", doomed
+        )
+
+    def delete(self, namespace: str, key: Any) -> None:
+        """Remove a single entry (no-op if absent)."""
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                    (namespace, self._key(key)),
+                )
+        except Exception as exc:  # noqa: BLE001
+            _logger.debug("shared cache delete failed: %s", exc)
+
+    def clear(self, namespace: str | None = None) -> None:
+        """Remove every entry in *namespace* (or all entries if ``None``)."""
+        try:
+            with self._lock:
+                if namespace is None:
+                    self._conn.execute("DELETE FROM cache_entries")
+                else:
+                    self._conn.execute(
+                        "DELETE FROM cache_entries WHERE namespace = ?", (namespace,)
+                    )
+        except Exception as exc:  # noqa: BLE001
+            _logger.debug("shared cache clear failed: %s", exc)
+
+    def stats(self) -> dict[str, Any]:
+        """Return entry count and stored bytes for the current generation."""
+        try:
+            gen = self._generation()
+            with self._lock:
+                count, size = self._conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries "
+                    "WHERE generation = ?",
+                    (gen,),
+                ).fetchone()
+        except Exception as exc:  # noqa: BLE001
+            _logger.debug("shared cache stats failed: %s", exc)
+            return {"path": str(self.path), "entries": None, "bytes": None}
+        return {"path": str(self.path), "entries": count, "bytes": size,
+                "max_bytes": self._max_bytes}
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_shared_backend: SQLiteCacheBackend | None = None
+
+
+def set_shared_backend(backend: SQLiteCacheBackend | None) -> None:
+    """Install (or with ``None``, remove) the process-wide shared backend.
+
+    Only TTLCache instances created with a ``namespace`` use it.
+    """
+    global _shared_backend
+    old = _shared_backend
+    _shared_backend = backend
+    if old is not None and old is not backend:
+        old.close()
+
+
+def get_shared_backend() -> SQLiteCacheBackend | None:
+    """Return the installed shared backend, or ``None``."""
+    return _shared_backend
@@ -590,6 +590,11 @@ class AppConfig(Config):
         RATE_LIMIT_DOWNLOAD: Max download requests per minute per IP (default: 10)
         RATE_LIMIT_DEFAULT: Max requests per minute for other endpoints (default: 120)
         APP_DB_POOL_SIZE: Max DB connections in pool (default: 10)
+        APP_CACHE_BACKEND: "memory" (per-process) or "sqlite" (shared across
+            workers via APP_CACHE_PATH) (default: memory)
+        APP_CACHE_PATH: Shared cache file (default: <db stem>_api_cache.sqlite next
+            to the database; never a world-writable temp dir, since entries are pickled)
+        APP_CACHE_MAX_MB: Size bound for the shared cache in MB (default: 256)
         TRUSTED_PROXIES: Comma-separated proxy IP addresses to trust for forwarded IPs
     """
 
@@ -608,6 +613,10 @@ class AppConfig(Config):
         self.rate_limit_download = int(_os.getenv("RATE_LIMIT_DOWNLOAD", "10"))
         self.rate_limit_default = int(_os.getenv("RATE_LIMIT_DEFAULT", "120"))
         self.pool_size = int(_os.getenv("APP_DB_POOL_SIZE", "10"))
+        self.cache_backend = _os.getenv("APP_CACHE_BACKEND", "memory").lower()
+        raw_cache_path = _os.getenv("APP_CACHE_PATH")
+        self.cache_path: Path | None = Path(raw_cache_path) if raw_cache_path else None
+        self.cache_max_mb = int(_os.getenv("APP_CACHE_MAX_MB", "256"))
         raw_proxies = _os.getenv("TRUSTED_PROXIES", "")
         self.trusted_proxies: set[str] = (
             {p.strip() for p in raw_proxies.split(",") if p.strip()}
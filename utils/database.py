@@ -8,6 +8,7 @@ Provides reusable functions for:
 
 """
 
+import hashlib
 import logging
 import re
 import sqlite3
@@ -329,6 +330,123 @@ def vacuum_database(db_path: Path) -> None:
     conn.close()
 
 
+# ── OPT-GEN-001: Data generation stamp ───────────────────────────────────────
+#
+# A single monotonic number that changes whenever a pipeline step modifies
+# the data the API serves.  The builder, staging loader, enricher and repair
+# scripts bump it when they finish; the API keys its result caches and ETags
+# on it so caches live until the data actually changes and 304 responses
+# are exact.
+
+_DATA_GENERATION_DDL = """
+    CREATE TABLE IF NOT EXISTS data_generation (
+        id          INTEGER PRIMARY KEY CHECK (id = 1),
+        generation  INTEGER NOT NULL,
+        source      TEXT,
+        updated_at  TEXT DEFAULT (datetime('now'))
+    )
+"""
+
+
+def bump_data_generation(conn: sqlite3.Connection, source: str) -> int:
+    """Advance the database's data generation and commit.
+
+    The new value is ``max(previous + 1, now in milliseconds)`` so it keeps
+    increasing even when the database file is deleted and rebuilt from
+    scratch, and can never collide with a generation an API process has
+    already cached.
+
+    Args:
+        conn: Writable SQLite connection.
+        source: Name of the pipeline step making the change (e.g. "build").
+
+    Returns:
+        The new generation number.
+    """
+    conn.execute(_DATA_GENERATION_DDL)
+    row = conn.execute(
+        "SELECT generation FROM data_generation WHERE id = 1"
+    ).fetchone()
+    previous = row[0] if row else 0
+    generation = max(previous + 1, int(time.time() * 1000))
+    conn.execute(
+        "INSERT OR REPLACE INTO data_generation (id, generation, source, updated_at) "
+        "VALUES (1, ?, ?, datetime('now'))",
+        (generation, source),
+    )
+    conn.commit()
+    return generation
+
+
+def get_data_generation(conn: sqlite3.Connection) -> int | None:
+    """Return the database's data generation, or None if never stamped.
+
+    Args:
+        conn: SQLite connection (read-only is fine).
+    """
+    try:
+        row = conn.execute(
+            "SELECT generation FROM data_generation WHERE id = 1"
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return row[0] if row else None
+
+
+# ── OPT-VAL-002: In-place budget_lines change tracking ──────────────────────
+#
+# Incremental validation re-checks the files a build session ingested, but
+# repair scripts and enricher phases rewrite rows of other files in place.
+# Triggers record each such file with the data generation current at the
+# time of the write, so a validator can add every file written since the
+# generation its previous report saw.  Plain INSERTs are not tracked: new
+# rows only come from ingestion, which the build session already records.
+
+_SOURCE_FILE_CHANGES_DDL = """
+    CREATE TABLE IF NOT EXISTS source_file_changes (
+        source_file TEXT PRIMARY KEY,
+        generation  INTEGER NOT NULL
+    )
+"""
+
+
+def track_source_file_changes(conn: sqlite3.Connection) -> None:
+    """Install the triggers that record in-place budget_lines writes per file.
+
+    Args:
+        conn: Writable SQLite connection whose schema has budget_lines.
+    """
+    conn.execute(_DATA_GENERATION_DDL)
+    conn.execute(_SOURCE_FILE_CHANGES_DDL)
+    for suffix, event, ref in (("au", "UPDATE", "new"), ("ad", "DELETE", "old")):
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS budget_lines_changes_{suffix}
+            AFTER {event} ON budget_lines BEGIN
+                INSERT INTO source_file_changes (source_file, generation)
+                VALUES ({ref}.source_file, COALESCE(
+                    (SELECT generation FROM data_generation WHERE id = 1), 0))
+                ON CONFLICT (source_file) DO UPDATE
+                    SET generation = excluded.generation
+                    WHERE excluded.generation > generation;
+            END
+        """)
+
+
+def source_files_changed_since(conn: sqlite3.Connection,
+                               generation: int) -> set[str] | None:
+    """Return the files whose budget_lines were updated or deleted since *generation*.
+
+    Returns None when the database does not track changes (it was last
+    built before the tracking triggers existed).
+    """
+    try:
+        return {r[0] for r in conn.execute(
+            "SELECT source_file FROM source_file_changes WHERE generation >= ?",
+            (generation,))}
+    except sqlite3.OperationalError:
+        return None
+
+
 # ── Shared budget-type mapping ───────────────────────────────────────────────
 
 # Canonical mapping from appropriation_code to budget_type.  Used by:
@@ -357,6 +475,29 @@ BUDGET_TYPE_CASE_EXPR = (
 )
 
 
+# ── OPT-BUILD-004: Canonical budget-line fingerprint ─────────────────────────
+
+# Columns that identify a budget line across source files.  Two rows equal
+# on all of them are the same line reported by different exhibits/books.
+BUDGET_LINE_DEDUP_KEY: tuple[str, ...] = (
+    "fiscal_year", "pe_number", "line_item_title", "organization_name",
+    "exhibit_type", "amount_type", "appropriation_code",
+)
+
+
+def budget_line_fingerprint(*values: Any) -> str:
+    """Return the row_fingerprint for the BUDGET_LINE_DEDUP_KEY *values*.
+
+    NULLs hash to their own marker, so unlike a composite UNIQUE index two
+    rows that are both missing e.g. pe_number still collide.
+    """
+    if len(values) != len(BUDGET_LINE_DEDUP_KEY):
+        raise ValueError(
+            f"expected {len(BUDGET_LINE_DEDUP_KEY)} key values, got {len(values)}")
+    payload = "\x1f".join("\x00" if v is None else str(v) for v in values)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
 # ── OPT-DBUTIL-001: Dynamic schema introspection ──────────────────────────────
 
 def get_amount_columns(conn: sqlite3.Connection, table: str = "budget_lines") -> List[str]:
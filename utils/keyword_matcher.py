@@ -0,0 +1,182 @@
+"""
+Multi-pattern keyword matching for taxonomy tagging.
+
+OPT-ENRICH-002: The enricher used to run every taxonomy regex against every
+description one at a time — O(tags × patterns × text).  KeywordMatcher
+compiles a whole taxonomy once:
+
+1. Each term is reduced to its longest required literal (its *anchor*):
+   ``r"\\bISR\\b"`` → ``"isr"``, ``r"launch\\s+vehicle"`` → ``"vehicle"``.
+2. All anchors go into one Aho–Corasick automaton, so a single pass over
+   the case-folded text reports every anchor present, overlapping or not.
+3. Terms that are plain literals match on the anchor alone; the remaining
+   (true regex) terms are only searched when their anchor was seen, and
+   only until their tag has matched.
+
+The result is exactly what ``any(p.search(text) for p in patterns)`` per
+tag would return with ``re.IGNORECASE``.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+
+try:
+    from re import _constants as _sre  # type: ignore[attr-defined]  # Python 3.11+
+    from re import _parser as _sre_parse  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover - Python 3.10
+    import sre_constants as _sre  # type: ignore[no-redef]
+    import sre_parse as _sre_parse  # type: ignore[no-redef]
+
+# Characters outside ASCII that re.IGNORECASE treats as equal to an ASCII
+# letter.  Folding them one-for-one keeps anchor positions contiguous,
+# which str.lower() does not ("İ".lower() is two characters).
+_FOLD_TABLE = {c: c + 32 for c in range(ord("A"), ord("Z") + 1)}
+_FOLD_TABLE.update({0x130: ord("i"), 0x131: ord("i"),
+                    0x17F: ord("s"), 0x212A: ord("k")})
+
+
+def fold_text(text: str) -> str:
+    """Case-fold *text* the way re.IGNORECASE compares ASCII letters."""
+    if text.isascii():
+        return text.lower()
+    return text.translate(_FOLD_TABLE)
+
+
+def _literal_runs(parsed) -> tuple[list[str], bool]:
+    """Return (runs of required literal text, whether *parsed* is a plain literal).
+
+    Zero-width assertions (``\\b``) do not break a run because they consume
+    no characters.  Anything optional, repeated or a character class ends
+    the current run.
+    """
+    runs: list[str] = []
+    current: list[str] = []
+    plain = True
+    for op, av in parsed:
+        if op is _sre.LITERAL and av < 128 and not chr(av).isspace():
+            current.append(chr(av).lower())
+            continue
+        if op is _sre.AT:
+            plain = False
+            continue
+        plain = False
+        if current:
+            runs.append("".join(current))
+            current = []
+        if op is _sre.SUBPATTERN and not av[1] and not av[2]:
+            inner, _ = _literal_runs(av[3])
+            runs.extend(inner)
+        elif op is _sre.MAX_REPEAT and av[0] >= 1:
+            inner, _ = _literal_runs(av[2])
+            runs.extend(inner)
+    if current:
+        runs.append("".join(current))
+    return runs, plain
+
+
+def term_anchor(term: str) -> tuple[str | None, bool]:
+    """Return (anchor, is_plain_literal) for a regex *term*.
+
+    The anchor is a lowercase literal that every match of *term* contains,
+    or None when the term has no required literal (it must then always be
+    searched).
+    """
+    runs, plain = _literal_runs(_sre_parse.parse(term))
+    if not runs:
+        return None, False
+    return max(runs, key=len), plain and len(runs) == 1
+
+
+class _Automaton:
+    """Aho–Corasick automaton flattened into a per-state transition dict."""
+
+    def __init__(self, words: list[str]):
+        goto: list[dict[str, int]] = [{}]
+        out: list[set[int]] = [set()]
+        for idx, word in enumerate(words):
+            state = 0
+            for ch in word:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append(set())
+                state = nxt
+            out[state].add(idx)
+
+        # Breadth-first: fail links, inherited outputs, and full transitions
+        # so the scan loop never has to follow a fail chain.
+        fail = [0] * len(goto)
+        delta: list[dict[str, int]] = [dict(goto[0])]
+        delta.extend({} for _ in range(len(goto) - 1))
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            trans = dict(delta[fail[state]])
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(ch, 0)
+                out[nxt] |= out[fail[nxt]]
+                queue.append(nxt)
+                trans[ch] = nxt
+            delta[state] = trans
+        self._delta = delta
+        self._out = [frozenset(o) if o else None for o in out]
+
+    def scan(self, text: str) -> set[int]:
+        """Return the indexes of every word occurring in *text*."""
+        delta = self._delta
+        out = self._out
+        found: set[int] = set()
+        state = 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            words = out[state]
+            if words is not None:
+                found |= words
+        return found
+
+
+class KeywordMatcher:
+    """Match many tags, each defined by a list of regex terms, in one pass.
+
+    Args:
+        taxonomy: ``[(tag, [regex_term, ...]), ...]``; terms are matched
+            case-insensitively, exactly as ``re.compile(term, re.I)``.
+    """
+
+    def __init__(self, taxonomy: list[tuple[str, list[str]]]):
+        self.tags = [tag for tag, _ in taxonomy]
+        anchors: dict[str, int] = {}
+        # Per tag: list of (anchor index | None, compiled pattern | None).
+        # A None pattern means the anchor alone proves the match.
+        self._terms: list[list[tuple[int | None, re.Pattern | None]]] = []
+        for _, terms in taxonomy:
+            entries = []
+            for term in terms:
+                anchor, plain = term_anchor(term)
+                idx = anchors.setdefault(anchor, len(anchors)) if anchor else None
+                entries.append((idx, None if plain else re.compile(term, re.IGNORECASE)))
+            self._terms.append(entries)
+        self._automaton = _Automaton(list(anchors))
+
+    def match_indexes(self, text: str) -> list[int]:
+        """Return the taxonomy indexes of the tags matching *text*, ascending."""
+        if not text:
+            return []
+        seen = self._automaton.scan(fold_text(text))
+        matched: list[int] = []
+        for i, entries in enumerate(self._terms):
+            for idx, pattern in entries:
+                if idx is not None and idx not in seen:
+                    continue
+                if pattern is None or pattern.search(text):
+                    matched.append(i)
+                    break
+        return matched
+
+    def match(self, text: str) -> list[str]:
+        """Return the tags matching *text*, in taxonomy order."""
+        return [self.tags[i] for i in self.match_indexes(text)]
@@ -6,12 +6,14 @@ frontend.py, and download.py.
 
 from __future__ import annotations
 
+import base64
 import json
 import re
 import sqlite3
 from collections.abc import Sized
 from typing import Any
 
+from utils.cache import TTLCache
 from utils.config import CORE_SUMMARY_TYPES
 from utils.database import _validate_identifier, get_amount_columns
 
@@ -112,6 +114,7 @@ def build_where_clause(
     max_amount: float | None = None,
     q: str | None = None,
     fts_ids: list[int] | None = None,
+    fts_match: str | None = None,
     amount_column: str | None = None,
     exclude_summary: bool = False,
     extra_conditions: list[str] | None = None,
@@ -127,8 +130,13 @@ def build_where_clause(
         budget_type: Filter by budget type(s) (e.g. RDT&E, Procurement).
         min_amount: Minimum amount value (applied to amount_column).
         max_amount: Maximum amount value (applied to amount_column).
-        q: Free-text search (unused here — caller should use fts_ids).
-        fts_ids: Row IDs from FTS MATCH query to restrict results.
+        q: Free-text search (unused here — caller should use fts_match).
+        fts_ids: Row IDs from FTS MATCH query to restrict results.  Prefer
+            *fts_match* for user queries; broad terms can match more rows
+            than SQLite allows bound parameters.
+        fts_match: Sanitized FTS5 query.  Applied as a subquery against
+            ``budget_lines_fts`` so the hit set never leaves SQLite
+            (OPT-FTS-001); see :func:`probe_fts_match`.
         amount_column: Which FY amount column to filter on.
             Must be in VALID_AMOUNT_COLUMNS. Defaults to amount_fy2026_request.
         exclude_summary: If True, exclude summary exhibit types (P-1, R-1,
@@ -174,10 +182,37 @@ def build_where_clause(
             return "WHERE 1=0", []
         add_in_condition(conditions, params, "id", fts_ids)
 
+    if fts_match:
+        conditions.append(FTS_MATCH_CONDITION)
+        params.append(fts_match)
+
     where = "WHERE " + " AND ".join(conditions) if conditions else ""
     return where, params
 
 
+# OPT-FTS-001: Restrict budget_lines to FTS hits without materialising rowids
+FTS_MATCH_CONDITION = (
+    "id IN (SELECT rowid FROM budget_lines_fts WHERE budget_lines_fts MATCH ?)"
+)
+
+
+def probe_fts_match(conn: sqlite3.Connection, fts_query: str) -> bool:
+    """Return True if *fts_query* is valid and matches at least one row.
+
+    Lets callers short-circuit to an empty result (and keeps FTS syntax
+    errors or a missing FTS table out of the main query) at the cost of a
+    single-row lookup instead of fetching every matching rowid.
+    """
+    try:
+        row = conn.execute(
+            "SELECT 1 FROM budget_lines_fts WHERE budget_lines_fts MATCH ? LIMIT 1",
+            (fts_query,),
+        ).fetchone()
+    except (sqlite3.OperationalError, sqlite3.DatabaseError):
+        return False
+    return row is not None
+
+
 def build_order_clause(
     sort_by: str,
     sort_dir: str,
@@ -346,6 +381,100 @@ def fetch_with_has_more(
     return rows, False
 
 
+# ---------------------------------------------------------------------------
+# OPT-PAGE-001: Keyset (cursor) pagination
+# ---------------------------------------------------------------------------
+
+
+def encode_cursor(sort_by: str, sort_dir: str, value: Any, row_id: int) -> str:
+    """Encode the last row of a page as an opaque keyset cursor.
+
+    The cursor records the sort column and direction it was issued for, so
+    it cannot be replayed against a differently-ordered query.
+    """
+    payload = json.dumps(
+        [sort_by, sort_dir.lower(), value, row_id], separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, sort_by: str, sort_dir: str) -> tuple[Any, int]:
+    """Decode a cursor from :func:`encode_cursor` into ``(value, row_id)``.
+
+    Raises:
+        ValueError: If the token is malformed or was issued for a different
+            sort column/direction.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        col, direction, value, row_id = json.loads(raw)
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Invalid pagination cursor") from exc
+    if col != sort_by or direction != sort_dir.lower():
+        raise ValueError("Pagination cursor does not match sort order")
+    if not isinstance(row_id, int) or isinstance(value, (list, dict)):
+        raise ValueError("Invalid pagination cursor")
+    return value, row_id
+
+
+def build_keyset_condition(
+    sort_by: str,
+    sort_dir: str,
+    value: Any,
+    row_id: int,
+) -> tuple[str, list[Any]]:
+    """Build the WHERE condition selecting rows after a keyset cursor.
+
+    Pages are ordered by ``(sort_by, id)``; the condition is a row-value
+    comparison SQLite can answer by seeking the ``idx_bl_*`` index on
+    *sort_by* (every index implicitly ends in the rowid).  SQLite sorts NULLs
+    first ascending and last descending, so the NULL block is handled
+    explicitly.
+
+    Args:
+        sort_by: Column the page is ordered by (must already be validated).
+        sort_dir: ``'asc'`` or ``'desc'``.
+        value: *sort_by* value of the last row on the previous page.
+        row_id: ``id`` of the last row on the previous page.
+
+    Returns:
+        ``(condition, params)`` to AND into the page query.
+    """
+    _validate_identifier(sort_by, "column name")
+    desc = sort_dir.lower() == "desc"
+    if sort_by == "id":
+        return ("id < ?" if desc else "id > ?"), [row_id]
+    if value is None:
+        if desc:
+            return f"({sort_by} IS NULL AND id < ?)", [row_id]
+        return f"({sort_by} IS NOT NULL OR id > ?)", [row_id]
+    if desc:
+        return f"(({sort_by}, id) < (?, ?) OR {sort_by} IS NULL)", [value, row_id]
+    return f"({sort_by}, id) > (?, ?)", [value, row_id]
+
+
+# OPT-PAGE-001: COUNT(*) per filter set, reused across page clicks until the
+# data generation changes (see OPT-GEN-001).
+_count_cache: TTLCache = TTLCache(maxsize=1024, ttl_seconds=None,
+                                  namespace="row_count",
+                                  max_bytes=16 * 1024 * 1024)
+
+
+def cached_count(
+    conn: sqlite3.Connection,
+    table: str,
+    where: str,
+    params: list[Any],
+) -> int:
+    """Return ``SELECT COUNT(*) FROM table {where}``, cached per filter set."""
+    key = ("count", table, where, tuple(params))
+    total = _count_cache.get(key)
+    if total is None:
+        total = conn.execute(f"SELECT COUNT(*) FROM {table} {where}", params).fetchone()[0]
+        _count_cache.set(key, total)
+    return total
+
+
 def parse_json(val: Any, default: Any) -> Any:
     """Parse a JSON value, returning *default* on empty input or any parse
     failure.  Already-deserialised lists and dicts pass through unchanged.
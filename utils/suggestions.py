@@ -0,0 +1,221 @@
+"""
+Search suggestion index for /api/v1/search/suggest (OPT-SUGGEST-001).
+
+The typeahead used to run ``LIKE '%prefix%'`` with ``SELECT DISTINCT`` over
+budget_lines on every keystroke.  Instead, the enricher materialises one row
+per distinct suggestable value into ``search_suggestions`` (with a frequency
+count) and mirrors it into a trigram FTS5 table, so a lookup is an index probe
+over a few tens of thousands of short strings rather than a scan of every
+budget line.
+
+Tables:
+    search_suggestions      — (field, term) → label, freq, prio
+    search_suggestions_fts  — external-content FTS5 (trigram) over term/label,
+                              kept in sync by triggers
+
+refresh_suggestion_index() diffs the desired term set against the stored one
+and only writes rows that changed, so re-running it after a rebuild touches
+the FTS index for the delta alone.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+
+from utils.database import table_exists
+
+logger = logging.getLogger(__name__)
+
+#: Ranking priority per suggestion field (lower sorts first).
+SUGGEST_FIELD_PRIORITY: dict[str, int] = {
+    "pe_number": 0,
+    "bli_key": 1,
+    "line_item_title": 2,
+    "account_title": 3,
+    "organization_name": 4,
+}
+
+# Trigram MATCH needs at least three characters; shorter input falls back to
+# a LIKE scan of the (small) suggestion table for term or label contains.
+_MIN_TRIGRAM_LEN = 3
+
+_SUGGEST_DDL = """
+CREATE TABLE IF NOT EXISTS search_suggestions (
+    id      INTEGER PRIMARY KEY,
+    field   TEXT NOT NULL,
+    term    TEXT NOT NULL COLLATE NOCASE,
+    label   TEXT,
+    freq    INTEGER NOT NULL DEFAULT 0,
+    prio    INTEGER NOT NULL,
+    UNIQUE (field, term)
+);
+CREATE INDEX IF NOT EXISTS idx_suggest_term ON search_suggestions(term);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS search_suggestions_fts USING fts5(
+    term, label,
+    content='search_suggestions', content_rowid='id',
+    tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS search_suggestions_ai
+AFTER INSERT ON search_suggestions BEGIN
+    INSERT INTO search_suggestions_fts(rowid, term, label)
+    VALUES (new.id, new.term, new.label);
+END;
+CREATE TRIGGER IF NOT EXISTS search_suggestions_ad
+AFTER DELETE ON search_suggestions BEGIN
+    INSERT INTO search_suggestions_fts(search_suggestions_fts, rowid, term, label)
+    VALUES ('delete', old.id, old.term, old.label);
+END;
+CREATE TRIGGER IF NOT EXISTS search_suggestions_au
+AFTER UPDATE OF term, label ON search_suggestions BEGIN
+    INSERT INTO search_suggestions_fts(search_suggestions_fts, rowid, term, label)
+    VALUES ('delete', old.id, old.term, old.label);
+    INSERT INTO search_suggestions_fts(rowid, term, label)
+    VALUES (new.id, new.term, new.label);
+END;
+"""
+
+
+def _desired_terms_sql(conn: sqlite3.Connection) -> str:
+    """Return a SELECT yielding (field, term, label, freq) for every source."""
+    columns = {r[1] for r in conn.execute("PRAGMA table_info(budget_lines)")}
+    parts = [
+        f"SELECT '{col}' AS field, {col} AS term, NULL AS label, COUNT(*) AS freq "
+        f"FROM budget_lines "
+        f"WHERE {col} IS NOT NULL AND TRIM({col}) != '' GROUP BY {col}"
+        for col in ("line_item_title", "account_title", "organization_name")
+        if col in columns
+    ]
+    if table_exists(conn, "pe_index"):
+        parts.append(
+            "SELECT 'pe_number' AS field, pe_number AS term, "
+            "display_title AS label, 1 AS freq FROM pe_index "
+            "WHERE pe_number IS NOT NULL"
+        )
+    if table_exists(conn, "bli_index"):
+        parts.append(
+            "SELECT 'bli_key' AS field, bli_key AS term, display_title AS label, "
+            "COALESCE(row_count, 1) AS freq FROM bli_index WHERE bli_key IS NOT NULL"
+        )
+    return " UNION ALL ".join(parts) or (
+        "SELECT NULL AS field, NULL AS term, NULL AS label, NULL AS freq WHERE 0"
+    )
+
+
+def refresh_suggestion_index(
+    conn: sqlite3.Connection,
+    create: bool = True,
+) -> dict[str, int]:
+    """Bring ``search_suggestions`` in line with the current data.
+
+    Args:
+        conn: Writable connection to the budget database.
+        create: Create the index if it does not exist yet.  When False a
+            database without the index is left untouched (used by the
+            builder, which runs before enrichment has created it).
+
+    Returns:
+        Counts of ``inserted``, ``updated`` and ``deleted`` rows.
+    """
+    counts = {"inserted": 0, "updated": 0, "deleted": 0}
+    if not table_exists(conn, "budget_lines"):
+        return counts
+    if not create and not table_exists(conn, "search_suggestions"):
+        return counts
+
+    conn.executescript(_SUGGEST_DDL)
+    prio_case = " ".join(
+        f"WHEN '{field}' THEN {prio}" for field, prio in SUGGEST_FIELD_PRIORITY.items()
+    )
+    conn.execute("DROP TABLE IF EXISTS temp._suggest_desired")
+    conn.execute(
+        "CREATE TEMP TABLE _suggest_desired ("
+        " field TEXT, term TEXT COLLATE NOCASE, label TEXT, freq INTEGER,"
+        " prio INTEGER, PRIMARY KEY (field, term))"
+    )
+    # Terms differing only by case collapse into one row (term is NOCASE)
+    conn.execute(
+        f"INSERT INTO _suggest_desired "
+        f"SELECT field, MIN(term), MAX(label), SUM(freq), "
+        f"CASE field {prio_case} ELSE 9 END "
+        f"FROM ({_desired_terms_sql(conn)}) "
+        f"GROUP BY field, term COLLATE NOCASE"
+    )
+
+    counts["deleted"] = conn.execute(
+        "DELETE FROM search_suggestions WHERE NOT EXISTS ("
+        " SELECT 1 FROM _suggest_desired d"
+        " WHERE d.field = search_suggestions.field"
+        " AND d.term = search_suggestions.term)"
+    ).rowcount
+    counts["updated"] = conn.execute(
+        "UPDATE search_suggestions SET "
+        " term = d.term, label = d.label, freq = d.freq, prio = d.prio "
+        "FROM _suggest_desired d "
+        "WHERE d.field = search_suggestions.field"
+        " AND d.term = search_suggestions.term"
+        " AND (d.term IS NOT search_suggestions.term COLLATE BINARY"
+        "  OR d.label IS NOT search_suggestions.label"
+        "  OR d.freq != search_suggestions.freq"
+        "  OR d.prio != search_suggestions.prio)"
+    ).rowcount
+    counts["inserted"] = conn.execute(
+        "INSERT INTO search_suggestions (field, term, label, freq, prio) "
+        "SELECT field, term, label, freq, prio FROM _suggest_desired d "
+        "WHERE NOT EXISTS (SELECT 1 FROM search_suggestions s"
+        " WHERE s.field = d.field AND s.term = d.term)"
+    ).rowcount
+    conn.execute("DROP TABLE temp._suggest_desired")
+    conn.commit()
+    logger.info(
+        "Suggestion index refreshed: %d inserted, %d updated, %d deleted",
+        counts["inserted"], counts["updated"], counts["deleted"],
+    )
+    return counts
+
+
+def query_suggestions(
+    conn: sqlite3.Connection,
+    prefix: str,
+    limit: int,
+) -> list[dict] | None:
+    """Return ranked suggestions for *prefix*, or None if there is no index.
+
+    Values and labels containing *prefix* match.  Ranking: field priority
+    (PE, BLI, line item, account, organization), then values starting with
+    *prefix*, then frequency.  Prefixes too short for the trigram index scan
+    the suggestion table with LIKE instead.
+    """
+    escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    starts_with = f"{escaped}%"
+    contains = f"%{escaped}%"
+    try:
+        if len(prefix) >= _MIN_TRIGRAM_LEN:
+            phrase = '"' + prefix.replace('"', '""') + '"'
+            rows = conn.execute(
+                "SELECT s.field, s.term, s.label FROM search_suggestions s "
+                "WHERE s.id IN (SELECT rowid FROM search_suggestions_fts "
+                "               WHERE search_suggestions_fts MATCH ?) "
+                "ORDER BY s.prio, (s.term LIKE ? ESCAPE '\\') DESC, s.freq DESC, s.term "
+                "LIMIT ?",
+                (phrase, starts_with, limit),
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                "SELECT field, term, label FROM search_suggestions "
+                "WHERE term LIKE ? ESCAPE '\\' OR label LIKE ? ESCAPE '\\' "
+                "ORDER BY prio, (term LIKE ? ESCAPE '\\') DESC, freq DESC, term "
+                "LIMIT ?",
+                (contains, contains, starts_with, limit),
+            ).fetchall()
+    except sqlite3.OperationalError:
+        return None  # Index not built (pre-enrichment DB) or FTS5 unavailable
+    suggestions: list[dict] = []
+    for field, term, label in rows:
+        entry: dict = {"value": term, "field": field}
+        if label:
+            entry["label"] = label
+        suggestions.append(entry)
+    return suggestions